@@ -180,6 +180,24 @@ def create_app() -> FastAPI:
     except Exception as e:
       logger.error(f"Error stopping Redis SSE subscriber: {e}")
 
+    # Close shared Valkey connection pools
+    try:
+      from robosystems.config.valkey_registry import ValkeyConnectionRegistry
+
+      await ValkeyConnectionRegistry.aclose()
+      logger.info("Valkey connection pools closed")
+    except Exception as e:
+      logger.error(f"Error closing Valkey connection pools: {e}")
+
+    # Close the asyncpg connection pool
+    try:
+      from robosystems.database import dispose_async_engine
+
+      await dispose_async_engine()
+      logger.info("Async database connection pool closed")
+    except Exception as e:
+      logger.error(f"Error closing async database connection pool: {e}")
+
     logger.info("RoboSystems API shutdown complete")
 
   # Configure CORS with specific domains for security
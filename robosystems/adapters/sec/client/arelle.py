@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import shutil
@@ -13,6 +14,9 @@ from robosystems.config import env
 
 logger = logging.getLogger(__name__)
 
+# Manifest written by scripts/arelle_cache_manager.py into extracted bundles
+BUNDLE_MANIFEST = "bundle_manifest.json"
+
 
 class ArelleClient:
   """
@@ -76,7 +80,18 @@ class ArelleClient:
 
   def _populate_cache_from_bundle(self, source_dir: Path, target_dir: Path):
     """Copy pre-cached schemas to Arelle's cache directory."""
+    if source_dir.resolve() == target_dir.resolve():
+      logger.debug("Cache directory is the pre-cached bundle directory")
+      return
+
+    # Skip walking the bundle when the target already holds the same bundle
+    source_digest = self._bundle_digest(source_dir)
+    if source_digest and source_digest == self._bundle_digest(target_dir):
+      logger.debug(f"Cache already populated from bundle {source_digest[:16]}")
+      return
+
     schemas_copied = 0
+    schemas_failed = 0
     schemas_found = 0
 
     for source_file in source_dir.glob("**/*"):
@@ -100,8 +115,14 @@ class ArelleClient:
           schemas_copied += 1
           logger.debug(f"Copied schema: {relative_path}")
         except Exception as e:
+          schemas_failed += 1
           logger.warning(f"Failed to copy schema {relative_path}: {e}")
 
+    # Record the bundle only once every schema is in place
+    manifest = source_dir / BUNDLE_MANIFEST
+    if source_digest and not schemas_failed:
+      shutil.copy2(manifest, target_dir / BUNDLE_MANIFEST)
+
     logger.debug(
       f"Cache population: found {schemas_found} schemas, copied {schemas_copied} new ones"
     )
@@ -109,6 +130,16 @@ class ArelleClient:
       f"Cache directory contents: {list(target_dir.glob('*'))[:5]}..."
     )  # Show first 5 dirs
 
+  @staticmethod
+  def _bundle_digest(cache_dir: Path) -> str | None:
+    """Content digest of the schema bundle a cache directory was built from."""
+    try:
+      manifest = json.loads((cache_dir / BUNDLE_MANIFEST).read_text())
+    except (OSError, TypeError, ValueError):
+      return None
+    digest = manifest.get("digest") if isinstance(manifest, dict) else None
+    return digest if isinstance(digest, str) else None
+
   def _check_cache_health(self) -> bool:
     """Check if we have sufficient cached schemas to run offline."""
     if not self.cache_dir or not self.cache_dir.exists():
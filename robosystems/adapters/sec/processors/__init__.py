@@ -7,15 +7,19 @@ processing SEC XBRL filings into LadybugDB graph format via parquet files.
 Main Components:
 - xbrl_graph: Core XBRLGraphProcessor for XBRL to graph transformation
 - ingestion: XBRLDuckDBGraphProcessor for DuckDB-based graph ingestion
+- batch: FilingProcessPool for parallel processing of many filings
 - schema: Schema adapter and configuration generator
-- dataframe: DataFrame initialization and management
+- dataframe: DataFrame initialization, management and row buffering
 - parquet: Schema-aware Parquet file output
 - textblock: S3 externalization for large text values
-- ids: UUID generation and naming utilities
+- ids: UUID and compact ID generation and naming utilities
 """
 
-from .dataframe import DataFrameManager
+from .batch import FilingProcessPool, FilingResult, get_worker_arelle_client
+from .dataframe import DataFrameManager, TableBuffer
 from .ids import (
+  # Compact IDs
+  IdInterner,
   # Naming utilities
   camel_to_snake,
   convert_schema_name_to_filename,
@@ -32,6 +36,8 @@ from .ids import (
   create_structure_id,
   create_taxonomy_id,
   create_unit_id,
+  generate_compact_id,
+  get_id_interner,
   make_plural,
   safe_concat,
 )
@@ -52,10 +58,16 @@ __all__ = [
   "XBRL_GRAPH_PROCESSOR_VERSION",
   # DataFrame management
   "DataFrameManager",
+  # Parallel processing
+  "FilingProcessPool",
+  "FilingResult",
+  # Compact IDs
+  "IdInterner",
   "IngestTableInfo",
   # Parquet file output
   "ParquetWriter",
   "SchemaIngestConfig",
+  "TableBuffer",
   # S3 externalization
   "TextBlockExternalizer",
   # DuckDB ingestion
@@ -83,6 +95,9 @@ __all__ = [
   "create_structure_id",
   "create_taxonomy_id",
   "create_unit_id",
+  "generate_compact_id",
+  "get_id_interner",
+  "get_worker_arelle_client",
   "make_plural",
   "safe_concat",
 ]
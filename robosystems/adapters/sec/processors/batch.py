@@ -0,0 +1,240 @@
+"""
+Process-pool parallel processing of SEC filings.
+
+Arelle and XBRLGraphProcessor are CPU-bound and single-threaded, so processing a
+partition's filings one at a time leaves most cores of a backfill box idle. The
+FilingProcessPool spreads a batch of filings over worker processes:
+
+- Each worker creates one ArelleClient (controller, plugins, taxonomy cache) and
+  reuses it for every filing it processes
+- Filings fail independently: an exception only fails its own filing, and when a
+  worker process dies only the filings it was running are retried in isolation
+- Workers are replaced after a fixed number of filings so memory held by Arelle
+  and pandas stays bounded
+- Results are reported as filings complete for progress tracking
+
+The per-filing function is supplied by the caller. It must be a module-level
+(picklable) callable taking the filing key and returning a metadata dict; a
+``"status"`` other than ``"success"`` marks the filing as failed. It gets the
+worker's warm client from ``get_worker_arelle_client()``.
+"""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+from robosystems.logger import logger
+
+FilingFunction = Callable[[str], dict[str, Any]]
+ResultCallback = Callable[["FilingResult", int, int], None]
+
+# Per-process state of pool workers
+_worker_arelle_client = None
+_started_queue = None
+
+
+@dataclass
+class FilingResult:
+  """Outcome of processing a single filing."""
+
+  key: str
+  status: str
+  duration_seconds: float
+  metadata: dict[str, Any] = field(default_factory=dict)
+  error: str | None = None
+
+  @property
+  def success(self) -> bool:
+    return self.status == "success"
+
+
+def get_worker_arelle_client():
+  """Get the ArelleClient of the current process, creating it on first use."""
+  global _worker_arelle_client
+  if _worker_arelle_client is None:
+    from robosystems.adapters.sec.client.arelle import ArelleClient
+
+    _worker_arelle_client = ArelleClient()
+  return _worker_arelle_client
+
+
+def _initialize_worker(started_queue) -> None:
+  """Pool worker initializer: remember where to report started filings."""
+  global _started_queue
+  _started_queue = started_queue
+
+
+def _process_filing(fn: FilingFunction, key: str) -> FilingResult:
+  """Process one filing in a worker, turning exceptions into a failed result."""
+  if _started_queue is not None:
+    _started_queue.put(key)
+
+  start = time.perf_counter()
+  try:
+    metadata = fn(key) or {}
+  except Exception as e:
+    logger.error(f"Processing failed for {key}: {type(e).__name__}: {e}")
+    return FilingResult(
+      key=key,
+      status="error",
+      duration_seconds=time.perf_counter() - start,
+      error=f"{type(e).__name__}: {e}",
+    )
+
+  status = metadata.get("status", "success")
+  return FilingResult(
+    key=key,
+    status=status,
+    duration_seconds=time.perf_counter() - start,
+    metadata=metadata,
+    error=None if status == "success" else metadata.get("reason"),
+  )
+
+
+class FilingProcessPool:
+  """
+  Processes batches of SEC filings on a pool of worker processes.
+
+  Workers are spawned (not forked) so each starts from a clean interpreter, and
+  are replaced after ``filings_per_worker`` filings.
+  """
+
+  def __init__(
+    self,
+    max_workers: int | None = None,
+    filings_per_worker: int | None = None,
+  ):
+    """
+    Initialize the pool.
+
+    Args:
+        max_workers: Worker processes (defaults to SEC_PROCESS_WORKERS, or the
+            CPU count when that is 0)
+        filings_per_worker: Filings a worker processes before it is replaced
+            (defaults to SEC_PROCESS_FILINGS_PER_WORKER, 0 never replaces)
+    """
+    from robosystems.config import env
+
+    if not max_workers:
+      max_workers = env.SEC_PROCESS_WORKERS or os.cpu_count() or 1
+    if filings_per_worker is None:
+      filings_per_worker = env.SEC_PROCESS_FILINGS_PER_WORKER
+
+    self.max_workers = max(1, max_workers)
+    self.filings_per_worker = max(0, filings_per_worker)
+    self._context = multiprocessing.get_context("spawn")
+
+  def run(
+    self,
+    keys: Iterable[str],
+    fn: FilingFunction,
+    on_result: ResultCallback | None = None,
+  ) -> list[FilingResult]:
+    """
+    Process filings in parallel.
+
+    Args:
+        keys: Filing keys passed to ``fn`` (duplicates are processed once)
+        fn: Module-level function processing one filing
+        on_result: Called as ``on_result(result, completed, total)`` in this
+            process as each filing finishes
+
+    Returns:
+        One result per filing, in the order of ``keys``
+    """
+    keys = list(dict.fromkeys(keys))
+    total = len(keys)
+    results: dict[str, FilingResult] = {}
+
+    def record(result: FilingResult) -> None:
+      results[result.key] = result
+      if on_result:
+        on_result(result, len(results), total)
+
+    started_queue = self._context.SimpleQueue()
+    remaining = keys
+    while remaining:
+      crashed, in_flight = self._run_parallel(remaining, fn, started_queue, record)
+      if not crashed:
+        break
+
+      # Filings that were running when a worker died are retried one at a time
+      # in their own process; filings that never started go back to the pool.
+      suspects = [key for key in crashed if key in in_flight]
+      remaining = [key for key in crashed if key not in in_flight]
+      logger.warning(
+        f"Worker process died with {len(suspects)} filings in flight, "
+        f"retrying them in isolation"
+      )
+      for key in suspects:
+        record(self._run_isolated(key, fn))
+
+      if not suspects:
+        # Workers died before starting any filing; retrying would not help
+        for key in remaining:
+          record(_failed(key, "Worker process failed to start"))
+        break
+
+    return [results[key] for key in keys]
+
+  def _run_parallel(
+    self,
+    keys: list[str],
+    fn: FilingFunction,
+    started_queue,
+    record: Callable[[FilingResult], None],
+  ) -> tuple[list[str], set[str]]:
+    """
+    Run filings on a fresh pool.
+
+    Returns:
+        Tuple of (filings lost to a dead worker, filings started but not finished)
+    """
+    crashed = []
+    started: set[str] = set()
+    finished: set[str] = set()
+    with self._executor(
+      min(self.max_workers, len(keys)), self.filings_per_worker, started_queue
+    ) as executor:
+      futures = {executor.submit(_process_filing, fn, key): key for key in keys}
+      for future in as_completed(futures):
+        try:
+          record(future.result())
+          finished.add(futures[future])
+        except BrokenProcessPool:
+          crashed.append(futures[future])
+        # Drain as we go so the queue pipe never fills up
+        while not started_queue.empty():
+          started.add(started_queue.get())
+
+    while not started_queue.empty():
+      started.add(started_queue.get())
+    return crashed, started - finished
+
+  def _run_isolated(self, key: str, fn: FilingFunction) -> FilingResult:
+    """Run a single filing in its own worker process."""
+    with self._executor(1, 1, None) as executor:
+      try:
+        return executor.submit(_process_filing, fn, key).result()
+      except BrokenProcessPool:
+        return _failed(key, "Worker process died while processing filing")
+
+  def _executor(
+    self, max_workers: int, filings_per_worker: int, started_queue
+  ) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+      max_workers=max_workers,
+      mp_context=self._context,
+      max_tasks_per_child=filings_per_worker or None,
+      initializer=_initialize_worker,
+      initargs=(started_queue,),
+    )
+
+
+def _failed(key: str, error: str) -> FilingResult:
+  return FilingResult(key=key, status="error", duration_seconds=0.0, error=error)
@@ -2,16 +2,259 @@
 XBRL DataFrame Management
 
 Centralized DataFrame initialization and management for XBRL graph processing.
-Handles schema-driven DataFrame creation, mapping, and completeness validation.
+Handles schema-driven DataFrame creation, mapping, and completeness validation,
+and buffers output rows so each table's DataFrame is built once.
 """
 
-from typing import cast
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
-from robosystems.adapters.sec.processors.ids import camel_to_snake, make_plural
+from robosystems.adapters.sec.processors.ids import (
+  camel_to_snake,
+  make_plural,
+  safe_concat,
+)
 from robosystems.logger import logger
 
+# Dtypes a one-row DataFrame infers for plain Python values
+_SCALAR_DTYPES = {
+  bool: "bool",
+  int: "int64",
+  float: "float64",
+  str: "object",
+  type(None): "object",
+}
+_BUFFERED_DTYPES = frozenset(_SCALAR_DTYPES.values())
+_INT64_RANGE = range(-(2**63), 2**63)
+
+# Value casts safe_concat applies when a row's dtype differs from the column's
+_CASTS = {"bool": bool, "int64": int, "float64": float}
+
+
+def _scalar_dtype(value: Any) -> tuple[str | None, Any]:
+  """
+  Dtype of ``value`` in a one-row DataFrame, with the value as stored there.
+
+  Returns a None dtype for values whose dtype the buffer does not track.
+  """
+  dtype = _SCALAR_DTYPES.get(type(value))
+  if dtype is not None:
+    if dtype == "int64" and value not in _INT64_RANGE:
+      return None, value
+    return dtype, value
+
+  # numpy scalars, dates, Decimals and other objects: ask pandas
+  dtype = str(pd.DataFrame([{"value": value}])["value"].dtype)
+  if dtype not in _BUFFERED_DTYPES:
+    return None, value
+  if dtype != "object":
+    value = _CASTS[dtype](value)
+  return dtype, value
+
+
+class TableBuffer:
+  """
+  Column-oriented row buffer for one output table.
+
+  Appending rows one at a time through ``safe_concat`` copies the whole
+  DataFrame on every row, and looking rows up with a boolean mask scans it.
+  The buffer keeps one value list per column plus hash indexes for lookups, and
+  builds the DataFrame once when it is read.
+
+  The built DataFrame matches appending each row with ``safe_concat``: column
+  order, dtype promotions and missing-value fills follow the same rules, so the
+  Parquet files written from it are byte-identical. Values whose dtype the
+  buffer does not track switch it to per-row concatenation.
+  """
+
+  def __init__(self, df: pd.DataFrame | None = None):
+    """
+    Initialize the buffer.
+
+    Args:
+        df: Existing DataFrame to append to (an empty one is replaced by the
+            first row, as ``safe_concat`` does)
+    """
+    self._frame: pd.DataFrame | None = df if df is not None else pd.DataFrame()
+    self._dtypes: dict[str, str] | None = None
+    self._values: dict[str, list[Any]] = {}
+    self._length = 0
+    self._indexes: dict[tuple[str, ...], dict[tuple, int]] = {}
+    self._per_row = False
+
+  def __len__(self) -> int:
+    if self._frame is not None:
+      return len(self._frame)
+    return self._length
+
+  def append(self, row: dict[str, Any]) -> None:
+    """Append one row (column name to value)."""
+    if not row:
+      return
+
+    if self._per_row:
+      self._append_per_row(row)
+      return
+
+    typed = {}
+    for column, value in row.items():
+      dtype, value = _scalar_dtype(value)
+      if dtype is None:
+        self._switch_to_per_row()
+        self._append_per_row(row)
+        return
+      typed[column] = (dtype, value)
+
+    if self._dtypes is None:
+      self._load_frame()
+      if self._per_row:
+        self._append_per_row(row)
+        return
+    assert self._dtypes is not None
+    self._frame = None
+
+    if self._length == 0:
+      self._dtypes = {column: dtype for column, (dtype, _) in typed.items()}
+      self._values = {column: [value] for column, (_, value) in typed.items()}
+    else:
+      self._append_typed(typed)
+    self._length += 1
+
+    position = self._length - 1
+    for columns, index in self._indexes.items():
+      index.setdefault(self._key_at(columns, position), position)
+
+  def find(self, **key: Any) -> dict[str, Any] | None:
+    """
+    Find the first row whose columns equal the given values.
+
+    Args:
+        **key: Column names and values to match
+
+    Returns:
+        The matching row as a dict, or None
+    """
+    columns = tuple(key)
+    index = self._indexes.get(columns)
+    if index is None:
+      index = {}
+      for position, values in enumerate(
+        zip(*(self._column_values(column) for column in columns), strict=True)
+      ):
+        index.setdefault(values, position)
+      self._indexes[columns] = index
+
+    position = index.get(tuple(key.values()))
+    if position is None:
+      return None
+    if self._frame is not None:
+      return self._frame.iloc[position].to_dict()
+    return {column: values[position] for column, values in self._values.items()}
+
+  def to_dataframe(self) -> pd.DataFrame:
+    """
+    Build the DataFrame, or return the one already built.
+
+    The returned DataFrame is kept as the buffer's contents, so changes made to
+    it in place survive later appends.
+    """
+    if self._frame is None:
+      assert self._dtypes is not None
+      self._frame = pd.DataFrame(
+        {
+          column: pd.Series(self._values[column], dtype=dtype)
+          for column, dtype in self._dtypes.items()
+        }
+      )
+      self._dtypes = None
+      self._values = {}
+      self._indexes.clear()
+    return self._frame
+
+  def _append_typed(self, typed: dict[str, tuple[str, Any]]) -> None:
+    """Append a row onto existing rows, promoting dtypes like safe_concat."""
+    assert self._dtypes is not None
+    for column, dtype in self._dtypes.items():
+      values = self._values[column]
+      if column in typed:
+        row_dtype, value = typed[column]
+        if row_dtype != dtype:
+          if "object" in (dtype, row_dtype):
+            self._dtypes[column] = "object"
+          else:
+            value = _CASTS[dtype](value)
+        values.append(value)
+      else:
+        # Missing from the row: NaN-filled like pd.concat does
+        if dtype == "int64":
+          self._values[column] = values = [float(v) for v in values]
+          self._dtypes[column] = "float64"
+        elif dtype == "bool":
+          self._dtypes[column] = "object"
+        values.append(np.nan)
+
+    for column, (dtype, value) in typed.items():
+      if column not in self._values:
+        # New column: NaN-filled for the existing rows
+        if dtype == "int64":
+          dtype, value = "float64", float(value)
+        elif dtype == "bool":
+          dtype = "object"
+        self._dtypes[column] = dtype
+        self._values[column] = [np.nan] * self._length + [value]
+
+  def _load_frame(self) -> None:
+    """Load the current DataFrame into per-column value lists."""
+    frame = self._frame
+    assert frame is not None
+    self._dtypes = {}
+    self._values = {}
+    self._length = 0
+    if frame.empty:
+      return
+
+    if not frame.columns.is_unique:
+      self._switch_to_per_row()
+      return
+    for column in frame.columns:
+      dtype = str(frame[column].dtype)
+      if dtype not in _BUFFERED_DTYPES:
+        self._switch_to_per_row()
+        return
+      self._dtypes[column] = dtype
+      self._values[column] = frame[column].tolist()
+    self._length = len(frame)
+
+  def _switch_to_per_row(self) -> None:
+    """Fall back to appending one-row DataFrames with safe_concat."""
+    if self._frame is None:
+      self.to_dataframe()
+    self._dtypes = None
+    self._values = {}
+    self._per_row = True
+
+  def _append_per_row(self, row: dict[str, Any]) -> None:
+    assert self._frame is not None
+    self._frame = safe_concat(self._frame, pd.DataFrame([row]))
+    position = len(self._frame) - 1
+    for columns, index in self._indexes.items():
+      index.setdefault(tuple(row.get(column, np.nan) for column in columns), position)
+
+  def _column_values(self, column: str) -> list[Any]:
+    if self._frame is not None:
+      if column in self._frame.columns:
+        return self._frame[column].tolist()
+      return [np.nan] * len(self._frame)
+    return self._values.get(column, [np.nan] * self._length)
+
+  def _key_at(self, columns: tuple[str, ...], position: int) -> tuple:
+    return tuple(
+      self._values[column][position] if column in self._values else np.nan
+      for column in columns
+    )
+
 
 class DataFrameManager:
   """
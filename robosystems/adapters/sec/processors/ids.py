@@ -4,22 +4,160 @@ XBRL ID and Naming Utilities
 Deterministic UUID generation for XBRL graph entities using UUIDv7
 for optimal database performance and cross-pipeline consistency.
 Also includes string conversion and naming convention helpers.
+
+With XBRL_COMPACT_IDS enabled, the high-volume entities (facts, elements,
+periods, units and dimensions) get deterministic signed 64-bit integer IDs
+instead of 36-character UUID strings. Shared entities (elements, periods, units)
+are interned: resolved once per process and, when XBRL_ID_INTERN_PATH is set,
+recorded in a persistent interning table that detects ID collisions across
+filings. The SEC graph schema must be created with the same setting.
 """
 
+import hashlib
 import re
+import sqlite3
+import threading
 
 import pandas as pd
 
+from robosystems.config import env
+from robosystems.logger import logger
 from robosystems.utils.uuid import generate_deterministic_uuid7
 
+# =============================================================================
+# Compact IDs
+# =============================================================================
+
+# Entity namespaces that get integer IDs when compact IDs are enabled
+COMPACT_ID_NAMESPACES = frozenset({"fact", "element", "period", "unit", "dimension"})
+# Namespaces shared across filings, resolved through the interning table
+INTERNED_ID_NAMESPACES = frozenset({"element", "period", "unit"})
+
+
+def generate_compact_id(content: str, namespace: str) -> int:
+  """
+  Generate a deterministic signed 64-bit ID (fits INT64 columns) for content.
+
+  Uses BLAKE2b over the same namespace-prefixed content as the UUID IDs, so
+  the same entity always gets the same ID across processes and reprocessing.
+  """
+  digest = hashlib.blake2b(f"{namespace}:{content}".encode(), digest_size=8).digest()
+  return int.from_bytes(digest, "big", signed=True)
+
+
+class IdInterner:
+  """
+  Interning table for compact IDs of entities shared across filings.
+
+  Keeps an in-process map of resolved keys and, when given a path, a
+  persistent SQLite table of (namespace, key, id) shared by all processes on
+  the machine. IDs stay hash-derived so they agree across machines; the table
+  records every key seen so a collision between two keys fails loudly instead
+  of merging two entities in the graph.
+  """
+
+  def __init__(self, path: str | None = None, max_entries: int = 1_000_000):
+    self.path = path or None
+    self.max_entries = max_entries
+    self._ids: dict[tuple[str, str], int] = {}
+    self._lock = threading.Lock()
+    self._conn: sqlite3.Connection | None = None
+
+    if self.path:
+      self._conn = sqlite3.connect(
+        self.path, timeout=30, isolation_level=None, check_same_thread=False
+      )
+      self._conn.execute("PRAGMA journal_mode=WAL")
+      self._conn.execute(
+        "CREATE TABLE IF NOT EXISTS interned_ids ("
+        "namespace TEXT NOT NULL, key TEXT NOT NULL, id INTEGER NOT NULL, "
+        "PRIMARY KEY (namespace, key))"
+      )
+      self._conn.execute(
+        "CREATE INDEX IF NOT EXISTS interned_ids_by_id ON interned_ids (namespace, id)"
+      )
+
+  def intern(self, namespace: str, key: str) -> int:
+    """Get the compact ID of a shared entity, recording it on first use."""
+    cache_key = (namespace, key)
+    compact_id = self._ids.get(cache_key)
+    if compact_id is not None:
+      return compact_id
+
+    compact_id = generate_compact_id(key, namespace)
+    with self._lock:
+      if self._conn is not None:
+        self._record(namespace, key, compact_id)
+      if len(self._ids) >= self.max_entries:
+        self._ids.clear()
+      self._ids[cache_key] = compact_id
+    return compact_id
+
+  def lookup(self, namespace: str, compact_id: int) -> str | None:
+    """Get the key an interned ID was generated from (persistent table only)."""
+    if self._conn is None:
+      return None
+    with self._lock:
+      row = self._conn.execute(
+        "SELECT key FROM interned_ids WHERE namespace = ? AND id = ?",
+        (namespace, compact_id),
+      ).fetchone()
+    return row[0] if row else None
+
+  def _record(self, namespace: str, key: str, compact_id: int) -> None:
+    assert self._conn is not None
+    self._conn.execute(
+      "INSERT OR IGNORE INTO interned_ids (namespace, key, id) VALUES (?, ?, ?)",
+      (namespace, key, compact_id),
+    )
+    keys = [
+      row[0]
+      for row in self._conn.execute(
+        "SELECT key FROM interned_ids WHERE namespace = ? AND id = ?",
+        (namespace, compact_id),
+      )
+    ]
+    if keys != [key]:
+      other = next(k for k in keys if k != key)
+      logger.error(f"Compact {namespace} ID {compact_id} collision: {key} / {other}")
+      raise ValueError(
+        f"Compact {namespace} ID collision between '{key}' and '{other}'"
+      )
+
+  def close(self) -> None:
+    if self._conn is not None:
+      self._conn.close()
+      self._conn = None
+
+
+_id_interner: IdInterner | None = None
+
+
+def get_id_interner() -> IdInterner:
+  """Get the process-wide interner (persistent when XBRL_ID_INTERN_PATH is set)."""
+  global _id_interner
+  if _id_interner is None:
+    _id_interner = IdInterner(env.XBRL_ID_INTERN_PATH)
+  return _id_interner
+
+
+def _create_id(content: str, namespace: str) -> str | int:
+  """Create an entity ID in the configured ID scheme."""
+  if env.XBRL_COMPACT_IDS and namespace in COMPACT_ID_NAMESPACES:
+    if namespace in INTERNED_ID_NAMESPACES:
+      return get_id_interner().intern(namespace, content)
+    return generate_compact_id(content, namespace)
+  return generate_deterministic_uuid7(content, namespace=namespace)
+
+
 # =============================================================================
 # ID Generation Functions
 # =============================================================================
 
 
-def create_element_id(uri: str) -> str:
+def create_element_id(uri: str) -> str | int:
   """Create an Element identifier from URI."""
-  return generate_deterministic_uuid7(uri, namespace="element")
+  return _create_id(uri, "element")
 
 
 def create_label_id(value: str, label_type: str, language: str) -> str:
@@ -49,14 +187,14 @@ def create_report_id(uri: str) -> str:
   return generate_deterministic_uuid7(uri, namespace="report")
 
 
-def create_fact_id(fact_uri: str) -> str:
+def create_fact_id(fact_uri: str) -> str | int:
   """
   Create a Fact identifier.
 
   Facts must have deterministic IDs based on URI for consistency
   across pipeline runs.
   """
-  return generate_deterministic_uuid7(fact_uri, namespace="fact")
+  return _create_id(fact_uri, "fact")
 
 
 def create_entity_id(entity_uri: str) -> str:
@@ -64,14 +202,14 @@ def create_entity_id(entity_uri: str) -> str:
   return generate_deterministic_uuid7(entity_uri, namespace="entity")
 
 
-def create_period_id(period_uri: str) -> str:
+def create_period_id(period_uri: str) -> str | int:
   """Create a Period identifier."""
-  return generate_deterministic_uuid7(period_uri, namespace="period")
+  return _create_id(period_uri, "period")
 
 
-def create_unit_id(unit_uri: str) -> str:
+def create_unit_id(unit_uri: str) -> str | int:
   """Create a Unit identifier."""
-  return generate_deterministic_uuid7(unit_uri, namespace="unit")
+  return _create_id(unit_uri, "unit")
 
 
 def create_factset_id(factset_uri: str) -> str:
@@ -79,9 +217,9 @@ def create_factset_id(factset_uri: str) -> str:
   return generate_deterministic_uuid7(factset_uri, namespace="factset")
 
 
-def create_dimension_id(dimension_uri: str) -> str:
+def create_dimension_id(dimension_uri: str) -> str | int:
   """Create a FactDimension identifier."""
-  return generate_deterministic_uuid7(dimension_uri, namespace="dimension")
+  return _create_id(dimension_uri, "dimension")
 
 
 def create_structure_id(structure_uri: str) -> str:
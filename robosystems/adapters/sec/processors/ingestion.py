@@ -6,8 +6,8 @@ instead of the proven consolidation + COPY approach.
 
 Flow:
 1. Discover ALL processed Parquet files in S3 (optionally filtered by year)
-2. Create DuckDB staging tables via Graph API from discovered files
-3. Trigger graph ingestion via Graph API (rebuilds graph from scratch)
+2. Stage them into DuckDB tables via Graph API, tracking each file by S3 key
+3. Trigger graph ingestion via Graph API (new files only, or a full rebuild)
 
 Architecture:
 - Worker communicates with Graph API via Graph API client
@@ -15,13 +15,14 @@ Architecture:
 - Works directly with processed files (many small files) instead of consolidated files
 - Tests performance with high file counts
 
-LIMITATION: This approach currently ALWAYS rebuilds the graph from scratch because it
-discovers and loads ALL files from S3, not just new/changed files. This is fundamentally
-different from the COPY-based approach which works incrementally with consolidated files.
+Ingestion is incremental by default: the DuckDB staging file registry records which
+processed files are already staged, so a run only reads and materializes new files.
+A full rebuild remains available and is used automatically when staging cannot be
+applied incrementally.
 
 To add a new company:
 1. Process the company's filings (creates processed files in S3)
-2. Run DuckDB-based ingestion (discovers ALL files and rebuilds entire graph)
+2. Run DuckDB-based ingestion (stages and materializes only the new files)
 
 Status: Testing phase - may replace the existing COPY-based pipeline if it proves
 more robust and maintainable at scale.
@@ -69,23 +70,29 @@ class XBRLDuckDBGraphProcessor:
 
   async def process_files(
     self,
-    rebuild: bool = True,
+    rebuild: bool = False,
     year: int | None = None,
   ) -> dict[str, Any]:
     """
     Process Parquet files into graph database using DuckDB-based pattern.
 
-    IMPORTANT: This approach always rebuilds the graph from scratch because
-    DuckDB staging tables contain ALL processed files from S3. Unlike the
-    COPY-based approach which uses consolidated files incrementally, this
-    method discovers all files and recreates the entire graph.
+    Incremental (default): every processed file is staged with its S3 key as
+    file_id. Files staged by an earlier run are skipped, so only new files
+    are read into DuckDB and only their rows are materialized into the graph.
+    Shared nodes (Entity, Element, Unit, Period, ...) that are already staged
+    or already in the graph are kept as they are: staging only appends
+    identifiers it has not seen and COPY skips existing primary keys.
+
+    The graph is rebuilt from all files when rebuild is requested, when
+    nothing has been staged yet, or when staging could not be applied
+    incrementally (processed files were removed or replaced, or the staging
+    tables predate file tracking).
 
     Args:
-        rebuild: Whether to rebuild graph from scratch (default: True).
-                 Setting to False will cause duplicate key errors if graph
-                 already contains data.
-        year: Optional year filter for processing. If provided, only files
-              from that year will be included in the rebuild.
+        rebuild: Delete and rebuild the graph from all processed files
+        year: Optional year filter for rebuilds. If provided, only files from
+              that year are included. Ignored for incremental runs, which
+              always cover all years.
 
     Returns:
         Processing results with statistics
@@ -112,6 +119,20 @@ class XBRLDuckDBGraphProcessor:
           "duration_seconds": time.time() - start_time,
         }
 
+      staged_tables: set[str] = set()
+      if not rebuild:
+        staged_tables = await self._staged_tables(client)
+        if not staged_tables:
+          logger.info("Nothing staged yet - building the graph from scratch")
+          rebuild = True
+        elif year is not None:
+          # Staging treats the file list as complete; a single year would
+          # look like every other year's files were removed
+          logger.warning(
+            f"Year filter {year} ignored for incremental ingestion (all years)"
+          )
+          year = None
+
       # Step 1: Discover processed files
       logger.info("Step 1: Discovering processed Parquet files...")
       tables_info = await self._discover_processed_files(year)
@@ -131,58 +152,57 @@ class XBRLDuckDBGraphProcessor:
       # Step 2: Handle LadybugDB database rebuild BEFORE creating DuckDB tables
       if rebuild:
         logger.info("Step 2: Rebuilding LadybugDB database...")
-        logger.info(
-          f"Rebuild requested - regenerating entire LadybugDB database for {self.graph_id}"
-        )
-        from robosystems.database import SessionFactory
-        from robosystems.models.iam import GraphSchema
-
-        db = SessionFactory()
-        try:
-          await client.delete_database(self.graph_id)
-          logger.info(f"Deleted LadybugDB database: {self.graph_id}")
-
-          schema = GraphSchema.get_active_schema(self.graph_id, db)
-          if not schema:
-            raise ValueError(f"No schema found for graph {self.graph_id}")
-
-          create_db_kwargs = {
-            "graph_id": self.graph_id,
-            "schema_type": schema.schema_type,
-            "custom_schema_ddl": schema.schema_ddl,
-          }
-
-          if schema.schema_type == "shared":
-            create_db_kwargs["repository_name"] = self.graph_id
-
-          await client.create_database(**create_db_kwargs)
-          logger.info(
-            f"Recreated LadybugDB database with schema type: {schema.schema_type}"
-          )
-        finally:
-          db.close()
+        await self._rebuild_database(client)
 
       # Step 3: Create DuckDB staging tables via Graph API
       logger.info("Step 3: Creating DuckDB staging tables via Graph API...")
-      await self._create_duckdb_tables(tables_info, client)
+      staging = await self._create_duckdb_tables(tables_info, client)
+
+      if not rebuild:
+        restaged = [
+          table_name
+          for table_name, response in staging.items()
+          if response.get("mode") == "full" and table_name in staged_tables
+        ]
+        if restaged:
+          logger.warning(
+            f"Staging rebuilt {len(restaged)} existing tables ({', '.join(restaged)}) "
+            f"- graph no longer matches staged files, rebuilding from scratch"
+          )
+          rebuild = True
+          await self._rebuild_database(client)
+          staging = await self._create_duckdb_tables(tables_info, client)
 
-      # Step 4: Trigger ingestion
+      # Step 4: Trigger ingestion (only new files when incremental)
       logger.info("Step 4: Triggering graph ingestion...")
-      ingestion_results = await self._trigger_ingestion(
-        list(tables_info.keys()), client, rebuild=False
-      )
+      if rebuild:
+        file_ids: dict[str, list[str] | None] = dict.fromkeys(tables_info)
+      else:
+        file_ids = {
+          table_name: response.get("file_ids")
+          for table_name, response in staging.items()
+          if response.get("mode") == "full" or response.get("file_ids")
+        }
+      ingestion_results = await self._trigger_ingestion(file_ids, client)
 
+      files_staged = sum(
+        response.get("files_scanned") or 0 for response in staging.values()
+      )
       duration = time.time() - start_time
 
       logger.info(
-        f"✅ SEC DuckDB-based ingestion complete in {duration:.2f}s: "
-        f"{ingestion_results.get('total_rows_ingested', 0)} rows ingested from {total_files} files"
+        f"✅ SEC DuckDB-based ingestion complete in {duration:.2f}s "
+        f"({'rebuild' if rebuild else 'incremental'}): "
+        f"{ingestion_results.get('total_rows_ingested', 0)} rows ingested from "
+        f"{files_staged} new of {total_files} files"
       )
 
       return {
         "status": "success",
+        "mode": "rebuild" if rebuild else "incremental",
         "tables_processed": len(tables_info),
         "total_files": total_files,
+        "files_staged": files_staged,
         "ingestion_results": ingestion_results,
         "duration_seconds": duration,
       }
@@ -195,6 +215,50 @@ class XBRLDuckDBGraphProcessor:
         "duration_seconds": time.time() - start_time,
       }
 
+  async def _staged_tables(self, graph_client) -> set[str]:
+    """Names of the DuckDB staging tables that already exist."""
+    tables = await graph_client.list_tables(self.graph_id)
+    return {table["table_name"] for table in tables}
+
+  async def _rebuild_database(self, graph_client) -> None:
+    """
+    Delete and recreate the LadybugDB database from its active schema.
+
+    Deleting the database also deletes its DuckDB staging database, so every
+    table is staged again from all files afterwards.
+    """
+    from robosystems.database import SessionFactory
+    from robosystems.models.iam import GraphSchema
+
+    logger.info(
+      f"Rebuild requested - regenerating entire LadybugDB database for {self.graph_id}"
+    )
+
+    db = SessionFactory()
+    try:
+      await graph_client.delete_database(self.graph_id)
+      logger.info(f"Deleted LadybugDB database: {self.graph_id}")
+
+      schema = GraphSchema.get_active_schema(self.graph_id, db)
+      if not schema:
+        raise ValueError(f"No schema found for graph {self.graph_id}")
+
+      create_db_kwargs = {
+        "graph_id": self.graph_id,
+        "schema_type": schema.schema_type,
+        "custom_schema_ddl": schema.schema_ddl,
+      }
+
+      if schema.schema_type == "shared":
+        create_db_kwargs["repository_name"] = self.graph_id
+
+      await graph_client.create_database(**create_db_kwargs)
+      logger.info(
+        f"Recreated LadybugDB database with schema type: {schema.schema_type}"
+      )
+    finally:
+      db.close()
+
   async def _discover_processed_files(
     self, year: int | None = None
   ) -> dict[str, list[str]]:
@@ -297,55 +361,64 @@ class XBRLDuckDBGraphProcessor:
     self,
     tables_info: dict[str, list[str]],
     graph_client,
-  ) -> None:
+  ) -> dict[str, dict[str, Any]]:
     """
     Create DuckDB staging tables for each discovered table via Graph API.
 
-    Passes the actual list of S3 file paths instead of wildcards to avoid
-    DuckDB prepared parameter issues.
+    Passes the complete list of S3 file paths, with each file's S3 key as its
+    file_id. Files staged by an earlier run are not read again.
 
     Args:
         tables_info: Dictionary mapping table names to S3 keys
         graph_client: Graph API client instance
+
+    Returns:
+        Dictionary mapping table names to table creation responses
     """
+    responses: dict[str, dict[str, Any]] = {}
+
     for table_name, s3_keys in tables_info.items():
       logger.info(f"Creating DuckDB table: {table_name} ({len(s3_keys)} files)")
 
-      # Build list of full S3 URIs
-      s3_files = [f"s3://{self.bucket}/{key}" for key in s3_keys]
+      # Build list of full S3 URIs, tracked by S3 key
+      file_id_map = {f"s3://{self.bucket}/{key}": key for key in s3_keys}
 
       try:
-        # Use graph client to call Graph API's table creation endpoint
-        # Pass the list of files instead of a wildcard pattern
         response = await graph_client.create_table(
           graph_id=self.graph_id,
           table_name=table_name,
-          s3_pattern=s3_files,  # Actually a list of files, not a pattern
+          s3_pattern=list(file_id_map),
+          file_id_map=file_id_map,
         )
+        responses[table_name] = response
 
         logger.info(
-          f"✓ Created DuckDB table {table_name}: "
-          f"{response.get('row_count', 0)} rows, {response.get('column_count', 0)} columns "
-          f"from {len(s3_keys)} files"
+          f"✓ Staged DuckDB table {table_name} ({response.get('mode', 'full')}): "
+          f"{response.get('files_scanned', len(s3_keys))} of {len(s3_keys)} files read"
         )
 
       except Exception as e:
         logger.error(f"Failed to create DuckDB table {table_name}: {e}")
         raise
 
+    return responses
+
   async def _trigger_ingestion(
     self,
-    table_names: list[str],
+    file_ids: dict[str, list[str] | None],
     graph_client,
-    rebuild: bool = False,
   ) -> dict[str, Any]:
     """
-    Trigger ingestion for all tables into LadybugDB graph via Graph API.
+    Trigger ingestion for tables into LadybugDB graph via Graph API.
+
+    Tables are materialized in order (node tables are discovered first). When
+    a selective materialization fails, its files are removed from staging so
+    the next incremental run stages and materializes them again.
 
     Args:
-        table_names: List of table names to ingest
+        file_ids: Table names to ingest, each with the file IDs to materialize
+            (None materializes the whole table)
         graph_client: Graph API client instance
-        rebuild: Ignored - rebuild is now handled in process_files before table creation
 
     Returns:
         Ingestion results with statistics
@@ -354,14 +427,18 @@ class XBRLDuckDBGraphProcessor:
     total_time_ms = 0.0
     results = []
 
-    for table_name in table_names:
-      logger.info(f"Materializing table: {table_name}")
+    for table_name, table_file_ids in file_ids.items():
+      logger.info(
+        f"Materializing table: {table_name}"
+        + (f" ({len(table_file_ids)} new files)" if table_file_ids else "")
+      )
 
       try:
         response = await graph_client.materialize_table(
           graph_id=self.graph_id,
           table_name=table_name,
           ignore_errors=True,
+          file_ids=table_file_ids,
         )
 
         total_rows += response.get("rows_ingested", 0)
@@ -383,6 +460,8 @@ class XBRLDuckDBGraphProcessor:
 
       except Exception as e:
         logger.error(f"Failed to materialize table {table_name}: {e}")
+        if table_file_ids:
+          await self._unstage_files(table_name, table_file_ids, graph_client)
         results.append(
           {
             "table_name": table_name,
@@ -396,3 +475,16 @@ class XBRLDuckDBGraphProcessor:
       "total_time_ms": total_time_ms,
       "tables": results,
     }
+
+  async def _unstage_files(
+    self, table_name: str, file_ids: list[str], graph_client
+  ) -> None:
+    """Remove files from a staging table so the next run picks them up again."""
+    for file_id in file_ids:
+      try:
+        await graph_client.delete_file_data(self.graph_id, table_name, file_id)
+      except Exception as e:
+        logger.error(
+          f"Failed to unstage {file_id} from {table_name} - "
+          f"run with rebuild to recover: {e}"
+        )
@@ -196,6 +196,21 @@ class XBRLSchemaAdapter:
     Returns:
         DataFrame with complete schema-compatible structure
     """
+    return pd.DataFrame([self.process_row_for_schema(table_name, data_dict)])
+
+  def process_row_for_schema(
+    self, table_name: str, data_dict: dict[str, Any]
+  ) -> dict[str, Any]:
+    """
+    Process data dictionary into a schema-compatible row.
+
+    Args:
+        table_name: Name of the target table/schema
+        data_dict: Raw data dictionary (may have missing columns)
+
+    Returns:
+        Row with every schema column, in schema order
+    """
     schema_name = self._resolve_schema_name(table_name)
     schema_info = self._get_schema_info(schema_name)
 
@@ -204,17 +219,16 @@ class XBRLSchemaAdapter:
         f"Schema not found for table {table_name} (resolved to {schema_name}), "
         f"returning data as-is"
       )
-      return pd.DataFrame([data_dict])
+      return dict(data_dict)
 
     processed_data = self._process_data_with_schema(data_dict, schema_info)
-    result_df = pd.DataFrame([processed_data])
 
     logger.debug(
       f"Processed {table_name} data with {len(processed_data)} columns "
       f"for schema {schema_name}"
     )
 
-    return result_df
+    return processed_data
 
   def validate_dataframe_schema(
     self, table_name: str, df: pd.DataFrame
@@ -428,6 +442,7 @@ class XBRLSchemaConfigGenerator:
       version=config.get("version", "1.0.0"),
       base_schema=config.get("base_schema", "base"),
       extensions=config.get("extensions", []),
+      compact_identifiers=config.get("compact_identifiers", False),
     )
 
   def _generate_ingest_config(self) -> SchemaIngestConfig:
@@ -48,7 +48,7 @@ class TextBlockExternalizer:
   def queue_value_for_s3(
     self,
     value: Any,
-    fact_id: str,
+    fact_id: str | int,
     entity_data: dict | None,
     report_data: dict | None,
   ) -> dict[str, Any] | None:
@@ -157,7 +157,7 @@ class TextBlockExternalizer:
   def externalize_value_to_s3(
     self,
     value: Any,
-    fact_id: str,
+    fact_id: str | int,
     entity_data: dict | None,
     report_data: dict | None,
   ) -> dict[str, Any] | None:
@@ -194,11 +194,8 @@ class TextBlockExternalizer:
       if not accession:
         accession = "unknown"
 
-      fact_id_short = (
-        fact_id[:FACT_ID_TRUNCATE_LENGTH]
-        if len(fact_id) > FACT_ID_TRUNCATE_LENGTH
-        else fact_id
-      )
+      # Compact IDs are integers
+      fact_id_short = str(fact_id)[:FACT_ID_TRUNCATE_LENGTH]
       s3_key = f"{year}/{cik}/{accession}/fact_{fact_id_short}.{file_extension}"
 
       logger.debug(f"Uploading large value to S3: s3://{self.bucket}/{s3_key}")
@@ -227,7 +224,7 @@ class TextBlockExternalizer:
 
   def _generate_s3_key(
     self,
-    fact_id: str,
+    fact_id: str | int,
     entity_data: dict | None,
     report_data: dict | None,
     file_extension: str,
@@ -253,11 +250,8 @@ class TextBlockExternalizer:
     if not accession:
       accession = "unknown"
 
-    fact_id_short = (
-      fact_id[:FACT_ID_TRUNCATE_LENGTH]
-      if len(fact_id) > FACT_ID_TRUNCATE_LENGTH
-      else fact_id
-    )
+    # Compact IDs are integers
+    fact_id_short = str(fact_id)[:FACT_ID_TRUNCATE_LENGTH]
     s3_key = f"{year}/{cik}/{accession}/fact_{fact_id_short}.{file_extension}"
 
     return s3_key
@@ -10,6 +10,7 @@ from robosystems.adapters.sec.client.arelle import ArelleClient
 from robosystems.adapters.sec.processors import (
   DataFrameManager,
   ParquetWriter,
+  TableBuffer,
   TextBlockExternalizer,
   create_dimension_id,
   create_element_id,
@@ -50,10 +51,12 @@ class XBRLGraphProcessor:
     output_dir="./data/output",
     schema_config=None,
     local_file_path=None,
+    arelle_client=None,
   ):
     logger.debug(f"Initializing XBRL processor for report URI: {report_uri}")
     self.report_uri = report_uri  # Keep original SEC URL for metadata
     self.local_file_path = local_file_path  # Local file for processing
+    self.arelle_client = arelle_client  # Warm client shared across filings
     self.entityId = entityId
     self.sec_filer = sec_filer
     self.sec_report = sec_report
@@ -63,6 +66,9 @@ class XBRLGraphProcessor:
     self.entity_data = None
     self.report_data = None
 
+    # Output rows per DataFrame attribute (see __getattr__)
+    self._tables: dict[str, TableBuffer] = {}
+
     # Track which elements have been fully processed to avoid duplicate label/reference creation
     self.processed_elements = set()
 
@@ -115,9 +121,9 @@ class XBRLGraphProcessor:
       # Initialize all DataFrames through the manager
       dataframes = self.df_manager.initialize_all_dataframes()
 
-      # Set DataFrames as instance attributes for backward compatibility
+      # Buffer rows per DataFrame; the DataFrames stay readable as attributes
       for df_attr_name, df in dataframes.items():
-        setattr(self, df_attr_name, df)
+        self._tables[df_attr_name] = TableBuffer(df)
 
       # Create dynamic DataFrame mapping
       self.schema_to_dataframe_mapping = (
@@ -146,6 +152,36 @@ class XBRLGraphProcessor:
       f"XBRL processor initialized with version {self.version} for output directory {self.output_dir}"
     )
 
+  def __getattr__(self, name):
+    """Build DataFrame attributes (e.g. ``facts_df``) from their row buffers."""
+    tables = self.__dict__.get("_tables")
+    if tables is not None and name in tables:
+      return tables[name].to_dataframe()
+    raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+  def __setattr__(self, name, value):
+    """Assigning a DataFrame attribute replaces the contents of its row buffer."""
+    tables = self.__dict__.get("_tables")
+    if tables is not None and name.endswith("_df") and isinstance(value, pd.DataFrame):
+      tables[name] = TableBuffer(value)
+      return
+    super().__setattr__(name, value)
+
+  def _table(self, df_attr_name: str) -> TableBuffer:
+    """Row buffer behind a DataFrame attribute, created on first use."""
+    table = self._tables.get(df_attr_name)
+    if table is None:
+      table = self._tables[df_attr_name] = TableBuffer()
+    return table
+
+  def _append_row(
+    self, df_attr_name: str, row: dict, schema_name: str | None = None
+  ) -> None:
+    """Append one output row, completed to the schema when one is named."""
+    if schema_name and self.schema_adapter:
+      row = self.schema_adapter.process_row_for_schema(schema_name, row)
+    self._table(df_attr_name).append(row)
+
   def safe_concat(
     self, existing_df: pd.DataFrame, new_df: pd.DataFrame
   ) -> pd.DataFrame:
@@ -199,7 +235,8 @@ class XBRLGraphProcessor:
 
     try:
       logger.debug("Initializing Arelle controller")
-      self.arelle_cntlr = ArelleClient().controller(self.instance_path)
+      arelle_client = self.arelle_client or ArelleClient()
+      self.arelle_cntlr = arelle_client.controller(self.instance_path)
 
       logger.info("Processing DTS (Discoverable Taxonomy Set)")
       self.make_dts()
@@ -216,6 +253,11 @@ class XBRLGraphProcessor:
 
       logger.error(f"Traceback: {traceback.format_exc()}")
       raise e
+    finally:
+      model = getattr(self, "arelle_cntlr", None)
+      if self.arelle_client and model is not None:
+        # Release the model so a reused controller does not accumulate filings
+        model.close()
 
   async def process_async(self):
     """Async version of process method for use in async contexts."""
@@ -329,17 +371,8 @@ class XBRLGraphProcessor:
         f"Entity {entity_data['name']} data prepared with {sum(1 for v in entity_data.values() if v is not None)} populated fields"
       )
 
-    # Add to entities DataFrame using schema adapter if available
-    if self.schema_adapter:
-      new_entity_df = self.schema_adapter.process_dataframe_for_schema(
-        "Entity", entity_data
-      )
-      logger.debug(
-        f"Schema adapter created entity DataFrame with {len(new_entity_df.columns)} columns: {list(new_entity_df.columns)}"
-      )
-    else:
-      new_entity_df = pd.DataFrame([entity_data])
-    self.entities_df = self.safe_concat(self.entities_df, new_entity_df)
+    # Add to entities DataFrame using schema adapter to populate all columns
+    self._append_row("entities_df", entity_data, "Entity")
 
     self.entity_data = entity_data
     return entity_data
@@ -418,17 +451,8 @@ class XBRLGraphProcessor:
       report_data["is_inline_xbrl"] = self.sec_report.get("isInlineXBRL", False)
       logger.info(f"Report {report_data['name']} data prepared")
 
-    # Add to reports DataFrame using schema adapter if available
-    if self.schema_adapter:
-      new_report_df = self.schema_adapter.process_dataframe_for_schema(
-        "Report", report_data
-      )
-      logger.debug(
-        f"Schema adapter created report DataFrame with {len(new_report_df.columns)} columns: {list(new_report_df.columns)}"
-      )
-    else:
-      new_report_df = pd.DataFrame([report_data])
-    self.reports_df = self.safe_concat(self.reports_df, new_report_df)
+    # Add to reports DataFrame using schema adapter to populate all columns
+    self._append_row("reports_df", report_data, "Report")
 
     # Add entity-report relationship if entity exists
     if self.entity_data:
@@ -438,15 +462,7 @@ class XBRLGraphProcessor:
         "to": report_data["identifier"],
         "report_context": f"Filing: {report_data.get('form', 'Unknown')}",
       }
-      if self.schema_adapter:
-        new_entity_report_df = self.schema_adapter.process_dataframe_for_schema(
-          "ENTITY_HAS_REPORT", entity_report_rel
-        )
-      else:
-        new_entity_report_df = pd.DataFrame([entity_report_rel])
-      self.entity_reports_df = self.safe_concat(
-        self.entity_reports_df, new_entity_report_df
-      )
+      self._append_row("entity_reports_df", entity_report_rel, "ENTITY_HAS_REPORT")
 
     logger.debug("Report data creation completed")
     self.report_data = report_data
@@ -531,8 +547,7 @@ class XBRLGraphProcessor:
     factset_uri = f"{self.report_uri}#factset"
     factset_id = create_factset_id(factset_uri)
     factset_data = {"identifier": factset_id}
-    new_factset_df = pd.DataFrame([factset_data])
-    self.fact_sets_df = self.safe_concat(self.fact_sets_df, new_factset_df)
+    self._append_row("fact_sets_df", factset_data)
 
     # Connect fact set to report
     if self.report_data:
@@ -541,10 +556,7 @@ class XBRLGraphProcessor:
         "to": factset_id,
         "fact_set_context": f"Report facts for {self.report_data.get('form', 'filing')}",
       }
-      new_report_factset_df = pd.DataFrame([report_factset_rel])
-      self.report_fact_sets_df = self.safe_concat(
-        self.report_fact_sets_df, new_report_factset_df
-      )
+      self._append_row("report_fact_sets_df", report_factset_rel)
 
     self.report_factset_id = factset_id
     logger.debug(f"Created fact set with ID: {factset_id}")
@@ -565,8 +577,7 @@ class XBRLGraphProcessor:
     logger.debug(f"Processing fact: {fact_uri}")
 
     # Check if fact already exists to prevent duplicates
-    existing_fact = self.facts_df[self.facts_df["identifier"] == identifier]
-    if not existing_fact.empty:
+    if self._table("facts_df").find(identifier=identifier) is not None:
       logger.debug(f"Fact already exists, skipping duplicate: {fact_uri}")
       # Return early to avoid creating duplicate relationships
       return
@@ -624,12 +635,7 @@ class XBRLGraphProcessor:
     logger.debug(f"Created new fact: {fact_uri}")
 
     # Add fact to DataFrame using schema adapter to ensure all columns are populated
-    if self.schema_adapter:
-      new_fact_df = self.schema_adapter.process_dataframe_for_schema("Fact", fact_data)
-    else:
-      new_fact_df = pd.DataFrame([fact_data])
-
-    self.facts_df = self.safe_concat(self.facts_df, new_fact_df)
+    self._append_row("facts_df", fact_data, "Fact")
 
     # Connect fact to report
     if self.report_data:
@@ -638,21 +644,14 @@ class XBRLGraphProcessor:
         "to": identifier,
         "fact_context": f"Fact from {fact_data.get('type', 'unknown')} fact",
       }
-      new_report_fact_df = pd.DataFrame([report_fact_rel])
-      self.report_facts_df = self.safe_concat(self.report_facts_df, new_report_fact_df)
+      self._append_row("report_facts_df", report_fact_rel)
 
     # Connect fact to fact set
     factset_fact_rel = {
       "from": self.report_factset_id,
       "to": identifier,
     }
-    new_factset_fact_df = pd.DataFrame([factset_fact_rel])
-    if hasattr(self, "fact_set_contains_facts_df"):
-      self.fact_set_contains_facts_df = self.safe_concat(
-        self.fact_set_contains_facts_df, new_factset_fact_df
-      )
-    else:
-      self.fact_set_contains_facts_df = new_factset_fact_df
+    self._append_row("fact_set_contains_facts_df", factset_fact_rel)
 
     if xfact.unit is not None:
       logger.debug(f"Processing numeric fact with decimals: {fact_data['decimals']}")
@@ -693,8 +692,8 @@ class XBRLGraphProcessor:
       unit_identifier = create_unit_id(uri)
 
       # Check if unit already exists globally
-      existing_unit = self.units_df[self.units_df["identifier"] == unit_identifier]
-      if existing_unit.empty:
+      existing_unit = self._table("units_df").find(identifier=unit_identifier)
+      if existing_unit is None:
         unit_data = {
           "identifier": unit_identifier,
           "uri": uri,
@@ -705,17 +704,10 @@ class XBRLGraphProcessor:
         }
 
         # Use schema adapter to ensure all columns are populated
-        if self.schema_adapter:
-          new_unit_df = self.schema_adapter.process_dataframe_for_schema(
-            "Unit", unit_data
-          )
-        else:
-          new_unit_df = pd.DataFrame([unit_data])
-
-        self.units_df = self.safe_concat(self.units_df, new_unit_df)
+        self._append_row("units_df", unit_data, "Unit")
         logger.debug(f"Created new unit: {uri}")
       else:
-        unit_data = existing_unit.iloc[0].to_dict()
+        unit_data = existing_unit
 
     elif xfact.unit.isDivide:
       nummeasure, numval, numuri = make_unit_uri(xfact.unit.measures[0][0])
@@ -732,8 +724,8 @@ class XBRLGraphProcessor:
       unit_identifier = create_unit_id(fraction_uri)
 
       # Check if unit already exists globally
-      existing_unit = self.units_df[self.units_df["identifier"] == unit_identifier]
-      if existing_unit.empty:
+      existing_unit = self._table("units_df").find(identifier=unit_identifier)
+      if existing_unit is None:
         unit_data = {
           "identifier": unit_identifier,
           "uri": fraction_uri,  # Use generated URI instead of None
@@ -744,17 +736,10 @@ class XBRLGraphProcessor:
         }
 
         # Use schema adapter to ensure all columns are populated
-        if self.schema_adapter:
-          new_unit_df = self.schema_adapter.process_dataframe_for_schema(
-            "Unit", unit_data
-          )
-        else:
-          new_unit_df = pd.DataFrame([unit_data])
-
-        self.units_df = self.safe_concat(self.units_df, new_unit_df)
+        self._append_row("units_df", unit_data, "Unit")
         logger.debug(f"Created new divided unit: {fraction_measure}")
       else:
-        unit_data = existing_unit.iloc[0].to_dict()
+        unit_data = existing_unit
 
     # Create fact-unit relationship
     if unit_data:
@@ -765,8 +750,7 @@ class XBRLGraphProcessor:
         "to": unit_identifier,
         "unit_context": f"Unit: {unit_data.get('measure', 'unknown')}",
       }
-      new_fact_unit_df = pd.DataFrame([fact_unit_rel])
-      self.fact_units_df = self.safe_concat(self.fact_units_df, new_fact_unit_df)
+      self._append_row("fact_units_df", fact_unit_rel)
 
   def make_fact_dimensions(self, fact_data, xfact):
     logger.debug("Processing fact dimensions")
@@ -800,22 +784,11 @@ class XBRLGraphProcessor:
         fact_dim_identifier = create_dimension_id(fact_dim_uri)
 
         # Check if fact dimension already exists
-        if (
-          hasattr(self, "fact_dimensions_df")
-          and not self.fact_dimensions_df.empty
-          and "axis_uri" in self.fact_dimensions_df.columns
-          and "member_uri" in self.fact_dimensions_df.columns
-          and "type" in self.fact_dimensions_df.columns
-        ):
-          existing_fact_dim = self.fact_dimensions_df[
-            (self.fact_dimensions_df["axis_uri"] == axis_uri)
-            & (self.fact_dimensions_df["member_uri"] == member_uri)
-            & (self.fact_dimensions_df["type"] == axis_type)
-          ]
-        else:
-          existing_fact_dim = pd.DataFrame()  # Empty dataframe
+        existing_fact_dim = self._table("fact_dimensions_df").find(
+          axis_uri=axis_uri, member_uri=member_uri, type=axis_type
+        )
 
-        if existing_fact_dim.empty:
+        if existing_fact_dim is None:
           fact_dim_data = {
             "identifier": fact_dim_identifier,
             "axis_uri": axis_uri,
@@ -824,13 +797,7 @@ class XBRLGraphProcessor:
             "is_explicit": True,
             "is_typed": False,
           }
-          new_fact_dim_df = pd.DataFrame([fact_dim_data])
-          if hasattr(self, "fact_dimensions_df") and not self.fact_dimensions_df.empty:
-            self.fact_dimensions_df = self.safe_concat(
-              self.fact_dimensions_df, new_fact_dim_df
-            )
-          else:
-            self.fact_dimensions_df = new_fact_dim_df
+          self._append_row("fact_dimensions_df", fact_dim_data)
           logger.debug(f"Created new fact dimension: {member_uri}")
 
           # Create axis element if needed
@@ -845,16 +812,7 @@ class XBRLGraphProcessor:
               "from": fact_dim_identifier,
               "to": axis_element_data["identifier"],
             }
-            new_fact_dim_elem_df = pd.DataFrame([fact_dim_axis_rel])
-            if (
-              hasattr(self, "fact_dimension_axis_element_rel_df")
-              and not self.fact_dimension_axis_element_rel_df.empty
-            ):
-              self.fact_dimension_axis_element_rel_df = self.safe_concat(
-                self.fact_dimension_axis_element_rel_df, new_fact_dim_elem_df
-              )
-            else:
-              self.fact_dimension_axis_element_rel_df = new_fact_dim_elem_df
+            self._append_row("fact_dimension_axis_element_rel_df", fact_dim_axis_rel)
 
           # Create fact dimension to member element relationship
           if member_element_data:
@@ -862,18 +820,11 @@ class XBRLGraphProcessor:
               "from": fact_dim_identifier,
               "to": member_element_data["identifier"],
             }
-            new_fact_dim_elem_df = pd.DataFrame([fact_dim_member_rel])
-            if (
-              hasattr(self, "fact_dimension_member_element_rel_df")
-              and not self.fact_dimension_member_element_rel_df.empty
-            ):
-              self.fact_dimension_member_element_rel_df = self.safe_concat(
-                self.fact_dimension_member_element_rel_df, new_fact_dim_elem_df
-              )
-            else:
-              self.fact_dimension_member_element_rel_df = new_fact_dim_elem_df
+            self._append_row(
+              "fact_dimension_member_element_rel_df", fact_dim_member_rel
+            )
         else:
-          fact_dim_identifier = existing_fact_dim.iloc[0]["identifier"]
+          fact_dim_identifier = existing_fact_dim["identifier"]
 
       elif mem.isTyped:
         typed_member = mem.stringValue
@@ -884,22 +835,11 @@ class XBRLGraphProcessor:
         fact_dim_identifier = create_dimension_id(fact_dim_uri)
 
         # Check if fact dimension already exists
-        if (
-          hasattr(self, "fact_dimensions_df")
-          and not self.fact_dimensions_df.empty
-          and "axis_uri" in self.fact_dimensions_df.columns
-          and "member_uri" in self.fact_dimensions_df.columns
-          and "type" in self.fact_dimensions_df.columns
-        ):
-          existing_fact_dim = self.fact_dimensions_df[
-            (self.fact_dimensions_df["axis_uri"] == axis_uri)
-            & (self.fact_dimensions_df["member_uri"] == typed_member)
-            & (self.fact_dimensions_df["type"] == axis_type)
-          ]
-        else:
-          existing_fact_dim = pd.DataFrame()  # Empty dataframe
+        existing_fact_dim = self._table("fact_dimensions_df").find(
+          axis_uri=axis_uri, member_uri=typed_member, type=axis_type
+        )
 
-        if existing_fact_dim.empty:
+        if existing_fact_dim is None:
           fact_dim_data = {
             "identifier": fact_dim_identifier,
             "axis_uri": axis_uri,
@@ -908,13 +848,7 @@ class XBRLGraphProcessor:
             "is_explicit": False,
             "is_typed": True,
           }
-          new_fact_dim_df = pd.DataFrame([fact_dim_data])
-          if hasattr(self, "fact_dimensions_df") and not self.fact_dimensions_df.empty:
-            self.fact_dimensions_df = self.safe_concat(
-              self.fact_dimensions_df, new_fact_dim_df
-            )
-          else:
-            self.fact_dimensions_df = new_fact_dim_df
+          self._append_row("fact_dimensions_df", fact_dim_data)
           logger.debug(f"Created new typed fact dimension: {typed_member}")
 
           # Create axis element if needed
@@ -926,18 +860,9 @@ class XBRLGraphProcessor:
               "from": fact_dim_identifier,
               "to": axis_element_data["identifier"],
             }
-            new_fact_dim_elem_df = pd.DataFrame([fact_dim_axis_rel])
-            if (
-              hasattr(self, "fact_dimension_axis_element_rel_df")
-              and not self.fact_dimension_axis_element_rel_df.empty
-            ):
-              self.fact_dimension_axis_element_rel_df = self.safe_concat(
-                self.fact_dimension_axis_element_rel_df, new_fact_dim_elem_df
-              )
-            else:
-              self.fact_dimension_axis_element_rel_df = new_fact_dim_elem_df
+            self._append_row("fact_dimension_axis_element_rel_df", fact_dim_axis_rel)
         else:
-          fact_dim_identifier = existing_fact_dim.iloc[0]["identifier"]
+          fact_dim_identifier = existing_fact_dim["identifier"]
 
       # Create fact to dimension relationship
       if fact_dim_identifier:
@@ -945,27 +870,7 @@ class XBRLGraphProcessor:
           "from": fact_data["identifier"],
           "to": fact_dim_identifier,
         }
-        new_fact_dim_rel_df = pd.DataFrame([fact_dim_rel])
-
-        # Validate columns before concatenation to prevent schema mismatches
-        expected_columns = {"from", "to"}
-        if (
-          hasattr(self, "fact_has_dimension_rel_df")
-          and not self.fact_has_dimension_rel_df.empty
-        ):
-          existing_columns = set(self.fact_has_dimension_rel_df.columns)
-          if existing_columns != expected_columns:
-            logger.error(
-              f"fact_has_dimension_rel_df has wrong columns: {existing_columns}"
-            )
-            # Reset the DataFrame with correct schema
-            self.fact_has_dimension_rel_df = pd.DataFrame(
-              columns=list(expected_columns)
-            )
-
-        self.fact_has_dimension_rel_df = self.safe_concat(
-          self.fact_has_dimension_rel_df, new_fact_dim_rel_df
-        )
+        self._append_row("fact_has_dimension_rel_df", fact_dim_rel)
 
   def make_entity_from_context(self, fact_data, xfact):
     """Process entity information from XBRL context.
@@ -1003,8 +908,8 @@ class XBRLGraphProcessor:
       entity_identifier = create_entity_id(canonical_uri)
 
       # Check if this subsidiary entity already exists
-      existing_entity = self.entities_df[self.entities_df["uri"] == canonical_uri]
-      if existing_entity.empty:
+      existing_entity = self._table("entities_df").find(uri=canonical_uri)
+      if existing_entity is None:
         entity_data = {
           "identifier": entity_identifier,  # Primary key - deterministic UUID5
           "uri": canonical_uri,
@@ -1019,14 +924,7 @@ class XBRLGraphProcessor:
         }
 
         # Use schema adapter to ensure all columns are populated
-        if self.schema_adapter:
-          new_entity_df = self.schema_adapter.process_dataframe_for_schema(
-            "Entity", entity_data
-          )
-        else:
-          new_entity_df = pd.DataFrame([entity_data])
-
-        self.entities_df = self.safe_concat(self.entities_df, new_entity_df)
+        self._append_row("entities_df", entity_data, "Entity")
         logger.debug(
           f"Created subsidiary entity: {canonical_uri} with ID: {entity_identifier}"
         )
@@ -1037,8 +935,7 @@ class XBRLGraphProcessor:
       "to": entity_identifier,
       "entity_context": f"Entity: {entity_id}",
     }
-    new_fact_entity_df = pd.DataFrame([fact_entity_rel])
-    self.fact_entities_df = self.safe_concat(self.fact_entities_df, new_fact_entity_df)
+    self._append_row("fact_entities_df", fact_entity_rel)
 
   def make_concept(self, fact_data, xfact):
     logger.debug("Processing concept for fact")
@@ -1059,10 +956,7 @@ class XBRLGraphProcessor:
           "from": fact_data["identifier"],  # Fact HAS element
           "to": element_data["identifier"],
         }
-        new_fact_element_df = pd.DataFrame([fact_element_rel])
-        self.fact_elements_df = self.safe_concat(
-          self.fact_elements_df, new_fact_element_df
-        )
+        self._append_row("fact_elements_df", fact_element_rel)
 
       return element_data
 
@@ -1080,10 +974,8 @@ class XBRLGraphProcessor:
       period_identifier = create_period_id(period_uri)
 
       # Check if period already exists globally
-      existing_period = self.periods_df[
-        self.periods_df["identifier"] == period_identifier
-      ]
-      if existing_period.empty:
+      existing_period = self._table("periods_df").find(identifier=period_identifier)
+      if existing_period is None:
         # Compute fiscal year and other time series fields (Claude Opus recommendation)
         instant_dt = datetime.strptime(instant_date, "%Y-%m-%d")
         fiscal_year = instant_dt.year
@@ -1120,8 +1012,7 @@ class XBRLGraphProcessor:
           "period_type": "instant",  # Clearly identify as instant
           "is_ytd": False,  # Instant values are not cumulative
         }
-        new_period_df = pd.DataFrame([period_data])
-        self.periods_df = self.safe_concat(self.periods_df, new_period_df)
+        self._append_row("periods_df", period_data)
         logger.debug(f"Created new instant period: {period_uri}")
 
     elif xfact.context.isStartEndPeriod:
@@ -1134,10 +1025,8 @@ class XBRLGraphProcessor:
       period_identifier = create_period_id(period_uri)
 
       # Check if period already exists globally
-      existing_period = self.periods_df[
-        self.periods_df["identifier"] == period_identifier
-      ]
-      if existing_period.empty:
+      existing_period = self._table("periods_df").find(identifier=period_identifier)
+      if existing_period is None:
         # Compute fiscal year, quarter and duration analysis (Claude Opus recommendation)
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
@@ -1204,8 +1093,7 @@ class XBRLGraphProcessor:
           "period_type": period_type,  # NEW: quarterly, semi_annual, nine_months, annual, other
           "is_ytd": is_ytd,  # NEW: True for cumulative YTD periods
         }
-        new_period_df = pd.DataFrame([period_data])
-        self.periods_df = self.safe_concat(self.periods_df, new_period_df)
+        self._append_row("periods_df", period_data)
         logger.debug(f"Created new start-end period: {period_uri}")
 
     elif xfact.context.isForeverPeriod:
@@ -1216,10 +1104,8 @@ class XBRLGraphProcessor:
       period_identifier = create_period_id(period_uri)
 
       # Check if period already exists globally
-      existing_period = self.periods_df[
-        self.periods_df["identifier"] == period_identifier
-      ]
-      if existing_period.empty:
+      existing_period = self._table("periods_df").find(identifier=period_identifier)
+      if existing_period is None:
         period_data = {
           "identifier": period_identifier,
           "uri": period_uri,
@@ -1235,8 +1121,7 @@ class XBRLGraphProcessor:
           "period_type": "forever",  # NEW: Clearly identify as forever
           "is_ytd": False,  # Forever is not YTD
         }
-        new_period_df = pd.DataFrame([period_data])
-        self.periods_df = self.safe_concat(self.periods_df, new_period_df)
+        self._append_row("periods_df", period_data)
         logger.debug("Created new forever period")
     else:
       # Fallback for unknown period types
@@ -1248,10 +1133,8 @@ class XBRLGraphProcessor:
       # Use deterministic period ID for the report context
       period_identifier = create_period_id(f"{report_id}#{period_uri}")
 
-      existing_period = self.periods_df[
-        self.periods_df["identifier"] == period_identifier
-      ]
-      if existing_period.empty:
+      existing_period = self._table("periods_df").find(identifier=period_identifier)
+      if existing_period is None:
         period_data = {
           "identifier": period_identifier,
           "uri": period_uri,
@@ -1260,8 +1143,7 @@ class XBRLGraphProcessor:
           "end_date": None,
           "forever_date": False,
         }
-        new_period_df = pd.DataFrame([period_data])
-        self.periods_df = self.safe_concat(self.periods_df, new_period_df)
+        self._append_row("periods_df", period_data)
         logger.debug("Created fallback unknown period")
 
     # Create fact-period relationship
@@ -1278,8 +1160,7 @@ class XBRLGraphProcessor:
         "to": period_identifier,
         "period_context": f"Period: {period_uri.split('#')[-1] if '#' in period_uri else 'unknown'}",
       }
-      new_fact_period_df = pd.DataFrame([fact_period_rel])
-      self.fact_periods_df = self.safe_concat(self.fact_periods_df, new_fact_period_df)
+      self._append_row("fact_periods_df", fact_period_rel)
 
   def make_taxonomy(self):
     if not hasattr(self, "taxonomy_uri") or not self.taxonomy_uri:
@@ -1291,18 +1172,15 @@ class XBRLGraphProcessor:
     taxonomy_identifier = create_taxonomy_id(self.taxonomy_uri)
 
     # Check if taxonomy already exists
-    existing_taxonomy = self.taxonomies_df[
-      self.taxonomies_df["uri"] == self.taxonomy_uri
-    ]
-    if existing_taxonomy.empty:
+    existing_taxonomy = self._table("taxonomies_df").find(uri=self.taxonomy_uri)
+    if existing_taxonomy is None:
       taxonomy_data = {"identifier": taxonomy_identifier, "uri": self.taxonomy_uri}
-      new_taxonomy_df = pd.DataFrame([taxonomy_data])
-      self.taxonomies_df = self.safe_concat(self.taxonomies_df, new_taxonomy_df)
+      self._append_row("taxonomies_df", taxonomy_data)
       logger.debug(f"Created new taxonomy: {self.taxonomy_uri}")
       self.taxonomy_data = taxonomy_data
     else:
       # Use existing taxonomy data
-      self.taxonomy_data = existing_taxonomy.iloc[0].to_dict()
+      self.taxonomy_data = existing_taxonomy
 
     # Connect taxonomy to report
     if self.report_data:
@@ -1312,16 +1190,7 @@ class XBRLGraphProcessor:
         "to": taxonomy_identifier,
         "taxonomy_context": f"Uses taxonomy: {self.taxonomy_uri.split('/')[-1] if '/' in self.taxonomy_uri else 'unknown'}",
       }
-      new_report_taxonomy_df = pd.DataFrame([report_taxonomy_rel])
-      if (
-        hasattr(self, "report_uses_taxonomy_df")
-        and not self.report_uses_taxonomy_df.empty
-      ):
-        self.report_uses_taxonomy_df = self.safe_concat(
-          self.report_uses_taxonomy_df, new_report_taxonomy_df
-        )
-      else:
-        self.report_uses_taxonomy_df = new_report_taxonomy_df
+      self._append_row("report_uses_taxonomy_df", report_taxonomy_rel)
 
     self.make_structures()
     logger.debug("Taxonomy creation completed")
@@ -1351,10 +1220,8 @@ class XBRLGraphProcessor:
       structure_uri = f"{self.taxonomy_uri}#{role.id}"
 
       # Check if structure already exists
-      existing_structure = self.structures_df[
-        self.structures_df["uri"] == structure_uri
-      ]
-      if existing_structure.empty:
+      existing_structure = self._table("structures_df").find(uri=structure_uri)
+      if existing_structure is None:
         # Make structure identifier filing-specific using accession number to avoid cross-filing conflicts
         accession_number = (
           self.report_data.get("accession_number", "unknown")
@@ -1393,8 +1260,7 @@ class XBRLGraphProcessor:
           "type": network_type,
           "name": network_name,
         }
-        new_structure_df = pd.DataFrame([structure_data])
-        self.structures_df = self.safe_concat(self.structures_df, new_structure_df)
+        self._append_row("structures_df", structure_data)
         logger.debug(f"Created new structure: {structure_uri} with ID: {structure_id}")
 
         # Connect structure to taxonomy
@@ -1404,12 +1270,9 @@ class XBRLGraphProcessor:
             "to": self.taxonomy_data["identifier"],
             "taxonomy_context": f"Taxonomy: {self.taxonomy_data.get('uri', 'unknown')}",
           }
-          new_structure_taxonomy_df = pd.DataFrame([structure_taxonomy_rel])
-          self.structure_taxonomies_df = self.safe_concat(
-            self.structure_taxonomies_df, new_structure_taxonomy_df
-          )
+          self._append_row("structure_taxonomies_df", structure_taxonomy_rel)
       else:
-        structure_data = existing_structure.iloc[0].to_dict()
+        structure_data = existing_structure
         logger.debug(
           f"Using existing structure: {structure_uri} with ID: {structure_data.get('identifier', 'unknown')}"
         )
@@ -1461,10 +1324,7 @@ class XBRLGraphProcessor:
           "preferred_label": r.preferredLabel if r.preferredLabel is not None else None,
         }
 
-        new_association_df = pd.DataFrame([association_data])
-        self.associations_df = self.safe_concat(
-          self.associations_df, new_association_df
-        )
+        self._append_row("associations_df", association_data)
         logger.debug(
           f"Created association between {getattr(to_ele, 'name', 'unknown') if to_ele is not None else 'unknown'} and {getattr(from_ele, 'name', 'unknown') if from_ele is not None else 'unknown'}"
         )
@@ -1476,20 +1336,14 @@ class XBRLGraphProcessor:
             "from": association_id,
             "to": parent_element_data["identifier"],
           }
-          new_assoc_from_df = pd.DataFrame([assoc_from_rel])
-          self.association_from_elements_df = self.safe_concat(
-            self.association_from_elements_df, new_assoc_from_df
-          )
+          self._append_row("association_from_elements_df", assoc_from_rel)
 
           # Association TO element (child in hierarchy)
           assoc_to_rel = {
             "from": association_id,
             "to": child_element_data["identifier"],
           }
-          new_assoc_to_df = pd.DataFrame([assoc_to_rel])
-          self.association_to_elements_df = self.safe_concat(
-            self.association_to_elements_df, new_assoc_to_df
-          )
+          self._append_row("association_to_elements_df", assoc_to_rel)
 
         # Connect association to structure
         structure_assoc_rel = {
@@ -1497,10 +1351,7 @@ class XBRLGraphProcessor:
           "to": association_id,
           "association_context": f"Association: {association_data.get('type', 'unknown')}",
         }
-        new_structure_assoc_df = pd.DataFrame([structure_assoc_rel])
-        self.structure_associations_df = self.safe_concat(
-          self.structure_associations_df, new_structure_assoc_df
-        )
+        self._append_row("structure_associations_df", structure_assoc_rel)
 
   def make_element(self, xconcept):
     if xconcept.qname is None:
@@ -1561,14 +1412,7 @@ class XBRLGraphProcessor:
     element_data = self.make_element_classification(element_data, xconcept)
 
     # Use schema adapter to ensure all columns are populated
-    if self.schema_adapter:
-      new_element_df = self.schema_adapter.process_dataframe_for_schema(
-        "Element", element_data
-      )
-    else:
-      new_element_df = pd.DataFrame([element_data])
-
-    self.elements_df = self.safe_concat(self.elements_df, new_element_df)
+    self._append_row("elements_df", element_data, "Element")
     logger.debug(
       f"Created new element: {concept_uri} with global ID: {element_identifier}"
     )
@@ -1660,8 +1504,7 @@ class XBRLGraphProcessor:
       }
 
       # With global identifiers, labels can be deduplicated across reports
-      new_label_df = pd.DataFrame([label_data])
-      self.labels_df = self.safe_concat(self.labels_df, new_label_df)
+      self._append_row("labels_df", label_data)
 
       # Create element-label relationship
       element_label_rel = {
@@ -1669,10 +1512,7 @@ class XBRLGraphProcessor:
         "to": label_identifier,
         "label_context": f"Label: {label_data.get('type', 'unknown')}",
       }
-      new_element_label_df = pd.DataFrame([element_label_rel])
-      self.element_labels_df = self.safe_concat(
-        self.element_labels_df, new_element_label_df
-      )
+      self._append_row("element_labels_df", element_label_rel)
 
       # Create taxonomy-label relationship
       if hasattr(self, "taxonomy_data"):
@@ -1681,10 +1521,7 @@ class XBRLGraphProcessor:
           "to": label_identifier,
           "label_context": f"Taxonomy label: {label_data.get('type', 'unknown')}",
         }
-        new_taxonomy_label_df = pd.DataFrame([taxonomy_label_rel])
-        self.taxonomy_labels_df = self.safe_concat(
-          self.taxonomy_labels_df, new_taxonomy_label_df
-        )
+        self._append_row("taxonomy_labels_df", taxonomy_label_rel)
 
   def make_element_references(self, element_data, xconcept):
     logger.debug(f"Processing references for element: {element_data['uri']}")
@@ -1707,8 +1544,7 @@ class XBRLGraphProcessor:
         }
 
         # With global identifiers, references can be deduplicated across reports
-        new_reference_df = pd.DataFrame([reference_data])
-        self.references_df = self.safe_concat(self.references_df, new_reference_df)
+        self._append_row("references_df", reference_data)
 
         # Create element-reference relationship
         element_ref_rel = {
@@ -1716,10 +1552,7 @@ class XBRLGraphProcessor:
           "to": reference_identifier,
           "reference_context": f"Reference: {reference_data.get('type', 'unknown')}",
         }
-        new_element_ref_df = pd.DataFrame([element_ref_rel])
-        self.element_references_df = self.safe_concat(
-          self.element_references_df, new_element_ref_df
-        )
+        self._append_row("element_references_df", element_ref_rel)
 
         # Create taxonomy-reference relationship
         if hasattr(self, "taxonomy_data"):
@@ -1728,7 +1561,4 @@ class XBRLGraphProcessor:
             "to": reference_identifier,
             "reference_context": f"Taxonomy reference: {reference_data.get('type', 'unknown')}",
           }
-          new_taxonomy_ref_df = pd.DataFrame([taxonomy_ref_rel])
-          self.taxonomy_references_df = self.safe_concat(
-            self.taxonomy_references_df, new_taxonomy_ref_df
-          )
+          self._append_row("taxonomy_references_df", taxonomy_ref_rel)
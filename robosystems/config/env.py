@@ -435,11 +435,18 @@ class EnvConfig:
   GRAPH_MAX_REQUEST_SIZE = get_int_env("GRAPH_MAX_REQUEST_SIZE", GRAPH_MAX_REQUEST_SIZE)
   GRAPH_CONNECT_TIMEOUT = get_float_env("GRAPH_CONNECT_TIMEOUT", GRAPH_CONNECT_TIMEOUT)
   GRAPH_READ_TIMEOUT = get_float_env("GRAPH_READ_TIMEOUT", GRAPH_READ_TIMEOUT)
+  # Long-lived HTTP clients kept per graph instance URL (0 disables pooling)
+  GRAPH_CLIENT_POOL_SIZE = get_int_env("GRAPH_CLIENT_POOL_SIZE", 64)
 
   # Graph Resiliency and Circuit Breaker Configuration (applies to all backends)
   GRAPH_INSTANCE_CACHE_TTL = get_int_env(
     "GRAPH_INSTANCE_CACHE_TTL", GRAPH_INSTANCE_CACHE_TTL
   )
+  # In-process graph location cache in front of the Valkey location cache
+  GRAPH_LOCATION_CACHE_TTL = get_int_env("GRAPH_LOCATION_CACHE_TTL", 30)
+  GRAPH_LOCATION_CACHE_MAX_ENTRIES = get_int_env(
+    "GRAPH_LOCATION_CACHE_MAX_ENTRIES", 4096
+  )
   GRAPH_CIRCUIT_BREAKER_THRESHOLD = get_int_env(
     "GRAPH_CIRCUIT_BREAKER_THRESHOLD", GRAPH_CIRCUIT_BREAKER_THRESHOLD
   )
@@ -482,10 +489,21 @@ class EnvConfig:
   LBUG_MAX_DATABASES_PER_NODE = get_int_env(
     "LBUG_MAX_DATABASES_PER_NODE", MAX_DATABASES_PER_NODE
   )
+  # Minimum seconds between checks of the database directory for out-of-band changes
+  LBUG_REGISTRY_RECONCILE_SECONDS = get_int_env("LBUG_REGISTRY_RECONCILE_SECONDS", 5)
 
   # LadybugDB Memory Configuration (can be overridden per-tier)
   LBUG_MAX_MEMORY_MB = get_int_env("LBUG_MAX_MEMORY_MB", 2048)
   LBUG_MAX_MEMORY_PER_DB_MB = get_int_env("LBUG_MAX_MEMORY_PER_DB_MB", 0)
+  # Shared buffer pool budget for multi-tenant instances (memory_per_db_mb > 0)
+  LBUG_MEMORY_GOVERNOR_ENABLED = get_bool_env("LBUG_MEMORY_GOVERNOR_ENABLED", True)
+  LBUG_MEMORY_BUDGET_MB = get_int_env(
+    "LBUG_MEMORY_BUDGET_MB", 0
+  )  # 0 = tier max_memory_mb
+  LBUG_MIN_BUFFER_POOL_MB = get_int_env("LBUG_MIN_BUFFER_POOL_MB", 256)
+  LBUG_DATABASE_IDLE_EVICT_MINUTES = get_float_env(
+    "LBUG_DATABASE_IDLE_EVICT_MINUTES", 15.0
+  )  # 0 = never close idle databases
 
   # Tier-specific memory allocations (with environment variable overrides)
   GRAPH_STANDARD_MAX_MEMORY_MB_OVERRIDE = get_int_env(
@@ -521,6 +539,9 @@ class EnvConfig:
   # DuckDB Configuration (with environment variable overrides)
   DUCKDB_MAX_THREADS = get_int_env("DUCKDB_MAX_THREADS", DUCKDB_MAX_THREADS)
   DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", DUCKDB_MEMORY_LIMIT)
+  DUCKDB_POOL_ACQUIRE_TIMEOUT_SECONDS = get_float_env(
+    "DUCKDB_POOL_ACQUIRE_TIMEOUT_SECONDS", 30.0
+  )  # Wait for a pooled staging connection when all are checked out
 
   # Neo4j-Specific Configuration (when GRAPH_BACKEND_TYPE=neo4j_*)
   NEO4J_URI = get_str_env("NEO4J_URI", "bolt://localhost:7687")
@@ -555,6 +576,8 @@ class EnvConfig:
   DATABASE_POOL_TIMEOUT = get_int_env("DATABASE_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT)
   DATABASE_POOL_RECYCLE = get_int_env("DATABASE_POOL_RECYCLE", DEFAULT_POOL_RECYCLE)
   DATABASE_ECHO = get_bool_env("DATABASE_ECHO", False)
+  # Resolve users and graph access for auth dependencies on the asyncpg engine
+  DATABASE_ASYNC_AUTH_ENABLED = get_bool_env("DATABASE_ASYNC_AUTH_ENABLED", True)
 
   # ==========================================================================
   # CACHE AND QUEUE CONFIGURATION (VALKEY/REDIS)
@@ -573,6 +596,11 @@ class EnvConfig:
     "VALKEY_AUTH_SECRET_NAME", f"robosystems/{ENVIRONMENT}/valkey/auth"
   )
 
+  # Shared connection pools (one per database, process and event loop)
+  VALKEY_POOL_MAX_CONNECTIONS = get_int_env("VALKEY_POOL_MAX_CONNECTIONS", 50)
+  # Seconds to wait for a free pooled connection before failing
+  VALKEY_POOL_TIMEOUT = get_float_env("VALKEY_POOL_TIMEOUT", 5.0)
+
   # Cache TTLs
   CREDIT_BALANCE_CACHE_TTL = get_int_env("CREDIT_BALANCE_CACHE_TTL", CACHE_TTL_SHORT)
   CREDIT_SUMMARY_CACHE_TTL = get_int_env("CREDIT_SUMMARY_CACHE_TTL", 600)  # 10 minutes
@@ -582,6 +610,26 @@ class EnvConfig:
   JWT_CACHE_TTL = get_int_env("JWT_CACHE_TTL", 1800)  # 30 minutes
   API_KEY_CACHE_TTL = get_int_env("API_KEY_CACHE_TTL", 300)  # 5 minutes
 
+  # In-process auth cache in front of the Valkey auth cache (per worker)
+  AUTH_LOCAL_CACHE_ENABLED = get_bool_env("AUTH_LOCAL_CACHE_ENABLED", True)
+  AUTH_LOCAL_CACHE_TTL = get_int_env("AUTH_LOCAL_CACHE_TTL", 30)
+  AUTH_LOCAL_CACHE_MAX_ENTRIES = get_int_env("AUTH_LOCAL_CACHE_MAX_ENTRIES", 10000)
+  # Minimum seconds between sliding-expiry rewrites of one Valkey auth entry
+  AUTH_CACHE_REFRESH_INTERVAL = get_int_env("AUTH_CACHE_REFRESH_INTERVAL", 60)
+
+  # Cypher query result cache (read-only queries, invalidated per graph on writes)
+  QUERY_RESULT_CACHE_ENABLED = get_bool_env("QUERY_RESULT_CACHE_ENABLED", True)
+  QUERY_RESULT_CACHE_TTL = get_int_env("QUERY_RESULT_CACHE_TTL", 60)  # 1 minute
+  QUERY_RESULT_CACHE_MAX_BYTES = get_int_env(
+    "QUERY_RESULT_CACHE_MAX_BYTES", 1024 * 1024
+  )  # Skip caching results larger than 1MB serialized
+  QUERY_RESULT_CACHE_LOCAL_ENABLED = get_bool_env(
+    "QUERY_RESULT_CACHE_LOCAL_ENABLED", True
+  )
+  QUERY_RESULT_CACHE_LOCAL_MAX_ENTRIES = get_int_env(
+    "QUERY_RESULT_CACHE_LOCAL_MAX_ENTRIES", 256
+  )
+
   # Distributed lock TTLs
   INGESTION_LOCK_TTL = get_int_env("INGESTION_LOCK_TTL", 3600)  # 1 hour
 
@@ -602,6 +650,13 @@ class EnvConfig:
   QUERY_PRIORITY_BOOST_PREMIUM = get_int_env(
     "QUERY_PRIORITY_BOOST_PREMIUM", QUERY_PRIORITY_BOOST_PREMIUM
   )
+  # Publish queued query results to Valkey so waiters on other workers are woken
+  QUERY_QUEUE_REMOTE_RESULTS_ENABLED = get_bool_env(
+    "QUERY_QUEUE_REMOTE_RESULTS_ENABLED", False
+  )
+  QUERY_QUEUE_REMOTE_RESULT_MAX_BYTES = get_int_env(
+    "QUERY_QUEUE_REMOTE_RESULT_MAX_BYTES", 1024 * 1024
+  )  # Larger results are delivered without data to remote waiters
 
   # Admission control
   ADMISSION_MEMORY_THRESHOLD = get_float_env(
@@ -631,6 +686,17 @@ class EnvConfig:
   LBUG_HEALTH_CHECK_INTERVAL_MINUTES = get_float_env(
     "LBUG_HEALTH_CHECK_INTERVAL_MINUTES", 5.0
   )  # 5 minutes default
+  # Seconds to wait for a pooled connection when all are checked out
+  LBUG_POOL_ACQUIRE_TIMEOUT_SECONDS = get_float_env(
+    "LBUG_POOL_ACQUIRE_TIMEOUT_SECONDS", 30.0
+  )
+  # Shared query executor (0 = size from the tier's connection pool)
+  LBUG_QUERY_WORKERS = get_int_env("LBUG_QUERY_WORKERS", 0)
+  LBUG_QUERY_QUEUE_LIMIT = get_int_env("LBUG_QUERY_QUEUE_LIMIT", 100)
+  # Prepared statements kept per LadybugDB connection (0 disables caching)
+  LBUG_PREPARED_STATEMENT_CACHE_SIZE = get_int_env(
+    "LBUG_PREPARED_STATEMENT_CACHE_SIZE", 128
+  )
 
   # Load shedding
   LOAD_SHED_START_PRESSURE = get_float_env(
@@ -650,6 +716,11 @@ class EnvConfig:
     "RATE_LIMIT_SSE_CONNECTIONS_WINDOW", 60
   )
 
+  # Rate limiting: requests a worker may lease from Valkey and spend locally
+  # before checking again (0 disables leasing)
+  RATE_LIMIT_LOCAL_LEASE_SIZE = get_int_env("RATE_LIMIT_LOCAL_LEASE_SIZE", 0)
+  RATE_LIMIT_LOCAL_LEASE_TTL = get_float_env("RATE_LIMIT_LOCAL_LEASE_TTL", 1.0)
+
   # ==========================================================================
   # AWS CONFIGURATION
   # ==========================================================================
@@ -732,6 +803,12 @@ class EnvConfig:
 
   # API key configuration
   CONNECTION_CREDENTIALS_KEY = get_secret_value("CONNECTION_CREDENTIALS_KEY", "")
+  # Threads verifying bcrypt API key hashes off the request path
+  API_KEY_VERIFY_WORKERS = get_int_env("API_KEY_VERIFY_WORKERS", 4)
+  # Store API keys as HMAC-SHA256 with a server pepper instead of bcrypt
+  # (existing keys are re-hashed on their next successful verification)
+  API_KEY_HMAC_HASHING_ENABLED = get_bool_env("API_KEY_HMAC_HASHING_ENABLED", False)
+  API_KEY_HMAC_PEPPER = get_secret_value("API_KEY_HMAC_PEPPER", "")
 
   # Cloudflare Turnstile (CAPTCHA)
   TURNSTILE_SECRET_KEY = get_secret_value("TURNSTILE_SECRET_KEY", "")
@@ -773,6 +850,9 @@ class EnvConfig:
   )
   # Parallel processing concurrency (for local sec-process-parallel command)
   SEC_PARALLEL_CONCURRENCY = get_int_env("SEC_PARALLEL_CONCURRENCY", 2)
+  # Batched processing worker pool (0 workers = one per CPU core)
+  SEC_PROCESS_WORKERS = get_int_env("SEC_PROCESS_WORKERS", 0)
+  SEC_PROCESS_FILINGS_PER_WORKER = get_int_env("SEC_PROCESS_FILINGS_PER_WORKER", 50)
 
   # OpenFIGI (financial identifiers)
   OPENFIGI_API_KEY = get_secret_value("OPENFIGI_API_KEY", "")
@@ -811,6 +891,11 @@ class EnvConfig:
   XBRL_STANDARDIZED_FILENAMES = get_bool_env("XBRL_STANDARDIZED_FILENAMES", False)
   XBRL_TYPE_PREFIXES = get_bool_env("XBRL_TYPE_PREFIXES", False)
   XBRL_COLUMN_STANDARDIZATION = get_bool_env("XBRL_COLUMN_STANDARDIZATION", False)
+  # Compact INT64 IDs for facts, elements, periods, units and dimensions.
+  # Must match between processing and the SEC graph schema (rebuild to switch).
+  XBRL_COMPACT_IDS = get_bool_env("XBRL_COMPACT_IDS", False)
+  # Persistent interning table (SQLite) for shared compact IDs ("" = in-memory)
+  XBRL_ID_INTERN_PATH = get_str_env("XBRL_ID_INTERN_PATH", "")
   # XBRL technical limits
   XBRL_EXTERNALIZATION_THRESHOLD = get_int_env(
     "XBRL_EXTERNALIZATION_THRESHOLD", XBRL_EXTERNALIZATION_THRESHOLD
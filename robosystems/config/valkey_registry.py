@@ -8,9 +8,12 @@ IMPORTANT: When adding a new Redis connection, always check this registry first
 and use the next available database number.
 """
 
+import asyncio
 import logging
 import os
 import ssl
+import threading
+import time
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
@@ -616,3 +619,292 @@ def create_redis_client_from_url(
 
   # Create client
   return redis.from_url(url, **params)
+
+
+# =============================================================================
+# Shared Connection Pools
+# =============================================================================
+
+
+class ValkeyConnectionRegistry:
+  """
+  Process-wide registry of shared Valkey connection pools.
+
+  ``create_redis_client`` and ``create_async_redis_client`` build a client with
+  its own pool on every call. Hot paths (auth, rate limiting, caches, SSE) use
+  this registry instead so each process keeps one pool per database and
+  connection settings, reusing sockets across requests.
+
+  Async pools are additionally keyed by event loop because redis.asyncio
+  connections cannot be shared between loops, and every pool is keyed by
+  process id so forked workers never reuse their parent's sockets.
+  """
+
+  _pools: dict[tuple, Any] = {}
+  _clients: dict[tuple, Any] = {}
+  _stats: dict[tuple, dict[str, Any]] = {}
+  _lock = threading.Lock()
+
+  @staticmethod
+  def _pool_settings() -> tuple[int, float]:
+    from robosystems.config import env
+
+    return env.VALKEY_POOL_MAX_CONNECTIONS, env.VALKEY_POOL_TIMEOUT
+
+  @classmethod
+  def _key(
+    cls,
+    kind: str,
+    database: ValkeyDatabase,
+    decode_responses: bool,
+    kwargs: dict[str, Any],
+    loop: Any = None,
+  ) -> tuple:
+    options = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+    return (kind, database, decode_responses, options, os.getpid(), loop)
+
+  @classmethod
+  def _connection_params(cls, decode_responses: bool, kwargs: dict[str, Any]):
+    max_connections, timeout = cls._pool_settings()
+    params = get_redis_connection_params()
+    params["decode_responses"] = decode_responses
+    params["max_connections"] = max_connections
+    params["timeout"] = timeout
+    params.update(kwargs)
+    return params
+
+  @classmethod
+  def _register(cls, key: tuple, pool: Any, client: Any) -> None:
+    cls._pools[key] = pool
+    cls._clients[key] = client
+    cls._stats[key] = {"created_at": time.time(), "checkouts": 0}
+
+  @classmethod
+  def get_client(
+    cls, database: ValkeyDatabase, decode_responses: bool = True, **kwargs
+  ) -> Any:  # Returns redis.Redis but avoid import here
+    """
+    Get a shared synchronous client for a database.
+
+    Args:
+        database: The Valkey database to connect to
+        decode_responses: Whether to decode responses as strings
+        **kwargs: Additional connection parameters (part of the pool key)
+
+    Returns:
+        Redis client backed by the shared pool
+    """
+    key = cls._key("sync", database, decode_responses, kwargs)
+    with cls._lock:
+      client = cls._clients.get(key)
+      if client is None:
+        import redis
+
+        url = ValkeyURLBuilder.build_authenticated_url(
+          database, include_ssl_params=False
+        )
+        pool = redis.BlockingConnectionPool.from_url(
+          url, **cls._connection_params(decode_responses, kwargs)
+        )
+        client = redis.Redis(connection_pool=pool)
+        cls._register(key, pool, client)
+        logger.debug(f"Created shared Valkey pool for {database.name} (sync)")
+      cls._stats[key]["checkouts"] += 1
+      return client
+
+  @classmethod
+  def get_async_client(
+    cls, database: ValkeyDatabase, decode_responses: bool = True, **kwargs
+  ) -> Any:  # Returns redis.asyncio.Redis but avoid import here
+    """
+    Get a shared async client for a database on the running event loop.
+
+    Args:
+        database: The Valkey database to connect to
+        decode_responses: Whether to decode responses as strings
+        **kwargs: Additional connection parameters (part of the pool key)
+
+    Returns:
+        Async Redis client backed by the shared pool for this event loop
+    """
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      loop = None
+
+    key = cls._key("async", database, decode_responses, kwargs, loop)
+    with cls._lock:
+      client = cls._clients.get(key)
+      if client is None:
+        import redis.asyncio as redis_async
+
+        cls._prune_closed_loops()
+        url = ValkeyURLBuilder.build_authenticated_url(
+          database, include_ssl_params=False
+        )
+        pool = redis_async.BlockingConnectionPool.from_url(
+          url, **cls._connection_params(decode_responses, kwargs)
+        )
+        client = redis_async.Redis(connection_pool=pool)
+        cls._register(key, pool, client)
+        logger.debug(f"Created shared Valkey pool for {database.name} (async)")
+      cls._stats[key]["checkouts"] += 1
+      return client
+
+  @classmethod
+  def _prune_closed_loops(cls) -> None:
+    """Forget async pools whose event loop has been closed."""
+    for key in list(cls._pools):
+      loop = key[-1]
+      if loop is not None and loop.is_closed():
+        cls._pools.pop(key, None)
+        cls._clients.pop(key, None)
+        cls._stats.pop(key, None)
+
+  @staticmethod
+  def _connection_counts(pool: Any) -> dict[str, int]:
+    """Best-effort connection counts from a redis-py pool."""
+    try:
+      if hasattr(pool, "_in_use_connections"):
+        return {
+          "in_use": len(pool._in_use_connections),
+          "idle": len(pool._available_connections),
+        }
+      # Synchronous BlockingConnectionPool keeps idle connections in a queue
+      idle = sum(1 for c in list(pool.pool.queue) if c is not None)
+      return {"in_use": len(pool._connections) - idle, "idle": idle}
+    except Exception:
+      return {}
+
+  @classmethod
+  def get_pool_stats(cls) -> list[dict[str, Any]]:
+    """Get per-pool statistics for monitoring."""
+    with cls._lock:
+      entries = list(cls._pools.items())
+      stats = {key: dict(value) for key, value in cls._stats.items()}
+
+    result = []
+    for key, pool in entries:
+      kind, database, decode_responses, _, pid, _ = key
+      result.append(
+        {
+          "database": database.name,
+          "kind": kind,
+          "decode_responses": decode_responses,
+          "pid": pid,
+          "max_connections": pool.max_connections,
+          **cls._connection_counts(pool),
+          **stats.get(key, {}),
+        }
+      )
+    return result
+
+  @classmethod
+  def health_check(cls) -> dict[str, bool]:
+    """Ping every synchronous pool in this process."""
+    with cls._lock:
+      clients = [
+        (key, client)
+        for key, client in cls._clients.items()
+        if key[0] == "sync" and key[4] == os.getpid()
+      ]
+
+    results = {}
+    for key, client in clients:
+      try:
+        results[key[1].name] = bool(client.ping())
+      except Exception as e:
+        logger.warning(f"Valkey health check failed for {key[1].name}: {e}")
+        results[key[1].name] = False
+    return results
+
+  @classmethod
+  async def async_health_check(cls) -> dict[str, bool]:
+    """Ping every async pool bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with cls._lock:
+      clients = [
+        (key, client)
+        for key, client in cls._clients.items()
+        if key[0] == "async" and key[-1] is loop
+      ]
+
+    results = {}
+    for key, client in clients:
+      try:
+        results[key[1].name] = bool(await client.ping())
+      except Exception as e:
+        logger.warning(f"Valkey health check failed for {key[1].name}: {e}")
+        results[key[1].name] = False
+    return results
+
+  @classmethod
+  def close(cls) -> None:
+    """Disconnect synchronous pools (async pools are closed by ``aclose``)."""
+    with cls._lock:
+      keys = [key for key in cls._pools if key[0] == "sync"]
+      pools = [cls._pools.pop(key) for key in keys]
+      for key in keys:
+        cls._clients.pop(key, None)
+        cls._stats.pop(key, None)
+
+    for pool in pools:
+      try:
+        pool.disconnect()
+      except Exception as e:
+        logger.warning(f"Error closing Valkey pool: {e}")
+
+  @classmethod
+  async def aclose(cls) -> None:
+    """Disconnect every pool usable from the running event loop."""
+    loop = asyncio.get_running_loop()
+    with cls._lock:
+      keys = [
+        key for key in cls._pools if key[0] == "async" and key[-1] in (loop, None)
+      ]
+      pools = [cls._pools.pop(key) for key in keys]
+      for key in keys:
+        cls._clients.pop(key, None)
+        cls._stats.pop(key, None)
+
+    for pool in pools:
+      try:
+        await pool.disconnect()
+      except Exception as e:
+        logger.warning(f"Error closing Valkey pool: {e}")
+
+    cls.close()
+
+
+def get_shared_redis_client(
+  database: ValkeyDatabase, decode_responses: bool = True, **kwargs
+) -> Any:  # Returns redis.Redis but avoid import here
+  """
+  Get a synchronous client backed by the process-wide pool for a database.
+
+  Prefer this over ``create_redis_client`` for anything called per request.
+  The client is shared, so callers must not close it.
+
+  Example:
+      >>> from robosystems.config.valkey_registry import ValkeyDatabase, get_shared_redis_client
+      >>> client = get_shared_redis_client(ValkeyDatabase.AUTH_CACHE)
+      >>> client.get("key")
+  """
+  return ValkeyConnectionRegistry.get_client(database, decode_responses, **kwargs)
+
+
+def get_shared_async_redis_client(
+  database: ValkeyDatabase, decode_responses: bool = True, **kwargs
+) -> Any:  # Returns redis.asyncio.Redis but avoid import here
+  """
+  Get an async client backed by the shared pool for the running event loop.
+
+  Prefer this over ``create_async_redis_client`` for anything called per
+  request. The client is shared, so callers must not close it.
+
+  Example:
+      >>> from robosystems.config.valkey_registry import ValkeyDatabase, get_shared_async_redis_client
+      >>> client = get_shared_async_redis_client(ValkeyDatabase.AUTH_CACHE)
+      >>> await client.get("key")
+  """
+  return ValkeyConnectionRegistry.get_async_client(database, decode_responses, **kwargs)
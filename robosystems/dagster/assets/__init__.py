@@ -19,6 +19,7 @@ from robosystems.dagster.assets.quickbooks import (
 )
 from robosystems.dagster.assets.sec import (
   # Config classes
+  SECBatchProcessConfig,
   SECDownloadConfig,
   SECDuckDBConfig,
   SECMaterializeConfig,
@@ -28,6 +29,7 @@ from robosystems.dagster.assets.sec import (
   # Assets - dynamic partition processing
   sec_filing_partitions,
   sec_graph_materialized,
+  sec_process_batch,
   sec_process_filing,
   sec_raw_filings,
   # Partitions
@@ -37,6 +39,7 @@ from robosystems.dagster.assets.staged_files import staged_files_source
 
 __all__ = [
   # SEC config
+  "SECBatchProcessConfig",
   "SECDownloadConfig",
   "SECDuckDBConfig",
   "SECMaterializeConfig",
@@ -54,6 +57,7 @@ __all__ = [
   # SEC assets - dynamic partition processing
   "sec_filing_partitions",
   "sec_graph_materialized",
+  "sec_process_batch",
   "sec_process_filing",
   "sec_raw_filings",
   # SEC partitions
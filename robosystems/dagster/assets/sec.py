@@ -7,6 +7,7 @@ Pipeline stages (run independently via separate jobs):
 
 2. PROCESS (sec_process job, sensor-triggered):
    - sec_process_filing - Process single filing to parquet (dynamic partitions)
+   - sec_process_batch - Process a year's filings on a worker process pool (backfills)
 
 3. MATERIALIZE (sec_materialize job):
    - sec_duckdb_staging - Discover processed parquet files
@@ -22,8 +23,9 @@ Architecture Notes:
 - EFTS-based O(1) discovery replaces per-company iteration
 - Year partitioning for downloads
 - Dynamic partitioning for processing (one partition per filing, parallel)
+- Batched processing reuses warm Arelle workers across a year's filings
 - Sensor discovers unprocessed filings and triggers processing
-- Graph materialization always rebuilds from all processed data
+- Graph materialization stages and ingests only new processed files (rebuild on request)
 """
 
 from datetime import UTC
@@ -46,6 +48,7 @@ from robosystems.config.storage.shared import (
   get_raw_key,
 )
 from robosystems.dagster.resources import S3Resource
+from robosystems.logger import logger
 
 # In-memory cache for SEC submissions during a single run
 _sec_submissions_cache: dict[str, dict] = {}
@@ -220,6 +223,177 @@ def _get_sec_metadata(
   return sec_filer, sec_report
 
 
+def _process_filing(
+  partition_key: str, s3_client, log=None, arelle_client=None
+) -> dict:
+  """Process a single SEC filing to parquet format.
+
+  Downloads the raw ZIP for the filing, processes it with XBRLGraphProcessor and
+  uploads one parquet file per table to the processed bucket.
+
+  Args:
+      partition_key: Filing key in format {year}_{cik}_{accession}
+      s3_client: boto3 S3 client
+      log: Logger for progress messages (defaults to the application logger)
+      arelle_client: Warm ArelleClient to reuse (a new one is created if None)
+
+  Returns:
+      Metadata dict with processing statistics and a "status" of success or error
+  """
+  from robosystems.adapters.sec import XBRLGraphProcessor
+
+  log = log or logger
+
+  # Parse partition key: {year}_{cik}_{accession}
+  parts = partition_key.split("_", 2)  # Split into 3 parts max
+  if len(parts) != 3:
+    log.error(f"Invalid partition key format: {partition_key}")
+    return {"status": "error", "reason": f"Invalid partition key: {partition_key}"}
+
+  year, cik, accession = parts
+  log.info(f"Processing filing: year={year}, cik={cik}, accession={accession}")
+
+  raw_bucket = env.SHARED_RAW_BUCKET
+  processed_bucket = env.SHARED_PROCESSED_BUCKET
+
+  # Download raw ZIP from shared bucket
+  raw_key = get_raw_key(DataSourceType.SEC, f"year={year}", cik, f"{accession}.zip")
+
+  import os
+  import tempfile
+  import zipfile
+  from io import BytesIO
+
+  try:
+    buffer = BytesIO()
+    s3_client.download_fileobj(raw_bucket, raw_key, buffer)
+    buffer.seek(0)
+  except Exception as e:
+    log.error(f"Failed to download {raw_key}: {e}")
+    return {"status": "error", "reason": f"Download failed: {e}"}
+
+  # Extract and process
+  try:
+    with tempfile.TemporaryDirectory() as tmpdir:
+      with zipfile.ZipFile(buffer, "r") as zf:
+        zf.extractall(tmpdir)
+
+      # Find main XBRL instance file
+      exclude_suffixes = ("_def.xml", "_lab.xml", "_pre.xml", "_cal.xml", ".xsd")
+      all_files = os.listdir(tmpdir)
+      xbrl_files = [
+        f
+        for f in all_files
+        if f.endswith((".xml", ".htm", ".html"))
+        and not any(f.endswith(suffix) for suffix in exclude_suffixes)
+      ]
+
+      # Prefer .htm files for inline XBRL
+      htm_files = [f for f in xbrl_files if f.endswith((".htm", ".html"))]
+      if htm_files:
+        xbrl_files = sorted(
+          htm_files,
+          key=lambda f: os.path.getsize(os.path.join(tmpdir, f)),
+          reverse=True,
+        )
+
+      if not xbrl_files:
+        log.warning(f"No XBRL instance files found in {raw_key}")
+        return {"status": "error", "reason": "No XBRL files found"}
+
+      # Build report URL
+      from robosystems.adapters.sec import SEC_BASE_URL
+
+      report_url = f"{SEC_BASE_URL}/Archives/edgar/data/{int(cik)}/{accession.replace('-', '')}/{xbrl_files[0]}"
+
+      # Schema config
+      schema_config = {
+        "name": "SEC Database Schema",
+        "description": "Complete financial reporting schema with XBRL taxonomy support",
+        "base_schema": "base",
+        "extensions": ["roboledger"],
+        "compact_identifiers": env.XBRL_COMPACT_IDS,
+      }
+
+      # Fetch full SEC metadata from S3 snapshot (stored during download)
+      sec_filer, sec_report = _get_sec_metadata(
+        cik, accession, s3_client=s3_client, bucket=raw_bucket
+      )
+      # Ensure primaryDocument is set from local files if not in API response
+      if not sec_report.get("primaryDocument"):
+        sec_report["primaryDocument"] = xbrl_files[0]
+
+      # Process with XBRLGraphProcessor
+      processor = XBRLGraphProcessor(
+        report_uri=report_url,
+        entityId=cik,
+        sec_filer=sec_filer,
+        sec_report=sec_report,
+        output_dir=tmpdir,
+        local_file_path=os.path.join(tmpdir, xbrl_files[0]),
+        schema_config=schema_config,
+        arelle_client=arelle_client,
+      )
+
+      processor.process()
+
+      # Upload parquet files to S3
+      files_uploaded = 0
+      for entity_type in ["nodes", "relationships"]:
+        entity_dir = os.path.join(tmpdir, entity_type)
+        if os.path.exists(entity_dir):
+          for parquet_file in os.listdir(entity_dir):
+            if parquet_file.endswith(".parquet"):
+              local_path = os.path.join(entity_dir, parquet_file)
+              table_name = parquet_file.replace(".parquet", "")
+              s3_key = get_processed_key(
+                DataSourceType.SEC,
+                f"year={year}",
+                entity_type,
+                table_name,
+                f"{cik}_{accession}.parquet",
+              )
+
+              with open(local_path, "rb") as f:
+                s3_client.upload_fileobj(f, processed_bucket, s3_key)
+              files_uploaded += 1
+
+      log.info(f"Processed {partition_key}: {files_uploaded} files uploaded")
+
+      return {
+        "partition_key": partition_key,
+        "year": year,
+        "cik": cik,
+        "accession": accession,
+        "files_uploaded": files_uploaded,
+        "status": "success",
+      }
+
+  except Exception as e:
+    log.error(f"Processing failed for {partition_key}: {e}")
+    return {
+      "partition_key": partition_key,
+      "status": "error",
+      "reason": str(e),
+    }
+
+
+# Per-process S3 client for batch processing workers
+_worker_s3_client = None
+
+
+def _process_filing_in_worker(partition_key: str) -> dict:
+  """Process a filing in a FilingProcessPool worker with its warm ArelleClient."""
+  from robosystems.adapters.sec.processors import get_worker_arelle_client
+
+  global _worker_s3_client
+  if _worker_s3_client is None:
+    _worker_s3_client = S3Resource().client
+  return _process_filing(
+    partition_key, _worker_s3_client, arelle_client=get_worker_arelle_client()
+  )
+
+
 # Year partitions for SEC data (2019-2025)
 SEC_YEARS = [str(y) for y in range(2019, 2026)]
 sec_year_partitions = StaticPartitionsDefinition(SEC_YEARS)
@@ -266,6 +440,22 @@ class SECSingleFilingConfig(Config):
   pass
 
 
+class SECBatchProcessConfig(Config):
+  """Configuration for batched processing of a year's filings.
+
+  Processes all unprocessed filings of the year partition in one run on a pool
+  of worker processes, each keeping a warm Arelle controller and taxonomy cache
+  across filings. Suited to backfills on a many-core box; the sensor-driven
+  sec_process job remains the default for incremental processing.
+  """
+
+  max_workers: int = 0  # Worker processes (0 = SEC_PROCESS_WORKERS or CPU count)
+  filings_per_worker: int = 0  # Filings before a worker is replaced (0 = env default)
+  ciks: list[str] = []  # Optional CIK filter
+  max_filings: int = 0  # Max filings to process (0 = unlimited)
+  skip_existing: bool = True  # Skip filings that already have parquet output
+
+
 class SECDuckDBConfig(Config):
   """Configuration for DuckDB staging - discovers all processed files."""
 
@@ -277,7 +467,7 @@ class SECMaterializeConfig(Config):
 
   graph_id: str = "sec"  # Target graph ID
   ignore_errors: bool = True  # Continue on individual table errors
-  # Note: Always rebuilds graph from scratch - incremental not yet supported
+  rebuild: bool = False  # Rebuild graph from all files instead of new files only
 
 
 # ============================================================================
@@ -648,149 +838,138 @@ def sec_process_filing(
   Returns:
       MaterializeResult with processing statistics
   """
-  from robosystems.adapters.sec import XBRLGraphProcessor
-
-  # Parse partition key: {year}_{cik}_{accession}
-  partition_key = context.partition_key
-  parts = partition_key.split("_", 2)  # Split into 3 parts max
-  if len(parts) != 3:
-    context.log.error(f"Invalid partition key format: {partition_key}")
-    return MaterializeResult(
-      metadata={"status": "error", "reason": f"Invalid partition key: {partition_key}"}
-    )
-
-  year, cik, accession = parts
-  context.log.info(f"Processing filing: year={year}, cik={cik}, accession={accession}")
-
-  raw_bucket = env.SHARED_RAW_BUCKET
-  processed_bucket = env.SHARED_PROCESSED_BUCKET
+  metadata = _process_filing(context.partition_key, s3.client, log=context.log)
+  return MaterializeResult(metadata=metadata)
+
+
+def _list_year_filings(
+  s3_client, year: str, ciks: list[str], skip_existing: bool
+) -> list[str]:
+  """List partition keys of a year's raw filings, optionally only unprocessed ones."""
+  raw_prefix = get_raw_key(DataSourceType.SEC, f"year={year}") + "/"
+  cik_filter = {cik.lstrip("0") for cik in ciks}
+
+  partition_keys = []
+  paginator = s3_client.get_paginator("list_objects_v2")
+  for page in paginator.paginate(Bucket=env.SHARED_RAW_BUCKET, Prefix=raw_prefix):
+    for obj in page.get("Contents", []):
+      # Format: sec/year=2024/320193/0000320193-24-000081.zip
+      parts = obj["Key"].split("/")
+      if len(parts) < 4 or not parts[-1].endswith(".zip"):
+        continue
+      cik = parts[2]
+      accession = parts[-1].removesuffix(".zip")
+      if cik_filter and cik.lstrip("0") not in cik_filter:
+        continue
+
+      if skip_existing:
+        processed_key = get_processed_key(
+          DataSourceType.SEC,
+          f"year={year}",
+          "nodes",
+          "Entity",
+          f"{cik}_{accession}.parquet",
+        )
+        try:
+          s3_client.head_object(Bucket=env.SHARED_PROCESSED_BUCKET, Key=processed_key)
+          continue  # Already processed
+        except Exception:
+          pass
 
-  # Download raw ZIP from shared bucket
-  raw_key = get_raw_key(DataSourceType.SEC, f"year={year}", cik, f"{accession}.zip")
+      partition_keys.append(f"{year}_{cik}_{accession}")
 
-  import os
-  import tempfile
-  import zipfile
-  from io import BytesIO
+  return partition_keys
 
-  try:
-    buffer = BytesIO()
-    s3.client.download_fileobj(raw_bucket, raw_key, buffer)
-    buffer.seek(0)
-  except Exception as e:
-    context.log.error(f"Failed to download {raw_key}: {e}")
-    return MaterializeResult(
-      metadata={"status": "error", "reason": f"Download failed: {e}"}
-    )
 
-  # Extract and process
-  try:
-    with tempfile.TemporaryDirectory() as tmpdir:
-      with zipfile.ZipFile(buffer, "r") as zf:
-        zf.extractall(tmpdir)
+@asset(
+  group_name="sec_pipeline",
+  description="Process a year's SEC filings to parquet on a worker process pool",
+  compute_kind="transform",
+  partitions_def=sec_year_partitions,
+  metadata={
+    "pipeline": "sec",
+    "stage": "processing",
+  },
+  # The worker pool uses every core of the box - one year at a time
+  op_tags={
+    "dagster/concurrency_key": "sec_process_batch",
+    "dagster/max_concurrent": "1",
+  },
+)
+def sec_process_batch(
+  context: AssetExecutionContext,
+  config: SECBatchProcessConfig,
+  s3: S3Resource,
+) -> MaterializeResult:
+  """Process a year's unprocessed filings in parallel worker processes.
 
-      # Find main XBRL instance file
-      exclude_suffixes = ("_def.xml", "_lab.xml", "_pre.xml", "_cal.xml", ".xsd")
-      all_files = os.listdir(tmpdir)
-      xbrl_files = [
-        f
-        for f in all_files
-        if f.endswith((".xml", ".htm", ".html"))
-        and not any(f.endswith(suffix) for suffix in exclude_suffixes)
-      ]
+  Each filing is processed exactly like sec_process_filing and writes the same
+  per-filing parquet files. A failed filing does not fail the run; failures are
+  reported in the result metadata.
 
-      # Prefer .htm files for inline XBRL
-      htm_files = [f for f in xbrl_files if f.endswith((".htm", ".html"))]
-      if htm_files:
-        xbrl_files = sorted(
-          htm_files,
-          key=lambda f: os.path.getsize(os.path.join(tmpdir, f)),
-          reverse=True,
-        )
+  Returns:
+      MaterializeResult with processing statistics
+  """
+  import time
 
-      if not xbrl_files:
-        context.log.warning(f"No XBRL instance files found in {raw_key}")
-        return MaterializeResult(
-          metadata={"status": "error", "reason": "No XBRL files found"}
-        )
+  from robosystems.adapters.sec.processors import FilingProcessPool
 
-      # Build report URL
-      from robosystems.adapters.sec import SEC_BASE_URL
+  year = context.partition_key
+  start_time = time.time()
 
-      report_url = f"{SEC_BASE_URL}/Archives/edgar/data/{int(cik)}/{accession.replace('-', '')}/{xbrl_files[0]}"
+  partition_keys = _list_year_filings(
+    s3.client, year, config.ciks, config.skip_existing
+  )
+  if config.max_filings > 0:
+    partition_keys = partition_keys[: config.max_filings]
 
-      # Schema config
-      schema_config = {
-        "name": "SEC Database Schema",
-        "description": "Complete financial reporting schema with XBRL taxonomy support",
-        "base_schema": "base",
-        "extensions": ["roboledger"],
-      }
+  if not partition_keys:
+    context.log.info(f"No filings to process for {year}")
+    return MaterializeResult(metadata={"year": year, "filings": 0, "status": "success"})
 
-      # Fetch full SEC metadata from S3 snapshot (stored during download)
-      sec_filer, sec_report = _get_sec_metadata(
-        cik, accession, s3_client=s3.client, bucket=raw_bucket
-      )
-      # Ensure primaryDocument is set from local files if not in API response
-      if not sec_report.get("primaryDocument"):
-        sec_report["primaryDocument"] = xbrl_files[0]
+  pool = FilingProcessPool(
+    max_workers=config.max_workers or None,
+    filings_per_worker=config.filings_per_worker or None,
+  )
+  context.log.info(
+    f"Processing {len(partition_keys)} filings for {year} "
+    f"with {pool.max_workers} workers"
+  )
 
-      # Process with XBRLGraphProcessor
-      processor = XBRLGraphProcessor(
-        report_uri=report_url,
-        entityId=cik,
-        sec_filer=sec_filer,
-        sec_report=sec_report,
-        output_dir=tmpdir,
-        local_file_path=os.path.join(tmpdir, xbrl_files[0]),
-        schema_config=schema_config,
+  def report_progress(result, completed: int, total: int) -> None:
+    if result.success:
+      context.log.info(
+        f"[{completed}/{total}] Processed {result.key} ({result.duration_seconds:.1f}s)"
       )
+    else:
+      context.log.warning(f"[{completed}/{total}] Failed {result.key}: {result.error}")
 
-      processor.process()
+  results = pool.run(partition_keys, _process_filing_in_worker, report_progress)
 
-      # Upload parquet files to S3
-      files_uploaded = 0
-      for entity_type in ["nodes", "relationships"]:
-        entity_dir = os.path.join(tmpdir, entity_type)
-        if os.path.exists(entity_dir):
-          for parquet_file in os.listdir(entity_dir):
-            if parquet_file.endswith(".parquet"):
-              local_path = os.path.join(entity_dir, parquet_file)
-              table_name = parquet_file.replace(".parquet", "")
-              s3_key = get_processed_key(
-                DataSourceType.SEC,
-                f"year={year}",
-                entity_type,
-                table_name,
-                f"{cik}_{accession}.parquet",
-              )
-
-              with open(local_path, "rb") as f:
-                s3.client.upload_fileobj(f, processed_bucket, s3_key)
-              files_uploaded += 1
-
-      context.log.info(f"Processed {partition_key}: {files_uploaded} files uploaded")
-
-      return MaterializeResult(
-        metadata={
-          "partition_key": partition_key,
-          "year": year,
-          "cik": cik,
-          "accession": accession,
-          "files_uploaded": files_uploaded,
-          "status": "success",
-        }
-      )
+  failed = [result for result in results if not result.success]
+  duration = time.time() - start_time
+  context.log.info(
+    f"Processed {len(results) - len(failed)}/{len(results)} filings for {year} "
+    f"in {duration:.1f}s ({len(results) / duration * 60:.1f} filings/min)"
+  )
 
-  except Exception as e:
-    context.log.error(f"Processing failed for {partition_key}: {e}")
-    return MaterializeResult(
-      metadata={
-        "partition_key": partition_key,
-        "status": "error",
-        "reason": str(e),
-      }
-    )
+  return MaterializeResult(
+    metadata={
+      "year": year,
+      "filings": len(results),
+      "processed": len(results) - len(failed),
+      "failed": len(failed),
+      "workers": pool.max_workers,
+      "duration_seconds": round(duration, 1),
+      "files_uploaded": sum(
+        result.metadata.get("files_uploaded", 0) for result in results
+      ),
+      "failed_filings": MetadataValue.json(
+        {result.key: result.error for result in failed[:100]}
+      ),
+      "status": "success" if not failed else "partial_failure",
+    }
+  )
 
 
 # ============================================================================
@@ -882,9 +1061,9 @@ def sec_graph_materialized(
   """Materialize staged data to LadybugDB graph.
 
   Uses XBRLDuckDBGraphProcessor.process_files() which handles:
-  - Database rebuild (if requested)
-  - DuckDB staging table creation
-  - Graph ingestion
+  - Database rebuild (if requested, or if staging cannot be applied incrementally)
+  - DuckDB staging table creation (new files only)
+  - Graph ingestion (new files only)
 
   Note: This is a synchronous wrapper around the async processor.
 
@@ -916,9 +1095,8 @@ def sec_graph_materialized(
     context.log.info(f"SEC repository status: {repo_result.get('status', 'unknown')}")
 
     # Use the high-level process_files method which handles everything
-    # Always rebuild - incremental ingestion not yet supported
     result = await processor.process_files(
-      rebuild=True,
+      rebuild=config.rebuild,
       year=None,  # Process all years
     )
     return result
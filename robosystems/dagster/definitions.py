@@ -31,6 +31,7 @@ from robosystems.dagster.assets import (
   sec_duckdb_staging,
   sec_graph_materialized,
   # SEC pipeline - dynamic partition processing
+  sec_process_batch,
   sec_process_filing,
   sec_raw_filings,
   # Direct staging observable source
@@ -87,6 +88,7 @@ from robosystems.dagster.jobs.sec import (
   sec_download_job,
   sec_materialize_job,
   sec_nightly_materialize_schedule,
+  sec_process_batch_job,
   sec_process_job,
 )
 from robosystems.dagster.resources import (
@@ -149,6 +151,7 @@ all_jobs = [
   # SEC pipeline jobs
   sec_download_job,  # Download raw filings to S3
   sec_process_job,  # Per-filing processing (sensor-triggered)
+  sec_process_batch_job,  # Year-batched processing on a worker pool (backfills)
   sec_materialize_job,  # Staging + materialization to graph
   # Notification jobs
   send_email_job,
@@ -199,6 +202,8 @@ all_assets = [
   sec_raw_filings,
   # SEC pipeline - dynamic partition processing (sensor handles discovery)
   sec_process_filing,
+  # SEC pipeline - batched processing on a worker pool
+  sec_process_batch,
   # SEC pipeline - staging and materialization
   sec_duckdb_staging,
   sec_graph_materialized,
@@ -33,6 +33,7 @@ from robosystems.dagster.jobs.sec import (
   sec_download_job,
   sec_materialize_job,
   sec_nightly_materialize_schedule,
+  sec_process_batch_job,
   sec_process_job,
 )
 from robosystems.dagster.jobs.shared_repository import (
@@ -61,6 +62,7 @@ __all__ = [
   "sec_download_job",
   "sec_materialize_job",
   "sec_nightly_materialize_schedule",
+  "sec_process_batch_job",
   "sec_process_job",
   # Notifications
   "send_email_job",
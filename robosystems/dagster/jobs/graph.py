@@ -684,6 +684,13 @@ def restore_backup(
   finally:
     loop.close()
 
+  # Routing caches may still describe the graph as it was before the restore
+  from robosystems.middleware.graph.location_cache import (
+    invalidate_graph_location_sync,
+  )
+
+  invalidate_graph_location_sync(config.graph_id)
+
   # Verify restore
   verification_status = "not_verified"
   if config.verify_after_restore:
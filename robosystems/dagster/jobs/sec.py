@@ -10,6 +10,8 @@ Pipeline Architecture (3 phases, run independently):
   Phase 2 - Process (sensor-triggered or manual):
     sec_process_job: sec_process_filing (dynamic partitions)
     Parallel processing - one partition per filing.
+    sec_process_batch_job: sec_process_batch (year-partitioned)
+    Backfills - a year's filings on a worker process pool in one run.
 
   Phase 3 - Materialize:
     sec_materialize_job: sec_duckdb_staging → sec_graph_materialized
@@ -38,6 +40,7 @@ from robosystems.dagster.assets import (
   sec_duckdb_staging,
   sec_filing_partitions,
   sec_graph_materialized,
+  sec_process_batch,
   sec_process_filing,
   sec_raw_filings,
   sec_year_partitions,
@@ -76,6 +79,20 @@ sec_process_job = define_asset_job(
 )
 
 
+# Phase 2 (backfills): Process a year's filings in one run
+# Worker processes keep a warm Arelle controller across filings, so throughput
+# scales with the cores of the box instead of the number of Dagster runs.
+sec_process_batch_job = define_asset_job(
+  name="sec_process_batch",
+  description="Process a year's SEC filings to parquet on a worker process pool.",
+  selection=AssetSelection.assets(
+    sec_process_batch,
+  ),
+  tags={"pipeline": "sec", "phase": "process"},
+  partitions_def=sec_year_partitions,
+)
+
+
 # Phase 3: Materialize (unpartitioned)
 sec_materialize_job = define_asset_job(
   name="sec_materialize",
@@ -1,8 +1,17 @@
 import asyncio
 import contextvars
+import os
 import threading
+from typing import Any
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+  AsyncEngine,
+  AsyncSession,
+  async_sessionmaker,
+  create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
 
 from robosystems.config import env
@@ -92,6 +101,86 @@ SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 session = scoped_session(SessionFactory, scopefunc=_session_scope)
 
 
+# The asyncpg engine serves hot request paths (auth dependencies) without
+# blocking the event loop. It is created lazily and rebuilt per process and
+# event loop, since asyncpg connections cannot be shared across either.
+_async_engine: AsyncEngine | None = None
+_async_engine_owner: tuple[int, asyncio.AbstractEventLoop] | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_async_engine_lock = threading.Lock()
+
+
+def _async_engine_options() -> tuple[URL, dict[str, Any]]:
+  """
+  Get the asyncpg database URL and connect arguments.
+
+  asyncpg does not accept libpq's ``sslmode`` query parameter, so the SSL
+  mode is passed as the ``ssl`` connect argument instead.
+  """
+  url = make_url(env.DATABASE_URL)
+  query = dict(url.query)
+  sslmode = query.pop("sslmode", None)
+  if sslmode is None and (env.is_staging() or env.is_production()):
+    sslmode = "require"
+
+  url = url.set(drivername="postgresql+asyncpg", query=query)
+  return url, ({"ssl": sslmode} if sslmode else {})
+
+
+def _get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+  """Get the async session factory for the running process and event loop."""
+  global _async_engine, _async_engine_owner, _async_session_factory
+
+  owner = (os.getpid(), asyncio.get_running_loop())
+  with _async_engine_lock:
+    if _async_session_factory is None or _async_engine_owner != owner:
+      if _async_engine is not None:
+        # Connections belong to another process or loop; drop without closing
+        _async_engine.sync_engine.dispose(close=False)
+
+      url, connect_args = _async_engine_options()
+      _async_engine = create_async_engine(
+        url,
+        pool_size=env.DATABASE_POOL_SIZE,
+        max_overflow=env.DATABASE_MAX_OVERFLOW,
+        pool_timeout=env.DATABASE_POOL_TIMEOUT,
+        pool_recycle=env.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=env.DATABASE_ECHO,
+        connect_args=connect_args,
+      )
+      _async_session_factory = async_sessionmaker(
+        _async_engine, autoflush=False, expire_on_commit=False
+      )
+      _async_engine_owner = owner
+    return _async_session_factory
+
+
+def async_session() -> AsyncSession:
+  """
+  Create a session on the asyncpg engine.
+
+  Use as ``async with async_session() as db:`` from a running event loop.
+  Instances are not expired on commit, so loaded rows stay readable after the
+  session closes.
+  """
+  return _get_async_session_factory()()
+
+
+async def dispose_async_engine() -> None:
+  """Close the asyncpg connection pool on shutdown."""
+  global _async_engine, _async_engine_owner, _async_session_factory
+
+  with _async_engine_lock:
+    async_engine = _async_engine
+    _async_engine = None
+    _async_engine_owner = None
+    _async_session_factory = None
+
+  if async_engine is not None:
+    await async_engine.dispose()
+
+
 class Base(DeclarativeBase):
   """Base class for all models."""
 
@@ -74,6 +74,12 @@ def create_app() -> FastAPI:
     logger.info("Graph API shutting down")
     duckdb_pool.close_all_connections()
     logger.info("Closed all DuckDB connections")
+    try:
+      from robosystems.config.valkey_registry import ValkeyConnectionRegistry
+
+      await ValkeyConnectionRegistry.aclose()
+    except Exception as e:
+      logger.warning(f"Error closing Valkey connection pools: {e}")
 
   # Load description from markdown file
   base_dir = Path(__file__).parent.parent.parent  # Go up to project root
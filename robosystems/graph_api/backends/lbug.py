@@ -152,7 +152,10 @@ class LadybugBackend(GraphBackend):
     database: str | None = None,
   ) -> dict[str, Any]:
     # Use ConnectionPool's context manager - this is the 1.0.1 pattern
-    with self.connection_pool.get_connection(graph_id, read_only=False) as conn:
+    with (
+      self.connection_pool.bulk_load(graph_id),
+      self.connection_pool.get_connection(graph_id, read_only=False) as conn,
+    ):
       # Load httpfs extension (try bundled local file first, fallback to standard load)
       try:
         result = conn.execute("CALL show_loaded_extensions() RETURN *")
@@ -9,11 +9,12 @@ import asyncio
 import json
 import time
 from collections.abc import AsyncGenerator
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 from httpx_sse import aconnect_sse
 
+from robosystems.config import env
 from robosystems.logger import logger
 
 from .base import BaseGraphClient
@@ -23,6 +24,9 @@ from .exceptions import (
   GraphTransientError,
 )
 
+if TYPE_CHECKING:
+  import pyarrow as pa
+
 
 class GraphClient(BaseGraphClient):
   """Asynchronous client for Graph API operations."""
@@ -31,6 +35,7 @@ class GraphClient(BaseGraphClient):
     self,
     base_url: str | None = None,
     config: GraphClientConfig | None = None,
+    http_client: httpx.AsyncClient | None = None,
     **kwargs,
   ):
     """
@@ -39,25 +44,18 @@ class GraphClient(BaseGraphClient):
     Args:
         base_url: Base URL for the API
         config: Client configuration
+        http_client: Shared httpx client to send requests through. The caller
+            keeps ownership, so close() leaves it open.
         **kwargs: Additional config overrides
     """
     super().__init__(base_url, config, **kwargs)
 
-    # Configure httpx client limits
-    limits = httpx.Limits(
-      max_connections=self.config.max_connections,
-      max_keepalive_connections=self.config.max_keepalive_connections,
-      keepalive_expiry=self.config.keepalive_expiry,
-    )
-
-    # Create httpx client
-    self.client = httpx.AsyncClient(
-      base_url=self.config.base_url,
-      timeout=httpx.Timeout(self.config.timeout),
-      limits=limits,
-      headers=self.config.headers,
-      verify=self.config.verify_ssl,
-    )
+    if http_client is not None:
+      self.client = http_client
+      self._owns_http_client = False
+    else:
+      self.client = self._create_http_client()
+      self._owns_http_client = True
 
     # Routing metadata (set by factory for debugging)
     self._route_target: str | None = None
@@ -74,9 +72,42 @@ class GraphClient(BaseGraphClient):
     """Async context manager exit."""
     await self.close()
 
+  def _create_http_client(self) -> httpx.AsyncClient:
+    """Create the httpx client for this configuration."""
+    # Configure httpx client limits
+    limits = httpx.Limits(
+      max_connections=self.config.max_connections,
+      max_keepalive_connections=self.config.max_keepalive_connections,
+      keepalive_expiry=self.config.keepalive_expiry,
+    )
+
+    http2 = self.config.http2
+    if http2:
+      try:
+        import h2  # noqa: F401
+      except ImportError:
+        logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+      base_url=self.config.base_url,
+      timeout=httpx.Timeout(self.config.timeout),
+      limits=limits,
+      headers=self.config.headers,
+      verify=self.config.verify_ssl,
+      http2=http2,
+    )
+
   async def close(self):
     """Close the client and cleanup resources."""
-    await self.client.aclose()
+    if self._owns_http_client:
+      await self.client.aclose()
+
+  async def _invalidate_query_cache(self, graph_id: str) -> None:
+    """Invalidate cached query results after a write to a graph."""
+    from robosystems.middleware.graph.query_cache import invalidate_query_cache
+
+    await invalidate_query_cache(graph_id)
 
   async def _execute_with_retry(self, func, *args, **kwargs):
     """
@@ -146,6 +177,7 @@ class GraphClient(BaseGraphClient):
     json_data: dict[str, Any] | None = None,
     params: dict[str, Any] | None = None,
     timeout: float | None = None,
+    headers: dict[str, str] | None = None,
   ) -> httpx.Response:
     """
     Make HTTP request with retry logic.
@@ -156,6 +188,7 @@ class GraphClient(BaseGraphClient):
         json_data: JSON body
         params: Query parameters
         timeout: Request timeout
+        headers: Additional request headers
 
     Returns:
         Response object
@@ -172,6 +205,8 @@ class GraphClient(BaseGraphClient):
       request_kwargs["params"] = params
     if timeout is not None:
       request_kwargs["timeout"] = timeout
+    if headers is not None:
+      request_kwargs["headers"] = headers
 
     async def make_request():
       # Debug log the request
@@ -237,6 +272,16 @@ class GraphClient(BaseGraphClient):
       response = await self._request(
         "POST", f"/databases/{graph_id}/query", json_data=payload, params=params
       )
+
+      if env.QUERY_RESULT_CACHE_ENABLED:
+        from robosystems.security.cypher_analyzer import (
+          is_schema_ddl,
+          is_write_operation,
+        )
+
+        if is_write_operation(cypher) or is_schema_ddl(cypher):
+          await self._invalidate_query_cache(graph_id)
+
       # Debug logging for response content
       logger.debug(f"Response status: {response.status_code}")
       logger.debug(f"Response content type: {response.headers.get('content-type')}")
@@ -302,6 +347,114 @@ class GraphClient(BaseGraphClient):
 
     return stream_chunks()
 
+  async def _stream_bytes(
+    self,
+    path: str,
+    payload: dict[str, Any],
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+  ) -> AsyncGenerator[bytes]:
+    """Stream a raw response body from the Graph API without parsing it."""
+    async with self.client.stream(
+      "POST",
+      path,
+      json=payload,
+      params=params,
+      headers=headers,
+      timeout=httpx.Timeout(300.0, connect=10.0),  # 5 min stream timeout
+    ) as response:
+      if response.status_code >= 400:
+        error_text = await response.aread()
+        try:
+          error_data = json.loads(error_text)
+        except Exception:
+          error_data = {"detail": error_text.decode(errors="replace")}
+        raise self._handle_response_error(response.status_code, error_data)
+
+      async for data in response.aiter_bytes():
+        if data:
+          yield data
+
+  async def query_arrow(
+    self,
+    cypher: str,
+    graph_id: str = "sec",
+    parameters: dict[str, Any] | None = None,
+  ) -> "pa.Table":
+    """
+    Execute a Cypher query and return the result as an Arrow table.
+
+    The Graph API sends the result as an Arrow IPC stream, avoiding per-row
+    JSON serialization on the server and parsing on the client.
+
+    Args:
+        cypher: Cypher query to execute
+        graph_id: Target graph database ID
+        parameters: Query parameters
+
+    Returns:
+        Result as a pyarrow Table
+    """
+    from robosystems.graph_api.core.arrow_ipc import (
+      ARROW_STREAM_MEDIA_TYPE,
+      read_ipc_table,
+    )
+
+    payload: dict[str, Any] = {"cypher": cypher, "database": graph_id}
+    if parameters:
+      payload["parameters"] = parameters
+
+    response = await self._request(
+      "POST",
+      f"/databases/{graph_id}/query",
+      json_data=payload,
+      headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+    )
+
+    if env.QUERY_RESULT_CACHE_ENABLED:
+      from robosystems.security.cypher_analyzer import (
+        is_schema_ddl,
+        is_write_operation,
+      )
+
+      if is_write_operation(cypher) or is_schema_ddl(cypher):
+        await self._invalidate_query_cache(graph_id)
+
+    return read_ipc_table(response.content)
+
+  async def query_arrow_stream(
+    self,
+    cypher: str,
+    graph_id: str = "sec",
+    parameters: dict[str, Any] | None = None,
+  ) -> AsyncGenerator[bytes]:
+    """
+    Execute a Cypher query and stream the raw Arrow IPC bytes.
+
+    The bytes can be passed straight through to an HTTP response, or decoded
+    incrementally with ``ArrowStreamDecoder``. No row limit applies.
+
+    Args:
+        cypher: Cypher query to execute
+        graph_id: Target graph database ID
+        parameters: Query parameters
+
+    Returns:
+        Async generator of Arrow IPC stream bytes
+    """
+    from robosystems.graph_api.core.arrow_ipc import ARROW_STREAM_MEDIA_TYPE
+
+    payload: dict[str, Any] = {"cypher": cypher, "database": graph_id}
+    if parameters:
+      payload["parameters"] = parameters
+
+    return self._stream_bytes(
+      f"/databases/{graph_id}/query",
+      payload,
+      params={"streaming": "true"},
+      headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+    )
+
   async def get_info(self) -> dict[str, Any]:
     """
     Get comprehensive cluster information.
@@ -376,9 +529,11 @@ class GraphClient(BaseGraphClient):
       logger.info(f"Started ingestion task {task_id}, monitoring via SSE...")
 
       # Step 2: Monitor via SSE
-      return await self._monitor_ingestion_sse(
+      result = await self._monitor_ingestion_sse(
         sse_path=sse_path, task_id=task_id, table_name=table_name, timeout=timeout
       )
+      await self._invalidate_query_cache(graph_id)
+      return result
 
     except Exception as e:
       logger.error(f"Failed to start/monitor ingestion: {e}")
@@ -580,11 +735,13 @@ class GraphClient(BaseGraphClient):
       payload["custom_schema_ddl"] = custom_schema_ddl
 
     response = await self._request("POST", "/databases", json_data=payload)
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   async def delete_database(self, graph_id: str) -> dict[str, Any]:
     """Delete a database."""
     response = await self._request("DELETE", f"/databases/{graph_id}")
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   async def ingest(
@@ -643,6 +800,7 @@ class GraphClient(BaseGraphClient):
       json_data=payload,
       timeout=timeout,
     )
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   async def get_task_status(self, task_id: str) -> dict[str, Any]:
@@ -692,6 +850,22 @@ class GraphClient(BaseGraphClient):
     result = cast(dict[str, Any], await self.query(cypher, database, params))
     return result.get("data", [])
 
+  async def execute_query_arrow_stream(
+    self, cypher: str, params: dict[str, Any] | None = None
+  ) -> AsyncGenerator[bytes]:
+    """
+    Execute a query and stream Arrow IPC bytes (APIRepository compatibility).
+
+    Args:
+        cypher: Cypher query
+        params: Query parameters
+
+    Returns:
+        Async generator of Arrow IPC stream bytes
+    """
+    database = getattr(self, "_database_name", None) or self.graph_id or "sec"
+    return await self.query_arrow_stream(cypher, database, params)
+
   async def execute_single(
     self, cypher: str, params: dict[str, Any] | None = None
   ) -> dict[str, Any] | None:
@@ -757,6 +931,7 @@ class GraphClient(BaseGraphClient):
     response = await self._request(
       "POST", f"/databases/{graph_id}/schema", json_data=payload
     )
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   # Additional endpoints not in original API
@@ -1043,6 +1218,7 @@ class GraphClient(BaseGraphClient):
       data=data,
     )
     response.raise_for_status()
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   async def restore_with_sse(
@@ -1098,9 +1274,11 @@ class GraphClient(BaseGraphClient):
       logger.info(f"Started restore task {task_id}, monitoring via SSE...")
 
       # Step 2: Monitor via SSE
-      return await self._monitor_task_sse(
+      result = await self._monitor_task_sse(
         sse_path=monitor_url, task_id=task_id, task_type="restore", timeout=timeout
       )
+      await self._invalidate_query_cache(graph_id)
+      return result
 
     except Exception as e:
       logger.error(f"Failed to start/monitor restore: {e}")
@@ -1114,6 +1292,7 @@ class GraphClient(BaseGraphClient):
     table_name: str,
     s3_pattern: str | list[str],
     file_id_map: dict[str, str] | None = None,
+    rebuild: bool = False,
   ) -> dict[str, Any]:
     """
     Create a DuckDB staging table (external view over S3).
@@ -1123,6 +1302,7 @@ class GraphClient(BaseGraphClient):
         table_name: Name for the table
         s3_pattern: S3 glob pattern (string) or list of S3 file paths
         file_id_map: Optional map of s3_key -> file_id for provenance tracking
+        rebuild: Rebuild from all files instead of staging only new files
 
     Returns:
         Table creation response with status and metadata
@@ -1134,6 +1314,8 @@ class GraphClient(BaseGraphClient):
     }
     if file_id_map is not None:
       json_data["file_id_map"] = file_id_map
+    if rebuild:
+      json_data["rebuild"] = True
 
     response = await self._request(
       "POST",
@@ -1180,6 +1362,38 @@ class GraphClient(BaseGraphClient):
     )
     return response.json()
 
+  async def query_table_arrow_stream(
+    self,
+    graph_id: str,
+    sql: str,
+    parameters: list[Any] | None = None,
+    chunk_size: int = 10000,
+  ) -> AsyncGenerator[bytes]:
+    """
+    Execute SQL query on DuckDB staging tables and stream Arrow IPC bytes.
+
+    Args:
+        graph_id: Graph database identifier
+        sql: SQL query to execute
+        parameters: Optional query parameters for safe value substitution
+        chunk_size: Rows per record batch
+
+    Returns:
+        Async generator of Arrow IPC stream bytes
+    """
+    from robosystems.graph_api.core.arrow_ipc import ARROW_STREAM_MEDIA_TYPE
+
+    json_data: dict[str, Any] = {"graph_id": graph_id, "sql": sql}
+    if parameters is not None:
+      json_data["parameters"] = parameters
+
+    return self._stream_bytes(
+      f"/databases/{graph_id}/tables/query",
+      json_data,
+      params={"chunk_size": chunk_size},
+      headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+    )
+
   async def delete_table(self, graph_id: str, table_name: str) -> dict[str, Any]:
     """
     Delete a DuckDB staging table.
@@ -1247,6 +1461,7 @@ class GraphClient(BaseGraphClient):
       f"/databases/{graph_id}/tables/{table_name}/materialize",
       json_data=json_data,
     )
+    await self._invalidate_query_cache(graph_id)
     return response.json()
 
   async def fork_from_parent(
@@ -1281,4 +1496,5 @@ class GraphClient(BaseGraphClient):
         "ignore_errors": ignore_errors,
       },
     )
+    await self._invalidate_query_cache(subgraph_id)
     return response.json()
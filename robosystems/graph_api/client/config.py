@@ -24,6 +24,7 @@ class GraphClientConfig:
   max_connections: int = 100
   max_keepalive_connections: int = 20
   keepalive_expiry: float = 5.0
+  http2: bool = False
 
   # Circuit breaker settings
   circuit_breaker_threshold: int = 5
@@ -56,6 +57,7 @@ class GraphClientConfig:
       "max_connections": "MAX_CONNECTIONS",
       "max_keepalive_connections": "MAX_KEEPALIVE_CONNECTIONS",
       "keepalive_expiry": "KEEPALIVE_EXPIRY",
+      "http2": "HTTP2",
       "circuit_breaker_threshold": "CIRCUIT_BREAKER_THRESHOLD",
       "circuit_breaker_timeout": "CIRCUIT_BREAKER_TIMEOUT",
       "verify_ssl": "VERIFY_SSL",
@@ -96,6 +98,7 @@ class GraphClientConfig:
       "max_connections": self.max_connections,
       "max_keepalive_connections": self.max_keepalive_connections,
       "keepalive_expiry": self.keepalive_expiry,
+      "http2": self.http2,
       "circuit_breaker_threshold": self.circuit_breaker_threshold,
       "circuit_breaker_timeout": self.circuit_breaker_timeout,
       "headers": self.headers.copy(),
@@ -15,7 +15,6 @@ Routing targets:
 """
 
 import asyncio
-import json
 import random
 import threading
 import time
@@ -31,6 +30,7 @@ from robosystems.config.valkey_registry import ValkeyDatabase
 from robosystems.graph_api.client import GraphClient
 from robosystems.logger import logger
 from robosystems.middleware.graph.allocation_manager import LadybugAllocationManager
+from robosystems.middleware.graph.location_cache import get_graph_location_cache
 from robosystems.middleware.graph.types import GraphTypeRegistry
 from robosystems.middleware.graph.utils import parse_subgraph_id
 
@@ -198,19 +198,22 @@ class GraphClientFactory:
   # Shared repositories from the graph type registry
   SHARED_REPOSITORIES = list(GraphTypeRegistry.SHARED_REPOSITORIES.keys())
 
-  # Cache TTLs from constants
-  _instance_cache_ttl = env.GRAPH_INSTANCE_CACHE_TTL
-
   # Timeout configurations from constants
   _connect_timeout = env.GRAPH_CONNECT_TIMEOUT
   _read_timeout = env.GRAPH_READ_TIMEOUT
 
-  # Connection pools for reuse (HTTP/2 enabled for efficiency)
+  # Long-lived httpx clients keyed by instance URL, in least-recently-used order.
+  # Each GraphClient handed out is a lightweight view over one of these, so a
+  # request checks out a kept-alive socket instead of opening a new connection.
   _connection_pools: dict[str, httpx.AsyncClient] = {}
   _pool_stats: dict[str, dict[str, Any]] = {}  # Track pool statistics
+  _pool_lock = threading.Lock()
+  _pool_max_size = env.GRAPH_CLIENT_POOL_SIZE
+  _retiring_clients: set[asyncio.Task] = set()
 
-  # Redis connection pool for caching (thread-local to avoid event loop issues)
+  # Redis client for caching, from the shared pool (pinged once per pool)
   _redis_pool: redis.ConnectionPool | None = None
+  _redis_client: redis.Redis | None = None
   _redis_client_lock = threading.Lock()
 
   # Circuit breakers for different services
@@ -238,18 +241,17 @@ class GraphClientFactory:
 
   @classmethod
   async def _get_redis(cls) -> redis.Redis | None:
-    """Get or create Redis connection for caching with event loop safety."""
+    """Get the shared Redis client for caching with event loop safety."""
     # Check if Redis caching is enabled via feature flag
     if not env.GRAPH_REDIS_CACHE_ENABLED:
       return None
 
     try:
-      # Create a new Redis client for each event loop to avoid "Event loop is closed" errors
-      # This is necessary because background tasks may create new event loops
-      # Use async factory method to handle SSL params correctly
-      from robosystems.config.valkey_registry import create_async_redis_client
+      # The registry keeps one pool per event loop, since background tasks may
+      # run their own loops. It also handles SSL params correctly.
+      from robosystems.config.valkey_registry import get_shared_async_redis_client
 
-      client = create_async_redis_client(
+      client = get_shared_async_redis_client(
         ValkeyDatabase.LBUG_CACHE,
         decode_responses=True,
         max_connections=10,
@@ -263,21 +265,154 @@ class GraphClientFactory:
         else {},
       )
 
-      # Test the connection - handle connection state issues gracefully
+      if client is cls._redis_client:
+        return client
+
+      # Test the connection once - handle connection state issues gracefully
       try:
         await client.ping()
-        return client
       except AttributeError as ae:
         # Handle '_AsyncRESP2Parser' object has no attribute '_connected' error
         # This happens when the event loop context changes (e.g., in background tasks)
         logger.debug(f"Redis connection state issue, skipping cache: {ae}")
         return None
 
+      with cls._redis_client_lock:
+        cls._redis_client = client
+      return client
+
     except Exception as e:
       # Don't cache failures - might be transient
       logger.warning(f"Redis not available for caching: {e}")
       return None
 
+  @classmethod
+  def _build_client(cls, api_url: str, api_key: str | None) -> GraphClient:
+    """
+    Build a GraphClient for an instance URL on top of a pooled HTTP client.
+
+    The returned GraphClient carries per-request routing metadata and may be
+    closed by the caller as usual; the underlying connection pool stays open
+    and is reused by the next request to the same instance.
+
+    Args:
+        api_url: Graph API base URL of the instance
+        api_key: Graph API key
+
+    Returns:
+        GraphClient sharing the instance's pooled HTTP client
+    """
+    if cls._pool_max_size <= 0:
+      return GraphClient(base_url=api_url, api_key=api_key)
+
+    url = api_url.rstrip("/")
+    loop = asyncio.get_running_loop()
+
+    with cls._pool_lock:
+      pooled = cls._connection_pools.pop(url, None)
+      stats = cls._pool_stats.get(url, {})
+      if pooled is not None:
+        if stats.get("loop") is loop and stats.get("api_key") == api_key:
+          # Re-insert to mark as most recently used
+          cls._connection_pools[url] = pooled
+          stats["requests"] = stats.get("requests", 0) + 1
+          return GraphClient(base_url=url, api_key=api_key, http_client=pooled)
+        cls._pool_stats.pop(url, None)
+        cls._retire_http_client(url, pooled, stats.get("loop"))
+
+    client = GraphClient(base_url=url, api_key=api_key)
+
+    with cls._pool_lock:
+      if url in cls._connection_pools:
+        # Another caller pooled this instance first; keep ours private
+        return client
+
+      # Hand ownership of the HTTP client to the pool
+      client._owns_http_client = False
+      cls._connection_pools[url] = client.client
+      cls._pool_stats[url] = {
+        "created_at": time.time(),
+        "requests": 1,
+        "failures": 0,
+        "loop": loop,
+        "api_key": api_key,
+      }
+
+      while len(cls._connection_pools) > cls._pool_max_size:
+        lru_url = next(iter(cls._connection_pools))
+        lru_client = cls._connection_pools.pop(lru_url)
+        lru_stats = cls._pool_stats.pop(lru_url, {})
+        cls._retire_http_client(lru_url, lru_client, lru_stats.get("loop"))
+
+    return client
+
+  @classmethod
+  def _retire_http_client(
+    cls,
+    url: str,
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+    grace_period: float | None = None,
+  ) -> None:
+    """
+    Close a pooled HTTP client once in-flight requests had time to finish.
+
+    Clients created on another event loop cannot be closed from this one and
+    are left to garbage collection.
+    """
+    try:
+      running = asyncio.get_running_loop()
+    except RuntimeError:
+      running = None
+
+    if running is None or running is not loop:
+      logger.debug(f"Dropping pooled graph client for {url} from another event loop")
+      return
+
+    delay = cls._read_timeout if grace_period is None else grace_period
+
+    async def _close() -> None:
+      await asyncio.sleep(delay)
+      try:
+        await client.aclose()
+        logger.debug(f"Closed connection pool for {url}")
+      except Exception as e:
+        logger.warning(f"Error closing connection pool for {url}: {e}")
+
+    task = running.create_task(_close())
+    cls._retiring_clients.add(task)
+    task.add_done_callback(cls._retiring_clients.discard)
+
+  @classmethod
+  def evict_instance(cls, instance: str) -> int:
+    """
+    Drop pooled HTTP clients for a graph instance.
+
+    Called when an instance is deallocated so later requests never reuse
+    connections to it.
+
+    Args:
+        instance: Instance private IP, host, or base URL
+
+    Returns:
+        Number of pooled clients evicted
+    """
+    target = instance.rstrip("/")
+    evicted = 0
+
+    with cls._pool_lock:
+      for url in list(cls._connection_pools):
+        if url != target and httpx.URL(url).host != target:
+          continue
+        client = cls._connection_pools.pop(url)
+        stats = cls._pool_stats.pop(url, {})
+        cls._retire_http_client(url, client, stats.get("loop"), grace_period=0)
+        evicted += 1
+
+    if evicted:
+      logger.info(f"Evicted {evicted} pooled graph client(s) for {target}")
+    return evicted
+
   @classmethod
   async def create_client(
     cls,
@@ -420,7 +555,7 @@ class GraphClientFactory:
       api_key = env.GRAPH_API_KEY
 
     # Create client with appropriate configuration
-    client = GraphClient(base_url=api_url, api_key=api_key)
+    client = cls._build_client(api_url, api_key)
 
     # Add metadata for debugging
     client._route_target = target.value
@@ -670,69 +805,38 @@ class GraphClientFactory:
         f"Dev environment: Routing user graph {graph_id} to local graph at {api_url}"
       )
 
-      client = GraphClient(base_url=api_url, api_key=api_key)
+      client = cls._build_client(api_url, api_key)
       client._route_target = RouteTarget.USER_GRAPH.value
       client._graph_id = graph_id
       client._database_name = database_name  # Actual database to use
 
       return client
 
-    # Production/staging: Use allocation manager to find the right instance
-    # Check cache first - use actual_graph_id for routing
-    cache_key = cls._get_cache_key("location", actual_graph_id)
-    redis_client = await cls._get_redis()
-
-    db_location = None
-    if redis_client:
-      try:
-        cached = await redis_client.get(cache_key)
-        if cached:
-          location_data = json.loads(cached)
-          # Verify cache is still fresh (1 minute TTL)
-          if time.time() - location_data.get("timestamp", 0) < cls._instance_cache_ttl:
-            from robosystems.middleware.graph.allocation_manager import DatabaseLocation
-
-            db_location = DatabaseLocation(**location_data["location"])
-            logger.debug(f"Using cached location for {graph_id}")
-      except Exception as e:
-        logger.warning(f"Redis cache read failed for location: {e}")
-
-    # If not cached, look it up - use actual_graph_id for routing
-    if not db_location:
+    # Production/staging: Use allocation manager to find the right instance.
+    # The location cache answers from process memory or Valkey and only falls
+    # through to DynamoDB on a full miss - use actual_graph_id for routing.
+    async def _lookup_location():
       allocation_manager = LadybugAllocationManager(
         environment=environment or env.ENVIRONMENT
       )
-      db_location = await allocation_manager.find_database_location(actual_graph_id)
+      return await allocation_manager.find_database_location(actual_graph_id)
+
+    db_location = await get_graph_location_cache().get(
+      actual_graph_id, _lookup_location
+    )
 
-      if not db_location:
-        # Database doesn't exist
+    if not db_location:
+      # Database doesn't exist
+      error_msg = (
+        f"Database {actual_graph_id} not found in any instance. "
+        f"It may need to be created first."
+      )
+      if subgraph_info:
         error_msg = (
-          f"Database {actual_graph_id} not found in any instance. "
-          f"It may need to be created first."
+          f"Parent graph {actual_graph_id} not found for subgraph {graph_id}. "
+          f"The parent graph must be created before creating subgraphs."
         )
-        if subgraph_info:
-          error_msg = (
-            f"Parent graph {actual_graph_id} not found for subgraph {graph_id}. "
-            f"The parent graph must be created before creating subgraphs."
-          )
-        raise RouteError(error_msg)
-
-      # Cache the location
-      if redis_client:
-        try:
-          location_data = {
-            "location": {
-              "instance_id": db_location.instance_id,
-              "private_ip": db_location.private_ip,
-              "database_name": db_location.graph_id,
-            },
-            "timestamp": time.time(),
-          }
-          await redis_client.setex(
-            cache_key, cls._instance_cache_ttl, json.dumps(location_data)
-          )
-        except Exception as e:
-          logger.warning(f"Redis cache write failed for location: {e}")
+      raise RouteError(error_msg)
 
     # Create client with the allocated instance's endpoint
     api_url = f"http://{db_location.private_ip}:8001"
@@ -746,7 +850,7 @@ class GraphClientFactory:
     if not api_key:
       logger.error("GRAPH_API_KEY is not set in environment!")
 
-    client = GraphClient(base_url=api_url, api_key=api_key)
+    client = cls._build_client(api_url, api_key)
 
     # Add metadata
     client._route_target = RouteTarget.USER_GRAPH.value
@@ -818,6 +922,7 @@ class GraphClientFactory:
         },
       },
       "total_pools": len(cls._connection_pools),
+      "max_pools": cls._pool_max_size,
     }
 
     # Add pool-specific statistics
@@ -850,18 +955,22 @@ class GraphClientFactory:
       logger.warning(f"Error getting pool statistics during cleanup: {e}")
 
     # Close HTTP connection pools with error handling
-    for url, client in cls._connection_pools.items():
+    with cls._pool_lock:
+      pools = list(cls._connection_pools.items())
+      cls._connection_pools.clear()
+      cls._pool_stats.clear()
+
+    for url, client in pools:
       try:
         await client.aclose()
         logger.debug(f"Closed connection pool for {url}")
       except Exception as e:
         logger.warning(f"Error closing connection pool for {url}: {e}")
 
-    cls._connection_pools.clear()
-    cls._pool_stats.clear()
-
-    # Close Redis connection pool with error handling
+    # Forget the shared Redis client (its pool is owned by the Valkey registry)
+    # and close any legacy connection pool with error handling
     with cls._redis_client_lock:
+      cls._redis_client = None
       if cls._redis_pool:
         try:
           await cls._redis_pool.disconnect()
@@ -970,7 +1079,7 @@ async def get_graph_client_for_instance(
   api_url = f"http://{instance_ip}:8001"
   logger.info(f"Creating direct graph client for instance at {api_url}")
 
-  return GraphClient(base_url=api_url, api_key=api_key)
+  return GraphClientFactory._build_client(api_url, api_key)
 
 
 # Special factory method for SEC ingestion
@@ -1009,7 +1118,7 @@ async def get_graph_client_for_sec_ingestion() -> GraphClient:
 
   api_key = env.GRAPH_API_KEY
 
-  client = GraphClient(base_url=api_url, api_key=api_key)
+  client = GraphClientFactory._build_client(api_url, api_key)
   client._route_target = RouteTarget.SHARED_MASTER.value
   client._purpose = "sec_ingestion"
 
@@ -0,0 +1,132 @@
+"""
+Arrow IPC result transport.
+
+Query results can be exchanged between the Graph API and the main API as an
+Arrow IPC stream instead of per-row JSON. Both LadybugDB and DuckDB produce
+Arrow data natively, so the columnar path avoids building a Python dict per
+row on the Graph API and parsing it again on the client.
+
+The format is opt-in: callers request it with
+``Accept: application/vnd.apache.arrow.stream``. Everything else continues to
+receive JSON/NDJSON.
+"""
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Default number of rows per record batch when streaming
+DEFAULT_BATCH_ROWS = 10000
+
+
+def wants_arrow(accept_header: str | None) -> bool:
+  """Check whether an Accept header asks for the Arrow IPC stream format."""
+  return bool(accept_header) and ARROW_STREAM_MEDIA_TYPE in accept_header.lower()
+
+
+def rename_columns(table: pa.Table, columns: list[str] | None) -> pa.Table:
+  """Apply Cypher column aliases to an Arrow table when the counts match."""
+  if columns and len(columns) == table.num_columns and columns != table.column_names:
+    return table.rename_columns(columns)
+  return table
+
+
+def iter_ipc_stream(
+  schema: pa.Schema, batches: Iterable[pa.RecordBatch]
+) -> Iterator[bytes]:
+  """
+  Encode record batches as an Arrow IPC stream.
+
+  Yields the encoded bytes after each record batch (the schema message is
+  emitted with the first one) and the end-of-stream marker last, so the output
+  can be handed directly to a streaming HTTP response. The sink is drained
+  after every batch, so memory stays bounded by a single batch.
+  """
+  sink = io.BytesIO()
+
+  def drain() -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate(0)
+    return data
+
+  with pa.ipc.new_stream(sink, schema) as writer:
+    for batch in batches:
+      if batch.num_rows == 0:
+        continue
+      writer.write_batch(batch)
+      yield drain()
+
+  # Schema (for empty results) and end-of-stream marker
+  yield drain()
+
+
+def table_to_ipc_bytes(table: pa.Table, batch_rows: int = DEFAULT_BATCH_ROWS) -> bytes:
+  """Serialize a complete Arrow table to IPC stream bytes."""
+  return b"".join(
+    iter_ipc_stream(table.schema, table.to_batches(max_chunksize=batch_rows))
+  )
+
+
+def read_ipc_table(data: bytes) -> pa.Table:
+  """Deserialize a complete Arrow IPC stream into a table."""
+  with pa.ipc.open_stream(pa.BufferReader(data)) as reader:
+    return reader.read_all()
+
+
+def table_to_rows(table: pa.Table) -> list[dict[str, Any]]:
+  """Materialize an Arrow table into row dicts (only where a consumer needs them)."""
+  return table.to_pylist()
+
+
+class ArrowStreamDecoder:
+  """
+  Incremental decoder for Arrow IPC streams received in arbitrary byte chunks.
+
+  Feed network chunks with ``feed`` and collect complete record batches as
+  they become available. The schema is read from the first message.
+  """
+
+  def __init__(self):
+    self._buffer = bytearray()
+    self.schema: pa.Schema | None = None
+    self.finished = False
+
+  def feed(self, data: bytes) -> list[pa.RecordBatch]:
+    """Add bytes and return every record batch that is now complete."""
+    if data:
+      self._buffer.extend(data)
+
+    batches: list[pa.RecordBatch] = []
+    while self._buffer and not self.finished:
+      reader = pa.BufferReader(bytes(self._buffer))
+      try:
+        message = pa.ipc.read_message(reader)
+      except EOFError:
+        # End-of-stream marker
+        self.finished = True
+        self._buffer.clear()
+        break
+      except (pa.ArrowInvalid, OSError):
+        # Incomplete message - wait for more data
+        break
+
+      del self._buffer[: reader.tell()]
+
+      if self.schema is None:
+        self.schema = pa.ipc.read_schema(message)
+      else:
+        batches.append(pa.ipc.read_record_batch(message, self.schema))
+
+    return batches
+
+  def close(self) -> None:
+    """Verify that no partial message is left over."""
+    if self._buffer and not self.finished:
+      raise ValueError(
+        f"Arrow IPC stream ended with {len(self._buffer)} undecoded bytes"
+      )
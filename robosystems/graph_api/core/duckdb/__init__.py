@@ -16,6 +16,7 @@ from .manager import (
 from .pool import (
   DuckDBConnectionInfo,
   DuckDBConnectionPool,
+  DuckDBPoolTimeoutError,
   get_duckdb_pool,
   initialize_duckdb_pool,
 )
@@ -23,6 +24,7 @@ from .pool import (
 __all__ = [
   "DuckDBConnectionInfo",
   "DuckDBConnectionPool",
+  "DuckDBPoolTimeoutError",
   "DuckDBTableManager",
   "TableCreateRequest",
   "TableCreateResponse",
@@ -4,6 +4,7 @@ from typing import Any
 
 from fastapi import HTTPException, status
 
+from robosystems.graph_api.core.arrow_ipc import iter_ipc_stream
 from robosystems.graph_api.core.duckdb.pool import get_duckdb_pool
 from robosystems.graph_api.models.tables import (
   TableCreateRequest,
@@ -14,6 +15,11 @@ from robosystems.graph_api.models.tables import (
 )
 from robosystems.logger import logger
 
+# Files staged into each table with file_id tracking. Kept outside the main
+# schema so it is not listed, forked or materialized as a staging table.
+FILE_REGISTRY_SCHEMA = "_staging"
+FILE_REGISTRY = f"{FILE_REGISTRY_SCHEMA}.file_registry"
+
 
 def validate_table_name(table_name: str) -> None:
   """
@@ -141,91 +147,245 @@ class DuckDBTableManager:
         FROM read_parquet({read_pattern}, hive_partitioning=false)
       """
 
-  def _build_table_sql_with_file_id(
+  def _ensure_file_registry(self, conn) -> None:
+    """Create the staged file registry if this database does not have it yet."""
+    conn.execute(f"CREATE SCHEMA IF NOT EXISTS {FILE_REGISTRY_SCHEMA}")
+    conn.execute(
+      f"""
+      CREATE TABLE IF NOT EXISTS {FILE_REGISTRY} (
+        table_name VARCHAR NOT NULL,
+        s3_key VARCHAR NOT NULL,
+        file_id VARCHAR NOT NULL,
+        staged_at TIMESTAMP DEFAULT current_timestamp,
+        PRIMARY KEY (table_name, s3_key)
+      )
+      """
+    )
+
+  def _registered_files(self, conn, table_name: str) -> dict[str, str]:
+    """Files already staged into a table, as s3_key -> file_id."""
+    rows = conn.execute(
+      f"SELECT s3_key, file_id FROM {FILE_REGISTRY} WHERE table_name = ?",
+      [table_name],
+    ).fetchall()
+    return dict(rows)
+
+  def _register_files(
+    self, conn, table_name: str, s3_files: list[str], file_id_map: dict[str, str]
+  ) -> None:
+    """Record files as staged into a table."""
+    conn.execute(
+      f"INSERT INTO {FILE_REGISTRY} (table_name, s3_key, file_id) "
+      "SELECT ?, UNNEST(?::VARCHAR[]), UNNEST(?::VARCHAR[])",
+      [
+        table_name,
+        s3_files,
+        [file_id_map.get(s3_key, "unknown") for s3_key in s3_files],
+      ],
+    )
+
+  def _unregister_files(
+    self, conn, table_name: str, file_id: str | None = None
+  ) -> None:
+    """Forget staged files of a table (all of them, or those of one file_id)."""
+    self._ensure_file_registry(conn)
+    if file_id is None:
+      conn.execute(f"DELETE FROM {FILE_REGISTRY} WHERE table_name = ?", [table_name])
+    else:
+      conn.execute(
+        f"DELETE FROM {FILE_REGISTRY} WHERE table_name = ? AND file_id = ?",
+        [table_name, file_id],
+      )
+
+  def _table_columns(self, conn, table_name: str) -> list[str]:
+    """Columns of an existing staging table (empty if it does not exist)."""
+    rows = conn.execute(
+      "SELECT column_name FROM information_schema.columns "
+      "WHERE table_schema = 'main' AND table_name = ? ORDER BY ordinal_position",
+      [table_name],
+    ).fetchall()
+    return [row[0] for row in rows]
+
+  def _build_registered_scan(self, has_from_to: bool) -> str:
+    """
+    Build a single parquet scan over a list of files, tagged with file_id.
+
+    The scan reads every file in one ``read_parquet`` call and joins the
+    source filename to the file registry, so the SQL stays the same size no
+    matter how many files are read. Parameters: file list, table name.
+
+    Args:
+        has_from_to: Whether table has 'from'/'to' columns (renamed to src/dst)
+
+    Returns:
+        SELECT statement producing staged rows with a file_id column
+    """
+    if has_from_to:
+      # IMPORTANT: LadybugDB expects columns in order: src, dst, then properties
+      columns = (
+        'p."from" AS src, p."to" AS dst, '
+        'p.* EXCLUDE ("from", "to", _source_file), r.file_id'
+      )
+    else:
+      columns = "p.* EXCLUDE (_source_file), r.file_id"
+
+    return f"""
+      SELECT {columns}
+      FROM read_parquet(
+        ?, hive_partitioning=false, union_by_name=true, filename='_source_file'
+      ) AS p
+      JOIN {FILE_REGISTRY} AS r
+        ON r.s3_key = p._source_file AND r.table_name = ?
+    """
+
+  def _build_staging_sql(
     self,
     quoted_table: str,
     has_identifier: bool,
     has_from_to: bool,
-    s3_files: list[str],
-    file_id_map: dict[str, str],
+    incremental: bool,
   ) -> str:
     """
-    Build CREATE TABLE SQL with file_id column injection (v2 incremental ingestion).
+    Build the SQL that stages registered files into a table.
 
-    Uses UNION ALL to combine files, injecting file_id for each source file.
-    This enables per-file deletion and provenance tracking.
+    A full rebuild replaces the table; an incremental run appends only the
+    rows whose key is not staged yet, so existing rows win (the same rule
+    LadybugDB applies when a COPY hits an existing primary key). Either way,
+    duplicates inside the scanned files are collapsed with ROW_NUMBER.
 
     Args:
         quoted_table: Quoted table name
-        has_identifier: Whether table has 'identifier' column
-        has_from_to: Whether table has 'from'/'to' columns
-        s3_files: List of S3 file paths
-        file_id_map: Map of s3_key -> file_id
+        has_identifier: Whether table has 'identifier' column (node table)
+        has_from_to: Whether table has 'from'/'to' columns (relationship table)
+        incremental: Append to the existing table instead of replacing it
 
     Returns:
-        SQL with UNION ALL and file_id injection
+        SQL statement taking the scan parameters (file list, table name)
     """
-    # Build individual SELECT queries for each file
-    selects = []
-
-    for s3_key in s3_files:
-      file_id = file_id_map.get(s3_key, "unknown")
-
-      if has_identifier:
-        # Node table: keep identifier, add file_id
-        select = f"""
-          SELECT *, '{file_id}' as file_id
-          FROM read_parquet('{s3_key}', hive_partitioning=false)
-        """
-      elif has_from_to:
-        # Relationship table: rename from/to to src/dst, add file_id
-        select = f"""
-          SELECT
-            "from" as src,
-            "to" as dst,
-            * EXCLUDE ("from", "to"),
-            '{file_id}' as file_id
-          FROM read_parquet('{s3_key}', hive_partitioning=false)
-        """
-      else:
-        # Unknown table: just add file_id
-        select = f"""
-          SELECT *, '{file_id}' as file_id
-          FROM read_parquet('{s3_key}', hive_partitioning=false)
-        """
+    scan = self._build_registered_scan(has_from_to)
 
-      selects.append(select)
+    if has_identifier:
+      key_columns = ["identifier"]
+    elif has_from_to:
+      key_columns = ["src", "dst"]
+    else:
+      # Unknown table type: no key to deduplicate on
+      if incremental:
+        return f"INSERT INTO {quoted_table} BY NAME {scan}"
+      return f"CREATE OR REPLACE TABLE {quoted_table} AS {scan}"
+
+    partition = ", ".join(key_columns)
+    deduplicated = f"""
+      SELECT * EXCLUDE (rn)
+      FROM (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY {partition}) AS rn
+        FROM ({scan})
+      ) AS staged
+      WHERE rn = 1
+    """
 
-    # Combine with UNION ALL
-    union_query = "\n UNION ALL\n".join(selects)
+    if not incremental:
+      return f"CREATE OR REPLACE TABLE {quoted_table} AS {deduplicated}"
 
-    # Wrap in deduplication if needed
-    if has_identifier:
-      return f"""
-        CREATE OR REPLACE TABLE {quoted_table} AS
-        SELECT * EXCLUDE (rn)
-        FROM (
-          SELECT *, ROW_NUMBER() OVER (PARTITION BY identifier ORDER BY identifier) AS rn
-          FROM ({union_query})
+    # Only keys present in the new files are compared against the table
+    key_match = " AND ".join(
+      f"existing.{column} = staged.{column}" for column in key_columns
+    )
+    return f"""
+      INSERT INTO {quoted_table} BY NAME
+      {deduplicated}
+        AND NOT EXISTS (
+          SELECT 1 FROM {quoted_table} AS existing WHERE {key_match}
         )
-        WHERE rn = 1
-      """
-    elif has_from_to:
-      return f"""
-        CREATE OR REPLACE TABLE {quoted_table} AS
-        SELECT * EXCLUDE (rn)
-        FROM (
-          SELECT *, ROW_NUMBER() OVER (PARTITION BY src, dst ORDER BY src, dst) AS rn
-          FROM ({union_query})
+    """
+
+  def _stage_files(
+    self, conn, request: TableCreateRequest, quoted_table: str
+  ) -> tuple[str, list[str]]:
+    """
+    Stage a list of files with file_id tracking, incrementally when possible.
+
+    ``request.s3_pattern`` is the complete list of files the table should
+    contain. Files already in the registry are not read again; only new files
+    are scanned and appended. The table is rebuilt from all files when it does
+    not exist yet, when a registered file was removed or changed file_id (its
+    rows may have shadowed duplicates in other files), when new files bring
+    columns the table does not have, or when ``request.rebuild`` is set.
+
+    Args:
+        conn: DuckDB connection
+        request: Table creation request with a file list and file_id_map
+        quoted_table: Quoted table name
+
+    Returns:
+        Tuple of (mode, files scanned)
+    """
+    s3_files = list(dict.fromkeys(request.s3_pattern))
+    file_id_map = request.file_id_map or {}
+
+    self._ensure_file_registry(conn)
+    table_columns = self._table_columns(conn, request.table_name)
+    registered = (
+      self._registered_files(conn, request.table_name)
+      if "file_id" in table_columns
+      else {}
+    )
+
+    new_files = [s3_key for s3_key in s3_files if s3_key not in registered]
+    wanted = {s3_key: file_id_map.get(s3_key, "unknown") for s3_key in s3_files}
+    changed = [
+      s3_key for s3_key, file_id in registered.items() if wanted.get(s3_key) != file_id
+    ]
+
+    incremental = bool(registered) and not changed and not request.rebuild
+    if incremental and not new_files:
+      return "incremental", []
+
+    scan_files = new_files if incremental else s3_files
+
+    # Reads parquet footers only; detects node/relationship tables and new columns
+    probe_result = conn.execute(
+      "SELECT * FROM read_parquet(?, hive_partitioning=false, union_by_name=true) "
+      "LIMIT 0",
+      [scan_files],
+    ).description
+    column_names = [col[0] for col in probe_result]
+    has_identifier = "identifier" in column_names
+    has_from_to = "from" in column_names and "to" in column_names
+
+    if incremental:
+      renamed = {"from": "src", "to": "dst"} if has_from_to else {}
+      staged_columns = {renamed.get(column, column) for column in column_names}
+      missing = staged_columns - set(table_columns)
+      if missing:
+        logger.info(
+          f"New files add columns {sorted(missing)} to {request.table_name} "
+          f"- rebuilding from all files"
         )
-        WHERE rn = 1
-      """
-    else:
-      # No deduplication for unknown tables
-      return f"""
-        CREATE OR REPLACE TABLE {quoted_table} AS
-        {union_query}
-      """
+        incremental = False
+        scan_files = s3_files
+
+    mode = "incremental" if incremental else "full"
+    sql = self._build_staging_sql(
+      quoted_table, has_identifier, has_from_to, incremental
+    )
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+      if incremental:
+        self._register_files(conn, request.table_name, new_files, file_id_map)
+      else:
+        conn.execute(
+          f"DELETE FROM {FILE_REGISTRY} WHERE table_name = ?", [request.table_name]
+        )
+        self._register_files(conn, request.table_name, s3_files, file_id_map)
+      conn.execute(sql, [scan_files, request.table_name])
+      conn.execute("COMMIT")
+    except Exception:
+      conn.execute("ROLLBACK")
+      raise
+
+    return mode, scan_files
 
   @validate_table_name_decorator
   def create_table(self, request: TableCreateRequest) -> TableCreateResponse:
@@ -246,6 +406,10 @@ class DuckDBTableManager:
     - s3_pattern as string: wildcard pattern (e.g., "s3://bucket/path/*.parquet")
     - s3_pattern as list: explicit file paths (uses DuckDB list syntax)
     - file_id_map: Optional map to inject file_id for incremental ingestion tracking
+
+    With a file list and file_id_map, the list is the complete set of files for
+    the table: files staged by an earlier call are not read again, and only new
+    files are appended (see ``_stage_files``).
     """
     import time
 
@@ -270,32 +434,34 @@ class DuckDBTableManager:
       with pool.get_connection(request.graph_id) as conn:
         quoted_table = f'"{request.table_name}"'
 
-        # Determine if this is a node table (has identifier) or relationship table (has from/to)
-        # Peek at the first file to check schema
-        sample_file = request.s3_pattern[0] if is_list else request.s3_pattern
-
-        # Check if 'identifier' column exists (node table) or 'from' column exists (relationship table)
-        # Use hive_partitioning=false to prevent DuckDB from auto-adding partition columns
-        probe_result = conn.execute(
-          "SELECT * FROM read_parquet(?, hive_partitioning=false) LIMIT 0",
-          [sample_file],
-        ).description
-        column_names = [col[0] for col in probe_result]
-        has_identifier = "identifier" in column_names
-        has_from_to = "from" in column_names and "to" in column_names
-
-        # v2 Incremental Ingestion: Build UNION ALL with file_id injection
+        mode = None
+        files_scanned = None
+        staged_file_ids = None
+
         if has_file_id_map and is_list:
-          sql = self._build_table_sql_with_file_id(
-            quoted_table,
-            has_identifier,
-            has_from_to,
-            request.s3_pattern,
-            request.file_id_map,
-          )
-          conn.execute(sql)
+          # Incremental ingestion: single scan of new files joined to the registry
+          mode, scanned = self._stage_files(conn, request, quoted_table)
+          files_scanned = len(scanned)
+          if mode == "incremental":
+            staged_file_ids = [
+              request.file_id_map.get(s3_key, "unknown") for s3_key in scanned
+            ]
         else:
           # Legacy path: without file_id tracking
+          # Determine if this is a node table (has identifier) or relationship table (has from/to)
+          # Peek at the first file to check schema
+          sample_file = request.s3_pattern[0] if is_list else request.s3_pattern
+
+          # Check if 'identifier' column exists (node table) or 'from' column exists (relationship table)
+          # Use hive_partitioning=false to prevent DuckDB from auto-adding partition columns
+          probe_result = conn.execute(
+            "SELECT * FROM read_parquet(?, hive_partitioning=false) LIMIT 0",
+            [sample_file],
+          ).description
+          column_names = [col[0] for col in probe_result]
+          has_identifier = "identifier" in column_names
+          has_from_to = "from" in column_names and "to" in column_names
+
           sql = self._build_table_sql(
             quoted_table, has_identifier, has_from_to, is_list
           )
@@ -314,9 +480,10 @@ class DuckDBTableManager:
 
         execution_time_ms = (time.time() - start_time) * 1000
 
+        staged = f", {mode}: {files_scanned} scanned" if mode else ""
         logger.info(
           f"Created external table {request.table_name} for graph {request.graph_id} "
-          f"in {execution_time_ms:.2f}ms ({file_count} {'files' if is_list else ''})"
+          f"in {execution_time_ms:.2f}ms ({file_count} {'files' if is_list else ''}{staged})"
         )
 
         return TableCreateResponse(
@@ -324,6 +491,9 @@ class DuckDBTableManager:
           graph_id=request.graph_id,
           table_name=request.table_name,
           execution_time_ms=execution_time_ms,
+          mode=mode,
+          files_scanned=files_scanned,
+          file_ids=staged_file_ids,
         )
 
     except Exception as e:
@@ -460,6 +630,53 @@ class DuckDBTableManager:
         "execution_time_ms": (time.time() - start_time) * 1000,
       }
 
+  def query_table_arrow(self, request: TableQueryRequest, chunk_size: int = 1000):
+    """
+    Execute SQL query and yield the result as an Arrow IPC stream.
+
+    DuckDB exports results to Arrow natively via ``fetch_record_batch``, so
+    rows are never materialized as Python objects. Query errors are raised
+    when the first chunk is requested, before any bytes are sent.
+
+    Args:
+        request: Query request
+        chunk_size: Number of rows per record batch
+
+    Yields:
+        Encoded Arrow IPC stream bytes
+    """
+    import time
+
+    start_time = time.time()
+
+    logger.info(
+      f"Executing Arrow query for graph {request.graph_id}: {request.sql[:100]}..."
+    )
+
+    pool = get_duckdb_pool()
+
+    with pool.get_connection(request.graph_id) as conn:
+      if request.parameters:
+        cursor = conn.execute(request.sql, request.parameters)
+      else:
+        cursor = conn.execute(request.sql)
+      reader = cursor.fetch_record_batch(chunk_size)
+
+      total_rows = 0
+
+      def count_rows(batches):
+        nonlocal total_rows
+        for batch in batches:
+          total_rows += batch.num_rows
+          yield batch
+
+      yield from iter_ipc_stream(reader.schema, count_rows(reader))
+
+    execution_time_ms = (time.time() - start_time) * 1000
+    logger.info(
+      f"Arrow query completed: {total_rows} rows in {execution_time_ms:.2f}ms"
+    )
+
   def list_tables(self, graph_id: str) -> list[TableInfo]:
     logger.info(f"Listing tables for graph {graph_id}")
 
@@ -565,6 +782,7 @@ class DuckDBTableManager:
 
         conn.execute(f"DROP VIEW IF EXISTS {quoted_table}")
         conn.execute(f"DROP TABLE IF EXISTS {quoted_table}")
+        self._unregister_files(conn, table_name)
 
         s3_pattern_list = ", ".join([f"'{key}'" for key in s3_keys])
         create_view_sql = f"CREATE VIEW {quoted_table} AS SELECT * FROM read_parquet([{s3_pattern_list}])"
@@ -611,6 +829,7 @@ class DuckDBTableManager:
         quoted_table = f'"{table_name}"'
         conn.execute(f"DROP TABLE IF EXISTS {quoted_table}")
         conn.execute(f"DROP VIEW IF EXISTS {quoted_table}")
+        self._unregister_files(conn, table_name)
 
         logger.info(f"Deleted table {table_name} from graph {graph_id}")
 
@@ -637,6 +856,9 @@ class DuckDBTableManager:
         table_name: Table name
         file_id: File identifier to delete
 
+    Rows of other files that were dropped as duplicates of this file's keys
+    are not restored; pass ``rebuild=True`` to ``create_table`` for that.
+
     Returns:
         Dict with status and rows_deleted count
     """
@@ -683,6 +905,9 @@ class DuckDBTableManager:
             detail=f"Table {table_name} does not support file-level deletion (no file_id column)",
           )
 
+        # The file is no longer staged, even if none of its rows survived dedup
+        self._unregister_files(conn, table_name, file_id)
+
         # Count rows before deletion
         count_result = conn.execute(
           f"SELECT COUNT(*) FROM {quoted_table} WHERE file_id = ?", [file_id]
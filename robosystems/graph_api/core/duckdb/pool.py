@@ -6,18 +6,28 @@ with proper thread safety, connection limits, TTL, and health checking.
 
 Inspired by the successful LadybugConnectionPool implementation.
 
+DuckDB connections are not safe for concurrent use, so a connection is checked
+out for the duration of a ``get_connection`` block and returned afterwards.
+When every connection of a database is checked out, callers wait in FIFO order
+until one is returned or the acquire timeout expires.
+
 Key features:
 - Thread-safe connection management using locks
+- Exclusive checkout with FIFO waiting and an acquire timeout
 - Configurable connection limits per database
 - Connection TTL and automatic cleanup
-- Connection health checking and recovery
+- Connection health checking and recovery (idle connections only)
+- Per-database wait time and utilization metrics
 - Metrics and monitoring integration
 - Graceful connection cleanup on shutdown
 - Per-database DuckDB instances (one per graph_id)
 """
 
+import itertools
 import threading
+import time
 import weakref
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -40,6 +50,12 @@ class DuckDBConnectionInfo:
   last_used: datetime
   use_count: int
   is_healthy: bool
+  in_use: bool = False  # Checked out by a caller
+  retired: bool = False  # Removed from the pool while checked out
+
+
+class DuckDBPoolTimeoutError(TimeoutError):
+  """Raised when no connection becomes available within the acquire timeout."""
 
 
 class DuckDBConnectionPool:
@@ -61,6 +77,7 @@ class DuckDBConnectionPool:
     connection_ttl_minutes: int = 30,
     health_check_interval_minutes: int = 5,
     cleanup_interval_minutes: int = 10,
+    acquire_timeout_seconds: float | None = None,
   ):
     """
     Initialize DuckDB connection pool.
@@ -71,14 +88,22 @@ class DuckDBConnectionPool:
         connection_ttl_minutes: Connection time-to-live in minutes
         health_check_interval_minutes: How often to check connection health
         cleanup_interval_minutes: How often to cleanup expired connections
+        acquire_timeout_seconds: How long to wait for a connection when all
+            are checked out (defaults to DUCKDB_POOL_ACQUIRE_TIMEOUT_SECONDS)
 
     Note:
         Database files are NOT automatically deleted. They persist as long as
         the graph exists. Use force_database_cleanup() to manually delete when
         a graph is deleted.
     """
+    if acquire_timeout_seconds is None:
+      from robosystems.config import env
+
+      acquire_timeout_seconds = env.DUCKDB_POOL_ACQUIRE_TIMEOUT_SECONDS
+
     self.base_path = Path(base_path)
     self.max_connections_per_db = max_connections_per_db
+    self.acquire_timeout = acquire_timeout_seconds
     self.connection_ttl = timedelta(minutes=connection_ttl_minutes)
     self.health_check_interval = timedelta(minutes=health_check_interval_minutes)
     self.cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
@@ -92,7 +117,14 @@ class DuckDBConnectionPool:
     # Thread-safe storage
     self._pools: dict[str, dict[str, DuckDBConnectionInfo]] = {}
     self._locks: dict[str, threading.RLock] = {}
+    self._conditions: dict[str, threading.Condition] = {}
+    self._waiters: dict[str, deque[object]] = {}
+    # Guards the registries only; never take a database lock while holding it
     self._global_lock = threading.RLock()
+    self._connection_ids = itertools.count()
+
+    # Connections removed from the pool while checked out, closed on return
+    self._retired: list[DuckDBConnectionInfo] = []
 
     # Monitoring
     self._stats = {
@@ -103,6 +135,7 @@ class DuckDBConnectionPool:
       "health_failures": 0,
       "databases_cleaned": 0,
     }
+    self._db_stats: dict[str, dict[str, float]] = {}
 
     # Cleanup tracking
     self._last_cleanup = datetime.now(UTC)
@@ -117,48 +150,116 @@ class DuckDBConnectionPool:
     )
 
   @contextmanager
-  def get_connection(self, graph_id: str):
+  def get_connection(self, graph_id: str, timeout: float | None = None):
     """
     Get a connection from the pool (context manager).
 
+    The connection is checked out exclusively until the block exits.
+
     Args:
         graph_id: Graph database identifier (used as database name)
+        timeout: Seconds to wait when all connections are checked out
+            (defaults to the pool's acquire timeout)
 
     Yields:
         duckdb.DuckDBPyConnection: Database connection
 
+    Raises:
+        DuckDBPoolTimeoutError: If no connection became available in time
+
     Example:
         with pool.get_connection("graph123") as conn:
             result = conn.execute("SELECT * FROM my_table").fetchall()
     """
     connection_info = None
     try:
-      connection_info = self._acquire_connection(graph_id)
+      connection_info = self._acquire_connection(graph_id, timeout)
       yield connection_info.connection
     finally:
       if connection_info:
         self._release_connection(graph_id, connection_info)
 
-  def _acquire_connection(self, graph_id: str) -> DuckDBConnectionInfo:
-    """Acquire a connection from the pool."""
+  def _acquire_connection(
+    self, graph_id: str, timeout: float | None = None
+  ) -> DuckDBConnectionInfo:
+    """Check out a connection, waiting in FIFO order while the pool is saturated."""
     self._maybe_run_maintenance()
 
-    with self._get_database_lock(graph_id):
-      connection_info = self._get_existing_connection(graph_id)
+    timeout = self.acquire_timeout if timeout is None else timeout
+    started = time.monotonic()
+    deadline = started + timeout
 
-      if connection_info and self._is_connection_valid(connection_info):
-        connection_info.last_used = datetime.now(UTC)
-        connection_info.use_count += 1
-        self._stats["connections_reused"] += 1
-        logger.debug(
-          f"Reused DuckDB connection for {graph_id} (use count: {connection_info.use_count})"
-        )
-        return connection_info
+    condition = self._get_condition(graph_id)
+    with condition:
+      waiters = self._waiters.setdefault(graph_id, deque())
+      ticket = object()
+      waiters.append(ticket)
+      waited = False
+      try:
+        while True:
+          # Only the longest waiting caller may take a connection
+          if waiters[0] is ticket:
+            connection_info = self._checkout_connection(graph_id)
+            if connection_info is not None:
+              self._record_checkout(graph_id, waited, time.monotonic() - started)
+              return connection_info
+
+          remaining = deadline - time.monotonic()
+          if remaining <= 0:
+            self._get_db_stats(graph_id)["timeouts"] += 1
+            raise DuckDBPoolTimeoutError(
+              f"No DuckDB connection available for {graph_id} after "
+              f"{timeout:.1f}s ({self.max_connections_per_db} in use)"
+            )
+          waited = True
+          condition.wait(remaining)
+      finally:
+        waiters.remove(ticket)
+        # Let the next waiter re-check
+        condition.notify_all()
+
+  def _checkout_connection(self, graph_id: str) -> DuckDBConnectionInfo | None:
+    """Check out an idle connection or create one; None if all are in use."""
+    connection_info = self._get_existing_connection(graph_id)
+
+    if connection_info and self._is_connection_valid(connection_info):
+      connection_info.last_used = datetime.now(UTC)
+      connection_info.use_count += 1
+      connection_info.in_use = True
+      self._stats["connections_reused"] += 1
+      logger.debug(
+        f"Reused DuckDB connection for {graph_id} (use count: {connection_info.use_count})"
+      )
+      return connection_info
+
+    # Make room by closing an idle connection that cannot be reused
+    pool = self._pools.get(graph_id, {})
+    if len(pool) >= self.max_connections_per_db and not self._remove_oldest_connection(
+      graph_id
+    ):
+      return None
 
-      return self._create_new_connection(graph_id)
+    connection_info = self._create_new_connection(graph_id)
+    connection_info.in_use = True
+    return connection_info
 
   def _release_connection(self, graph_id: str, connection_info: DuckDBConnectionInfo):
-    """Release a connection back to the pool."""
+    """Return a checked-out connection to the pool."""
+    condition = self._get_condition(graph_id)
+    with condition:
+      connection_info.in_use = False
+      connection_info.last_used = datetime.now(UTC)
+
+      if connection_info.retired:
+        # Removed from the pool while in use (invalidation, cleanup, shutdown)
+        self._retired = [info for info in self._retired if info is not connection_info]
+        self._checkpoint_and_close(graph_id, connection_info, "retired")
+      elif not self._is_connection_valid(connection_info):
+        for conn_id, info in list(self._pools.get(graph_id, {}).items()):
+          if info is connection_info:
+            self._close_connection(graph_id, conn_id)
+
+      condition.notify_all()
     logger.debug(f"Released DuckDB connection for {graph_id}")
 
   def _get_database_lock(self, graph_id: str) -> threading.RLock:
@@ -168,6 +269,40 @@ class DuckDBConnectionPool:
         self._locks[graph_id] = threading.RLock()
       return self._locks[graph_id]
 
+  def _get_condition(self, graph_id: str) -> threading.Condition:
+    """Get or create the checkout condition for a database (uses its lock)."""
+    with self._global_lock:
+      if graph_id not in self._conditions:
+        self._conditions[graph_id] = threading.Condition(
+          self._get_database_lock(graph_id)
+        )
+      return self._conditions[graph_id]
+
+  def _get_db_stats(self, graph_id: str) -> dict[str, float]:
+    """Get or create checkout metrics for a database."""
+    stats = self._db_stats.get(graph_id)
+    if stats is None:
+      stats = self._db_stats.setdefault(
+        graph_id,
+        {
+          "checkouts": 0,
+          "waits": 0,
+          "total_wait_seconds": 0.0,
+          "max_wait_seconds": 0.0,
+          "timeouts": 0,
+        },
+      )
+    return stats
+
+  def _record_checkout(self, graph_id: str, waited: bool, wait_seconds: float):
+    """Record a successful checkout and how long it waited."""
+    stats = self._get_db_stats(graph_id)
+    stats["checkouts"] += 1
+    if waited:
+      stats["waits"] += 1
+      stats["total_wait_seconds"] += wait_seconds
+      stats["max_wait_seconds"] = max(stats["max_wait_seconds"], wait_seconds)
+
   def _get_existing_connection(self, graph_id: str) -> DuckDBConnectionInfo | None:
     """Get an existing connection for a database if available."""
     if graph_id not in self._pools:
@@ -180,7 +315,8 @@ class DuckDBConnectionPool:
 
     for conn_id, conn_info in pool.items():
       if (
-        conn_info.is_healthy
+        not conn_info.in_use
+        and conn_info.is_healthy
         and conn_info.last_used < oldest_time
         and self._is_connection_valid(conn_info)
       ):
@@ -224,7 +360,7 @@ class DuckDBConnectionPool:
       if graph_id not in self._pools:
         self._pools[graph_id] = {}
 
-      conn_id = f"{graph_id}_{len(self._pools[graph_id])}"
+      conn_id = f"{graph_id}_{next(self._connection_ids)}"
       self._pools[graph_id][conn_id] = connection_info
 
       self._stats["connections_created"] += 1
@@ -328,31 +464,46 @@ class DuckDBConnectionPool:
 
     return connection_info.is_healthy
 
-  def _remove_oldest_connection(self, graph_id: str):
-    """Remove the oldest connection from a database pool."""
+  def _remove_oldest_connection(self, graph_id: str) -> bool:
+    """Remove the oldest idle connection from a database pool."""
     if graph_id not in self._pools or not self._pools[graph_id]:
-      return
+      return False
 
     pool = self._pools[graph_id]
 
+    # Checked-out connections are never evicted
     oldest_conn_id = None
     oldest_time = datetime.now(UTC)
 
     for conn_id, conn_info in pool.items():
-      if conn_info.created_at < oldest_time:
+      if not conn_info.in_use and conn_info.created_at < oldest_time:
         oldest_conn_id = conn_id
         oldest_time = conn_info.created_at
 
     if oldest_conn_id:
       self._close_connection(graph_id, oldest_conn_id)
+      return True
+    return False
 
   def _close_connection(self, graph_id: str, connection_id: str):
-    """Close and remove a specific connection."""
+    """Close and remove a specific connection (on return if checked out)."""
     if graph_id not in self._pools or connection_id not in self._pools[graph_id]:
       return
 
-    connection_info = self._pools[graph_id][connection_id]
+    connection_info = self._pools[graph_id].pop(connection_id)
+
+    if connection_info.in_use:
+      connection_info.retired = True
+      self._retired.append(connection_info)
+      logger.debug(f"DuckDB connection {connection_id} for {graph_id} closes on return")
+      return
+
+    self._checkpoint_and_close(graph_id, connection_info, connection_id)
 
+  def _checkpoint_and_close(
+    self, graph_id: str, connection_info: DuckDBConnectionInfo, connection_id: str
+  ):
+    """Flush the WAL and close a connection."""
     try:
       # Execute checkpoint to flush WAL to main database file
       try:
@@ -365,7 +516,6 @@ class DuckDBConnectionPool:
     except Exception as e:
       logger.warning(f"Error closing DuckDB connection {connection_id}: {e}")
 
-    del self._pools[graph_id][connection_id]
     self._stats["connections_closed"] += 1
 
     logger.debug(f"Closed DuckDB connection {connection_id} for {graph_id}")
@@ -386,42 +536,43 @@ class DuckDBConnectionPool:
     # Staging databases should persist as long as the graph exists
     # Cleanup can be triggered manually via force_database_cleanup() if needed
 
-  def _cleanup_expired_connections(self):
-    """Clean up expired connections."""
+  def _database_names(self) -> list[str]:
+    """Snapshot the pooled databases so each can be locked on its own."""
     with self._global_lock:
-      expired_connections = []
+      return list(self._pools)
 
-      for db_name, pool in self._pools.items():
-        for conn_id, conn_info in pool.items():
-          if not self._is_connection_valid(conn_info):
-            expired_connections.append((db_name, conn_id))
+  def _cleanup_expired_connections(self):
+    """Clean up expired connections."""
+    expired_connections = 0
 
-      for db_name, conn_id in expired_connections:
-        with self._get_database_lock(db_name):
-          self._close_connection(db_name, conn_id)
+    for db_name in self._database_names():
+      with self._get_database_lock(db_name):
+        for conn_id, conn_info in list(self._pools.get(db_name, {}).items()):
+          # Checked-out connections are validated when they are returned
+          if not conn_info.in_use and not self._is_connection_valid(conn_info):
+            self._close_connection(db_name, conn_id)
+            expired_connections += 1
 
-      if expired_connections:
-        logger.info(f"Cleaned up {len(expired_connections)} expired DuckDB connections")
+    if expired_connections:
+      logger.info(f"Cleaned up {expired_connections} expired DuckDB connections")
 
   def _check_connection_health(self):
-    """Check health of all connections."""
-    with self._global_lock:
-      unhealthy_connections = []
-
-      for db_name, pool in self._pools.items():
-        for conn_id, conn_info in pool.items():
+    """Check health of idle connections."""
+    unhealthy_connections = 0
+
+    for db_name in self._database_names():
+      with self._get_database_lock(db_name):
+        for conn_id, conn_info in list(self._pools.get(db_name, {}).items()):
+          # Never run a probe on a connection another caller is using
+          if conn_info.in_use:
+            continue
           if not self._test_connection_health(conn_info):
             conn_info.is_healthy = False
-            unhealthy_connections.append((db_name, conn_id))
+            self._close_connection(db_name, conn_id)
+            unhealthy_connections += 1
 
-      for db_name, conn_id in unhealthy_connections:
-        with self._get_database_lock(db_name):
-          self._close_connection(db_name, conn_id)
-
-      if unhealthy_connections:
-        logger.warning(
-          f"Removed {len(unhealthy_connections)} unhealthy DuckDB connections"
-        )
+    if unhealthy_connections:
+      logger.warning(f"Removed {unhealthy_connections} unhealthy DuckDB connections")
 
   def _test_connection_health(self, connection_info: DuckDBConnectionInfo) -> bool:
     """Test if a connection is healthy."""
@@ -463,6 +614,7 @@ class DuckDBConnectionPool:
 
       self._pools.clear()
       self._locks.clear()
+      self._conditions.clear()
 
       if total_closed > 0:
         logger.info(f"Closed {total_closed} DuckDB connections on shutdown")
@@ -478,19 +630,9 @@ class DuckDBConnectionPool:
     """
     with self._get_database_lock(graph_id):
       if graph_id in self._pools:
-        for conn_id, conn_info in self._pools[graph_id].items():
-          try:
-            # Execute checkpoint to flush WAL to main database file
-            try:
-              conn_info.connection.execute("CHECKPOINT")
-              logger.debug(f"Checkpointed DuckDB connection {conn_id} for {graph_id}")
-            except Exception as cp_err:
-              logger.debug(f"Could not checkpoint DuckDB connection: {cp_err}")
-
-            conn_info.connection.close()
-            self._stats["connections_closed"] += 1
-          except Exception as e:
-            logger.warning(f"Error closing connection during invalidation: {e}")
+        # Checked-out connections are closed when they are returned
+        for conn_id in list(self._pools[graph_id].keys()):
+          self._close_connection(graph_id, conn_id)
 
         del self._pools[graph_id]
         logger.info(f"Invalidated all DuckDB connections for: {graph_id}")
@@ -503,10 +645,25 @@ class DuckDBConnectionPool:
 
       for db_name, pool in self._pools.items():
         healthy_count = sum(1 for conn in pool.values() if conn.is_healthy)
+        in_use_count = sum(1 for conn in pool.values() if conn.in_use)
+        db_stats = self._get_db_stats(db_name)
         pool_stats[db_name] = {
           "total_connections": len(pool),
           "healthy_connections": healthy_count,
           "max_connections": self.max_connections_per_db,
+          "in_use_connections": in_use_count,
+          "idle_connections": len(pool) - in_use_count,
+          "utilization": in_use_count / self.max_connections_per_db,
+          "waiting": len(self._waiters.get(db_name, ())),
+          "checkouts": db_stats["checkouts"],
+          "waits": db_stats["waits"],
+          "avg_wait_ms": (
+            db_stats["total_wait_seconds"] / db_stats["waits"] * 1000
+            if db_stats["waits"]
+            else 0.0
+          ),
+          "max_wait_ms": db_stats["max_wait_seconds"] * 1000,
+          "acquire_timeouts": db_stats["timeouts"],
         }
         total_connections += len(pool)
 
@@ -519,8 +676,10 @@ class DuckDBConnectionPool:
         "total_databases_on_disk": total_databases,
         "database_pools": pool_stats,
         "stats": self._stats.copy(),
+        "retired_connections": len(self._retired),
         "configuration": {
           "max_connections_per_db": self.max_connections_per_db,
+          "acquire_timeout_seconds": self.acquire_timeout,
           "connection_ttl_minutes": self.connection_ttl.total_seconds() / 60,
           "health_check_interval_minutes": self.health_check_interval.total_seconds()
           / 60,
@@ -558,7 +717,7 @@ class DuckDBConnectionPool:
     Args:
         graph_id: Graph database identifier
     """
-    with self._global_lock:
+    with self._get_database_lock(graph_id):
       logger.info(f"Forcing cleanup for DuckDB database: {graph_id}")
 
       # Close all connections
@@ -3,13 +3,19 @@
 This module provides LadybugDB-specific functionality including:
 - Engine: Low-level database connection and query execution
 - ConnectionPool: Connection pooling for LadybugDB
+- QueryExecutor: Shared bounded executor for query timeouts
+- PreparedStatementCache: Per-connection prepared statement LRU
+- MemoryGovernor: Shared buffer pool budget for multi-tenant instances
 - DatabaseManager: Multi-database lifecycle management
 - LadybugService: High-level service orchestration
 """
 
 from .engine import ConnectionError, Engine, QueryError, Repository
+from .executor import LadybugQueryExecutor, get_query_executor
 from .manager import LadybugDatabaseManager
+from .memory import MemoryGovernor
 from .pool import (
+  ConnectionPoolTimeoutError,
   LadybugConnectionPool,
   get_connection_pool,
   initialize_connection_pool,
@@ -20,21 +26,31 @@ from .service import (
   init_ladybug_service,
   validate_cypher_query,
 )
+from .statements import PreparedStatementCache, bump_schema_version
 
 __all__ = [
   "ConnectionError",
+  "ConnectionPoolTimeoutError",
   # Engine
   "Engine",
   # Connection Pool
   "LadybugConnectionPool",
   # Database Manager
   "LadybugDatabaseManager",
+  # Query Executor
+  "LadybugQueryExecutor",
   # Service
   "LadybugService",
+  # Memory Governor
+  "MemoryGovernor",
+  # Prepared Statements
+  "PreparedStatementCache",
   "QueryError",
   "Repository",
+  "bump_schema_version",
   "get_connection_pool",
   "get_ladybug_service",
+  "get_query_executor",
   "init_ladybug_service",
   "initialize_connection_pool",
   "validate_cypher_query",
@@ -4,6 +4,7 @@ LadybugDB database engine implementation
 This module provides LadybugDB database integration for the application.
 """
 
+import functools
 import re
 import time
 from pathlib import Path
@@ -15,6 +16,20 @@ from robosystems.config import env
 from robosystems.graph_api.interfaces import GraphEngineInterface, GraphOperation
 from robosystems.logger import log_app_error, log_db_query, logger
 
+from .statements import PreparedStatementCache
+
+# Parameter validation limits
+MAX_PARAMETER_DEPTH = 3
+MAX_PARAMETER_ARRAY_SIZE = 1000
+MAX_PARAMETER_OBJECT_KEYS = 100
+MAX_PARAMETER_STRING_LENGTH = 10000
+
+# Distinct flat parameter shapes (names and value types) remembered as valid
+PARAMETER_SHAPE_CACHE_SIZE = 1024
+
+PARAMETER_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+ALLOWED_PARAMETER_TYPES = (str, int, float, bool, type(None))
+
 
 class ConnectionError(Exception):
   """Raised when database connection fails."""
@@ -28,6 +43,36 @@ class QueryError(Exception):
   pass
 
 
+def _validate_parameter_name(key: str) -> None:
+  """Validate a parameter name (alphanumeric + underscore only)."""
+  if not isinstance(key, str) or not PARAMETER_NAME_PATTERN.match(key):
+    raise QueryError(
+      f"Invalid parameter name: {key}. Must be alphanumeric with underscores only."
+    )
+
+
+def _validate_string_length(key: str, value: Any) -> None:
+  """Reject excessively long string values (DoS protection)."""
+  if isinstance(value, str) and len(value) > MAX_PARAMETER_STRING_LENGTH:
+    raise QueryError(
+      f"Parameter '{key}' value too long: {len(value)} characters "
+      f"(max {MAX_PARAMETER_STRING_LENGTH})"
+    )
+
+
+@functools.lru_cache(maxsize=PARAMETER_SHAPE_CACHE_SIZE)
+def _validate_flat_parameter_shape(shape: tuple[tuple[str, type], ...]) -> None:
+  """
+  Validate parameter names and scalar value types for a parameter shape.
+
+  Only successful validations are cached; invalid shapes raise every time.
+  """
+  for key, value_type in shape:
+    _validate_parameter_name(key)
+    if not issubclass(value_type, ALLOWED_PARAMETER_TYPES):
+      raise QueryError(f"Parameter '{key}' has unsupported type: {value_type.__name__}")
+
+
 class Engine(GraphEngineInterface):
   """
   LadybugDB database engine implementation.
@@ -48,6 +93,9 @@ class Engine(GraphEngineInterface):
     self._db = None
     self._conn = None
 
+    # Prepared statements for parameterized queries on this connection
+    self._statements = PreparedStatementCache(Path(database_path).stem)
+
     # Ensure database directory exists
     db_dir = Path(database_path).parent
     db_dir.mkdir(parents=True, exist_ok=True)
@@ -152,11 +200,10 @@ class Engine(GraphEngineInterface):
       self._validate_parameters(params)
 
       # Use LadybugDB's native parameter binding (much safer than string substitution)
+      # through a cached prepared statement, so repeated shapes skip parse/plan
       if params:
         logger.debug(f"Executing query with {len(params)} parameters")
-        result = self._conn.execute(cypher, params)
-      else:
-        result = self._conn.execute(cypher)
+      result = self._statements.execute(self._conn, cypher, params)
 
       # Convert result to standard format
       result_dict_list = self._convert_result_to_dict_list(result)
@@ -236,59 +283,60 @@ class Engine(GraphEngineInterface):
     if not params:
       return
 
-    MAX_DEPTH = 3
-    MAX_ARRAY_SIZE = 1000
-    MAX_OBJECT_KEYS = 100
+    # Flat parameters (the common case) only need the per-call length check
+    # once their shape has been validated
+    if not any(isinstance(value, (list, tuple, dict)) for value in params.values()):
+      _validate_flat_parameter_shape(
+        tuple((key, type(value)) for key, value in params.items())
+      )
+      for key, value in params.items():
+        _validate_string_length(key, value)
+      return
 
     def validate_value(key: str, value: Any, depth: int = 0) -> None:
       """Recursively validate parameter values with depth limiting."""
-      if depth > MAX_DEPTH:
-        raise QueryError(f"Parameter '{key}' nesting too deep (max depth: {MAX_DEPTH})")
-
-      # Check for excessively long string values (DoS protection)
-      if isinstance(value, str) and len(value) > 10000:
+      if depth > MAX_PARAMETER_DEPTH:
         raise QueryError(
-          f"Parameter '{key}' value too long: {len(value)} characters (max 10000)"
+          f"Parameter '{key}' nesting too deep (max depth: {MAX_PARAMETER_DEPTH})"
         )
 
+      # Check for excessively long string values (DoS protection)
+      _validate_string_length(key, value)
+
       # Validate arrays
       if isinstance(value, (list, tuple)):
-        if len(value) > MAX_ARRAY_SIZE:
+        if len(value) > MAX_PARAMETER_ARRAY_SIZE:
           raise QueryError(
-            f"Parameter '{key}' array too large: {len(value)} items (max {MAX_ARRAY_SIZE})"
+            f"Parameter '{key}' array too large: {len(value)} items "
+            f"(max {MAX_PARAMETER_ARRAY_SIZE})"
           )
         for i, item in enumerate(value):
           validate_value(f"{key}[{i}]", item, depth + 1)
 
       # Validate objects/dicts
       elif isinstance(value, dict):
-        if len(value) > MAX_OBJECT_KEYS:
+        if len(value) > MAX_PARAMETER_OBJECT_KEYS:
           raise QueryError(
-            f"Parameter '{key}' object too large: {len(value)} keys (max {MAX_OBJECT_KEYS})"
+            f"Parameter '{key}' object too large: {len(value)} keys "
+            f"(max {MAX_PARAMETER_OBJECT_KEYS})"
           )
         for k, v in value.items():
           # Validate dict keys
           if not isinstance(k, str):
             raise QueryError(f"Parameter '{key}' has non-string key: {type(k)}")
-          if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", k):
+          if not PARAMETER_NAME_PATTERN.match(k):
             raise QueryError(f"Invalid key in parameter '{key}': {k}")
           validate_value(f"{key}.{k}", v, depth + 1)
 
       # Basic type validation
-      else:
-        allowed_types = (str, int, float, bool, type(None))
-        if not isinstance(value, allowed_types):
-          raise QueryError(
-            f"Parameter '{key}' has unsupported type: {type(value).__name__}"
-          )
-
-    for key, value in params.items():
-      # Validate parameter name (alphanumeric + underscore only)
-      if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", key):
+      elif not isinstance(value, ALLOWED_PARAMETER_TYPES):
         raise QueryError(
-          f"Invalid parameter name: {key}. Must be alphanumeric with underscores only."
+          f"Parameter '{key}' has unsupported type: {type(value).__name__}"
         )
 
+    for key, value in params.items():
+      _validate_parameter_name(key)
+
       # Recursively validate the value
       validate_value(key, value)
 
@@ -374,6 +422,8 @@ class Engine(GraphEngineInterface):
   def close(self) -> None:
     """Close the database connection."""
     try:
+      # Release prepared statements before the connection they belong to
+      self._statements.clear()
       if self._conn:
         logger.debug(f"Closing graph connection: {self.database_path}")
         self._conn.close()
@@ -0,0 +1,227 @@
+"""
+Shared query executor for LadybugDB.
+
+Queries run on a bounded, process-wide worker pool instead of a throwaway
+thread per query. Timeouts are enforced cooperatively: the connection's native
+query timeout is set before execution, and if the wait still expires the
+running query is interrupted on its connection so the worker is returned to
+the pool rather than abandoned.
+
+Key features:
+- Worker count sized from the instance tier (connection pool size)
+- Bounded queue with rejection when the backlog is full
+- Queue depth, active worker and timeout metrics
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any
+
+from robosystems.logger import logger
+
+# Extra seconds to wait beyond the timeout so the native timeout fires first
+TIMEOUT_SLACK_SECONDS = 0.5
+
+# Seconds to wait for an interrupted query to release its worker
+INTERRUPT_GRACE_SECONDS = 5.0
+
+
+class QueryTimeoutError(Exception):
+  """Raised when a query exceeds its timeout and was interrupted."""
+
+
+class QueryExecutorSaturatedError(Exception):
+  """Raised when the executor queue is full and a query cannot be admitted."""
+
+
+class LadybugQueryExecutor:
+  """
+  Bounded thread pool for executing LadybugDB queries with timeouts.
+
+  A single executor is shared by all databases on the node so the number of
+  concurrently executing queries (and the buffer pool pressure they create)
+  is capped per instance.
+  """
+
+  def __init__(self, max_workers: int = 10, max_queue: int = 100):
+    """
+    Initialize the query executor.
+
+    Args:
+        max_workers: Maximum number of concurrently executing queries
+        max_queue: Maximum number of queries waiting for a worker
+    """
+    self.max_workers = max(1, max_workers)
+    self.max_queue = max(0, max_queue)
+
+    self._executor = ThreadPoolExecutor(
+      max_workers=self.max_workers, thread_name_prefix="lbug-query"
+    )
+    self._lock = threading.Lock()
+
+    # Metrics
+    self._queued = 0
+    self._active = 0
+    self._completed = 0
+    self._failed = 0
+    self._timed_out = 0
+    self._rejected = 0
+    self._stuck = 0
+
+    logger.info(
+      f"LadybugQueryExecutor initialized - workers: {self.max_workers}, "
+      f"max queue: {self.max_queue}"
+    )
+
+  def run(self, conn, fn: Callable[[], Any], timeout: float) -> Any:
+    """
+    Run a query function on the shared pool with a timeout.
+
+    Args:
+        conn: LadybugDB connection the query executes on
+        fn: Callable that executes the query on ``conn``
+        timeout: Timeout in seconds
+
+    Returns:
+        The value returned by ``fn``
+
+    Raises:
+        QueryExecutorSaturatedError: If the queue is full
+        QueryTimeoutError: If the query exceeded the timeout
+    """
+    with self._lock:
+      if self._queued + self._active >= self.max_workers + self.max_queue:
+        self._rejected += 1
+        raise QueryExecutorSaturatedError(
+          f"Query executor saturated ({self._active} active, {self._queued} queued)"
+        )
+      self._queued += 1
+
+    timeout_ms = max(1, int(timeout * 1000))
+
+    def task():
+      with self._lock:
+        self._queued -= 1
+        self._active += 1
+      try:
+        # Native timeout: LadybugDB aborts the query itself when it expires
+        _set_query_timeout(conn, timeout_ms)
+        try:
+          return fn()
+        finally:
+          _set_query_timeout(conn, 0)
+      finally:
+        with self._lock:
+          self._active -= 1
+
+    future = self._executor.submit(task)
+
+    try:
+      result = future.result(timeout=timeout + TIMEOUT_SLACK_SECONDS)
+    except FuturesTimeoutError:
+      self._handle_timeout(conn, future)
+      raise QueryTimeoutError(f"Query exceeded timeout of {timeout} seconds")
+    except RuntimeError as e:
+      if "Interrupted" in str(e):
+        with self._lock:
+          self._timed_out += 1
+        raise QueryTimeoutError(f"Query exceeded timeout of {timeout} seconds")
+      with self._lock:
+        self._failed += 1
+      raise
+    except Exception:
+      with self._lock:
+        self._failed += 1
+      raise
+
+    with self._lock:
+      self._completed += 1
+    return result
+
+  def _handle_timeout(self, conn, future) -> None:
+    """Cancel a queued query or interrupt a running one and reclaim its worker."""
+    with self._lock:
+      self._timed_out += 1
+
+    if future.cancel():
+      # Never started; the worker never saw it
+      with self._lock:
+        self._queued -= 1
+      return
+
+    try:
+      conn.interrupt()
+    except Exception as e:
+      logger.warning(f"Failed to interrupt timed out query: {e}")
+
+    try:
+      future.result(timeout=INTERRUPT_GRACE_SECONDS)
+    except Exception:
+      # Interrupted queries raise; that is the expected outcome
+      pass
+
+    if not future.done():
+      with self._lock:
+        self._stuck += 1
+      logger.error(
+        f"Interrupted query still running after {INTERRUPT_GRACE_SECONDS}s; "
+        "worker remains occupied"
+      )
+
+  def get_metrics(self) -> dict[str, Any]:
+    """Get current executor metrics."""
+    with self._lock:
+      return {
+        "max_workers": self.max_workers,
+        "max_queue": self.max_queue,
+        "active": self._active,
+        "queue_depth": self._queued,
+        "completed": self._completed,
+        "failed": self._failed,
+        "timed_out": self._timed_out,
+        "rejected": self._rejected,
+        "stuck": self._stuck,
+      }
+
+  def shutdown(self, wait: bool = False) -> None:
+    """Shut down the worker pool."""
+    self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _set_query_timeout(conn, timeout_ms: int) -> None:
+  """Apply the native query timeout on connections that support it."""
+  set_timeout = getattr(conn, "set_query_timeout", None)
+  if set_timeout is None:
+    return
+  try:
+    set_timeout(timeout_ms)
+  except Exception as e:
+    logger.debug(f"Could not set query timeout on connection: {e}")
+
+
+# Global query executor instance
+_query_executor: LadybugQueryExecutor | None = None
+_query_executor_lock = threading.Lock()
+
+
+def get_query_executor() -> LadybugQueryExecutor:
+  """Get or create the global query executor."""
+  global _query_executor
+  if _query_executor is None:
+    with _query_executor_lock:
+      if _query_executor is None:
+        from robosystems.config import env
+
+        max_workers = env.LBUG_QUERY_WORKERS
+        if max_workers <= 0:
+          # Size from the instance tier's connection pool
+          max_workers = env.get_lbug_tier_config().get("connection_pool_size", 10)
+
+        _query_executor = LadybugQueryExecutor(
+          max_workers=max_workers,
+          max_queue=env.LBUG_QUERY_QUEUE_LIMIT,
+        )
+
+  return _query_executor
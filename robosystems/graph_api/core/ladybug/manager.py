@@ -7,13 +7,14 @@ including creating, deleting, and managing multiple databases on a single node.
 Key features:
 - Create new databases with schema installation
 - Delete databases and cleanup files
-- List all databases on the node
+- List all databases on the node (served from an in-memory registry)
 - Health checking for multiple databases
 - Schema management and validation
 """
 
 import re
 import shutil
+import threading
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -33,6 +34,10 @@ from robosystems.graph_api.models.database import (
 from robosystems.logger import logger
 
 from .pool import initialize_connection_pool
+from .statements import bump_schema_version
+
+# Directory mtimes newer than this are not trusted for change detection
+REGISTRY_MTIME_SLACK_NS = 1_000_000_000
 
 
 def validate_database_path(base_path: Path, db_name: str) -> Path:
@@ -110,6 +115,16 @@ class LadybugDatabaseManager:
     # Ensure base directory exists
     self.base_path.mkdir(parents=True, exist_ok=True)
 
+    # In-memory registry of databases on this node. Kept up to date by
+    # create/delete/restore and reconciled against the directory mtime so
+    # out-of-band changes are picked up without a scan per query.
+    self._registry: set[str] = set()
+    self._registry_lock = threading.Lock()
+    self._registry_dir_mtime_ns: int | None = None
+    self._registry_checked_at = 0.0
+    self._registry_reconcile_seconds = env.LBUG_REGISTRY_RECONCILE_SECONDS
+    self.refresh_registry()
+
     logger.info(
       f"Initialized LadybugDB Database Manager with connection pool: {base_path} (max: {max_databases})"
     )
@@ -207,6 +222,8 @@ class LadybugDatabaseManager:
 
       execution_time = (time.time() - start_time) * 1000
 
+      self.register_database(request.graph_id)
+
       logger.info(
         f"Database {request.graph_id} created successfully in {execution_time:.2f}ms"
       )
@@ -277,6 +294,8 @@ class LadybugDatabaseManager:
         # Legacy cleanup for old .db directories
         shutil.rmtree(db_path)
 
+      self.unregister_database(graph_id)
+
       # Clean up DuckDB staging database alongside LadybugDB database
       from robosystems.graph_api.core.duckdb import get_duckdb_pool
 
@@ -321,22 +340,99 @@ class LadybugDatabaseManager:
     """
     List all databases on this node.
 
+    Served from the in-memory registry. The directory mtime is checked on
+    every call and the registry is rebuilt only when it changed.
+
     Returns:
         List of database names
     """
-    databases = []
+    self._reconcile_registry(force=True)
+    with self._registry_lock:
+      return sorted(self._registry)
 
-    try:
-      for item in self.base_path.iterdir():
-        if item.is_file() and item.name.endswith(".lbug"):
-          db_name = item.name[:-5]  # Remove .lbug extension
-          databases.append(db_name)
+  def database_exists(self, graph_id: str) -> bool:
+    """
+    Check whether a database exists on this node.
 
-      return sorted(databases)
+    Registry hits are O(1). A miss falls back to a single stat of the database
+    file so a database restored moments ago is found before the next
+    reconciliation.
+
+    Args:
+        graph_id: Graph database identifier
+
+    Returns:
+        True if the database exists
+    """
+    self._reconcile_registry()
+    with self._registry_lock:
+      if graph_id in self._registry:
+        return True
+
+    if (self.base_path / f"{graph_id}.lbug").is_file():
+      self.register_database(graph_id)
+      return True
 
+    return False
+
+  def register_database(self, graph_id: str) -> None:
+    """Record a database that was added (or restored) on this node."""
+    with self._registry_lock:
+      self._registry.add(graph_id)
+    # New catalog; statements prepared against an earlier copy are stale
+    bump_schema_version(graph_id)
+
+  def unregister_database(self, graph_id: str) -> None:
+    """Forget a database that was removed from this node."""
+    with self._registry_lock:
+      self._registry.discard(graph_id)
+    bump_schema_version(graph_id)
+
+  def refresh_registry(self) -> None:
+    """Rebuild the database registry from a full directory scan."""
+    try:
+      mtime_ns = self.base_path.stat().st_mtime_ns
+      databases = {
+        item.name[:-5]  # Remove .lbug extension
+        for item in self.base_path.iterdir()
+        if item.is_file() and item.name.endswith(".lbug")
+      }
     except Exception as e:
       logger.error(f"Failed to list databases: {e}")
-      return []
+      mtime_ns = None
+      databases = set()
+
+    # A directory modified within the timestamp granularity window may change
+    # again without its mtime moving, so don't trust it for the next check
+    if mtime_ns is not None and time.time_ns() - mtime_ns < REGISTRY_MTIME_SLACK_NS:
+      mtime_ns = None
+
+    with self._registry_lock:
+      self._registry = databases
+      self._registry_dir_mtime_ns = mtime_ns
+      self._registry_checked_at = time.monotonic()
+
+  def _reconcile_registry(self, force: bool = False) -> None:
+    """
+    Rescan the directory if its mtime changed since the last scan.
+
+    Checks are rate limited to one stat per reconcile interval unless forced.
+    """
+    now = time.monotonic()
+    if not force and now - self._registry_checked_at < self._registry_reconcile_seconds:
+      return
+
+    try:
+      mtime_ns = self.base_path.stat().st_mtime_ns
+    except OSError as e:
+      logger.warning(f"Failed to stat database directory {self.base_path}: {e}")
+      mtime_ns = None
+
+    if mtime_ns is not None and mtime_ns == self._registry_dir_mtime_ns:
+      self._registry_checked_at = now
+      return
+
+    self.refresh_registry()
 
   def get_database_path(self, graph_id: str) -> str:
     """
@@ -860,8 +956,8 @@ class LadybugDatabaseManager:
         region_name="us-east-1",
       )
 
-      # Count databases (LadybugDB uses .lbug files)
-      db_count = len([f for f in self.base_path.glob("*.lbug") if f.is_file()])
+      # Count databases from the registry
+      db_count = len(self.list_databases())
       capacity_pct = int((db_count / self.max_databases) * 100)
 
       # Update the instance registry
@@ -0,0 +1,396 @@
+"""
+Buffer pool memory governor for multi-tenant LadybugDB instances.
+
+Every open ``lbug.Database`` owns a buffer pool that is sized when it is opened
+and held until it is closed. On oversubscribed instances (many databases with a
+per-database memory limit) the sum of those buffer pools can exceed physical
+memory, and databases nobody is querying keep their buffer pools indefinitely.
+
+The governor tracks a per-instance memory budget shared by all open databases:
+
+- Buffer pools are sized from the database's size on disk, with extra headroom
+  for databases that were busy recently, capped at the per-database limit
+- Opening a database that does not fit the remaining budget evicts the least
+  recently used idle databases first
+- Databases that stay idle are evicted by the pool's maintenance pass
+- Databases being bulk loaded (ingestion, materialization) get the full
+  per-database buffer pool for the duration of the load
+- Idle databases that have outgrown their buffer pool since they were opened
+  are closed by the maintenance pass, so they reopen with a re-planned size
+
+Eviction (checkpoint and close) is carried out by the connection pool; closed
+databases are reopened transparently on their next connection request.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from robosystems.logger import logger
+
+# Buffer pool as a multiple of the database size on disk
+COLD_HEADROOM = 1.25
+HOT_HEADROOM = 2.0
+
+# Decayed access count above which a database counts as busy
+HOT_ACTIVITY_THRESHOLD = 10.0
+
+# Half-life of the access count, in seconds
+ACTIVITY_HALF_LIFE_SECONDS = 300.0
+
+# Reopen an idle database once its planned buffer pool reaches this multiple
+# of the buffer pool it was opened with
+REPLAN_GROWTH_FACTOR = 2.0
+
+# Databases whose activity is remembered while they are closed
+MAX_TRACKED_DATABASES = 4096
+
+
+@dataclass
+class DatabaseMemory:
+  """Memory accounting for a single database."""
+
+  buffer_pool_mb: int = 0
+  disk_mb: float = 0.0
+  activity: float = 0.0
+  activity_updated: float = 0.0
+  last_access: float = 0.0
+  opened_at: float | None = None
+  open_count: int = 0
+  db_path: Path | None = None
+  bulk_loads: int = 0
+
+
+class MemoryGovernor:
+  """
+  Shares a per-instance memory budget between open LadybugDB databases.
+
+  The governor only does accounting and planning; it never touches Database
+  objects. Callers reserve a buffer pool before opening a database, release it
+  after closing, and report accesses so sizing and eviction follow activity.
+  """
+
+  def __init__(
+    self,
+    budget_mb: int,
+    max_per_db_mb: int,
+    min_per_db_mb: int = 256,
+    idle_evict_seconds: float = 900.0,
+  ):
+    """
+    Initialize the governor.
+
+    Args:
+        budget_mb: Total buffer pool memory shared by all open databases
+        max_per_db_mb: Largest buffer pool a single database may get
+        min_per_db_mb: Smallest buffer pool a database is opened with
+        idle_evict_seconds: Idle time after which a database may be closed
+            (0 disables idle eviction)
+    """
+    self.budget_mb = max(1, budget_mb)
+    self.max_per_db_mb = max(1, min(max_per_db_mb, self.budget_mb))
+    self.min_per_db_mb = max(1, min(min_per_db_mb, self.max_per_db_mb))
+    self.idle_evict_seconds = idle_evict_seconds
+
+    self._databases: dict[str, DatabaseMemory] = {}
+    self._lock = threading.Lock()
+
+    # Metrics
+    self.pressure_evictions = 0
+    self.idle_evictions = 0
+    self.overcommits = 0
+    self.resizes = 0
+
+    logger.info(
+      f"LadybugDB memory governor initialized - budget: {self.budget_mb} MB, "
+      f"buffer pool: {self.min_per_db_mb}-{self.max_per_db_mb} MB per database"
+    )
+
+  def record_access(self, database_name: str) -> None:
+    """Record a connection checkout for a database."""
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entry(database_name)
+      entry.activity = self._decayed_activity(entry, now) + 1
+      entry.activity_updated = now
+      entry.last_access = now
+
+  def plan(
+    self, database_name: str, db_path: Path, evictable: list[str]
+  ) -> tuple[int, list[str]]:
+    """
+    Size the buffer pool for a database about to be opened.
+
+    Args:
+        database_name: Database being opened
+        db_path: Path of the database file (used for its size on disk)
+        evictable: Open databases that could be closed to make room
+
+    Returns:
+        Tuple of (buffer pool size in MB, databases to evict first, LRU order)
+    """
+    disk_mb = _disk_size_mb(db_path)
+    now = time.monotonic()
+
+    with self._lock:
+      entry = self._entry(database_name)
+      entry.disk_mb = disk_mb
+      entry.db_path = db_path
+      desired = self._desired_size(entry, now)
+
+      available = self.budget_mb - self._reserved_mb(exclude=database_name)
+      victims = []
+      if desired > available:
+        evictable_names = set(evictable) - {database_name}
+        for name in self._lru_order():
+          if name not in evictable_names:
+            continue
+          victims.append(name)
+          available += self._databases[name].buffer_pool_mb
+          if available >= desired:
+            break
+
+      return desired, victims
+
+  def reserve(self, database_name: str, desired_mb: int) -> int:
+    """
+    Reserve a buffer pool for a database that is being opened.
+
+    Args:
+        database_name: Database being opened
+        desired_mb: Size returned by ``plan``
+
+    Returns:
+        The buffer pool size in MB to open the database with
+    """
+    with self._lock:
+      entry = self._entry(database_name)
+      available = self.budget_mb - self._reserved_mb(exclude=database_name)
+      size = min(desired_mb, max(available, self.min_per_db_mb))
+      if available < self.min_per_db_mb:
+        # Nothing evictable; open small rather than refuse the request
+        self.overcommits += 1
+        logger.warning(
+          f"Memory budget exhausted opening {database_name}: "
+          f"{available} MB available, opening with {size} MB"
+        )
+      entry.buffer_pool_mb = size
+      entry.opened_at = time.monotonic()
+      entry.open_count += 1
+      return size
+
+  def release(self, database_name: str) -> None:
+    """Release the buffer pool of a database that was closed."""
+    with self._lock:
+      entry = self._databases.get(database_name)
+      if entry is not None:
+        entry.buffer_pool_mb = 0
+        entry.opened_at = None
+
+  def begin_bulk_load(self, database_name: str) -> bool:
+    """
+    Reserve the full per-database buffer pool for a database being bulk loaded.
+
+    Args:
+        database_name: Database about to be ingested into or materialized
+
+    Returns:
+        True if the database is open with a smaller buffer pool and should be
+        reopened before the load starts
+    """
+    with self._lock:
+      entry = self._entry(database_name)
+      entry.bulk_loads += 1
+      return entry.opened_at is not None and entry.buffer_pool_mb < self.max_per_db_mb
+
+  def end_bulk_load(self, database_name: str) -> None:
+    """Release a bulk load reservation taken by ``begin_bulk_load``."""
+    with self._lock:
+      entry = self._databases.get(database_name)
+      if entry is not None and entry.bulk_loads > 0:
+        entry.bulk_loads -= 1
+
+  def record_resize(self, database_name: str) -> None:
+    """Count a database closed by the pool so it reopens with a larger pool."""
+    with self._lock:
+      self.resizes += 1
+    logger.info(f"Closed LadybugDB database {database_name} to resize its buffer pool")
+
+  def record_eviction(self, database_name: str, idle: bool) -> None:
+    """Count an eviction carried out by the pool."""
+    with self._lock:
+      if idle:
+        self.idle_evictions += 1
+      else:
+        self.pressure_evictions += 1
+    logger.info(
+      f"Evicted LadybugDB database {database_name} "
+      f"({'idle' if idle else 'memory pressure'})"
+    )
+
+  def idle_databases(self) -> list[str]:
+    """Open databases idle longer than the idle eviction threshold, LRU first."""
+    if self.idle_evict_seconds <= 0:
+      return []
+    cutoff = time.monotonic() - self.idle_evict_seconds
+    with self._lock:
+      return [
+        name for name in self._lru_order() if self._databases[name].last_access < cutoff
+      ]
+
+  def undersized_databases(self) -> list[str]:
+    """Open databases that have outgrown the buffer pool they were opened with."""
+    with self._lock:
+      candidates = [
+        (name, entry.db_path)
+        for name, entry in self._databases.items()
+        if entry.opened_at is not None
+        and entry.db_path is not None
+        and entry.buffer_pool_mb < self.max_per_db_mb
+      ]
+
+    # Stat files outside the lock
+    disk_sizes = {name: _disk_size_mb(db_path) for name, db_path in candidates}
+
+    now = time.monotonic()
+    undersized = []
+    with self._lock:
+      for name, disk_mb in disk_sizes.items():
+        entry = self._databases.get(name)
+        if entry is None or entry.opened_at is None:
+          continue
+        entry.disk_mb = disk_mb
+        desired = self._desired_size(entry, now)
+        if desired >= entry.buffer_pool_mb * REPLAN_GROWTH_FACTOR:
+          undersized.append(name)
+    return undersized
+
+  def get_stats(self) -> dict[str, Any]:
+    """Get budget, reservation and per-database memory statistics."""
+    now = time.monotonic()
+    with self._lock:
+      reserved = self._reserved_mb()
+      databases = {
+        name: {
+          "buffer_pool_mb": entry.buffer_pool_mb,
+          "disk_mb": round(entry.disk_mb, 1),
+          "activity": round(self._decayed_activity(entry, now), 2),
+          "idle_seconds": round(now - entry.last_access, 1),
+          "open_count": entry.open_count,
+          "bulk_loading": entry.bulk_loads > 0,
+        }
+        for name, entry in self._databases.items()
+        if entry.opened_at is not None
+      }
+      return {
+        "budget_mb": self.budget_mb,
+        "reserved_mb": reserved,
+        "available_mb": self.budget_mb - reserved,
+        "utilization": reserved / self.budget_mb,
+        "open_databases": len(databases),
+        "min_per_db_mb": self.min_per_db_mb,
+        "max_per_db_mb": self.max_per_db_mb,
+        "pressure_evictions": self.pressure_evictions,
+        "idle_evictions": self.idle_evictions,
+        "overcommits": self.overcommits,
+        "resizes": self.resizes,
+        "databases": databases,
+      }
+
+  def _entry(self, database_name: str) -> DatabaseMemory:
+    """Get or create the entry for a database (caller holds the lock)."""
+    entry = self._databases.get(database_name)
+    if entry is None:
+      entry = DatabaseMemory(last_access=time.monotonic())
+      self._databases[database_name] = entry
+      self._forget_closed()
+    return entry
+
+  def _forget_closed(self) -> None:
+    """Drop the oldest closed databases beyond the tracking limit."""
+    excess = len(self._databases) - MAX_TRACKED_DATABASES
+    if excess <= 0:
+      return
+    for name in self._lru_order(include_closed=True):
+      if excess <= 0:
+        break
+      if self._databases[name].opened_at is None:
+        del self._databases[name]
+        excess -= 1
+
+  def _desired_size(self, entry: DatabaseMemory, now: float) -> int:
+    """Buffer pool size for a database from its disk size and activity."""
+    if entry.bulk_loads:
+      # Sizing from disk would starve a new or empty database of memory
+      return self.max_per_db_mb
+    hot = self._decayed_activity(entry, now) >= HOT_ACTIVITY_THRESHOLD
+    headroom = HOT_HEADROOM if hot else COLD_HEADROOM
+    size = math.ceil(entry.disk_mb * headroom)
+    return max(self.min_per_db_mb, min(size, self.max_per_db_mb))
+
+  def _reserved_mb(self, exclude: str | None = None) -> int:
+    """Total buffer pool memory of open databases."""
+    return sum(
+      entry.buffer_pool_mb for name, entry in self._databases.items() if name != exclude
+    )
+
+  def _lru_order(self, include_closed: bool = False) -> list[str]:
+    """Database names, least recently accessed first."""
+    return [
+      name
+      for name, entry in sorted(
+        self._databases.items(), key=lambda item: item[1].last_access
+      )
+      if include_closed or entry.opened_at is not None
+    ]
+
+  @staticmethod
+  def _decayed_activity(entry: DatabaseMemory, now: float) -> float:
+    """Access count with exponential decay applied up to ``now``."""
+    if entry.activity == 0:
+      return 0.0
+    elapsed = max(0.0, now - entry.activity_updated)
+    return entry.activity * 0.5 ** (elapsed / ACTIVITY_HALF_LIFE_SECONDS)
+
+
+def _disk_size_mb(db_path: Path) -> float:
+  """Size of a database file and its WAL in MB (0 if it does not exist yet)."""
+  total = 0
+  for path in (db_path, db_path.with_name(db_path.name + ".wal")):
+    try:
+      total += path.stat().st_size
+    except OSError:
+      continue
+  return total / (1024 * 1024)
+
+
+def create_memory_governor() -> MemoryGovernor | None:
+  """
+  Create a governor from the instance tier configuration.
+
+  Returns None when the governor is disabled or the instance does not host
+  multiple databases with a per-database memory limit.
+  """
+  from robosystems.config import env
+
+  if not env.LBUG_MEMORY_GOVERNOR_ENABLED:
+    return None
+
+  tier_config = env.get_lbug_tier_config()
+  memory_per_db_mb = tier_config.get("memory_per_db_mb", 0)
+  if memory_per_db_mb <= 0:
+    # Single-database tiers give the whole instance to one buffer pool
+    return None
+
+  budget_mb = env.LBUG_MEMORY_BUDGET_MB or tier_config.get(
+    "lbug_max_memory_mb", tier_config.get("max_memory_mb", 2048)
+  )
+  return MemoryGovernor(
+    budget_mb=budget_mb,
+    max_per_db_mb=memory_per_db_mb,
+    min_per_db_mb=env.LBUG_MIN_BUFFER_POOL_MB,
+    idle_evict_seconds=env.LBUG_DATABASE_IDLE_EVICT_MINUTES * 60,
+  )
@@ -4,17 +4,30 @@ Thread-Safe LadybugDB Connection Pool
 This module provides a production-ready connection pool for LadybugDB databases
 with proper thread safety, connection limits, TTL, and health checking.
 
+Connections are checked out for the duration of a ``get_connection`` block and
+returned afterwards, so a connection is never shared by concurrent requests.
+When every connection of a database is checked out, callers wait in FIFO order
+until one is returned or the acquire timeout expires.
+
 Key features:
 - Thread-safe connection management using locks
+- Exclusive checkout with FIFO waiting and an acquire timeout
 - Configurable connection limits per database
 - Connection TTL and automatic cleanup
-- Connection health checking and recovery
+- Connection health checking and recovery (idle connections only)
+- Per-database wait time and utilization metrics
+- Per-connection prepared statement caches (see statements.py)
+- Shared buffer pool budget with idle database eviction on multi-tenant
+  instances (see memory.py)
 - Metrics and monitoring integration
 - Graceful connection cleanup on shutdown
 """
 
+import itertools
 import threading
+import time
 import weakref
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -25,6 +38,9 @@ import real_ladybug as lbug
 
 from robosystems.logger import logger
 
+from .memory import MemoryGovernor, create_memory_governor
+from .statements import discard_statement_cache, get_statement_cache
+
 
 @dataclass
 class ConnectionInfo:
@@ -37,6 +53,12 @@ class ConnectionInfo:
   use_count: int
   is_healthy: bool
   read_only: bool = False  # Track if connection was opened read-only
+  in_use: bool = False  # Checked out by a caller
+  retired: bool = False  # Removed from the pool while checked out
+
+
+class ConnectionPoolTimeoutError(TimeoutError):
+  """Raised when no connection becomes available within the acquire timeout."""
 
 
 class LadybugConnectionPool:
@@ -58,6 +80,8 @@ class LadybugConnectionPool:
     connection_ttl_minutes: int = 30,
     health_check_interval_minutes: int = 5,
     cleanup_interval_minutes: int = 10,
+    acquire_timeout_seconds: float | None = None,
+    memory_governor: MemoryGovernor | None = None,
   ):
     """
     Initialize connection pool.
@@ -68,17 +92,37 @@ class LadybugConnectionPool:
         connection_ttl_minutes: Connection time-to-live in minutes
         health_check_interval_minutes: How often to check connection health
         cleanup_interval_minutes: How often to cleanup expired connections
+        acquire_timeout_seconds: How long to wait for a connection when all
+            are checked out (defaults to LBUG_POOL_ACQUIRE_TIMEOUT_SECONDS)
+        memory_governor: Buffer pool budget shared by the databases (defaults
+            to one built from the tier configuration on multi-tenant tiers)
     """
+    if acquire_timeout_seconds is None:
+      from robosystems.config import env
+
+      acquire_timeout_seconds = env.LBUG_POOL_ACQUIRE_TIMEOUT_SECONDS
+
     self.base_path = Path(base_path)
     self.max_connections_per_db = max_connections_per_db
+    self.acquire_timeout = acquire_timeout_seconds
     self.connection_ttl = timedelta(minutes=connection_ttl_minutes)
     self.health_check_interval = timedelta(minutes=health_check_interval_minutes)
     self.cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
+    self.memory_governor = memory_governor or create_memory_governor()
 
     # Thread-safe storage
     self._pools: dict[str, dict[str, ConnectionInfo]] = {}
     self._locks: dict[str, threading.RLock] = {}
+    self._conditions: dict[str, threading.Condition] = {}
+    self._waiters: dict[str, deque[object]] = {}
+    # Guards the registries only; never take a database lock while holding it
     self._global_lock = threading.RLock()
+    self._connection_ids = itertools.count()
+
+    # Connections removed from the pool while checked out, closed on return
+    self._retired: list[ConnectionInfo] = []
+    # Database objects whose close waits for retired connections
+    self._pending_database_closes: list[lbug.Database] = []
 
     # Store Database objects to ensure all connections use the same one
     # This is critical for transaction visibility in LadybugDB
@@ -92,6 +136,7 @@ class LadybugConnectionPool:
       "health_checks": 0,
       "health_failures": 0,
     }
+    self._db_stats: dict[str, dict[str, float]] = {}
 
     # Cleanup tracking
     self._last_cleanup = datetime.now(UTC)
@@ -105,57 +150,290 @@ class LadybugConnectionPool:
     )
 
   @contextmanager
-  def get_connection(self, database_name: str, read_only: bool = False):
+  def get_connection(
+    self,
+    database_name: str,
+    read_only: bool = False,
+    timeout: float | None = None,
+  ):
     """
     Get a connection from the pool (context manager).
 
+    The connection is checked out exclusively until the block exits.
+
     Args:
         database_name: Name of the database
         read_only: Whether to open in read-only mode
+        timeout: Seconds to wait when all connections are checked out
+            (defaults to the pool's acquire timeout)
 
     Yields:
         lbug.Connection: Database connection
 
+    Raises:
+        ConnectionPoolTimeoutError: If no connection became available in time
+
     Example:
         with pool.get_connection("my_db") as conn:
             result = conn.execute("MATCH (n) RETURN count(n)")
     """
     connection_info = None
     try:
-      connection_info = self._acquire_connection(database_name, read_only)
+      connection_info = self._acquire_connection(database_name, read_only, timeout)
       yield connection_info.connection
     finally:
       if connection_info:
         self._release_connection(database_name, connection_info)
 
-  def _acquire_connection(self, database_name: str, read_only: bool) -> ConnectionInfo:
-    """Acquire a connection from the pool."""
+  @contextmanager
+  def bulk_load(self, database_name: str):
+    """
+    Give a database the full per-database buffer pool while it is bulk loaded.
+
+    Without a memory governor this does nothing. Otherwise the database is
+    planned at ``memory_per_db_mb`` until the block exits, and an idle database
+    that is open with a smaller buffer pool is reopened first.
+
+    Example:
+        with pool.bulk_load("kg123"), pool.get_connection("kg123") as conn:
+            conn.execute("COPY Entity FROM 's3://...'")
+    """
+    governor = self.memory_governor
+    if governor is None:
+      yield
+      return
+
+    if governor.begin_bulk_load(database_name) and self._close_idle_database(
+      database_name
+    ):
+      governor.record_resize(database_name)
+    try:
+      yield
+    finally:
+      governor.end_bulk_load(database_name)
+
+  def _acquire_connection(
+    self, database_name: str, read_only: bool, timeout: float | None = None
+  ) -> ConnectionInfo:
+    """Check out a connection, waiting in FIFO order while the pool is saturated."""
     # Perform periodic maintenance
     self._maybe_run_maintenance()
 
-    with self._get_database_lock(database_name):
-      # Try to get existing connection
-      connection_info = self._get_existing_connection(database_name, read_only)
-
-      if connection_info and self._is_connection_valid(connection_info):
-        # Reuse existing connection
-        connection_info.last_used = datetime.now(UTC)
-        connection_info.use_count += 1
-        self._stats["connections_reused"] += 1
-        logger.debug(
-          f"Reused connection for {database_name} (use count: {connection_info.use_count})"
-        )
-        return connection_info
+    timeout = self.acquire_timeout if timeout is None else timeout
+    started = time.monotonic()
+    deadline = started + timeout
+
+    condition = self._get_condition(database_name)
+    with condition:
+      waiters = self._waiters.setdefault(database_name, deque())
+      ticket = object()
+      waiters.append(ticket)
+      waited = False
+      try:
+        while True:
+          # Only the longest waiting caller may take a connection
+          if waiters[0] is ticket:
+            connection_info = self._checkout_connection(database_name, read_only)
+            if connection_info is not None:
+              self._record_checkout(database_name, waited, time.monotonic() - started)
+              return connection_info
+
+          remaining = deadline - time.monotonic()
+          if remaining <= 0:
+            self._get_db_stats(database_name)["timeouts"] += 1
+            raise ConnectionPoolTimeoutError(
+              f"No connection available for {database_name} after {timeout:.1f}s "
+              f"({self.max_connections_per_db} in use)"
+            )
+          waited = True
+          condition.wait(remaining)
+      finally:
+        waiters.remove(ticket)
+        # Let the next waiter re-check
+        condition.notify_all()
+
+  def _checkout_connection(
+    self, database_name: str, read_only: bool
+  ) -> ConnectionInfo | None:
+    """Check out an idle connection or create one; None if all are in use."""
+    # Try to get existing connection
+    connection_info = self._get_existing_connection(database_name, read_only)
+
+    if connection_info and self._is_connection_valid(connection_info):
+      # Reuse existing connection
+      connection_info.last_used = datetime.now(UTC)
+      connection_info.use_count += 1
+      connection_info.in_use = True
+      self._stats["connections_reused"] += 1
+      logger.debug(
+        f"Reused connection for {database_name} (use count: {connection_info.use_count})"
+      )
+      return connection_info
+
+    # Make room by closing an idle connection that cannot serve this request
+    pool = self._pools.get(database_name, {})
+    if len(pool) >= self.max_connections_per_db and not self._remove_oldest_connection(
+      database_name
+    ):
+      return None
 
-      # Create new connection
-      return self._create_new_connection(database_name, read_only)
+    # Create new connection
+    connection_info = self._create_new_connection(database_name, read_only)
+    connection_info.in_use = True
+    return connection_info
 
   def _release_connection(self, database_name: str, connection_info: ConnectionInfo):
-    """Release a connection back to the pool."""
-    # Connection is automatically returned to pool
-    # No explicit action needed as we're using a simple strategy
+    """Return a checked-out connection to the pool."""
+    condition = self._get_condition(database_name)
+    with condition:
+      connection_info.in_use = False
+      connection_info.last_used = datetime.now(UTC)
+
+      if connection_info.retired:
+        # Removed from the pool while in use (invalidation, cleanup, shutdown)
+        self._close_retired_connection(connection_info)
+      elif not self._is_connection_valid(connection_info):
+        for conn_id, info in list(self._pools.get(database_name, {}).items()):
+          if info is connection_info:
+            self._close_connection(database_name, conn_id)
+
+      condition.notify_all()
     logger.debug(f"Released connection for {database_name}")
 
+  def _close_retired_connection(self, connection_info: ConnectionInfo):
+    """Close a connection that was retired while checked out."""
+    self._retired = [info for info in self._retired if info is not connection_info]
+    try:
+      discard_statement_cache(connection_info.connection)
+      connection_info.connection.close()
+    except Exception as e:
+      logger.warning(f"Error closing retired connection: {e}")
+    self._stats["connections_closed"] += 1
+
+    # Close a replaced Database object once its last connection is returned
+    database = connection_info.database
+    if any(db is database for db in self._pending_database_closes) and not any(
+      info.database is database for info in self._retired
+    ):
+      self._pending_database_closes = [
+        db for db in self._pending_database_closes if db is not database
+      ]
+      try:
+        database.close()
+      except Exception as e:
+        logger.warning(f"Error closing deferred database object: {e}")
+
+  def _close_database_object(self, database_name: str):
+    """Close a shared Database object, deferring if connections are checked out."""
+    database = self._databases.pop(database_name, None)
+    if database is None:
+      return
+    if self.memory_governor is not None:
+      self.memory_governor.release(database_name)
+    if any(info.database is database for info in self._retired):
+      self._pending_database_closes.append(database)
+      logger.info(
+        f"Deferring close of Database object for {database_name} until "
+        "checked-out connections are returned"
+      )
+      return
+    try:
+      database.close()
+    except Exception as e:
+      logger.warning(f"Error closing database object for {database_name}: {e}")
+
+  def _reserve_buffer_pool(
+    self, governor: MemoryGovernor, database_name: str, db_path: Path
+  ) -> int:
+    """Size a buffer pool within the memory budget, evicting idle databases."""
+    evictable = [
+      name
+      for name in list(self._databases)
+      if name != database_name and self._is_idle_database(name)
+    ]
+    desired_mb, victims = governor.plan(database_name, db_path, evictable)
+    for victim in victims:
+      self._evict_database(victim, idle=False)
+
+    return governor.reserve(database_name, desired_mb)
+
+  def _is_idle_database(self, database_name: str) -> bool:
+    """Whether no connection of a database is checked out or awaited."""
+    pool = self._pools.get(database_name, {})
+    return not self._waiters.get(database_name) and not any(
+      info.in_use for info in list(pool.values())
+    )
+
+  def _evict_database(self, database_name: str, idle: bool) -> bool:
+    """
+    Checkpoint and close an idle database to release its buffer pool.
+
+    The database is reopened on its next connection request. Busy databases
+    (or ones whose lock is held by another thread) are skipped.
+    """
+    if not self._close_idle_database(database_name):
+      return False
+
+    if self.memory_governor is not None:
+      self.memory_governor.record_eviction(database_name, idle)
+    return True
+
+  def _close_idle_database(self, database_name: str) -> bool:
+    """Checkpoint and close a database if it is open and idle."""
+    # Never block on another database's lock; the caller may hold its own
+    lock = self._locks.get(database_name)
+    if lock is None or not lock.acquire(blocking=False):
+      return False
+    try:
+      database = self._databases.get(database_name)
+      if database is None or not self._is_idle_database(database_name):
+        return False
+
+      self._checkpoint_database(database_name, database)
+      for conn_id in list(self._pools.get(database_name, {}).keys()):
+        self._close_connection(database_name, conn_id)
+      self._pools.pop(database_name, None)
+      self._close_database_object(database_name)
+    finally:
+      lock.release()
+    return True
+
+  def _checkpoint_database(self, database_name: str, database: lbug.Database):
+    """Flush the WAL of a database before it is closed."""
+    try:
+      temp_conn = lbug.Connection(database)
+      try:
+        temp_conn.execute("CHECKPOINT;")
+      finally:
+        temp_conn.close()
+      logger.debug(f"Checkpointed {database_name} before eviction")
+    except Exception as e:
+      logger.warning(f"Could not checkpoint {database_name} before eviction: {e}")
+
+  def _evict_idle_databases(self):
+    """Close databases that have been idle past the eviction threshold."""
+    if self.memory_governor is None:
+      return
+
+    evicted = 0
+    for database_name in self.memory_governor.idle_databases():
+      if database_name in self._databases and self._evict_database(
+        database_name, idle=True
+      ):
+        evicted += 1
+
+    if evicted:
+      logger.info(f"Closed {evicted} idle databases to release buffer pool memory")
+
+  def _resize_grown_databases(self):
+    """Close idle databases that outgrew their buffer pool so they are re-planned."""
+    if self.memory_governor is None:
+      return
+
+    for database_name in self.memory_governor.undersized_databases():
+      if database_name in self._databases and self._close_idle_database(database_name):
+        self.memory_governor.record_resize(database_name)
+
   def invalidate_connection(self, database_name: str):
     """
     Invalidate all connections for a database.
@@ -168,13 +446,9 @@ class LadybugConnectionPool:
     """
     with self._get_database_lock(database_name):
       if database_name in self._pools:
-        # Close all connections for this database
-        for conn_id, conn_info in self._pools[database_name].items():
-          try:
-            conn_info.connection.close()
-            self._stats["connections_closed"] += 1
-          except Exception as e:
-            logger.warning(f"Error closing connection during invalidation: {e}")
+        # Close all connections for this database (checked-out ones on return)
+        for conn_id in list(self._pools[database_name].keys()):
+          self._close_connection(database_name, conn_id)
 
         # Clear the pool for this database
         del self._pools[database_name]
@@ -182,11 +456,7 @@ class LadybugConnectionPool:
         # Remove the shared Database object to force recreation
         # This ensures the next connection sees all committed data
         if database_name in self._databases:
-          try:
-            self._databases[database_name].close()
-          except Exception as e:
-            logger.warning(f"Error closing database object during invalidation: {e}")
-          del self._databases[database_name]
+          self._close_database_object(database_name)
           logger.info(f"Removed shared Database object for {database_name}")
 
         logger.info(f"Invalidated all connections for database: {database_name}")
@@ -198,6 +468,42 @@ class LadybugConnectionPool:
         self._locks[database_name] = threading.RLock()
       return self._locks[database_name]
 
+  def _get_condition(self, database_name: str) -> threading.Condition:
+    """Get or create the checkout condition for a database (uses its lock)."""
+    with self._global_lock:
+      if database_name not in self._conditions:
+        self._conditions[database_name] = threading.Condition(
+          self._get_database_lock(database_name)
+        )
+      return self._conditions[database_name]
+
+  def _get_db_stats(self, database_name: str) -> dict[str, float]:
+    """Get or create checkout metrics for a database."""
+    stats = self._db_stats.get(database_name)
+    if stats is None:
+      stats = self._db_stats.setdefault(
+        database_name,
+        {
+          "checkouts": 0,
+          "waits": 0,
+          "total_wait_seconds": 0.0,
+          "max_wait_seconds": 0.0,
+          "timeouts": 0,
+        },
+      )
+    return stats
+
+  def _record_checkout(self, database_name: str, waited: bool, wait_seconds: float):
+    """Record a successful checkout and how long it waited."""
+    stats = self._get_db_stats(database_name)
+    stats["checkouts"] += 1
+    if self.memory_governor is not None:
+      self.memory_governor.record_access(database_name)
+    if waited:
+      stats["waits"] += 1
+      stats["total_wait_seconds"] += wait_seconds
+      stats["max_wait_seconds"] = max(stats["max_wait_seconds"], wait_seconds)
+
   def _get_existing_connection(
     self, database_name: str, read_only: bool
   ) -> ConnectionInfo | None:
@@ -207,13 +513,14 @@ class LadybugConnectionPool:
 
     pool = self._pools[database_name]
 
-    # Find the least recently used healthy connection with matching read_only status
+    # Find the least recently used idle healthy connection with matching read_only status
     best_connection = None
     oldest_time = datetime.now(UTC)
 
     for conn_id, conn_info in pool.items():
       if (
-        conn_info.is_healthy
+        not conn_info.in_use
+        and conn_info.is_healthy
         and conn_info.read_only == read_only  # Match read_only status
         and conn_info.last_used < oldest_time
         and self._is_connection_valid(conn_info)
@@ -251,7 +558,14 @@ class LadybugConnectionPool:
         tier_config = env.get_lbug_tier_config()
 
         memory_per_db_mb = tier_config.get("memory_per_db_mb", 0)
-        if memory_per_db_mb > 0:
+        if self.memory_governor is not None:
+          # Multi-tenant instance: size from the shared budget, evicting idle
+          # databases if the instance is full
+          buffer_pool_mb = self._reserve_buffer_pool(
+            self.memory_governor, database_name, db_path
+          )
+          logger.info(f"Using governed buffer pool: {buffer_pool_mb} MB")
+        elif memory_per_db_mb > 0:
           # Use the per-database limit (for standard tier with oversubscription)
           buffer_pool_mb = memory_per_db_mb
           logger.info(f"Using per-database memory limit: {buffer_pool_mb} MB")
@@ -380,7 +694,7 @@ class LadybugConnectionPool:
       if database_name not in self._pools:
         self._pools[database_name] = {}
 
-      conn_id = f"{database_name}_{len(self._pools[database_name])}"
+      conn_id = f"{database_name}_{next(self._connection_ids)}"
       self._pools[database_name][conn_id] = connection_info
 
       self._stats["connections_created"] += 1
@@ -403,43 +717,52 @@ class LadybugConnectionPool:
     # Check health status
     return connection_info.is_healthy
 
-  def _remove_oldest_connection(self, database_name: str):
-    """Remove the oldest connection from a database pool."""
+  def _remove_oldest_connection(self, database_name: str) -> bool:
+    """Remove the oldest idle connection from a database pool."""
     if database_name not in self._pools or not self._pools[database_name]:
-      return
+      return False
 
     pool = self._pools[database_name]
 
-    # Find oldest connection
+    # Find oldest idle connection; checked-out connections are never evicted
     oldest_conn_id = None
     oldest_time = datetime.now(UTC)
 
     for conn_id, conn_info in pool.items():
-      if conn_info.created_at < oldest_time:
+      if not conn_info.in_use and conn_info.created_at < oldest_time:
         oldest_conn_id = conn_id
         oldest_time = conn_info.created_at
 
     if oldest_conn_id:
       self._close_connection(database_name, oldest_conn_id)
+      return True
+    return False
 
   def _close_connection(self, database_name: str, connection_id: str):
-    """Close and remove a specific connection."""
+    """Close and remove a specific connection (on return if checked out)."""
     if (
       database_name not in self._pools
       or connection_id not in self._pools[database_name]
     ):
       return
 
-    connection_info = self._pools[database_name][connection_id]
+    connection_info = self._pools[database_name].pop(connection_id)
+
+    if connection_info.in_use:
+      connection_info.retired = True
+      self._retired.append(connection_info)
+      logger.debug(f"Connection {connection_id} for {database_name} closes on return")
+      return
 
     try:
+      # Prepared statements must be released before their connection
+      discard_statement_cache(connection_info.connection)
       connection_info.connection.close()
       # Don't close the database here - it's shared and will be closed in _cleanup_all_connections
       # or when the pool is destroyed. This prevents double-closing.
     except Exception as e:
       logger.warning(f"Error closing connection {connection_id}: {e}")
 
-    del self._pools[database_name][connection_id]
     self._stats["connections_closed"] += 1
 
     logger.debug(f"Closed connection {connection_id} for {database_name}")
@@ -451,6 +774,8 @@ class LadybugConnectionPool:
     # Run cleanup
     if now - self._last_cleanup > self.cleanup_interval:
       self._cleanup_expired_connections()
+      self._evict_idle_databases()
+      self._resize_grown_databases()
       self._last_cleanup = now
 
     # Run health checks
@@ -458,40 +783,43 @@ class LadybugConnectionPool:
       self._check_connection_health()
       self._last_health_check = now
 
-  def _cleanup_expired_connections(self):
-    """Clean up expired connections."""
+  def _database_names(self) -> list[str]:
+    """Snapshot the pooled databases so each can be locked on its own."""
     with self._global_lock:
-      expired_connections = []
+      return list(self._pools)
 
-      for db_name, pool in self._pools.items():
-        for conn_id, conn_info in pool.items():
-          if not self._is_connection_valid(conn_info):
-            expired_connections.append((db_name, conn_id))
+  def _cleanup_expired_connections(self):
+    """Clean up expired connections."""
+    expired_connections = 0
 
-      for db_name, conn_id in expired_connections:
-        with self._get_database_lock(db_name):
-          self._close_connection(db_name, conn_id)
+    for db_name in self._database_names():
+      with self._get_database_lock(db_name):
+        for conn_id, conn_info in list(self._pools.get(db_name, {}).items()):
+          # Checked-out connections are validated when they are returned
+          if not conn_info.in_use and not self._is_connection_valid(conn_info):
+            self._close_connection(db_name, conn_id)
+            expired_connections += 1
 
-      if expired_connections:
-        logger.info(f"Cleaned up {len(expired_connections)} expired connections")
+    if expired_connections:
+      logger.info(f"Cleaned up {expired_connections} expired connections")
 
   def _check_connection_health(self):
-    """Check health of all connections."""
-    with self._global_lock:
-      unhealthy_connections = []
-
-      for db_name, pool in self._pools.items():
-        for conn_id, conn_info in pool.items():
+    """Check health of idle connections."""
+    unhealthy_connections = 0
+
+    for db_name in self._database_names():
+      with self._get_database_lock(db_name):
+        for conn_id, conn_info in list(self._pools.get(db_name, {}).items()):
+          # Never run a probe on a connection another caller is using
+          if conn_info.in_use:
+            continue
           if not self._test_connection_health(conn_info):
             conn_info.is_healthy = False
-            unhealthy_connections.append((db_name, conn_id))
+            self._close_connection(db_name, conn_id)
+            unhealthy_connections += 1
 
-      for db_name, conn_id in unhealthy_connections:
-        with self._get_database_lock(db_name):
-          self._close_connection(db_name, conn_id)
-
-      if unhealthy_connections:
-        logger.warning(f"Removed {len(unhealthy_connections)} unhealthy connections")
+    if unhealthy_connections:
+      logger.warning(f"Removed {unhealthy_connections} unhealthy connections")
 
   def _test_connection_health(self, connection_info: ConnectionInfo) -> bool:
     """Test if a connection is healthy."""
@@ -522,15 +850,11 @@ class LadybugConnectionPool:
 
       # Close all Database objects
       for db_name in list(self._databases.keys()):
-        try:
-          if hasattr(self._databases[db_name], "close"):
-            self._databases[db_name].close()
-        except Exception as e:
-          logger.warning(f"Error closing database {db_name}: {e}")
-        del self._databases[db_name]
+        self._close_database_object(db_name)
 
       self._pools.clear()
       self._locks.clear()
+      self._conditions.clear()
       self._databases.clear()
 
   def force_database_cleanup(self, database_name: str, aggressive: bool = True) -> None:
@@ -544,7 +868,7 @@ class LadybugConnectionPool:
         database_name: Name of the database to clean up
         aggressive: If True, use more aggressive memory cleanup techniques
     """
-    with self._global_lock:
+    with self._get_database_lock(database_name):
       logger.info(
         f"Forcing cleanup for database: {database_name} (aggressive={aggressive})"
       )
@@ -563,7 +887,6 @@ class LadybugConnectionPool:
       # This will cause it to be recreated with fresh memory on next access
       if database_name in self._databases:
         try:
-          # Try to close the database if it has a close method
           db = self._databases[database_name]
 
           # For SEC database, try to execute CHECKPOINT before closing
@@ -577,13 +900,11 @@ class LadybugConnectionPool:
             except Exception as cp_err:
               logger.debug(f"Could not execute checkpoint: {cp_err}")
 
-          if hasattr(db, "close"):
-            db.close()
         except Exception as e:
-          logger.debug(f"Could not close database object: {e}")
+          logger.debug(f"Could not checkpoint database object: {e}")
 
-        # Remove the database object from cache
-        del self._databases[database_name]
+        # Remove the database object from cache (closed once no longer in use)
+        self._close_database_object(database_name)
         logger.info(f"Removed cached Database object for: {database_name}")
 
         if aggressive:
@@ -637,10 +958,34 @@ class LadybugConnectionPool:
 
       for db_name, pool in self._pools.items():
         healthy_count = sum(1 for conn in pool.values() if conn.is_healthy)
+        in_use_count = sum(1 for conn in pool.values() if conn.in_use)
+        db_stats = self._get_db_stats(db_name)
+        statement_stats = [
+          get_statement_cache(conn.connection, db_name).get_stats()
+          for conn in pool.values()
+        ]
         pool_stats[db_name] = {
           "total_connections": len(pool),
           "healthy_connections": healthy_count,
           "max_connections": self.max_connections_per_db,
+          "in_use_connections": in_use_count,
+          "idle_connections": len(pool) - in_use_count,
+          "utilization": in_use_count / self.max_connections_per_db,
+          "waiting": len(self._waiters.get(db_name, ())),
+          "checkouts": db_stats["checkouts"],
+          "waits": db_stats["waits"],
+          "avg_wait_ms": (
+            db_stats["total_wait_seconds"] / db_stats["waits"] * 1000
+            if db_stats["waits"]
+            else 0.0
+          ),
+          "max_wait_ms": db_stats["max_wait_seconds"] * 1000,
+          "acquire_timeouts": db_stats["timeouts"],
+          "prepared_statements": sum(stats["size"] for stats in statement_stats),
+          "prepared_statement_hits": sum(stats["hits"] for stats in statement_stats),
+          "prepared_statement_misses": sum(
+            stats["misses"] for stats in statement_stats
+          ),
         }
         total_connections += len(pool)
 
@@ -648,14 +993,23 @@ class LadybugConnectionPool:
         "total_connections": total_connections,
         "database_pools": pool_stats,
         "stats": self._stats.copy(),
+        "retired_connections": len(self._retired),
+        "memory": self.get_memory_stats(),
         "configuration": {
           "max_connections_per_db": self.max_connections_per_db,
+          "acquire_timeout_seconds": self.acquire_timeout,
           "connection_ttl_minutes": self.connection_ttl.total_seconds() / 60,
           "health_check_interval_minutes": self.health_check_interval.total_seconds()
           / 60,
         },
       }
 
+  def get_memory_stats(self) -> dict[str, Any] | None:
+    """Get buffer pool budget statistics (None when memory is not governed)."""
+    if self.memory_governor is None:
+      return None
+    return self.memory_governor.get_stats()
+
   def close_database_connections(self, database_name: str):
     """Close all connections for a specific database."""
     with self._get_database_lock(database_name):
@@ -665,12 +1019,7 @@ class LadybugConnectionPool:
           self._close_connection(database_name, conn_id)
 
         # Close and remove the shared Database object
-        if database_name in self._databases:
-          try:
-            self._databases[database_name].close()
-          except Exception as e:
-            logger.warning(f"Error closing database {database_name}: {e}")
-          del self._databases[database_name]
+        self._close_database_object(database_name)
 
         logger.info(f"Closed all connections for database {database_name}")
 
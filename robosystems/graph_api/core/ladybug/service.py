@@ -6,19 +6,21 @@ on a single node, handling database operations, health monitoring, and metrics.
 """
 
 import os
-import re
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from collections.abc import Iterator
+from contextlib import ExitStack
 from datetime import UTC, datetime
 
 import psutil
+import pyarrow as pa
 from fastapi import HTTPException, status
 
 from robosystems.config import env
 from robosystems.exceptions import (
   ConfigurationError,
 )
+from robosystems.graph_api.core.arrow_ipc import DEFAULT_BATCH_ROWS, rename_columns
 from robosystems.graph_api.core.metrics_collector import LadybugMetricsCollector
 from robosystems.graph_api.core.utils import (
   validate_database_name,
@@ -32,8 +34,17 @@ from robosystems.graph_api.models.database import QueryRequest, QueryResponse
 from robosystems.logger import logger
 from robosystems.middleware.graph.types import NodeType, RepositoryType
 from robosystems.models.api.graphs.query import translate_neo4j_to_lbug
+from robosystems.security.cypher_analyzer import is_schema_ddl, is_write_operation
+from robosystems.security.cypher_parser import parse_cypher
 
+from .executor import (
+  QueryExecutorSaturatedError,
+  QueryTimeoutError,
+  get_query_executor,
+)
 from .manager import LadybugDatabaseManager
+from .pool import ConnectionPoolTimeoutError
+from .statements import execute_cached
 
 # OpenTelemetry imports - conditional based on OTEL_ENABLED
 
@@ -79,6 +90,10 @@ except Exception:
   __version__ = "1.0.0"
 
 
+# Maximum rows returned by a non-streaming query
+MAX_RESULT_ROWS = 10000
+
+
 def _extract_column_aliases_from_cypher(cypher_query: str) -> list[str]:
   """
   Extract column aliases from RETURN clause in Cypher query.
@@ -98,40 +113,9 @@ def _extract_column_aliases_from_cypher(cypher_query: str) -> list[str]:
       "RETURN count(c) as total" -> ["total"]
   """
   try:
-    # Remove line breaks and normalize whitespace
-    query = re.sub(r"\s+", " ", cypher_query.strip())
-
-    # Match RETURN clause (case insensitive)
-    # Look for RETURN followed by expressions, stopping at clause keywords or end
-    return_match = re.search(
-      r"\bRETURN\s+(.+?)(?:\s+(?:WHERE|ORDER|LIMIT|SKIP|WITH|UNION)|$)",
-      query,
-      re.IGNORECASE,
-    )
-    if not return_match:
-      return []
-
-    return_clause = return_match.group(1).strip()
-
-    # Split by comma, handling simple cases for now
-    # Note: This doesn't handle complex nested expressions with commas,
-    # but covers the majority of use cases
-    column_expressions = [expr.strip() for expr in return_clause.split(",")]
-
-    aliases = []
-    for expr in column_expressions:
-      # Check for explicit AS clause (case insensitive)
-      as_match = re.search(r"^(.+?)\s+(?:as|AS)\s+([a-zA-Z_][a-zA-Z0-9_]*)$", expr)
-      if as_match:
-        # Has explicit alias
-        aliases.append(as_match.group(2))
-      else:
-        # No alias, use the expression itself (cleaned up)
-        # Remove extra whitespace and use as column name
-        clean_expr = re.sub(r"\s+", " ", expr.strip())
-        aliases.append(clean_expr)
-
-    return aliases
+    # Aliases of the final top-level RETURN, ignoring commas nested in calls,
+    # lists and maps
+    return list(parse_cypher(cypher_query).return_aliases)
   except Exception as e:
     # If parsing fails, return empty list to fall back to generic names
     logger.debug(f"Failed to parse RETURN clause from query: {e}")
@@ -170,14 +154,6 @@ def validate_cypher_query(cypher: str) -> None:
       detail="Query cannot be empty",
     )
 
-  query_upper = cypher.upper()
-  for keyword in forbidden_keywords:
-    if keyword in query_upper:
-      raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail=f"Query contains forbidden keyword: {keyword}",
-      )
-
   # Check query length
   from robosystems.config import env
 
@@ -188,6 +164,105 @@ def validate_cypher_query(cypher: str) -> None:
       detail=f"Query too long (max {max_query_length} characters)",
     )
 
+  # Keywords are matched on tokens, so string literals and comments never match
+  analysis = parse_cypher(cypher)
+  for keyword in forbidden_keywords:
+    if analysis.has_phrase(keyword):
+      raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Query contains forbidden keyword: {keyword}",
+      )
+
+
+def _resolve_columns(query_result, translated_cypher: str) -> list[str]:
+  """Determine result column names, preferring aliases from the Cypher RETURN clause."""
+  columns: list[str] = []
+
+  # First, try to extract column aliases from the Cypher query itself
+  # This preserves custom aliases like "RETURN c as entity"
+  extracted_aliases = _extract_column_aliases_from_cypher(translated_cypher)
+
+  if hasattr(query_result, "get_schema"):
+    # Get column names from schema (these are generic: col0, col1, etc.)
+    schema = query_result.get_schema()
+    schema_columns = list(schema.keys())
+
+    # Use extracted aliases if available and count matches schema columns
+    if extracted_aliases and len(extracted_aliases) == len(schema_columns):
+      columns = extracted_aliases
+      logger.debug(f"Using extracted column aliases: {columns}")
+    else:
+      # Fall back to schema column names
+      columns = schema_columns
+      if extracted_aliases:
+        logger.debug(
+          f"Column count mismatch - extracted: {len(extracted_aliases)}, schema: {len(schema_columns)}"
+        )
+  else:
+    # If no schema available, try to use extracted aliases
+    if extracted_aliases:
+      columns = extracted_aliases
+
+  return columns
+
+
+def _rows_to_table(rows: list[list], columns: list[str]) -> pa.Table:
+  """Build a table from result rows, inferring each column's type from every row."""
+  names = columns or [f"col{i}" for i in range(len(rows[0]))]
+  arrays = [
+    pa.array([row[i] if i < len(row) else None for row in rows])
+    for i in range(len(names))
+  ]
+  return pa.Table.from_arrays(arrays, names=names)
+
+
+def _read_arrow_batches(
+  query_result,
+  columns: list[str],
+  batch_rows: int = DEFAULT_BATCH_ROWS,
+  max_rows: int | None = None,
+) -> Iterator[pa.RecordBatch]:
+  """
+  Read a LadybugDB result as Arrow record batches of at most ``batch_rows`` rows.
+
+  Results within ``max_rows`` use the native Arrow export, so every batch
+  carries the column types the database declared. Larger results are read row
+  by row only up to ``max_rows``; their column types are inferred once from all
+  of those rows, so every batch still shares one schema.
+  """
+  num_tuples = (
+    query_result.get_num_tuples() if hasattr(query_result, "get_num_tuples") else None
+  )
+  if (
+    hasattr(query_result, "get_as_arrow")
+    and isinstance(num_tuples, int)
+    and (max_rows is None or num_tuples <= max_rows)
+  ):
+    table = rename_columns(query_result.get_as_arrow(chunk_size=batch_rows), columns)
+    yield from table.to_batches(max_chunksize=batch_rows)
+    return
+
+  rows = []
+  while (max_rows is None or len(rows) < max_rows) and query_result.has_next():
+    rows.append(list(query_result.get_next()))
+
+  if max_rows is not None and len(rows) == max_rows and hasattr(query_result, "close"):
+    # Stopped at max_rows: release the rest of the result
+    query_result.close()
+
+  if rows:
+    yield from _rows_to_table(rows, columns).to_batches(max_chunksize=batch_rows)
+
+
+def _invalidate_query_cache(graph_id: str) -> None:
+  """Invalidate cached query results for a database after it was modified."""
+  try:
+    from robosystems.middleware.graph.query_cache import invalidate_query_cache_sync
+
+    invalidate_query_cache_sync(graph_id)
+  except Exception as e:
+    logger.warning(f"Failed to invalidate query cache for {graph_id}: {e}")
+
 
 class LadybugService:
   """LadybugDB service with multi-database support."""
@@ -286,7 +361,7 @@ class LadybugService:
         validate_cypher_query(request.cypher)
 
         # Check database exists
-        if validated_graph_id not in self.db_manager.list_databases():
+        if not self.db_manager.database_exists(validated_graph_id):
           raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Database '{validated_graph_id}' not found",
@@ -305,10 +380,9 @@ class LadybugService:
         ) as conn:
           # Execute query with comprehensive error handling
           try:
-            if request.parameters:
-              query_result = conn.execute(translated_cypher, request.parameters)
-            else:
-              query_result = conn.execute(translated_cypher)
+            query_result = execute_cached(
+              conn, validated_graph_id, translated_cypher, request.parameters
+            )
 
             # Handle case where execute returns a list of QueryResults
             if isinstance(query_result, list):
@@ -484,6 +558,109 @@ class LadybugService:
         )
         raise
 
+  def _execute_with_timeout(
+    self, conn, translated_cypher: str, parameters, validated_graph_id: str, span
+  ):
+    """
+    Execute a query on a connection with the configured timeout.
+
+    The query runs on the shared query executor. LadybugDB errors are mapped
+    to HTTP errors (400 for binder, parser and catalog errors, 408 for
+    timeouts, 503 when the executor is saturated, 500 otherwise).
+
+    Returns:
+        The LadybugDB query result
+    """
+    query_timeout = env.GRAPH_QUERY_TIMEOUT
+
+    def execute_query_with_params():
+      """Execute the query on a shared executor worker."""
+      # Parameterized queries reuse the connection's prepared statements
+      return execute_cached(conn, validated_graph_id, translated_cypher, parameters)
+
+    try:
+      # Bounded shared executor; timed out queries are interrupted on the
+      # connection instead of being left running in an abandoned thread
+      try:
+        query_result = get_query_executor().run(
+          conn, execute_query_with_params, timeout=query_timeout
+        )
+      except QueryTimeoutError:
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "QueryTimeout")
+        logger.warning(
+          f"Query timeout for {validated_graph_id} after {query_timeout} seconds"
+        )
+        raise HTTPException(
+          status_code=status.HTTP_408_REQUEST_TIMEOUT,
+          detail=f"Query execution timeout ({query_timeout} seconds)",
+        )
+      except QueryExecutorSaturatedError as e:
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "ExecutorSaturated")
+        logger.warning(f"Query rejected for {validated_graph_id}: {e}")
+        raise HTTPException(
+          status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+          detail=f"Server busy, retry later: {e}",
+        )
+
+      # Handle case where execute returns a list of QueryResults
+      if isinstance(query_result, list):
+        if len(query_result) == 0:
+          raise RuntimeError("Query returned no results")
+        query_result = query_result[0]  # Use first result
+
+    except HTTPException:
+      raise
+    except RuntimeError as e:
+      error_msg = str(e)
+      # Handle specific LadybugDB errors gracefully
+      if "Binder exception" in error_msg:
+        # Extract the specific binding error for cleaner logging
+        logger.warning(f"Query binding error for {validated_graph_id}: {error_msg}")
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "BinderException")
+        raise HTTPException(
+          status_code=status.HTTP_400_BAD_REQUEST,
+          detail=f"Query binding error: {error_msg}",
+        )
+      elif "Parser exception" in error_msg:
+        logger.warning(f"Query parsing error for {validated_graph_id}: {error_msg}")
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "ParserException")
+        raise HTTPException(
+          status_code=status.HTTP_400_BAD_REQUEST,
+          detail=f"Query parsing error: {error_msg}",
+        )
+      elif "Catalog exception" in error_msg:
+        logger.warning(f"Catalog error for {validated_graph_id}: {error_msg}")
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "CatalogException")
+        raise HTTPException(
+          status_code=status.HTTP_400_BAD_REQUEST,
+          detail=f"Catalog error: {error_msg}",
+        )
+      else:
+        # Other runtime errors
+        logger.error(f"Query execution error for {validated_graph_id}: {error_msg}")
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "RuntimeError")
+        raise HTTPException(
+          status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+          detail=f"Query execution error: {error_msg}",
+        )
+    except Exception as e:
+      # Catch-all for unexpected errors
+      logger.error(f"Unexpected query error for {validated_graph_id}: {e!s}")
+      span.set_attribute("error", True)
+      span.set_attribute("error.type", type(e).__name__)
+      raise HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"Unexpected error: {e!s}",
+      )
+
+    return query_result
+
   def execute_query(self, request: QueryRequest) -> QueryResponse:
     """Execute a query against a specific database."""
     with tracer.start_as_current_span(
@@ -503,7 +680,7 @@ class LadybugService:
         validate_query_parameters(request.parameters)
 
         # Check if database exists
-        if validated_graph_id not in self.db_manager.list_databases():
+        if not self.db_manager.database_exists(validated_graph_id):
           span.set_attribute("error", True)
           span.set_attribute("error.type", "DatabaseNotFound")
           raise HTTPException(
@@ -527,132 +704,15 @@ class LadybugService:
         with self.db_manager.get_connection(
           validated_graph_id, read_only=self.read_only
         ) as conn:
-          # Execute query with proper thread-based timeout
-          from robosystems.config import env
-
-          query_timeout = env.GRAPH_QUERY_TIMEOUT
-
-          # Use ThreadPoolExecutor for proper timeout handling
-          # This works across all platforms and doesn't interfere with signals
-          def execute_query_with_params():
-            """Execute the query in a separate thread for timeout control."""
-            if request.parameters:
-              return conn.execute(translated_cypher, request.parameters)
-            else:
-              return conn.execute(translated_cypher)
-
-          try:
-            # Execute the query with timeout using thread pool
-            with ThreadPoolExecutor(max_workers=1) as executor:
-              future = executor.submit(execute_query_with_params)
-              try:
-                query_result = future.result(timeout=query_timeout)
-
-                # Handle case where execute returns a list of QueryResults
-                if isinstance(query_result, list):
-                  if len(query_result) == 0:
-                    raise RuntimeError("Query returned no results")
-                  query_result = query_result[0]  # Use first result
-
-              except TimeoutError:
-                # Query exceeded timeout
-                span.set_attribute("error", True)
-                span.set_attribute("error.type", "QueryTimeout")
-                logger.warning(
-                  f"Query timeout for {validated_graph_id} after {query_timeout} seconds"
-                )
-                # Try to cancel the future (though LadybugDB query may continue)
-                future.cancel()
-                raise HTTPException(
-                  status_code=status.HTTP_408_REQUEST_TIMEOUT,
-                  detail=f"Query execution timeout ({query_timeout} seconds)",
-                )
-
-          except RuntimeError as e:
-            error_msg = str(e)
-            # Handle specific LadybugDB errors gracefully
-            if "Binder exception" in error_msg:
-              # Extract the specific binding error for cleaner logging
-              logger.warning(
-                f"Query binding error for {validated_graph_id}: {error_msg}"
-              )
-              span.set_attribute("error", True)
-              span.set_attribute("error.type", "BinderException")
-              raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Query binding error: {error_msg}",
-              )
-            elif "Parser exception" in error_msg:
-              logger.warning(
-                f"Query parsing error for {validated_graph_id}: {error_msg}"
-              )
-              span.set_attribute("error", True)
-              span.set_attribute("error.type", "ParserException")
-              raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Query parsing error: {error_msg}",
-              )
-            elif "Catalog exception" in error_msg:
-              logger.warning(f"Catalog error for {validated_graph_id}: {error_msg}")
-              span.set_attribute("error", True)
-              span.set_attribute("error.type", "CatalogException")
-              raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Catalog error: {error_msg}",
-              )
-            else:
-              # Other runtime errors
-              logger.error(
-                f"Query execution error for {validated_graph_id}: {error_msg}"
-              )
-              span.set_attribute("error", True)
-              span.set_attribute("error.type", "RuntimeError")
-              raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Query execution error: {error_msg}",
-              )
-          except Exception as e:
-            # Catch-all for unexpected errors
-            logger.error(f"Unexpected query error for {validated_graph_id}: {e!s}")
-            span.set_attribute("error", True)
-            span.set_attribute("error.type", type(e).__name__)
-            raise HTTPException(
-              status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-              detail=f"Unexpected error: {e!s}",
-            )
+          query_result = self._execute_with_timeout(
+            conn, translated_cypher, request.parameters, validated_graph_id, span
+          )
 
           # Parse results based on LadybugDB's output format
           rows = []
-          columns = []
-
-          # First, try to extract column aliases from the Cypher query itself
-          # This preserves custom aliases like "RETURN c as entity"
-          extracted_aliases = _extract_column_aliases_from_cypher(translated_cypher)
-
-          if hasattr(query_result, "get_schema"):
-            # Get column names from schema (these are generic: col0, col1, etc.)
-            schema = query_result.get_schema()
-            schema_columns = list(schema.keys())
-
-            # Use extracted aliases if available and count matches schema columns
-            if extracted_aliases and len(extracted_aliases) == len(schema_columns):
-              columns = extracted_aliases
-              logger.debug(f"Using extracted column aliases: {columns}")
-            else:
-              # Fall back to schema column names
-              columns = schema_columns
-              if extracted_aliases:
-                logger.debug(
-                  f"Column count mismatch - extracted: {len(extracted_aliases)}, schema: {len(schema_columns)}"
-                )
-          else:
-            # If no schema available, try to use extracted aliases
-            if extracted_aliases:
-              columns = extracted_aliases
-
+          columns = _resolve_columns(query_result, translated_cypher)
           # Iterate through all results with row limit protection
-          MAX_ROWS = 10000
-          while query_result.has_next() and len(rows) < MAX_ROWS:
+          while query_result.has_next() and len(rows) < MAX_RESULT_ROWS:
             row = query_result.get_next()
             # Convert row to dictionary based on columns
             if columns:
@@ -669,7 +729,7 @@ class LadybugService:
                 columns = list(row_dict.keys())
 
           # If we hit the limit, close the result to free resources
-          if len(rows) >= MAX_ROWS and hasattr(query_result, "close"):
+          if len(rows) >= MAX_RESULT_ROWS and hasattr(query_result, "close"):
             query_result.close()
 
           execution_time = (time.time() - start_time) * 1000
@@ -690,6 +750,9 @@ class LadybugService:
           span.set_attribute("query.row_count", len(rows))
           span.set_attribute("query.execution_time_ms", execution_time)
 
+          if is_write_operation(request.cypher) or is_schema_ddl(request.cypher):
+            _invalidate_query_cache(validated_graph_id)
+
           return QueryResponse(
             data=rows,
             columns=columns,
@@ -700,6 +763,14 @@ class LadybugService:
 
       except HTTPException:
         raise
+      except ConnectionPoolTimeoutError as e:
+        span.set_attribute("error", True)
+        span.set_attribute("error.type", "ConnectionPoolTimeout")
+        logger.warning(f"Query rejected for {request.database}: {e}")
+        raise HTTPException(
+          status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+          detail=f"Server busy, retry later: {e}",
+        )
       except Exception as e:
         execution_time = (time.time() - start_time) * 1000
         logger.error(
@@ -722,6 +793,202 @@ class LadybugService:
           detail=f"Query execution failed: {e!s}",
         )
 
+  def _prepare_arrow_query(self, request: QueryRequest, span) -> tuple[str, str]:
+    """Validate an Arrow query request and translate its Cypher."""
+    validated_graph_id = validate_database_name(request.database)
+    validate_cypher_query(request.cypher)
+    validate_query_parameters(request.parameters)
+
+    if not self.db_manager.database_exists(validated_graph_id):
+      span.set_attribute("error", True)
+      span.set_attribute("error.type", "DatabaseNotFound")
+      raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Database '{validated_graph_id}' not found",
+      )
+
+    return validated_graph_id, translate_neo4j_to_lbug(request.cypher)
+
+  def _arrow_query_failed(self, request: QueryRequest, span, start_time, e):
+    """Map an Arrow query failure to an HTTP error, recording metrics."""
+    if isinstance(e, ConnectionPoolTimeoutError):
+      span.set_attribute("error", True)
+      span.set_attribute("error.type", "ConnectionPoolTimeout")
+      logger.warning(f"Query rejected for {request.database}: {e}")
+      return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Server busy, retry later: {e}",
+      )
+
+    execution_time = (time.time() - start_time) * 1000
+    logger.error(f"Arrow query execution failed on {request.database}: {e}")
+
+    self.metrics_collector.record_query(
+      database=request.database,
+      duration_ms=execution_time,
+      success=False,
+    )
+
+    span.set_attribute("error", True)
+    span.set_attribute("error.message", str(e))
+
+    return HTTPException(
+      status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+      detail=f"Query execution failed: {e!s}",
+    )
+
+  def _record_arrow_query(
+    self,
+    request: QueryRequest,
+    validated_graph_id: str,
+    start_time: float,
+    row_count: int | None,
+  ) -> float:
+    """Record a successful Arrow query; returns execution time in milliseconds."""
+    execution_time = (time.time() - start_time) * 1000
+    self.last_activity = datetime.now()
+
+    self.metrics_collector.record_query(
+      database=validated_graph_id,
+      duration_ms=execution_time,
+      success=True,
+    )
+
+    rows = "streamed" if row_count is None else f"{row_count} rows"
+    logger.info(
+      f"Arrow query executed on {validated_graph_id}: {rows} in {execution_time:.2f}ms"
+    )
+
+    if is_write_operation(request.cypher) or is_schema_ddl(request.cypher):
+      _invalidate_query_cache(validated_graph_id)
+
+    return execution_time
+
+  def execute_query_arrow(
+    self, request: QueryRequest, max_rows: int = MAX_RESULT_ROWS
+  ) -> tuple[pa.Table, float]:
+    """
+    Execute a query and return at most ``max_rows`` rows as an Arrow table.
+
+    Uses LadybugDB's native Arrow export instead of iterating the result into
+    per-row Python dicts when the result fits within ``max_rows``; larger
+    results are read in batches up to the limit. Column aliases from the
+    RETURN clause are applied to the table schema.
+
+    Args:
+        request: Query request
+        max_rows: Maximum rows to return
+
+    Returns:
+        Tuple of (Arrow table, execution time in milliseconds)
+    """
+    with tracer.start_as_current_span(
+      "lbug.execute_query_arrow",
+      attributes={
+        "database.name": request.database,
+        "query.length": len(request.cypher),
+        "query.has_parameters": bool(request.parameters),
+      },
+    ) as span:
+      start_time = time.time()
+
+      try:
+        validated_graph_id, translated_cypher = self._prepare_arrow_query(request, span)
+
+        with self.db_manager.get_connection(
+          validated_graph_id, read_only=self.read_only
+        ) as conn:
+          query_result = self._execute_with_timeout(
+            conn, translated_cypher, request.parameters, validated_graph_id, span
+          )
+          columns = _resolve_columns(query_result, translated_cypher)
+          batches = list(_read_arrow_batches(query_result, columns, max_rows=max_rows))
+
+        if batches:
+          table = pa.Table.from_batches(batches)
+        else:
+          table = pa.table({column: pa.array([]) for column in columns})
+
+        execution_time = self._record_arrow_query(
+          request, validated_graph_id, start_time, table.num_rows
+        )
+        span.set_attribute("query.row_count", table.num_rows)
+        span.set_attribute("query.execution_time_ms", execution_time)
+
+        return table, execution_time
+
+      except HTTPException:
+        raise
+      except Exception as e:
+        raise self._arrow_query_failed(request, span, start_time, e) from e
+
+  def stream_query_arrow(
+    self, request: QueryRequest, batch_rows: int = DEFAULT_BATCH_ROWS
+  ) -> tuple[pa.Schema, Iterator[pa.RecordBatch], float]:
+    """
+    Execute a query and stream its result as Arrow record batches.
+
+    The query runs (and errors are raised) before this returns. The result is
+    exported in full before the first batch is sent, so every batch matches the
+    returned schema. The iterator holds the database connection until it is
+    exhausted or closed.
+
+    Args:
+        request: Query request
+        batch_rows: Maximum rows per record batch
+
+    Returns:
+        Tuple of (schema, record batch iterator, execution time in milliseconds)
+    """
+    with tracer.start_as_current_span(
+      "lbug.stream_query_arrow",
+      attributes={
+        "database.name": request.database,
+        "query.length": len(request.cypher),
+        "query.has_parameters": bool(request.parameters),
+      },
+    ) as span:
+      start_time = time.time()
+      stack = ExitStack()
+
+      try:
+        validated_graph_id, translated_cypher = self._prepare_arrow_query(request, span)
+
+        conn = stack.enter_context(
+          self.db_manager.get_connection(validated_graph_id, read_only=self.read_only)
+        )
+        query_result = self._execute_with_timeout(
+          conn, translated_cypher, request.parameters, validated_graph_id, span
+        )
+        columns = _resolve_columns(query_result, translated_cypher)
+        batches = _read_arrow_batches(query_result, columns, batch_rows=batch_rows)
+        first_batch = next(batches, None)
+
+        execution_time = self._record_arrow_query(
+          request, validated_graph_id, start_time, None
+        )
+        span.set_attribute("query.execution_time_ms", execution_time)
+
+      except HTTPException:
+        stack.close()
+        raise
+      except Exception as e:
+        stack.close()
+        raise self._arrow_query_failed(request, span, start_time, e) from e
+
+    if first_batch is not None:
+      schema = first_batch.schema
+    else:
+      schema = pa.schema([(column, pa.null()) for column in columns])
+
+    def iter_batches() -> Iterator[pa.RecordBatch]:
+      with stack:
+        if first_batch is not None:
+          yield first_batch
+        yield from batches
+
+    return schema, iter_batches(), execution_time
+
   def get_cluster_health(self) -> ClusterHealthResponse:
     """Get cluster health status."""
     databases = self.db_manager.list_databases()
@@ -979,7 +1246,8 @@ class LadybugService:
           raise ValueError("Invalid backup format - no database files found")
 
       # Database files have been restored to the expected location
-      # The database manager will detect them automatically on next access
+      self.db_manager.register_database(graph_id)
+      _invalidate_query_cache(graph_id)
 
       logger.info(
         f"Restore task {task_id} completed successfully for database {graph_id}"
@@ -0,0 +1,242 @@
+"""
+Prepared statement cache for LadybugDB connections.
+
+A parameterized query sent as text is parsed, bound and planned by LadybugDB on
+every call, even when only the parameter values change. Each connection keeps
+an LRU of prepared statements keyed by query text so hot query shapes skip
+that work and only bind the new values.
+
+Prepared statements are bound against the catalog when they are prepared, so
+every database has a schema version. Schema DDL executed through the engine,
+the connection pool or the schema endpoints bumps the version, and a cache that
+sees a newer version drops its statements before the next execution.
+
+Key features:
+- Per-connection LRU keyed by query text
+- Invalidation on schema changes, with a single re-prepare on binder errors
+  for DDL applied out-of-band
+- Hit, miss, eviction and invalidation metrics
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+import real_ladybug as lbug
+
+from robosystems.logger import logger
+from robosystems.security.cypher_parser import parse_cypher
+
+# Errors raised when a cached statement no longer matches the catalog
+STALE_STATEMENT_ERRORS = ("Binder exception", "Catalog exception")
+
+# Schema version per database, bumped on DDL
+_schema_versions: dict[str, int] = {}
+_schema_versions_lock = threading.Lock()
+
+
+def get_schema_version(database: str) -> int:
+  """Get the current schema version of a database."""
+  return _schema_versions.get(database, 0)
+
+
+def bump_schema_version(database: str) -> int:
+  """
+  Record a schema change so cached statements for the database are dropped.
+
+  Args:
+      database: Database name (graph ID)
+
+  Returns:
+      The new schema version
+  """
+  with _schema_versions_lock:
+    version = _schema_versions.get(database, 0) + 1
+    _schema_versions[database] = version
+  logger.debug(f"Schema version for {database} is now {version}")
+  return version
+
+
+def changes_schema(query: str) -> bool:
+  """Whether a query alters the catalog (tables or columns)."""
+  analysis = parse_cypher(query)
+  return analysis.is_schema_ddl or analysis.has_phrase("DROP TABLE")
+
+
+class PreparedStatementCache:
+  """
+  LRU of prepared statements for a single LadybugDB connection.
+
+  Only parameterized queries are prepared; queries without parameters run as
+  text so multi-statement scripts keep working.
+  """
+
+  def __init__(self, database: str, max_size: int | None = None):
+    """
+    Initialize the cache.
+
+    Args:
+        database: Database name whose schema version the cache follows
+        max_size: Maximum cached statements (defaults to
+            LBUG_PREPARED_STATEMENT_CACHE_SIZE; 0 disables caching)
+    """
+    if max_size is None:
+      from robosystems.config import env
+
+      max_size = env.LBUG_PREPARED_STATEMENT_CACHE_SIZE
+
+    self.database = database
+    self.max_size = max(0, max_size)
+    self._statements: OrderedDict[str, lbug.PreparedStatement] = OrderedDict()
+    self._schema_version = get_schema_version(database)
+    self._lock = threading.Lock()
+
+    # Metrics
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.invalidations = 0
+
+  def execute(self, conn, query: str, parameters: dict[str, Any] | None = None) -> Any:
+    """
+    Execute a query on the connection, reusing a prepared statement if cached.
+
+    Args:
+        conn: LadybugDB connection the cache belongs to
+        query: Cypher query text
+        parameters: Optional query parameters
+
+    Returns:
+        The LadybugDB query result
+    """
+    if not parameters or self.max_size == 0:
+      result = conn.execute(query, parameters) if parameters else conn.execute(query)
+    else:
+      result = self._execute_prepared(conn, query, parameters)
+
+    if changes_schema(query):
+      bump_schema_version(self.database)
+    return result
+
+  def _execute_prepared(self, conn, query: str, parameters: dict[str, Any]) -> Any:
+    """Execute through a cached prepared statement."""
+    statement, cached = self._get_statement(conn, query)
+    try:
+      return conn.execute(statement, parameters)
+    except RuntimeError as e:
+      if not cached or not any(marker in str(e) for marker in STALE_STATEMENT_ERRORS):
+        raise
+      # The schema may have changed outside this process; prepare once more
+      logger.debug(f"Re-preparing stale statement for {self.database}: {e}")
+      self.discard(query)
+      statement, _ = self._get_statement(conn, query)
+      return conn.execute(statement, parameters)
+
+  def _get_statement(self, conn, query: str) -> tuple[lbug.PreparedStatement, bool]:
+    """Get a cached statement or prepare and cache a new one."""
+    with self._lock:
+      version = get_schema_version(self.database)
+      if version != self._schema_version:
+        if self._statements:
+          self.invalidations += 1
+        self._statements.clear()
+        self._schema_version = version
+
+      statement = self._statements.get(query)
+      if statement is not None:
+        self._statements.move_to_end(query)
+        self.hits += 1
+        return statement, True
+      self.misses += 1
+
+    # Prepare outside the lock; planning can take a while for large queries
+    statement = lbug.PreparedStatement(conn, query)
+    if not statement.is_success():
+      raise RuntimeError(statement.get_error_message())
+
+    with self._lock:
+      self._statements[query] = statement
+      self._statements.move_to_end(query)
+      while len(self._statements) > self.max_size:
+        self._statements.popitem(last=False)
+        self.evictions += 1
+
+    return statement, False
+
+  def discard(self, query: str) -> None:
+    """Drop a single statement from the cache."""
+    with self._lock:
+      self._statements.pop(query, None)
+
+  def clear(self) -> None:
+    """Drop all cached statements."""
+    with self._lock:
+      self._statements.clear()
+
+  def get_stats(self) -> dict[str, Any]:
+    """Get cache statistics."""
+    with self._lock:
+      return {
+        "size": len(self._statements),
+        "max_size": self.max_size,
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+        "invalidations": self.invalidations,
+        "schema_version": self._schema_version,
+      }
+
+
+# Caches for pooled connections, released with their connection
+_connection_caches: "weakref.WeakKeyDictionary[Any, PreparedStatementCache]" = (
+  weakref.WeakKeyDictionary()
+)
+_connection_caches_lock = threading.Lock()
+
+
+def get_statement_cache(conn, database: str) -> PreparedStatementCache:
+  """
+  Get or create the statement cache of a pooled connection.
+
+  Args:
+      conn: LadybugDB connection
+      database: Database name the connection belongs to
+
+  Returns:
+      The connection's PreparedStatementCache
+  """
+  cache = _connection_caches.get(conn)
+  if cache is None:
+    with _connection_caches_lock:
+      cache = _connection_caches.get(conn)
+      if cache is None:
+        cache = PreparedStatementCache(database)
+        _connection_caches[conn] = cache
+  return cache
+
+
+def discard_statement_cache(conn) -> None:
+  """Release a connection's cached statements before it is closed."""
+  with _connection_caches_lock:
+    cache = _connection_caches.pop(conn, None)
+  if cache is not None:
+    cache.clear()
+
+
+def execute_cached(
+  conn, database: str, query: str, parameters: dict[str, Any] | None = None
+) -> Any:
+  """
+  Execute a query on a pooled connection through its statement cache.
+
+  Args:
+      conn: LadybugDB connection from the pool
+      database: Database name the connection belongs to
+      query: Cypher query text
+      parameters: Optional query parameters
+
+  Returns:
+      The LadybugDB query result
+  """
+  return get_statement_cache(conn, database).execute(conn, query, parameters)
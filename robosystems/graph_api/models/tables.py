@@ -31,6 +31,10 @@ class TableCreateRequest(BaseModel):
     default=None,
     description="Optional map of s3_key -> file_id for provenance tracking",
   )
+  rebuild: bool = Field(
+    default=False,
+    description="Rebuild the table from all files instead of staging only new files",
+  )
 
   @field_validator("s3_pattern")
   @classmethod
@@ -63,6 +67,17 @@ class TableCreateResponse(BaseModel):
   graph_id: str = Field(..., description="Graph database identifier")
   table_name: str = Field(..., description="Table name")
   execution_time_ms: float = Field(..., description="Creation time in milliseconds")
+  mode: str | None = Field(
+    default=None,
+    description="Staging mode with file_id tracking: 'full' or 'incremental'",
+  )
+  files_scanned: int | None = Field(
+    default=None, description="Number of files read to stage the table"
+  )
+  file_ids: list[str] | None = Field(
+    default=None,
+    description="File IDs appended by an incremental run (None after a full rebuild)",
+  )
 
 
 class TableQueryRequest(BaseModel):
@@ -65,10 +65,10 @@ class IngestionTaskManager:
     """Get async Redis client for task storage."""
     if not self._redis_client:
       # Use dedicated database for LadybugDB tasks
-      # Use async factory method to handle SSL params correctly
-      from robosystems.config.valkey_registry import create_async_redis_client
+      # Use the shared async pool, which handles SSL params correctly
+      from robosystems.config.valkey_registry import get_shared_async_redis_client
 
-      self._redis_client = create_async_redis_client(
+      self._redis_client = get_shared_async_redis_client(
         ValkeyDatabase.LBUG_CACHE, decode_responses=True
       )
     return self._redis_client
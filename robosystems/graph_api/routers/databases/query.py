@@ -8,8 +8,8 @@ specific LadybugDB graph databases with admission control.
 import json
 from contextlib import contextmanager
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from robosystems.config import env
@@ -18,7 +18,15 @@ from robosystems.graph_api.core.admission_control import (
   AdmissionDecision,
   get_admission_controller,
 )
+from robosystems.graph_api.core.arrow_ipc import (
+  ARROW_STREAM_MEDIA_TYPE,
+  DEFAULT_BATCH_ROWS,
+  iter_ipc_stream,
+  table_to_ipc_bytes,
+  wants_arrow,
+)
 from robosystems.graph_api.core.ladybug import get_ladybug_service
+from robosystems.graph_api.core.ladybug.service import MAX_RESULT_ROWS
 from robosystems.graph_api.models.database import QueryRequest
 from robosystems.logger import logger
 from robosystems.models.iam import Graph
@@ -48,6 +56,7 @@ def _get_service_for_request():
 @router.post("/{graph_id}/query")
 async def execute_query(
   request: QueryRequest,
+  full_request: Request,
   graph_id: str = Path(..., description="Graph database identifier"),
   streaming: bool = False,
   database: str | None = None,
@@ -61,13 +70,17 @@ async def execute_query(
   Can return results as a standard JSON response or as a streaming response
   for large result sets.
 
+  Sending ``Accept: application/vnd.apache.arrow.stream`` returns the result
+  as an Arrow IPC stream (columnar, no per-row JSON conversion). Streaming
+  Arrow responses are not subject to the non-streaming row limit.
+
   Args:
       graph_id: The database identifier
       request: Query request containing the Cypher query and optional parameters
       streaming: If true, use streaming response (recommended for large results)
 
   Returns:
-      Standard JSON response or streaming NDJSON response based on streaming parameter
+      Standard JSON response, streaming NDJSON response, or Arrow IPC stream
 
   Raises:
       HTTPException: 503 if server is overloaded (admission control)
@@ -127,6 +140,36 @@ async def execute_query(
           detail="Streaming not yet implemented for Neo4j backend",
         )
     else:
+      # Columnar Arrow IPC transport (opt-in via Accept header)
+      if wants_arrow(full_request.headers.get("accept")):
+        if not streaming:
+          table, execution_time = service.execute_query_arrow(
+            query_request, max_rows=MAX_RESULT_ROWS
+          )
+          return Response(
+            content=table_to_ipc_bytes(table),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+            headers={
+              "X-Row-Count": str(table.num_rows),
+              "X-Execution-Time-Ms": f"{execution_time:.2f}",
+              "Cache-Control": "no-cache",
+            },
+          )
+
+        # Record batches are read from the result as the response is sent
+        schema, batches, execution_time = service.stream_query_arrow(
+          query_request, batch_rows=DEFAULT_BATCH_ROWS
+        )
+        return StreamingResponse(
+          iter_ipc_stream(schema, batches),
+          media_type=ARROW_STREAM_MEDIA_TYPE,
+          headers={
+            "X-Execution-Time-Ms": f"{execution_time:.2f}",
+            "Cache-Control": "no-cache",
+            "X-Streaming": "true",
+          },
+        )
+
       # Use existing LadybugDB service (sync)
       if not streaming:
         return service.execute_query(query_request)
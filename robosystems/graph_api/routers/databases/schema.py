@@ -11,7 +11,10 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Path
 from fastapi import status as http_status
 
-from robosystems.graph_api.core.ladybug import get_ladybug_service
+from robosystems.graph_api.core.ladybug import (
+  bump_schema_version,
+  get_ladybug_service,
+)
 from robosystems.graph_api.core.utils import validate_database_name
 from robosystems.graph_api.models.database import (
   QueryRequest,
@@ -190,6 +193,9 @@ async def install_schema(
         # Commit transaction if all statements succeeded
         conn.execute("COMMIT")
 
+        # Drop prepared statements bound to the previous schema
+        bump_schema_version(graph_id)
+
         # Log metadata if provided
         if request.metadata:
           logger.info(f"Schema metadata for {graph_id}: {request.metadata}")
@@ -15,6 +15,80 @@ from robosystems.logger import logger
 
 router = APIRouter(prefix="/databases/{graph_id}/tables")
 
+# Staging bookkeeping column that is not part of the graph schema
+FILE_ID_COLUMN = "file_id"
+
+
+def _staging_columns(duck_conn, table_name: str) -> list[str]:
+  """Columns of a DuckDB staging table, in table order."""
+  rows = duck_conn.execute(
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_schema = 'main' AND table_name = ? ORDER BY ordinal_position",
+    [table_name],
+  ).fetchall()
+  return [row[0] for row in rows]
+
+
+def _staging_scan(
+  source: str, columns: list[str], file_ids: list[str] | None = None
+) -> str:
+  """
+  Cypher scan of an attached DuckDB staging table.
+
+  The scan projects away ``file_id`` and filters by it when file IDs are
+  given, so COPY reads the staging table directly instead of a physical copy.
+  """
+  projection = ", ".join(f"`{col}`" for col in columns if col != FILE_ID_COLUMN)
+  where = ""
+  if file_ids and FILE_ID_COLUMN in columns:
+    ids = ", ".join(
+      "'" + fid.replace("\\", "\\\\").replace("'", "\\'") + "'" for fid in file_ids
+    )
+    where = f" WHERE `{FILE_ID_COLUMN}` IN [{ids}]"
+  return f"LOAD FROM {source}{where} RETURN {projection}"
+
+
+def _scalar(conn, query: str) -> int:
+  """Run a single-value LadybugDB query."""
+  result = conn.execute(query)
+  try:
+    return int(result.get_next()[0]) if result.has_next() else 0
+  finally:
+    result.close()
+
+
+def _graph_row_count(conn, table_name: str, table_types: dict[str, str]) -> int:
+  """Number of nodes or relationships in a LadybugDB table."""
+  if table_types.get(table_name) == "REL":
+    return _scalar(conn, f"MATCH ()-[r:`{table_name}`]->() RETURN count(r)")
+  return _scalar(conn, f"MATCH (n:`{table_name}`) RETURN count(n)")
+
+
+def _graph_table_types(conn) -> dict[str, str]:
+  """LadybugDB table names mapped to their type (NODE or REL)."""
+  result = conn.execute("CALL show_tables() RETURN name, type")
+  try:
+    types = {}
+    while result.has_next():
+      name, table_type = result.get_next()
+      types[name] = table_type
+    return types
+  finally:
+    result.close()
+
+
+def _copy_from_staging(conn, table_name: str, scan: str, ignore_errors: bool) -> int:
+  """COPY a staging scan into a graph table and return the rows added."""
+  table_types = _graph_table_types(conn)
+  rows_before = _graph_row_count(conn, table_name, table_types)
+
+  options = " (ignore_errors=true)" if ignore_errors else ""
+  copy_query = f"COPY {table_name} FROM ({scan}){options}"
+  logger.info(f"Executing: {copy_query}")
+  conn.execute(copy_query).close()
+
+  return _graph_row_count(conn, table_name, table_types) - rows_before
+
 
 @router.post("/{table_name}/materialize", response_model=TableMaterializationResponse)
 async def materialize_table(
@@ -52,9 +126,8 @@ async def materialize_table(
     from robosystems.graph_api.core.duckdb import get_duckdb_pool
 
     duckdb_pool = get_duckdb_pool()
-    temp_table_name = f"{table_name}_temp_materialization"
 
-    # Check if table exists, create temp copy without file_id
+    # Check the table exists and read its columns for the projected scan
     try:
       with duckdb_pool.get_connection(graph_id) as duck_conn:
         max_retries = 3
@@ -96,57 +169,21 @@ async def materialize_table(
             execution_time_ms=0.0,
           )
 
-        # Drop temp table if it exists from previous failed run
-        try:
-          duck_conn.execute(f"DROP TABLE IF EXISTS {temp_table_name}")
-        except Exception:
-          pass
-
-        # Check if file_id column exists in the table
-        columns_result = duck_conn.execute(
-          f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}'"
-        ).fetchall()
-        column_names = [col[0] for col in columns_result]
-        has_file_id = "file_id" in column_names
-
-        # Create physical copy of table without file_id column (if it exists)
-        if request.file_ids:
-          file_ids_str = ", ".join([f"'{fid}'" for fid in request.file_ids])
-          if has_file_id:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table_name} AS "
-              f"SELECT * EXCLUDE (file_id) FROM {table_name} "
-              f"WHERE file_id IN ({file_ids_str})"
-            )
-          else:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table_name} AS SELECT * FROM {table_name}"
-            )
-          logger.info(
-            f"Created temp DuckDB table {temp_table_name} with {len(request.file_ids)} file(s)"
-          )
-        else:
-          if has_file_id:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table_name} AS "
-              f"SELECT * EXCLUDE (file_id) FROM {table_name}"
-            )
-          else:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table_name} AS SELECT * FROM {table_name}"
-            )
-          logger.info(
-            f"Created temp DuckDB table {temp_table_name} for full materialization"
-          )
+        column_names = _staging_columns(duck_conn, table_name)
 
     except Exception as err:
       logger.error(f"Could not prepare DuckDB table for materialization: {err}")
       raise
 
-    temp_table_created = True
+    # Read the staging table in place, without file_id (no intermediate copy)
+    scan = _staging_scan(f"duck.{table_name}", column_names, request.file_ids)
 
     try:
-      with ladybug_service.db_manager.connection_pool.get_connection(graph_id) as conn:
+      connection_pool = ladybug_service.db_manager.connection_pool
+      with (
+        connection_pool.bulk_load(graph_id),
+        connection_pool.get_connection(graph_id) as conn,
+      ):
         try:
           conn.execute(f"LOAD EXTENSION '{duckdb_extension_path}'")
           logger.info(f"Loaded DuckDB extension from {duckdb_extension_path}")
@@ -165,7 +202,6 @@ async def materialize_table(
         conn.execute(f"ATTACH '{duck_path}' AS duck (DBTYPE duckdb)")
         logger.info(f"Attached DuckDB database: {duck_path}")
 
-        # Copy from the temp table (which already has file_id excluded)
         if request.file_ids:
           logger.info(
             f"Executing selective materialization from DuckDB to graph: {table_name} "
@@ -176,26 +212,9 @@ async def materialize_table(
             f"Executing full materialization from DuckDB to graph: {table_name}"
           )
 
-        if request.ignore_errors:
-          copy_query = (
-            f"COPY {table_name} FROM duck.{temp_table_name} (ignore_errors=true)"
-          )
-        else:
-          copy_query = f"COPY {table_name} FROM duck.{temp_table_name}"
-
-        logger.info(f"Executing: {copy_query}")
-        result = conn.execute(copy_query)
-
-      rows_ingested = 0
-      if result and hasattr(result, "get_as_arrow"):
-        arrow_table = result.get_as_arrow()
-        if arrow_table.num_rows > 0 and arrow_table.num_columns > 0:
-          result_msg = str(arrow_table.column(0)[0].as_py())
-          import re
-
-          match = re.search(r"(\d+)\s+tuples?", result_msg)
-          if match:
-            rows_ingested = int(match.group(1))
+        rows_ingested = _copy_from_staging(
+          conn, table_name, scan, request.ignore_errors
+        )
 
       execution_time_ms = (time.time() - start_time) * 1000
 
@@ -218,18 +237,6 @@ async def materialize_table(
         detail=f"Failed to materialize table: {e!s}",
       )
 
-    finally:
-      # Clean up temp table
-      if temp_table_created:
-        try:
-          with duckdb_pool.get_connection(graph_id) as duck_conn:
-            duck_conn.execute(f"DROP TABLE IF EXISTS {temp_table_name}")
-            logger.info(f"Cleaned up temp DuckDB table: {temp_table_name}")
-        except Exception as cleanup_err:
-          logger.warning(
-            f"Failed to clean up temp table {temp_table_name}: {cleanup_err}"
-          )
-
   except Exception as outer_err:
     logger.error(f"Failed during table preparation or materialization: {outer_err}")
     raise HTTPException(
@@ -298,7 +305,7 @@ async def fork_from_parent_duckdb(
 
     duckdb_pool = get_duckdb_pool()
 
-    # Get list of tables and create views (excluding file_id column)
+    # Get list of tables and their columns (file_id is projected away on copy)
     with duckdb_pool.get_connection(parent_graph_id) as duck_conn:
       max_retries = 3
       for attempt in range(max_retries):
@@ -324,6 +331,10 @@ async def fork_from_parent_duckdb(
 
       result = duck_conn.execute("SHOW TABLES").fetchall()
       available_tables = [row[0] for row in result]
+      table_columns = {
+        table_name: _staging_columns(duck_conn, table_name)
+        for table_name in available_tables
+      }
 
     # Filter tables
     if request.tables:
@@ -348,42 +359,16 @@ async def fork_from_parent_duckdb(
         detail="No tables to copy",
       )
 
-    # Create temp physical tables in parent DuckDB for each table (excluding file_id if exists)
-    temp_tables = []
     try:
-      with duckdb_pool.get_connection(parent_graph_id) as duck_conn:
-        for table_name in tables_to_copy:
-          temp_table = f"{table_name}_temp_fork"
-          temp_tables.append(temp_table)
-
-          # Drop if exists from previous failed run
-          duck_conn.execute(f"DROP TABLE IF EXISTS {temp_table}")
-
-          # Check if file_id column exists in the table
-          columns_result = duck_conn.execute(
-            f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}'"
-          ).fetchall()
-          column_names = [col[0] for col in columns_result]
-          has_file_id = "file_id" in column_names
-
-          # Create physical temp table without file_id (if it exists)
-          if has_file_id:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table} AS SELECT * EXCLUDE (file_id) FROM {table_name}"
-            )
-          else:
-            duck_conn.execute(
-              f"CREATE TABLE {temp_table} AS SELECT * FROM {table_name}"
-            )
-        logger.info(f"Created {len(temp_tables)} temp tables in parent DuckDB for fork")
-
       # Connect to subgraph LadybugDB and attach parent DuckDB
       total_rows = 0
       tables_copied = []
 
-      with ladybug_service.db_manager.connection_pool.get_connection(
-        subgraph_id
-      ) as conn:
+      connection_pool = ladybug_service.db_manager.connection_pool
+      with (
+        connection_pool.bulk_load(subgraph_id),
+        connection_pool.get_connection(subgraph_id) as conn,
+      ):
         try:
           conn.execute(f"LOAD EXTENSION '{duckdb_extension_path}'")
           logger.info(f"Loaded DuckDB extension from {duckdb_extension_path}")
@@ -402,31 +387,15 @@ async def fork_from_parent_duckdb(
         conn.execute(f"ATTACH '{parent_duck_path}' AS parent_duck (DBTYPE duckdb)")
         logger.info(f"Attached parent DuckDB: {parent_duck_path}")
 
-        # Copy each table from the temp tables we created in parent DuckDB
-        for idx, table_name in enumerate(tables_to_copy):
+        # Copy each table straight from the parent's staging tables
+        for table_name in tables_to_copy:
           try:
-            temp_table = temp_tables[idx]
-
-            if request.ignore_errors:
-              copy_query = (
-                f"COPY {table_name} FROM parent_duck.{temp_table} (ignore_errors=true)"
-              )
-            else:
-              copy_query = f"COPY {table_name} FROM parent_duck.{temp_table}"
+            scan = _staging_scan(f"parent_duck.{table_name}", table_columns[table_name])
 
             logger.info(f"Copying {table_name} from parent to subgraph")
-            result = conn.execute(copy_query)
-
-            rows_ingested = 0
-            if result and hasattr(result, "get_as_arrow"):
-              arrow_table = result.get_as_arrow()
-              if arrow_table.num_rows > 0 and arrow_table.num_columns > 0:
-                result_msg = str(arrow_table.column(0)[0].as_py())
-                import re
-
-                match = re.search(r"(\d+)\s+tuples?", result_msg)
-                if match:
-                  rows_ingested = int(match.group(1))
+            rows_ingested = _copy_from_staging(
+              conn, table_name, scan, request.ignore_errors
+            )
 
             total_rows += rows_ingested
             tables_copied.append(table_name)
@@ -437,11 +406,11 @@ async def fork_from_parent_duckdb(
             if not request.ignore_errors:
               raise
 
-      # Detach parent DuckDB
-      try:
-        conn.execute("DETACH parent_duck")
-      except Exception:
-        pass
+        # Detach parent DuckDB before the connection is returned to the pool
+        try:
+          conn.execute("DETACH parent_duck")
+        except Exception:
+          pass
 
       execution_time_ms = (time.time() - start_time) * 1000
 
@@ -467,17 +436,6 @@ async def fork_from_parent_duckdb(
         detail=f"Failed to fork data: {e!s}",
       )
 
-    finally:
-      # Clean up temp tables
-      if temp_tables:
-        try:
-          with duckdb_pool.get_connection(parent_graph_id) as duck_conn:
-            for temp_table in temp_tables:
-              duck_conn.execute(f"DROP TABLE IF EXISTS {temp_table}")
-            logger.info(f"Cleaned up {len(temp_tables)} temp tables from parent DuckDB")
-        except Exception as cleanup_err:
-          logger.warning(f"Failed to clean up temp tables: {cleanup_err}")
-
   except Exception as outer_err:
     logger.error(f"Failed during fork preparation: {outer_err}")
     raise HTTPException(
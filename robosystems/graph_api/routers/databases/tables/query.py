@@ -1,3 +1,4 @@
+import itertools
 import json
 from datetime import UTC, datetime
 
@@ -6,6 +7,7 @@ from fastapi import status as http_status
 from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
+from robosystems.graph_api.core.arrow_ipc import ARROW_STREAM_MEDIA_TYPE, wants_arrow
 from robosystems.graph_api.core.duckdb.manager import (
   DuckDBTableManager,
   TableQueryRequest,
@@ -38,6 +40,7 @@ async def query_tables(
   - `application/json` (default): Return all results as JSON
   - `application/x-ndjson`: Stream results as NDJSON (efficient for large results)
   - `text/event-stream`: Stream results as SSE (with progress updates)
+  - `application/vnd.apache.arrow.stream`: Stream results as Arrow IPC (columnar)
 
   **Manual Override:**
   - `streaming=false`: Force JSON response
@@ -70,6 +73,21 @@ async def query_tables(
   request.graph_id = graph_id
 
   try:
+    if wants_arrow(accept_header):
+      # Columnar Arrow IPC stream - the first chunk surfaces query errors
+      arrow_stream = table_manager.query_table_arrow(request, chunk_size)
+      first_chunk = next(arrow_stream)
+
+      return StreamingResponse(
+        itertools.chain([first_chunk], arrow_stream),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={
+          "X-Streaming": "true",
+          "Cache-Control": "no-cache",
+          "X-Content-Type-Options": "nosniff",
+        },
+      )
+
     if streaming:
       if wants_sse:
         # SSE streaming with progress updates
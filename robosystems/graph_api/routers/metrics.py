@@ -11,7 +11,7 @@ from typing import Any
 from fastapi import APIRouter, Depends
 
 from robosystems.graph_api.core.admission_control import get_admission_controller
-from robosystems.graph_api.core.ladybug import get_ladybug_service
+from robosystems.graph_api.core.ladybug import get_ladybug_service, get_query_executor
 
 router = APIRouter(tags=["Cluster Metrics"])
 
@@ -29,6 +29,9 @@ async def get_metrics(
   - **Database Metrics**: Size, table counts, connection pools for each database
   - **Query Metrics**: Query counts, average execution times, slow queries
   - **Ingestion Metrics**: Queue depth, processing rates, active tasks
+  - **Query Executor**: Active workers, queue depth, timeouts and rejections
+  - **Buffer Pools**: Shared memory budget and per-database buffer pool sizes
+    (multi-tenant instances only)
   - **Cluster Info**: Node identification, type, and uptime
 
   This endpoint is designed for monitoring systems like Prometheus
@@ -47,6 +50,12 @@ async def get_metrics(
   admission_controller = get_admission_controller()
   admission_metrics = admission_controller.get_metrics()
 
+  # Get shared query executor metrics
+  executor_metrics = get_query_executor().get_metrics()
+
+  # Get buffer pool memory budget (None on single-database tiers)
+  buffer_pool_metrics = ladybug_service.db_manager.connection_pool.get_memory_stats()
+
   return {
     "timestamp": system_metrics.get("timestamp"),
     "system": system_metrics,
@@ -54,6 +63,8 @@ async def get_metrics(
     "queries": query_metrics,
     "ingestion": ingestion_metrics,
     "admission_control": admission_metrics,
+    "query_executor": executor_metrics,
+    "buffer_pools": buffer_pool_metrics,
     "cluster": {
       "node_id": ladybug_service.node_id,
       "node_type": ladybug_service.node_type.value,
@@ -15,9 +15,10 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from ...config import env
-from ...config.valkey_registry import ValkeyDatabase, create_redis_client
+from ...config.valkey_registry import ValkeyDatabase, get_shared_redis_client
 from ...logger import logger
 from ...security import SecurityAuditLogger, SecurityEventType
+from .local_cache import LocalAuthCache
 
 
 class APIKeyCache:
@@ -27,12 +28,14 @@ class APIKeyCache:
   DEFAULT_TTL = 300  # 5 minutes
   CACHE_KEY_PREFIX = "apikey:"
   GRAPH_CACHE_KEY_PREFIX = "apikey_graph:"
+  API_KEY_ID_PREFIX = "apikey_id:"  # API key id -> cache hash, for revocation
   USER_DATA_PREFIX = "user:"
   AUDIT_LOG_RATE_LIMIT_PREFIX = "audit_rate_limit:"
   AUDIT_LOG_RATE_LIMIT_TTL = 300  # 5 minutes - only log once per user per 5 minutes
   JWT_CACHE_KEY_PREFIX = "jwt:"
   JWT_GRAPH_CACHE_KEY_PREFIX = "jwt_graph:"
   JWT_BLACKLIST_PREFIX = "jwt_blacklist:"
+  GRAPH_ACCESS_PREFIX = "graph_access:"  # user -> {graph_id: role}
 
   # Rate limiting configuration
   RATE_LIMIT_PREFIX = "rate_limit:"
@@ -75,13 +78,16 @@ class APIKeyCache:
     self._signature_cache: dict[str, str] = {}
     self._signature_cache_times: dict[str, float] = {}
 
+    # In-process tier in front of Valkey, invalidated across workers via pub/sub
+    self.local = LocalAuthCache()
+
   @property
   def redis(self) -> redis.Redis:
     """Get Redis connection, creating if needed."""
     if self._redis is None:
       try:
-        # Use the new connection factory with proper ElastiCache support
-        self._redis = create_redis_client(ValkeyDatabase.AUTH_CACHE)
+        # Use the shared connection pool with proper ElastiCache support
+        self._redis = get_shared_redis_client(ValkeyDatabase.AUTH_CACHE)
         # Test connection
         self._redis.ping()
         logger.info("Connected to Valkey/Redis for API key caching")
@@ -127,10 +133,28 @@ class APIKeyCache:
     """Get cache key for JWT user + graph access."""
     return f"{self.JWT_GRAPH_CACHE_KEY_PREFIX}{user_id}:{graph_id}"
 
+  def _get_graph_access_key(self, user_id: str) -> str:
+    """Get cache key for a user's graph access matrix."""
+    return f"{self.GRAPH_ACCESS_PREFIX}{user_id}"
+
   def _get_jwt_blacklist_key(self, jwt_hash: str) -> str:
     """Get cache key for JWT blacklist."""
     return f"{self.JWT_BLACKLIST_PREFIX}{jwt_hash}"
 
+  @staticmethod
+  def _user_tags(user_data: dict[str, Any]) -> list[str]:
+    """Local cache tags identifying the user a cached principal belongs to."""
+    user_id = user_data.get("id") if user_data else None
+    return [f"user:{user_id}"] if user_id else []
+
+  @classmethod
+  def _api_key_tags(cls, api_key_hash: str, cache_data: dict[str, Any]) -> list[str]:
+    """Local cache tags for a cached API key validation."""
+    tags = [f"apikey:{api_key_hash}", *cls._user_tags(cache_data["user_data"])]
+    if cache_data.get("api_key_id"):
+      tags.append(f"apikey_id:{cache_data['api_key_id']}")
+    return tags
+
   def _hash_jwt_token(self, token: str) -> str:
     """Create a hash of the JWT token for caching."""
     return hashlib.sha256(token.encode()).hexdigest()
@@ -538,7 +562,11 @@ class APIKeyCache:
       return False
 
   def cache_api_key_validation(
-    self, api_key_hash: str, user_data: dict[str, Any], is_active: bool = True
+    self,
+    api_key_hash: str,
+    user_data: dict[str, Any],
+    is_active: bool = True,
+    api_key_id: str | None = None,
   ) -> None:
     """
     Cache API key validation result with encryption and integrity protection.
@@ -547,8 +575,11 @@ class APIKeyCache:
         api_key_hash: SHA-256 hash of the API key
         user_data: User data to cache (serializable dict)
         is_active: Whether the API key is active
+        api_key_id: ID of the API key record, so it can be revoked by ID
     """
     try:
+      generation = self.local.generation()
+
       # Validate input data integrity for positive cache entries
       # Negative cache entries (is_active=False) may have empty user_data
       if is_active and not self._validate_user_data_integrity(user_data):
@@ -559,6 +590,7 @@ class APIKeyCache:
       cache_data = {
         "user_data": user_data,
         "is_active": is_active,
+        "api_key_id": api_key_id,
         "cached_at": datetime.now(UTC).isoformat(),
         "cache_version": self.CACHE_VERSION,
       }
@@ -574,8 +606,17 @@ class APIKeyCache:
       pipe = self.redis.pipeline()
       pipe.setex(cache_key, self.ttl, encrypted_data)
       pipe.setex(signature_key, self.ttl, signature)
+      if api_key_id:
+        pipe.setex(f"{self.API_KEY_ID_PREFIX}{api_key_id}", self.ttl, api_key_hash)
       pipe.execute()
 
+      self.local.set(
+        cache_key,
+        cache_data,
+        self._api_key_tags(api_key_hash, cache_data),
+        generation=generation,
+      )
+
       logger.debug(f"Cached API key validation with encryption: {api_key_hash[:8]}...")
 
       # Log security event for cache write
@@ -610,6 +651,14 @@ class APIKeyCache:
     """
     try:
       cache_key = self._get_api_key_cache_key(api_key_hash)
+
+      # In-process hit skips the round trip, decryption and signature checks
+      local_data = self.local.get(cache_key)
+      if local_data is not None:
+        return local_data
+      # Skip the local store below if a revocation lands during the read
+      generation = self.local.generation()
+
       signature_key = f"{self.CACHE_SIGNATURE_PREFIX}{api_key_hash}"
 
       # Get both encrypted data and signature
@@ -659,7 +708,10 @@ class APIKeyCache:
         return None
 
       # Sliding window refresh: if cache is getting old but still valid, refresh it
-      if age_seconds > self.CACHE_REFRESH_THRESHOLD:
+      # (at most once per refresh interval per key from this worker)
+      if age_seconds > self.CACHE_REFRESH_THRESHOLD and self.local.should_refresh(
+        cache_key
+      ):
         try:
           logger.debug(
             f"Refreshing aging API key cache entry: {api_key_hash[:8]}... (age: {age_seconds}s)"
@@ -684,6 +736,13 @@ class APIKeyCache:
 
       logger.debug(f"Secure cache hit for API key: {api_key_hash[:8]}...")
 
+      self.local.set(
+        cache_key,
+        cache_data,
+        self._api_key_tags(api_key_hash, cache_data),
+        generation=generation,
+      )
+
       # Log successful secure cache read (rate limited to reduce noise)
       user_id = user_data.get("id")
       if user_id and self._should_log_audit_event(user_id, "cache_hit"):
@@ -723,6 +782,7 @@ class APIKeyCache:
         has_access: Whether user has access to the graph
     """
     try:
+      generation = self.local.generation()
       cache_key = self._get_graph_cache_key(api_key_hash, graph_id)
       cache_data = {
         "has_access": has_access,
@@ -730,6 +790,12 @@ class APIKeyCache:
       }
 
       self.redis.setex(cache_key, self.ttl, json.dumps(cache_data))
+      self.local.set(
+        cache_key,
+        has_access,
+        ["apikey_graph", f"apikey:{api_key_hash}", f"graph:{graph_id}"],
+        generation=generation,
+      )
       logger.debug(f"Cached graph access: {api_key_hash[:8]}... -> {graph_id}")
 
     except Exception as e:
@@ -748,11 +814,22 @@ class APIKeyCache:
     """
     try:
       cache_key = self._get_graph_cache_key(api_key_hash, graph_id)
+      local_access = self.local.get(cache_key)
+      if local_access is not None:
+        return local_access
+      generation = self.local.generation()
+
       cached_data = cast(str | None, self.redis.get(cache_key))
 
       if cached_data:
         data = json.loads(cached_data)
         logger.debug(f"Graph access cache hit: {api_key_hash[:8]}... -> {graph_id}")
+        self.local.set(
+          cache_key,
+          data["has_access"],
+          ["apikey_graph", f"apikey:{api_key_hash}", f"graph:{graph_id}"],
+          generation=generation,
+        )
         return data["has_access"]
 
       logger.debug(f"Graph access cache miss: {api_key_hash[:8]}... -> {graph_id}")
@@ -770,6 +847,9 @@ class APIKeyCache:
         api_key_hash: SHA-256 hash of the API key
     """
     try:
+      # Drop in-process entries in every worker first
+      self.local.invalidate(f"apikey:{api_key_hash}")
+
       # Remove API key validation cache and signature
       api_key_cache_key = self._get_api_key_cache_key(api_key_hash)
       signature_key = f"{self.CACHE_SIGNATURE_PREFIX}{api_key_hash}"
@@ -808,6 +888,33 @@ class APIKeyCache:
         risk_level="medium",
       )
 
+  def invalidate_api_key_by_id(self, api_key_id: str) -> None:
+    """
+    Invalidate all cached data for an API key record.
+
+    The cache is keyed by a hash of the plain key, which is not stored, so
+    positive validations record an index from the API key ID to that hash.
+
+    Args:
+        api_key_id: ID of the API key record
+    """
+    try:
+      self.local.invalidate(f"apikey_id:{api_key_id}")
+
+      index_key = f"{self.API_KEY_ID_PREFIX}{api_key_id}"
+      api_key_hash = cast(str | None, self.redis.get(index_key))
+      if api_key_hash:
+        self.invalidate_api_key(api_key_hash)
+      self.redis.delete(index_key)
+
+    except Exception as e:
+      logger.error(f"Failed to invalidate API key cache by id: {e}")
+      SecurityAuditLogger.log_security_event(
+        event_type=SecurityEventType.SUSPICIOUS_ACTIVITY,
+        details={"action": "cache_invalidation_failed", "error": str(e)},
+        risk_level="medium",
+      )
+
   # JWT Caching Methods
 
   def cache_jwt_validation(self, jwt_token: str, user_data: dict[str, Any]) -> None:
@@ -819,6 +926,8 @@ class APIKeyCache:
         user_data: User data to cache (serializable dict)
     """
     try:
+      generation = self.local.generation()
+
       # Validate input data integrity
       if not self._validate_user_data_integrity(user_data):
         logger.error("Refusing to cache invalid JWT user data")
@@ -846,6 +955,13 @@ class APIKeyCache:
       pipe.setex(signature_key, self.jwt_ttl, signature)
       pipe.execute()
 
+      self.local.set(
+        cache_key,
+        cache_data,
+        [f"jwt:{jwt_hash}", *self._user_tags(user_data)],
+        generation=generation,
+      )
+
       logger.debug(f"Cached JWT validation with encryption: {jwt_hash[:8]}...")
 
       # Log security event for JWT cache write
@@ -880,6 +996,14 @@ class APIKeyCache:
     try:
       jwt_hash = self._hash_jwt_token(jwt_token)
       cache_key = self._get_jwt_cache_key(jwt_hash)
+
+      # In-process hit skips the round trip, decryption and signature checks
+      local_data = self.local.get(cache_key)
+      if local_data is not None:
+        return local_data
+      # Skip the local store below if a revocation lands during the read
+      generation = self.local.generation()
+
       signature_key = f"{self.CACHE_SIGNATURE_PREFIX}jwt_{jwt_hash}"
 
       # Get both encrypted data and signature
@@ -943,7 +1067,10 @@ class APIKeyCache:
         return None
 
       # Sliding window refresh: if cache is getting old but still valid, refresh it
-      if age_seconds > self.CACHE_REFRESH_THRESHOLD:
+      # (at most once per refresh interval per key from this worker)
+      if age_seconds > self.CACHE_REFRESH_THRESHOLD and self.local.should_refresh(
+        cache_key
+      ):
         try:
           logger.debug(
             f"Refreshing aging JWT cache entry: {jwt_hash[:8]}... (age: {age_seconds}s)"
@@ -968,6 +1095,13 @@ class APIKeyCache:
 
       logger.debug(f"Secure JWT cache hit: {jwt_hash[:8]}...")
 
+      self.local.set(
+        cache_key,
+        cache_data,
+        [f"jwt:{jwt_hash}", *self._user_tags(user_data)],
+        generation=generation,
+      )
+
       # Log successful secure JWT cache read (rate limited to reduce noise)
       user_id = user_data.get("id")
       if user_id and self._should_log_audit_event(user_id, "cache_hit"):
@@ -1007,6 +1141,7 @@ class APIKeyCache:
         has_access: Whether user has access to the graph
     """
     try:
+      generation = self.local.generation()
       cache_key = self._get_jwt_graph_cache_key(user_id, graph_id)
       cache_data = {
         "has_access": has_access,
@@ -1016,6 +1151,12 @@ class APIKeyCache:
       # Use shorter TTL for graph access (10 minutes)
       graph_ttl = min(self.jwt_ttl, 600)
       self.redis.setex(cache_key, graph_ttl, json.dumps(cache_data))
+      self.local.set(
+        cache_key,
+        has_access,
+        ["jwt_graph", f"user:{user_id}", f"graph:{graph_id}"],
+        generation=generation,
+      )
       logger.debug(f"Cached JWT graph access: {user_id} -> {graph_id}")
 
     except Exception as e:
@@ -1034,11 +1175,22 @@ class APIKeyCache:
     """
     try:
       cache_key = self._get_jwt_graph_cache_key(user_id, graph_id)
+      local_access = self.local.get(cache_key)
+      if local_access is not None:
+        return local_access
+      generation = self.local.generation()
+
       cached_data = cast(str | None, self.redis.get(cache_key))
 
       if cached_data:
         data = json.loads(cached_data)
         logger.debug(f"JWT graph access cache hit: {user_id} -> {graph_id}")
+        self.local.set(
+          cache_key,
+          data["has_access"],
+          ["jwt_graph", f"user:{user_id}", f"graph:{graph_id}"],
+          generation=generation,
+        )
         return data["has_access"]
 
       logger.debug(f"JWT graph access cache miss: {user_id} -> {graph_id}")
@@ -1048,6 +1200,75 @@ class APIKeyCache:
       logger.error(f"Failed to get cached JWT graph access: {e}")
       return None
 
+  def cache_graph_access_matrix(
+    self, user_id: str, graph_roles: dict[str, str]
+  ) -> None:
+    """
+    Cache every graph a user has been granted access to.
+
+    Args:
+        user_id: User ID
+        graph_roles: Mapping of graph ID to the user's role on it
+    """
+    try:
+      generation = self.local.generation()
+      cache_key = self._get_graph_access_key(user_id)
+      cache_data = {
+        "graph_roles": graph_roles,
+        "cached_at": datetime.now(UTC).isoformat(),
+      }
+
+      # Same TTL as per-graph JWT access
+      graph_ttl = min(self.jwt_ttl, 600)
+      self.redis.setex(cache_key, graph_ttl, json.dumps(cache_data))
+      self.local.set(
+        cache_key,
+        graph_roles,
+        ["graph_access", f"user:{user_id}"],
+        generation=generation,
+      )
+      logger.debug(f"Cached graph access matrix: {user_id} ({len(graph_roles)})")
+
+    except Exception as e:
+      logger.error(f"Failed to cache graph access matrix: {e}")
+
+  def get_cached_graph_access_matrix(self, user_id: str) -> dict[str, str] | None:
+    """
+    Get a user's cached graph access matrix.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Mapping of graph ID to role, or None if not found/expired
+    """
+    try:
+      cache_key = self._get_graph_access_key(user_id)
+      local_roles = self.local.get(cache_key)
+      if local_roles is not None:
+        return local_roles
+      generation = self.local.generation()
+
+      cached_data = cast(str | None, self.redis.get(cache_key))
+
+      if cached_data:
+        graph_roles = json.loads(cached_data)["graph_roles"]
+        logger.debug(f"Graph access matrix cache hit: {user_id}")
+        self.local.set(
+          cache_key,
+          graph_roles,
+          ["graph_access", f"user:{user_id}"],
+          generation=generation,
+        )
+        return graph_roles
+
+      logger.debug(f"Graph access matrix cache miss: {user_id}")
+      return None
+
+    except Exception as e:
+      logger.error(f"Failed to get cached graph access matrix: {e}")
+      return None
+
   def blacklist_jwt_token(self, jwt_token: str, exp_timestamp: int) -> None:
     """
     Add JWT token to blacklist until its natural expiry.
@@ -1059,6 +1280,7 @@ class APIKeyCache:
     try:
       jwt_hash = self._hash_jwt_token(jwt_token)
       cache_key = self._get_jwt_blacklist_key(jwt_hash)
+      self.local.invalidate(f"jwt:{jwt_hash}")
 
       # Calculate TTL based on token expiry
       ttl = max(0, exp_timestamp - int(time.time()))
@@ -1100,7 +1322,8 @@ class APIKeyCache:
       cache_key = self._get_jwt_cache_key(jwt_hash)
       signature_key = f"{self.CACHE_SIGNATURE_PREFIX}jwt_{jwt_hash}"
 
-      # Delete both cache data and signature
+      # Drop in-process entries in every worker, then cache data and signature
+      self.local.invalidate(f"jwt:{jwt_hash}")
       self.redis.delete(cache_key, signature_key)
 
       logger.info(f"Securely invalidated JWT cache: {jwt_hash[:8]}...")
@@ -1134,6 +1357,10 @@ class APIKeyCache:
         graph_id: Specific graph ID, or None to invalidate all graphs for user
     """
     try:
+      self.local.invalidate(
+        "jwt_graph", f"user:{user_id}", *([f"graph:{graph_id}"] if graph_id else [])
+      )
+
       if graph_id:
         # Invalidate specific graph access for this user
         cache_key = self._get_jwt_graph_cache_key(user_id, graph_id)
@@ -1163,6 +1390,10 @@ class APIKeyCache:
         graph_id: Specific graph ID, or None to invalidate all graphs for user
     """
     try:
+      self.local.invalidate(
+        "apikey_graph", *([f"graph:{graph_id}"] if graph_id else [])
+      )
+
       if graph_id:
         # Invalidate specific graph access for all API keys of this user
         # This requires finding all API keys for the user, which would need DB access
@@ -1182,6 +1413,35 @@ class APIKeyCache:
     except Exception as e:
       logger.error(f"Failed to invalidate user graph access cache: {e}")
 
+  def invalidate_graph_membership(self, user_id: str, graph_id: str) -> None:
+    """
+    Invalidate cached graph access after a user's membership of a graph changes.
+
+    Drops the user's graph access matrix and JWT graph grants, and API key
+    grants for the graph and its subgraphs.
+
+    Args:
+        user_id: User whose membership changed
+        graph_id: Parent graph ID of the membership
+    """
+    try:
+      # In process, dropping the user's principals also drops their graph grants
+      self.local.invalidate(f"user:{user_id}")
+
+      keys = [self._get_graph_access_key(user_id)]
+      for pattern in (
+        f"{self.JWT_GRAPH_CACHE_KEY_PREFIX}{user_id}:*",
+        f"{self.GRAPH_CACHE_KEY_PREFIX}*:{graph_id}",
+        f"{self.GRAPH_CACHE_KEY_PREFIX}*:{graph_id}_*",
+      ):
+        keys.extend(cast(list[str], self.redis.keys(pattern)))
+      self.redis.delete(*keys)
+
+      logger.info(f"Invalidated graph access cache: {user_id} -> {graph_id}")
+
+    except Exception as e:
+      logger.error(f"Failed to invalidate graph access cache: {e}")
+
   def invalidate_user_data(self, user_id: str) -> None:
     """
     Invalidate all cached data for a user when their profile is updated.
@@ -1195,6 +1455,9 @@ class APIKeyCache:
     try:
       invalidated_count = 0
 
+      # Drop in-process principals (and their graph grants) in every worker
+      self.local.invalidate(f"user:{user_id}")
+
       # Invalidate all API key caches (contains user_data that might be stale)
       # We need to scan all API key cache entries to find ones containing this user
       api_key_pattern = f"{self.CACHE_KEY_PREFIX}*"
@@ -1204,10 +1467,12 @@ class APIKeyCache:
         try:
           cached_data = cast(str | None, self.redis.get(key))
           if cached_data:
-            data = json.loads(cached_data)
+            # Entries are stored encrypted (see cache_api_key_validation)
+            data = self._decrypt_cache_data(cached_data) or {}
             user_data = data.get("user_data", {})
-            if user_data.get("id") == user_id:
-              self.redis.delete(key)
+            if str(user_data.get("id")) == str(user_id):
+              api_key_hash = key.replace(self.CACHE_KEY_PREFIX, "", 1)
+              self.redis.delete(key, f"{self.CACHE_SIGNATURE_PREFIX}{api_key_hash}")
               invalidated_count += 1
         except Exception as e:
           logger.error(f"Failed to check/invalidate API key cache {key}: {e}")
@@ -1220,10 +1485,12 @@ class APIKeyCache:
         try:
           cached_data = cast(str | None, self.redis.get(key))
           if cached_data:
-            data = json.loads(cached_data)
+            # Entries are stored encrypted (see cache_jwt_validation)
+            data = self._decrypt_cache_data(cached_data) or {}
             user_data = data.get("user_data", {})
-            if user_data.get("id") == user_id:
-              self.redis.delete(key)
+            if str(user_data.get("id")) == str(user_id):
+              jwt_hash = key.replace(self.JWT_CACHE_KEY_PREFIX, "", 1)
+              self.redis.delete(key, f"{self.CACHE_SIGNATURE_PREFIX}jwt_{jwt_hash}")
               invalidated_count += 1
         except Exception as e:
           logger.error(f"Failed to check/invalidate JWT cache {key}: {e}")
@@ -1268,6 +1535,7 @@ class APIKeyCache:
           "keyspace_hits": info.get("keyspace_hits"),
           "keyspace_misses": info.get("keyspace_misses"),
         },
+        "local_cache": self.local.get_stats(),
         "cache_counts": {
           "api_keys": api_key_count,
           "graph_access": graph_access_count,
@@ -12,7 +12,7 @@ from typing import Any
 
 import redis.asyncio as redis_async
 
-from ...config.valkey_registry import ValkeyDatabase, create_async_redis_client
+from ...config.valkey_registry import ValkeyDatabase, get_shared_async_redis_client
 from ...logger import logger
 from ...security import SecurityAuditLogger, SecurityEventType
 from .cache import APIKeyCache
@@ -52,8 +52,8 @@ class CacheValidator:
   async def _get_async_redis(self) -> redis_async.Redis:
     """Get async Redis connection, creating if needed."""
     if self._async_redis is None:
-      # Use the new connection factory with proper ElastiCache support
-      self._async_redis = create_async_redis_client(ValkeyDatabase.AUTH_CACHE)
+      # Use the shared connection pool with proper ElastiCache support
+      self._async_redis = get_shared_async_redis_client(ValkeyDatabase.AUTH_CACHE)
       # Test connection
       await self._async_redis.ping()
     return self._async_redis
@@ -10,7 +10,8 @@ Security Note:
 from fastapi import Header, HTTPException, Query, Request, Security, status
 from fastapi.security import APIKeyHeader
 
-from ...database import session
+from ...config import env
+from ...database import async_session, session
 from ...logger import logger
 from ...models.iam import User
 from ...security import SecurityAuditLogger, SecurityEventType
@@ -19,8 +20,8 @@ from .cache import api_key_cache
 # Import JWT verification from local jwt module to avoid circular imports
 from .jwt import verify_jwt_token as verify_jwt_token_from_auth
 from .utils import (
-  validate_api_key,
-  validate_api_key_with_graph,
+  validate_api_key_async,
+  validate_api_key_with_graph_async,
   validate_repository_access,
 )
 
@@ -75,6 +76,43 @@ def _create_user_from_cache(user_data: dict) -> User | None:
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+async def _get_user(user_id: str) -> User | None:
+  """Load a user without blocking the event loop."""
+  if not env.DATABASE_ASYNC_AUTH_ENABLED:
+    return User.get_by_id(user_id, session())
+
+  async with async_session() as db:
+    return await User.get_by_id_async(user_id, db)
+
+
+async def _resolve_graph_access(
+  user_id: str, graph_id: str, user: User | None
+) -> tuple[User | None, bool]:
+  """
+  Resolve a user's access to a user graph, loading the user if not cached.
+
+  Access is checked against the user's cached graph access matrix. On a miss,
+  the user and every graph they can access are loaded in one query, so their
+  other graphs skip the database until a membership changes.
+  """
+  from ...models.iam import GraphUser
+
+  if not env.DATABASE_ASYNC_AUTH_ENABLED:
+    if user is None:
+      user = User.get_by_id(user_id, session())
+    return user, GraphUser.user_has_access(user_id, graph_id, session())
+
+  graph_roles = api_key_cache.get_cached_graph_access_matrix(str(user_id))
+  if graph_roles is None or user is None:
+    async with async_session() as db:
+      loaded_user, graph_roles = await User.get_with_graph_roles_async(user_id, db)
+    if loaded_user is not None:
+      api_key_cache.cache_graph_access_matrix(str(user_id), graph_roles)
+    user = user or loaded_user
+
+  return user, GraphUser.has_access_in(graph_roles, graph_id)
+
+
 def verify_jwt_token(token: str) -> str | None:
   """Verify a JWT token and return the user_id if valid.
 
@@ -105,6 +143,30 @@ def verify_jwt_token(token: str) -> str | None:
   return None
 
 
+async def verify_jwt_token_async(token: str) -> str | None:
+  """Verify a JWT token like ``verify_jwt_token``, loading the user asynchronously."""
+  cached_data = api_key_cache.get_cached_jwt_validation(token)
+  if cached_data:
+    user_data = cached_data.get("user_data", {})
+    return user_data.get("id")
+
+  user_id = verify_jwt_token_from_auth(token)
+
+  if user_id:
+    user = await _get_user(user_id)
+    if user and bool(user.is_active):
+      user_data = {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "is_active": user.is_active,
+      }
+      api_key_cache.cache_jwt_validation(token, user_data)
+      return user_id
+
+  return None
+
+
 async def get_optional_user(
   request: Request,
   api_key: str = Security(API_KEY_HEADER),
@@ -127,7 +189,7 @@ async def get_optional_user(
 
   # Try JWT token authentication first (takes precedence)
   if jwt_token:
-    user_id = verify_jwt_token(jwt_token)
+    user_id = await verify_jwt_token_async(jwt_token)
     if user_id:
       # Try to get user data from cache first
       cached_data = api_key_cache.get_cached_jwt_validation(jwt_token)
@@ -140,13 +202,13 @@ async def get_optional_user(
         # If validation failed, fall through to database query
       else:
         # Fallback to database query
-        user = User.get_by_id(user_id, session())
+        user = await _get_user(user_id)
         if user and bool(user.is_active):
           return user
 
   # Fall back to API key authentication
   if api_key:
-    user = validate_api_key(api_key)
+    user = await validate_api_key_async(api_key)
     return user
 
   return None
@@ -181,7 +243,7 @@ async def get_current_user(
 
   # Try JWT token authentication first (takes precedence)
   if jwt_token:
-    user_id = verify_jwt_token(jwt_token)
+    user_id = await verify_jwt_token_async(jwt_token)
     if user_id:
       # Try to get user data from cache first
       cached_data = api_key_cache.get_cached_jwt_validation(jwt_token)
@@ -200,7 +262,7 @@ async def get_current_user(
         # If validation failed, fall through to database query
       else:
         # Fallback to database query
-        user = User.get_by_id(user_id, session())
+        user = await _get_user(user_id)
         if user and bool(user.is_active):
           SecurityAuditLogger.log_auth_success(
             user_id=str(user_id),
@@ -226,7 +288,7 @@ async def get_current_user(
 
   # Fall back to API key authentication
   if api_key:
-    user = validate_api_key(api_key)
+    user = await validate_api_key_async(api_key)
     if user:
       SecurityAuditLogger.log_auth_success(
         user_id=str(user.id),
@@ -295,8 +357,10 @@ async def get_current_user_with_graph(
 
   # Try JWT token authentication first (takes precedence)
   if jwt_token:
-    user_id = verify_jwt_token(jwt_token)
+    user_id = await verify_jwt_token_async(jwt_token)
     if user_id:
+      from ..graph.utils import MultiTenantUtils
+
       # Try to get user data from cache first
       cached_data = api_key_cache.get_cached_jwt_validation(jwt_token)
       user = None
@@ -305,34 +369,27 @@ async def get_current_user_with_graph(
         user_data = cached_data.get("user_data", {})
         # Create User object from cached data with validation (avoid database query)
         user = _create_user_from_cache(user_data)
-        if not user:
-          # Validation failed - fallback to database query
-          user = User.get_by_id(user_id, session())
-      else:
-        # Fallback to database query
-        user = User.get_by_id(user_id, session())
 
-      if user and bool(user.is_active):
-        # Check if user has access to the graph (try cache first)
-        has_access = api_key_cache.get_cached_jwt_graph_access(str(user_id), graph_id)
+      # Check if user has access to the graph (try cache first)
+      has_access = api_key_cache.get_cached_jwt_graph_access(str(user_id), graph_id)
 
-        if has_access is None:
-          # Cache miss - check database and cache result
-          from ...models.iam import GraphUser
-          from ..graph.utils import MultiTenantUtils
-
-          # Check if this is a shared repository or user graph
-          if MultiTenantUtils.is_shared_repository(graph_id):
-            # Use generic repository access validation for shared repositories
-            has_access = MultiTenantUtils.validate_repository_access(
-              graph_id,
-              user_id,
-              "read",
-            )
-          else:
-            # Use GraphUser access validation for personal user graphs
-            has_access = GraphUser.user_has_access(user_id, graph_id, session())
+      if has_access is None and not MultiTenantUtils.is_shared_repository(graph_id):
+        # Cache miss on a user graph - resolve user and access together
+        user, has_access = await _resolve_graph_access(user_id, graph_id, user)
+        if user:
+          api_key_cache.cache_jwt_graph_access(str(user_id), graph_id, has_access)
+      elif not user:
+        # Validation failed or cache miss - fallback to database query
+        user = await _get_user(user_id)
 
+      if user and bool(user.is_active):
+        if has_access is None:
+          # Use generic repository access validation for shared repositories
+          has_access = MultiTenantUtils.validate_repository_access(
+            graph_id,
+            user_id,
+            "read",
+          )
           api_key_cache.cache_jwt_graph_access(str(user_id), graph_id, has_access)
 
         if has_access:
@@ -372,7 +429,7 @@ async def get_current_user_with_graph(
 
   # Fall back to API key authentication (with graph validation)
   if api_key:
-    user = validate_api_key_with_graph(api_key, graph_id)
+    user = await validate_api_key_with_graph_async(api_key, graph_id)
     if user:
       SecurityAuditLogger.log_auth_success(
         user_id=str(user.id),
@@ -514,7 +571,7 @@ async def get_current_user_sse(
 
   # Try JWT token authentication first (takes precedence)
   if jwt_token:
-    user_id = verify_jwt_token(jwt_token)
+    user_id = await verify_jwt_token_async(jwt_token)
     if user_id:
       # Try to get user data from cache first
       cached_data = api_key_cache.get_cached_jwt_validation(jwt_token)
@@ -533,7 +590,7 @@ async def get_current_user_sse(
         # If validation failed, fall through to database query
       else:
         # Fallback to database query
-        user = User.get_by_id(user_id, session())
+        user = await _get_user(user_id)
         if user and bool(user.is_active):
           SecurityAuditLogger.log_auth_success(
             user_id=str(user_id),
@@ -559,7 +616,7 @@ async def get_current_user_sse(
 
   # Fall back to API key authentication
   if api_key:
-    user = validate_api_key(api_key)
+    user = await validate_api_key_async(api_key)
     if user:
       SecurityAuditLogger.log_auth_success(
         user_id=str(user.id),
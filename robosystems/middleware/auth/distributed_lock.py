@@ -514,10 +514,13 @@ def get_sso_lock_manager() -> SSOTokenLockManager | None:
   try:
     # Use DB 2 for auth cache (same as SSO tokens)
     # Use distributed locks database from registry
-    from robosystems.config.valkey_registry import ValkeyDatabase, create_redis_client
+    from robosystems.config.valkey_registry import (
+      ValkeyDatabase,
+      get_shared_redis_client,
+    )
 
-    # Use factory method to handle SSL params correctly
-    redis_client = create_redis_client(
+    # Use the shared pool, which handles SSL params correctly
+    redis_client = get_shared_redis_client(
       ValkeyDatabase.DISTRIBUTED_LOCKS, decode_responses=True
     )
 
@@ -16,8 +16,8 @@ from ...config import env
 from ...config.logging import get_logger
 from ...config.valkey_registry import (
   ValkeyDatabase,
-  create_async_redis_client,
-  create_redis_client,
+  get_shared_async_redis_client,
+  get_shared_redis_client,
 )
 from ...security.device_fingerprinting import create_device_hash
 
@@ -41,12 +41,12 @@ class JWTConfig:
 
 def get_redis_client():
   """Get synchronous Redis client for token tracking with proper ElastiCache support."""
-  return create_redis_client(ValkeyDatabase.AUTH_CACHE)
+  return get_shared_redis_client(ValkeyDatabase.AUTH_CACHE)
 
 
 async def get_async_redis_client():
   """Get async Redis client for token tracking with proper ElastiCache support."""
-  return create_async_redis_client(ValkeyDatabase.AUTH_CACHE)
+  return get_shared_async_redis_client(ValkeyDatabase.AUTH_CACHE)
 
 
 def is_jwt_token_revoked(token: str) -> bool:
@@ -0,0 +1,316 @@
+"""
+In-process auth cache.
+
+A Valkey auth cache hit still costs a network round trip, Fernet decryption,
+HMAC signature verification and integrity checks on every authenticated
+request. This module keeps recently validated principals in process so a
+repeat request for the same API key or JWT is a dictionary lookup.
+
+Design:
+- A bounded LRU with a short TTL sits in front of the encrypted Valkey tier.
+  Entries use the same API-key / token hashes as the Valkey tier, so raw
+  credentials are never held.
+- Every entry carries tags (``apikey:<hash>``, ``jwt:<hash>``, ``user:<id>``,
+  ``graph:<id>``). Revoking a key, logging out, or changing or deactivating a
+  user publishes the matching tags on a Valkey channel and every process drops
+  the entries carrying all of them. Dropping an API key's principal also drops
+  its cached graph grants.
+- Every invalidation bumps a local generation counter. Callers snapshot it
+  before reading the Valkey tier and pass it to ``set``, so a value read
+  before a revocation landed is not stored after it.
+- Entries are only stored and served while the invalidation listener is
+  subscribed, and the tier is cleared whenever it (re)subscribes, so a worker
+  that may have missed a revocation falls back to the Valkey tier.
+- Sliding-expiry rewrites of the Valkey tier are rate-limited per key.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from robosystems.config import env
+from robosystems.config.valkey_registry import (
+  ValkeyDatabase,
+  create_redis_client,
+  get_shared_redis_client,
+)
+from robosystems.logger import logger
+
+# Delay before the listener resubscribes after losing its connection
+LISTENER_RETRY_SECONDS = 5.0
+
+
+class LocalAuthCache:
+  """Bounded in-process cache of validated auth principals."""
+
+  def __init__(
+    self,
+    ttl: int | None = None,
+    max_entries: int | None = None,
+    refresh_interval: int | None = None,
+  ):
+    self.ttl = ttl if ttl is not None else env.AUTH_LOCAL_CACHE_TTL
+    self.max_entries = (
+      max_entries if max_entries is not None else env.AUTH_LOCAL_CACHE_MAX_ENTRIES
+    )
+    self.refresh_interval = (
+      refresh_interval
+      if refresh_interval is not None
+      else env.AUTH_CACHE_REFRESH_INTERVAL
+    )
+
+    # key -> (expires_at, value, tags)
+    self._entries: OrderedDict[str, tuple[float, Any, frozenset[str]]] = OrderedDict()
+    # key -> last sliding-expiry rewrite (monotonic)
+    self._refreshed: OrderedDict[str, float] = OrderedDict()
+    # Bumped by every invalidation; guards stores of values read before one
+    self._generation = 0
+    self._lock = threading.Lock()
+
+    self._pid = os.getpid()
+    self._listener: threading.Thread | None = None
+    self._subscribed = threading.Event()
+    self._stats = {
+      "hits": 0,
+      "misses": 0,
+      "invalidations": 0,
+      "evictions": 0,
+      "stale_skipped": 0,
+      "refreshes_skipped": 0,
+    }
+
+  @staticmethod
+  def _channel() -> str:
+    env_prefix = env.ENVIRONMENT or "dev"
+    return f"auth:{env_prefix}:cache_invalidations"
+
+  # ---------------------------------------------------------------------------
+  # Invalidation listener
+  # ---------------------------------------------------------------------------
+
+  def _ensure_listener(self) -> None:
+    """Start the invalidation listener thread for this process if needed."""
+    pid = os.getpid()
+    listener = self._listener
+    if self._pid == pid and listener is not None and listener.is_alive():
+      return
+
+    with self._lock:
+      if self._pid != pid:
+        # Forked worker: the parent's listener thread does not carry over
+        self._pid = pid
+        self._listener = None
+        self._subscribed.clear()
+        self._entries.clear()
+        self._refreshed.clear()
+        self._generation += 1
+      if self._listener is not None and self._listener.is_alive():
+        return
+      self._listener = threading.Thread(
+        target=self._listen, name="auth-cache-invalidations", daemon=True
+      )
+      self._listener.start()
+
+  def _listen(self) -> None:
+    """Drop in-process entries named on the invalidation channel."""
+    while True:
+      client = None
+      pubsub = None
+      try:
+        # The subscription holds its connection, so keep it out of the shared pool
+        client = create_redis_client(ValkeyDatabase.AUTH_CACHE)
+        pubsub = client.pubsub()
+        pubsub.subscribe(self._channel())
+        # Invalidations may have been missed while unsubscribed
+        self.clear_local()
+        self._subscribed.set()
+        while True:
+          message = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+          if message and message.get("type") == "message":
+            self.invalidate_local(json.loads(message["data"]))
+      except Exception as e:
+        self._subscribed.clear()
+        self.clear_local()
+        logger.warning(f"Auth cache invalidation listener failed: {e}")
+        time.sleep(LISTENER_RETRY_SECONDS)
+      finally:
+        if pubsub is not None:
+          try:
+            pubsub.close()
+          except Exception:
+            pass
+        if client is not None:
+          try:
+            client.close()
+          except Exception:
+            pass
+
+  def _active(self) -> bool:
+    """Whether entries may be stored and served right now."""
+    if not env.AUTH_LOCAL_CACHE_ENABLED:
+      return False
+    try:
+      self._ensure_listener()
+    except Exception as e:
+      logger.debug(f"Auth cache invalidation listener unavailable: {e}")
+      return False
+    return self._subscribed.is_set()
+
+  # ---------------------------------------------------------------------------
+  # Public API
+  # ---------------------------------------------------------------------------
+
+  def get(self, key: str) -> Any | None:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key (same key as the Valkey tier)
+
+    Returns:
+        A copy of the cached value, or None if missing, expired or inactive
+    """
+    if not self._active():
+      return None
+
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None or entry[0] <= now:
+        if entry is not None:
+          del self._entries[key]
+        self._stats["misses"] += 1
+        return None
+      self._entries.move_to_end(key)
+      self._stats["hits"] += 1
+      value = entry[1]
+
+    return copy.deepcopy(value)
+
+  def generation(self) -> int:
+    """
+    Get the invalidation generation.
+
+    Snapshot it before reading a value from the Valkey tier and pass it to
+    ``set``; the store is skipped if an invalidation arrived in between.
+    """
+    with self._lock:
+      return self._generation
+
+  def set(
+    self,
+    key: str,
+    value: Any,
+    tags: Iterable[str] = (),
+    generation: int | None = None,
+  ) -> None:
+    """
+    Cache a validated value.
+
+    Args:
+        key: Cache key (same key as the Valkey tier)
+        value: Validation result; must not be mutated by the caller afterwards
+        tags: Invalidation tags this entry belongs to
+        generation: Generation snapshotted before the value was read
+    """
+    if not self._active():
+      return
+
+    expires_at = time.monotonic() + self.ttl
+    with self._lock:
+      if generation is not None and generation != self._generation:
+        # An invalidation arrived while the value was being read
+        self._stats["stale_skipped"] += 1
+        return
+      self._entries[key] = (expires_at, copy.deepcopy(value), frozenset(tags))
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+        self._stats["evictions"] += 1
+
+  def invalidate(self, *tags: str) -> None:
+    """
+    Drop entries carrying all of ``tags`` in every process.
+
+    Args:
+        tags: Tags an entry must carry to be dropped
+    """
+    self.invalidate_local(tags)
+    if not env.AUTH_LOCAL_CACHE_ENABLED:
+      return
+    try:
+      get_shared_redis_client(ValkeyDatabase.AUTH_CACHE).publish(
+        self._channel(), json.dumps(list(tags))
+      )
+    except Exception as e:
+      # Other workers fall back on the TTL
+      logger.warning(f"Failed to publish auth cache invalidation: {e}")
+
+  def invalidate_local(self, tags: Iterable[str]) -> None:
+    """Drop entries carrying all of ``tags`` in this process only."""
+    wanted = frozenset(tags)
+    if not wanted:
+      return
+
+    with self._lock:
+      dropped = {key for key, entry in self._entries.items() if wanted <= entry[2]}
+      # Graph grants are only meaningful alongside their API key principal
+      api_key_tags = {
+        tag
+        for key in dropped
+        for tag in self._entries[key][2]
+        if tag.startswith("apikey:")
+      }
+      if api_key_tags:
+        dropped.update(
+          key for key, entry in self._entries.items() if entry[2] & api_key_tags
+        )
+      for key in dropped:
+        del self._entries[key]
+      self._generation += 1
+      self._stats["invalidations"] += 1
+
+  def clear_local(self) -> None:
+    """Drop every in-process entry."""
+    with self._lock:
+      self._entries.clear()
+      self._generation += 1
+
+  def should_refresh(self, key: str) -> bool:
+    """
+    Rate-limit sliding-expiry rewrites of a Valkey entry.
+
+    Args:
+        key: Valkey key about to be rewritten
+
+    Returns:
+        True at most once per ``refresh_interval`` for the same key
+    """
+    now = time.monotonic()
+    with self._lock:
+      last = self._refreshed.get(key)
+      if last is not None and now - last < self.refresh_interval:
+        self._stats["refreshes_skipped"] += 1
+        return False
+      self._refreshed[key] = now
+      self._refreshed.move_to_end(key)
+      while len(self._refreshed) > self.max_entries:
+        self._refreshed.popitem(last=False)
+    return True
+
+  def get_stats(self) -> dict[str, Any]:
+    """Get in-process cache statistics."""
+    with self._lock:
+      return {
+        "enabled": env.AUTH_LOCAL_CACHE_ENABLED,
+        "subscribed": self._subscribed.is_set(),
+        "entries": len(self._entries),
+        "max_entries": self.max_entries,
+        "ttl": self.ttl,
+        **self._stats,
+      }
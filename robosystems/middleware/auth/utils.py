@@ -23,74 +23,82 @@ def _safe_cache_call(func_name: str, *args, **kwargs):
     return None
 
 
-def validate_api_key(api_key: str, db_session: Session | None = None) -> User | None:
-  """
-  Validate an API key and return the associated user if valid.
-  Uses secure bcrypt verification with encrypted cache.
+def _user_from_cached_api_key(cached_data: dict) -> User | None:
+  """Create a minimal User object from a cached API key validation."""
+  user_data = cached_data.get("user_data", {})
+  if not user_data or not user_data.get("id"):
+    return None
 
-  Args:
-      api_key (str): The API key to validate.
-      db_session (Session, optional): Database session to use. Defaults to global session.
+  user = User()
+  user.id = user_data["id"]
+  user.name = user_data.get("name")
+  user.email = user_data.get("email")
+  user.is_active = user_data.get("is_active", True)
+  return user
+
+
+def _cache_api_key_result(api_key_hash: str, key_record: UserAPIKey) -> None:
+  """Cache a positive API key validation with encrypted storage."""
+  user_data = {
+    "id": key_record.user.id,
+    "name": key_record.user.name,
+    "email": key_record.user.email,
+    "is_active": key_record.user.is_active,
+  }
+  _safe_cache_call(
+    "cache_api_key_validation",
+    api_key_hash,
+    user_data,
+    is_active=key_record.is_active,
+    api_key_id=key_record.id,
+  )
+
+
+def _cache_negative_api_key_result(api_key_hash: str) -> None:
+  """Cache an unknown API key (with shorter TTL)."""
+  try:
+    _safe_cache_call("cache_api_key_validation", api_key_hash, {}, is_active=False)
+  except (ConnectionError, TimeoutError) as e:
+    logger.error(f"Cache service unavailable for negative API key result: {e}")
+  except Exception as e:
+    logger.warning(f"Unexpected error caching negative API key result: {e}")
+
+
+def _check_api_key_cache(api_key_hash: str) -> tuple[bool, User | None]:
+  """
+  Look up an API key validation in the cache.
 
   Returns:
-      Optional[User]: The user associated with the API key, or None if invalid.
+      (hit, user) - on a hit, user is None if the key is inactive
   """
-  if not api_key:
-    return None
+  cached_data = _safe_cache_call("get_cached_api_key_validation", api_key_hash)
+  if not cached_data:
+    return False, None
 
-  # Generate cache key based on the API key
-  import hashlib
+  if not cached_data.get("is_active", False):
+    logger.debug(f"Cached API key is inactive: {api_key_hash[:8]}...")
+    return True, None
 
-  cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+  # Reconstruct user from cached data
+  user = _user_from_cached_api_key(cached_data)
+  if user is None:
+    return False, None
 
-  # Try cache first (cache now uses encrypted storage)
-  cached_data = _safe_cache_call("get_cached_api_key_validation", cache_key)
-  if cached_data:
-    if not cached_data.get("is_active", False):
-      logger.debug(f"Cached API key is inactive: {cache_key[:8]}...")
-      return None
-
-    # Reconstruct user from cached data
-    user_data = cached_data.get("user_data", {})
-    if user_data and user_data.get("id"):
-      logger.debug(f"API key validation cache hit: {cache_key[:8]}...")
-
-      # Create a minimal User object with cached data
-      user = User()
-      user.id = user_data["id"]
-      user.name = user_data.get("name")
-      user.email = user_data.get("email")
-      user.is_active = user_data.get("is_active", True)
-
-      return user
+  logger.debug(f"API key validation cache hit: {api_key_hash[:8]}...")
+  return True, user
 
-  # Cache miss - fall back to database with secure bcrypt verification
-  logger.debug(f"API key cache miss, querying database: {cache_key[:8]}...")
-  sess = db_session or session
 
-  # Use secure bcrypt verification (handles both verification and last_used update)
-  key_record = UserAPIKey.get_by_key(api_key, sess)
+def _complete_api_key_validation(
+  api_key_hash: str, key_record: UserAPIKey | None
+) -> User | None:
+  """Cache and audit the database result of an API key validation."""
   if not key_record:
-    # Cache negative result (with shorter TTL)
-    try:
-      _safe_cache_call("cache_api_key_validation", cache_key, {}, is_active=False)
-    except (ConnectionError, TimeoutError) as e:
-      logger.error(f"Cache service unavailable for negative API key result: {e}")
-    except Exception as e:
-      logger.warning(f"Unexpected error caching negative API key result: {e}")
+    _cache_negative_api_key_result(api_key_hash)
     return None
 
   # Cache positive result with encrypted storage
   try:
-    user_data = {
-      "id": key_record.user.id,
-      "name": key_record.user.name,
-      "email": key_record.user.email,
-      "is_active": key_record.user.is_active,
-    }
-    _safe_cache_call(
-      "cache_api_key_validation", cache_key, user_data, is_active=key_record.is_active
-    )
+    _cache_api_key_result(api_key_hash, key_record)
   except (ConnectionError, TimeoutError) as e:
     logger.error(f"Cache service unavailable for API key validation result: {e}")
   except Exception as e:
@@ -105,84 +113,113 @@ def validate_api_key(api_key: str, db_session: Session | None = None) -> User |
   return key_record.user
 
 
-def validate_api_key_with_graph(
-  api_key: str, graph_id: str, db_session: Session | None = None
-) -> User | None:
+def validate_api_key(api_key: str, db_session: Session | None = None) -> User | None:
   """
-  Validate an API key with graph ID authorization and return the associated user.
-  Uses Valkey cache with PostgreSQL fallback for performance.
+  Validate an API key and return the associated user if valid.
+  Uses secure bcrypt verification with encrypted cache.
 
   Args:
       api_key (str): The API key to validate.
-      graph_id (str): The graph database ID to check access for.
       db_session (Session, optional): Database session to use. Defaults to global session.
 
   Returns:
-      Optional[User]: The user associated with the API key, or None if invalid or unauthorized.
+      Optional[User]: The user associated with the API key, or None if invalid.
   """
-  if not api_key or not graph_id:
+  if not api_key:
     return None
 
-  # Hash the API key for cache lookup
-  api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+  # Try cache first (cache now uses encrypted storage)
+  cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+  hit, user = _check_api_key_cache(cache_key)
+  if hit:
+    return user
+
+  # Cache miss - fall back to database with secure bcrypt verification
+  logger.debug(f"API key cache miss, querying database: {cache_key[:8]}...")
+  sess = db_session or session
+
+  # Use secure bcrypt verification (handles both verification and last_used update)
+  key_record = UserAPIKey.get_by_key(api_key, sess)
+  return _complete_api_key_validation(cache_key, key_record)
+
+
+async def validate_api_key_async(
+  api_key: str, db_session: Session | None = None
+) -> User | None:
+  """
+  Validate an API key from async code without blocking the event loop on bcrypt.
+
+  Same semantics as ``validate_api_key``; on a cache miss the hash verification
+  runs on the bounded verifier pool and concurrent misses for the key share it.
+  """
+  if not api_key:
+    return None
+
+  cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+  hit, user = _check_api_key_cache(cache_key)
+  if hit:
+    return user
+
+  logger.debug(f"API key cache miss, querying database: {cache_key[:8]}...")
+  sess = db_session or session
+
+  key_record = await UserAPIKey.get_by_key_async(api_key, sess)
+  return _complete_api_key_validation(cache_key, key_record)
+
 
-  # Try to get cached API key validation first
+def _check_api_key_graph_cache(
+  api_key_hash: str, graph_id: str, db_session: Session | None
+) -> tuple[bool, User | None]:
+  """
+  Look up an API key validation plus graph access in the cache.
+
+  Returns:
+      (hit, user) - on a hit, user is None if the key or access is denied
+  """
   cached_api_key = _safe_cache_call("get_cached_api_key_validation", api_key_hash)
   cached_graph_access = _safe_cache_call(
     "get_cached_graph_access", api_key_hash, graph_id
   )
 
-  # If we have both cached results, use them
-  if cached_api_key and cached_graph_access is not None:
-    if not cached_api_key.get("is_active", False):
-      logger.debug(f"Cached API key is inactive: {api_key_hash[:8]}...")
-      return None
-
-    if not cached_graph_access:
-      logger.debug(f"Cached graph access denied: {api_key_hash[:8]}... -> {graph_id}")
-      return None
-
-    # Reconstruct user from cached data
-    user_data = cached_api_key.get("user_data", {})
-    if user_data and user_data.get("id"):
-      logger.debug(
-        f"API key + graph validation cache hit: {api_key_hash[:8]}... -> {graph_id}"
-      )
-
-      # Create a minimal User object with cached data
-      user = User()
-      user.id = user_data["id"]
-      user.name = user_data.get("name")
-      user.email = user_data.get("email")
-      user.is_active = user_data.get("is_active", True)
-
-      # Update last_used_at in background (don't block on this)
-      try:
-        sess = db_session or session
-        key_record = UserAPIKey.get_by_hash(api_key_hash, sess)
-        if key_record:
-          key_record.update_last_used(sess)
-      except Exception as e:
-        logger.error(f"Failed to update last_used_at for cached API key: {e}")
-
-      return user
+  # Only use the cache if we have both results
+  if not cached_api_key or cached_graph_access is None:
+    return False, None
+
+  if not cached_api_key.get("is_active", False):
+    logger.debug(f"Cached API key is inactive: {api_key_hash[:8]}...")
+    return True, None
+
+  if not cached_graph_access:
+    logger.debug(f"Cached graph access denied: {api_key_hash[:8]}... -> {graph_id}")
+    return True, None
+
+  # Reconstruct user from cached data
+  user = _user_from_cached_api_key(cached_api_key)
+  if user is None:
+    return False, None
 
-  # Cache miss - fall back to database
   logger.debug(
-    f"API key + graph cache miss, querying database: {api_key_hash[:8]}... -> {graph_id}"
+    f"API key + graph validation cache hit: {api_key_hash[:8]}... -> {graph_id}"
   )
-  sess = db_session or session
 
-  # Check if API key exists and is active
-  key_record = UserAPIKey.get_by_key(api_key, sess)
+  # Update last_used_at in background (don't block on this)
+  try:
+    sess = db_session or session
+    key_record = UserAPIKey.get_by_hash(api_key_hash, sess)
+    if key_record:
+      key_record.update_last_used(sess)
+  except Exception as e:
+    logger.error(f"Failed to update last_used_at for cached API key: {e}")
+
+  return True, user
+
+
+def _complete_api_key_graph_validation(
+  api_key_hash: str, graph_id: str, key_record: UserAPIKey | None, sess: Session
+) -> User | None:
+  """Check graph access for a database API key result, then cache and audit it."""
   if not key_record:
-    # Cache negative API key result
-    try:
-      _safe_cache_call("cache_api_key_validation", api_key_hash, {}, is_active=False)
-    except (ConnectionError, TimeoutError) as e:
-      logger.error(f"Cache service unavailable for negative API key result: {e}")
-    except Exception as e:
-      logger.warning(f"Unexpected error caching negative API key result: {e}")
+    _cache_negative_api_key_result(api_key_hash)
     return None
 
   # Check if the user has access to the specified graph
@@ -202,18 +239,7 @@ def validate_api_key_with_graph(
   if not has_access:
     # Cache the API key validation (positive) but graph access (negative)
     try:
-      user_data = {
-        "id": key_record.user.id,
-        "name": key_record.user.name,
-        "email": key_record.user.email,
-        "is_active": key_record.user.is_active,
-      }
-      _safe_cache_call(
-        "cache_api_key_validation",
-        api_key_hash,
-        user_data,
-        is_active=key_record.is_active,
-      )
+      _cache_api_key_result(api_key_hash, key_record)
       _safe_cache_call("cache_graph_access", api_key_hash, graph_id, has_access=False)
     except Exception as e:
       logger.error(f"Failed to cache API key + graph validation result: {e}")
@@ -224,18 +250,7 @@ def validate_api_key_with_graph(
 
   # Cache both positive results
   try:
-    user_data = {
-      "id": key_record.user.id,
-      "name": key_record.user.name,
-      "email": key_record.user.email,
-      "is_active": key_record.user.is_active,
-    }
-    _safe_cache_call(
-      "cache_api_key_validation",
-      api_key_hash,
-      user_data,
-      is_active=key_record.is_active,
-    )
+    _cache_api_key_result(api_key_hash, key_record)
     _safe_cache_call("cache_graph_access", api_key_hash, graph_id, has_access=True)
   except Exception as e:
     logger.error(f"Failed to cache API key + graph validation result: {e}")
@@ -249,6 +264,67 @@ def validate_api_key_with_graph(
   return key_record.user
 
 
+def validate_api_key_with_graph(
+  api_key: str, graph_id: str, db_session: Session | None = None
+) -> User | None:
+  """
+  Validate an API key with graph ID authorization and return the associated user.
+  Uses Valkey cache with PostgreSQL fallback for performance.
+
+  Args:
+      api_key (str): The API key to validate.
+      graph_id (str): The graph database ID to check access for.
+      db_session (Session, optional): Database session to use. Defaults to global session.
+
+  Returns:
+      Optional[User]: The user associated with the API key, or None if invalid or unauthorized.
+  """
+  if not api_key or not graph_id:
+    return None
+
+  # Hash the API key for cache lookup
+  api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+  hit, user = _check_api_key_graph_cache(api_key_hash, graph_id, db_session)
+  if hit:
+    return user
+
+  # Cache miss - fall back to database
+  logger.debug(
+    f"API key + graph cache miss, querying database: {api_key_hash[:8]}... -> {graph_id}"
+  )
+  sess = db_session or session
+
+  # Check if API key exists and is active
+  key_record = UserAPIKey.get_by_key(api_key, sess)
+  return _complete_api_key_graph_validation(api_key_hash, graph_id, key_record, sess)
+
+
+async def validate_api_key_with_graph_async(
+  api_key: str, graph_id: str, db_session: Session | None = None
+) -> User | None:
+  """
+  Validate an API key with graph authorization from async code.
+
+  Same semantics as ``validate_api_key_with_graph``; on a cache miss the hash
+  verification runs on the bounded verifier pool instead of the event loop.
+  """
+  if not api_key or not graph_id:
+    return None
+
+  api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+  hit, user = _check_api_key_graph_cache(api_key_hash, graph_id, db_session)
+  if hit:
+    return user
+
+  logger.debug(
+    f"API key + graph cache miss, querying database: {api_key_hash[:8]}... -> {graph_id}"
+  )
+  sess = db_session or session
+
+  key_record = await UserAPIKey.get_by_key_async(api_key, sess)
+  return _complete_api_key_graph_validation(api_key_hash, graph_id, key_record, sess)
+
+
 def validate_repository_access(
   user: User,
   repository_id: str,
@@ -8,7 +8,7 @@ from typing import Any, cast
 import redis
 
 from ...config import env
-from ...config.valkey_registry import ValkeyDatabase, create_redis_client
+from ...config.valkey_registry import ValkeyDatabase, get_shared_redis_client
 from ...logger import logger
 
 
@@ -41,8 +41,8 @@ class CreditCache:
     """Get Redis connection, creating if needed."""
     if self._redis is None:
       try:
-        # Use the new connection factory with proper ElastiCache support
-        self._redis = create_redis_client(ValkeyDatabase.CREDITS_CACHE)
+        # Use the shared connection pool with proper ElastiCache support
+        self._redis = get_shared_redis_client(ValkeyDatabase.CREDITS_CACHE)
         # Test connection
         self._redis.ping()
         logger.info("Connected to Valkey/Redis for credit caching")
@@ -12,6 +12,7 @@ Key features:
 - Health monitoring via DynamoDB
 """
 
+import asyncio
 import re
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -600,9 +601,12 @@ class LadybugAllocationManager:
         backend_type=parent_location.backend_type,
       )
 
-    # Parent graph or shared repository - look up in DynamoDB
+    # Parent graph or shared repository - look up in DynamoDB.
+    # boto3 is blocking, so keep the calls off the event loop.
     try:
-      response = self.graph_table.get_item(Key={"graph_id": graph_id})
+      response = await asyncio.to_thread(
+        self.graph_table.get_item, Key={"graph_id": graph_id}
+      )
 
       if "Item" not in response:
         return None
@@ -610,7 +614,8 @@ class LadybugAllocationManager:
       item = response["Item"]
 
       # Update last accessed time
-      self.graph_table.update_item(
+      await asyncio.to_thread(
+        self.graph_table.update_item,
         Key={"graph_id": graph_id},
         UpdateExpression="SET last_accessed = :time",
         ExpressionAttributeValues={":time": datetime.now(UTC).isoformat()},
@@ -755,6 +760,11 @@ class LadybugAllocationManager:
 
       logger.info(f"Deallocated database {graph_id} from instance {instance_id}")
 
+      # Stop routing requests to the removed database from cached locations
+      from robosystems.middleware.graph.location_cache import invalidate_graph_location
+
+      await invalidate_graph_location(graph_id)
+
       # Check if instance now has zero databases and remove protection if so (only in prod/staging)
       if self.environment not in ["dev", "test"]:
         try:
@@ -762,6 +772,12 @@ class LadybugAllocationManager:
           if "Item" in response:
             current_count = int(response["Item"].get("database_count", 0))
             if current_count == 0:
+              # Stop reusing pooled connections to the now-empty instance
+              if item.get("private_ip"):
+                from robosystems.graph_api.client.factory import GraphClientFactory
+
+                GraphClientFactory.evict_instance(item["private_ip"])
+
               # Remove instance protection since it has no databases
               try:
                 # Get the ASG name from the instance data
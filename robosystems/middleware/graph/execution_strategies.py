@@ -5,12 +5,12 @@ This module provides base classes and common logic for intelligent strategy
 selection based on client capabilities, system load, and operation characteristics.
 """
 
-import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any
 
 from robosystems.config.query_queue import QueryQueueConfig
+from robosystems.security.cypher_parser import CypherAnalysis, parse_cypher
 
 
 class BaseExecutionStrategy(Enum):
@@ -24,6 +24,7 @@ class BaseExecutionStrategy(Enum):
   NDJSON_STREAMING = "ndjson_streaming"  # Stream as newline-delimited JSON
   SSE_STREAMING = "sse_streaming"  # Stream via Server-Sent Events
   SSE_PROGRESS = "sse_progress"  # SSE with progress updates
+  ARROW_STREAMING = "arrow_streaming"  # Stream as Arrow IPC (columnar)
 
   # Queue strategies
   QUEUE_WITH_MONITORING = "queue_monitoring"  # Queue with SSE monitoring
@@ -97,52 +98,35 @@ class BaseAnalyzer(ABC):
         >>> analyze_cypher_query("MATCH (a)-[:KNOWS*]-(b) RETURN a, b")
         {'potentially_expensive': True, 'requires_streaming': True, ...}
     """
-    query_upper = query.upper()
-
-    # Check for LIMIT clause
-    has_limit = "LIMIT" in query_upper
-    limit_value = None
-    if has_limit:
-      limit_match = re.search(r"LIMIT\s+(\d+)", query_upper)
-      if limit_match:
-        limit_value = int(limit_match.group(1))
+    analysis = parse_cypher(query)
+    keywords = analysis.keywords
 
     # Estimate result size
-    estimated_rows = cls._estimate_result_size(query_upper, limit_value)
+    estimated_rows = cls._estimate_result_size(analysis)
 
-    # Check for aggregations
-    has_aggregation = any(
-      agg in query_upper
-      for agg in ["COUNT(", "SUM(", "AVG(", "MAX(", "MIN(", "COLLECT("]
+    has_aggregation = analysis.has_aggregation
+    potentially_expensive = (
+      analysis.has_shortest_path or analysis.has_all_paths or analysis.has_cartesian
     )
 
-    # Check for expensive operations
-    has_shortest_path = "SHORTEST" in query_upper and "PATH" in query_upper
-    has_all_paths = "ALL" in query_upper and "PATH" in query_upper
-    has_cartesian = query_upper.count("MATCH") > 1 and "," in query_upper
-
     return {
-      "has_limit": has_limit,
-      "limit_value": limit_value,
+      "has_limit": analysis.has_limit,
+      "limit_value": analysis.limit_value,
       "estimated_rows": estimated_rows,
       "has_aggregation": has_aggregation,
-      "has_match": "MATCH" in query_upper,
-      "has_where": "WHERE" in query_upper,
-      "has_order_by": "ORDER BY" in query_upper,
-      "has_shortest_path": has_shortest_path,
-      "has_all_paths": has_all_paths,
-      "potentially_expensive": has_shortest_path or has_all_paths or has_cartesian,
-      "is_count_only": has_aggregation
-      and "COUNT(" in query_upper
-      and "GROUP BY" not in query_upper,
+      "has_match": "MATCH" in keywords,
+      "has_where": "WHERE" in keywords,
+      "has_order_by": analysis.order_by_count > 0,
+      "has_shortest_path": analysis.has_shortest_path,
+      "has_all_paths": analysis.has_all_paths,
+      "potentially_expensive": potentially_expensive,
+      "is_count_only": _is_count_only(analysis),
       "requires_streaming": estimated_rows == "large" and not has_aggregation,
-      "supports_progress": "MATCH" in query_upper and not has_aggregation,
+      "supports_progress": "MATCH" in keywords and not has_aggregation,
     }
 
   @classmethod
-  def _estimate_result_size(
-    cls, query_upper: str, limit_value: int | None
-  ) -> int | str:
+  def _estimate_result_size(cls, analysis: CypherAnalysis) -> int | str:
     """
     Estimate the result size category based on query patterns and LIMIT clause.
 
@@ -161,21 +145,21 @@ class BaseAnalyzer(ABC):
        - Other patterns: 'medium' (default assumption)
 
     Args:
-        query_upper: The uppercase version of the Cypher query
-        limit_value: Extracted LIMIT value if present, None otherwise
+        analysis: Shared Cypher analysis from ``parse_cypher``
 
     Returns:
         Union[int, str]: Size category as string ('small', 'medium', 'large')
             Note: Despite the Union type hint, this always returns str in practice
 
     Examples:
-        >>> _estimate_result_size("MATCH (n) RETURN n LIMIT 50", 50)
+        >>> _estimate_result_size(parse_cypher("MATCH (n) RETURN n LIMIT 50"))
         'small'
-        >>> _estimate_result_size("MATCH (n) RETURN COUNT(n)", None)
+        >>> _estimate_result_size(parse_cypher("MATCH (n) RETURN COUNT(n)"))
         'small'
-        >>> _estimate_result_size("MATCH (n) RETURN n", None)
+        >>> _estimate_result_size(parse_cypher("MATCH (n) RETURN n"))
         'large'
     """
+    limit_value = analysis.limit_value
     if limit_value is not None:
       if limit_value <= cls.SMALL_RESULT:
         return "small"
@@ -185,16 +169,22 @@ class BaseAnalyzer(ABC):
         return "large"
 
     # No limit value but LIMIT clause present (parameterized limit like $limit)
-    if "LIMIT" in query_upper and limit_value is None:
+    if analysis.has_limit:
       return "medium"  # Assume reasonable size for parameterized limits
 
     # No limit - check for patterns
-    if "COUNT(" in query_upper and "GROUP BY" not in query_upper:
+    if _is_count_only(analysis):
       return "small"  # Single count result
-    elif "LIMIT" not in query_upper:
-      return "large"  # No limit means potentially large
-    else:
-      return "medium"  # Default
+    return "large"  # No limit means potentially large
+
+
+def _is_count_only(analysis: CypherAnalysis) -> bool:
+  """Whether the query aggregates with COUNT and no grouping."""
+  return (
+    analysis.has_aggregation
+    and "COUNT" in analysis.keywords
+    and not analysis.has_group_by
+  )
 
 
 class BaseClientDetector:
@@ -226,6 +216,9 @@ class BaseClientDetector:
       or "application/stream+json" in accept
     )
 
+    # Check for Arrow IPC support (columnar clients opt in explicitly)
+    supports_arrow = "application/vnd.apache.arrow.stream" in accept
+
     # Detect testing tools
     is_testing_tool = any(
       tool in user_agent
@@ -246,6 +239,7 @@ class BaseClientDetector:
     return {
       "supports_sse": supports_sse,
       "supports_ndjson": supports_ndjson,
+      "supports_arrow": supports_arrow,
       "supports_streaming": supports_sse or supports_ndjson,
       "is_testing_tool": is_testing_tool,
       "is_browser": is_browser,
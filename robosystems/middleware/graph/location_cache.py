@@ -0,0 +1,379 @@
+"""
+Graph location cache.
+
+Every routed request to a user graph needs the instance hosting it. Resolving
+that through Valkey costs a network round trip per request, and a Valkey miss
+falls through to the DynamoDB graph registry. This module keeps the answer in
+process so the hot path is a dictionary lookup.
+
+Design:
+- A bounded in-process LRU with a short TTL sits in front of the shared Valkey
+  location cache, which sits in front of the DynamoDB registry.
+- Concurrent misses for the same graph on one event loop share a single
+  lookup instead of each hitting Valkey and DynamoDB.
+- Deleting, moving or restoring a graph publishes its id on a Valkey channel.
+  Every process listening drops its entry, and the Valkey entry is deleted.
+  Each graph has a local generation counter so a lookup that was in flight
+  during an invalidation does not re-populate the stale location.
+- If the listener loses its subscription it clears the whole in-process tier,
+  since invalidations may have been missed. The TTL bounds staleness otherwise.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from robosystems.config import env
+from robosystems.config.valkey_registry import (
+  ValkeyDatabase,
+  create_async_redis_client,
+  get_shared_async_redis_client,
+  get_shared_redis_client,
+)
+from robosystems.logger import logger
+
+if TYPE_CHECKING:
+  from robosystems.middleware.graph.allocation_manager import DatabaseLocation
+
+LocationLookup = Callable[[], Awaitable["DatabaseLocation | None"]]
+
+# Delay before the listener resubscribes after losing its connection
+LISTENER_RETRY_SECONDS = 5.0
+
+
+def serialize_location(location: "DatabaseLocation") -> str:
+  """Serialize a database location for the Valkey tier."""
+  return json.dumps(
+    {
+      "graph_id": location.graph_id,
+      "instance_id": location.instance_id,
+      "private_ip": location.private_ip,
+      "availability_zone": location.availability_zone,
+      "created_at": location.created_at.isoformat(),
+      "status": location.status.value,
+      "backend_type": location.backend_type,
+    }
+  )
+
+
+def deserialize_location(raw: str) -> "DatabaseLocation":
+  """Rebuild a database location stored by ``serialize_location``."""
+  from robosystems.middleware.graph.allocation_manager import (
+    DatabaseLocation,
+    DatabaseStatus,
+  )
+
+  data = json.loads(raw)
+  return DatabaseLocation(
+    graph_id=data["graph_id"],
+    instance_id=data["instance_id"],
+    private_ip=data["private_ip"],
+    availability_zone=data.get("availability_zone", "unknown"),
+    created_at=datetime.fromisoformat(data["created_at"]),
+    status=DatabaseStatus(data.get("status", "active")),
+    backend_type=data.get("backend_type", "ladybug"),
+  )
+
+
+class GraphLocationCache:
+  """Three-tier (in-process, Valkey, DynamoDB) graph location resolver."""
+
+  KEY_PREFIX = "graph"
+
+  def __init__(
+    self,
+    ttl: int | None = None,
+    max_entries: int | None = None,
+    remote_ttl: int | None = None,
+  ):
+    """
+    Initialize the location cache.
+
+    Args:
+        ttl: Time-to-live for in-process entries in seconds
+        max_entries: Maximum number of in-process entries
+        remote_ttl: Time-to-live for Valkey entries in seconds
+    """
+    self.ttl = ttl if ttl is not None else env.GRAPH_LOCATION_CACHE_TTL
+    self.max_entries = (
+      max_entries if max_entries is not None else env.GRAPH_LOCATION_CACHE_MAX_ENTRIES
+    )
+    self.remote_ttl = (
+      remote_ttl if remote_ttl is not None else env.GRAPH_INSTANCE_CACHE_TTL
+    )
+
+    # graph_id -> (expires_at, location)
+    self._local: OrderedDict[str, tuple[float, DatabaseLocation]] = OrderedDict()
+    self._generations: dict[str, int] = {}
+    self._lock = threading.Lock()
+
+    # In-flight lookups, only shared with callers on the same event loop
+    self._inflight: dict[str, asyncio.Task] = {}
+
+    # The invalidation listener runs on the event loop that started it
+    self._listener: asyncio.Task | None = None
+
+    self._stats = {
+      "local_hits": 0,
+      "remote_hits": 0,
+      "lookups": 0,
+      "coalesced": 0,
+      "invalidations": 0,
+      "errors": 0,
+    }
+
+  # ---------------------------------------------------------------------------
+  # Keys and clients
+  # ---------------------------------------------------------------------------
+
+  def _remote_key(self, graph_id: str) -> str:
+    return f"{self.KEY_PREFIX}:{env.ENVIRONMENT or 'dev'}:location:{graph_id}"
+
+  def _channel(self) -> str:
+    return f"{self.KEY_PREFIX}:{env.ENVIRONMENT or 'dev'}:location_invalidations"
+
+  def _get_async_redis(self):
+    """Get the shared async Valkey client for the running event loop."""
+    return get_shared_async_redis_client(
+      ValkeyDatabase.LBUG_CACHE, decode_responses=True
+    )
+
+  def _get_sync_redis(self):
+    """Get the shared sync Valkey client (used from Dagster ops and scripts)."""
+    return get_shared_redis_client(ValkeyDatabase.LBUG_CACHE, decode_responses=True)
+
+  # ---------------------------------------------------------------------------
+  # In-process tier
+  # ---------------------------------------------------------------------------
+
+  def _local_get(self, graph_id: str) -> "DatabaseLocation | None":
+    with self._lock:
+      entry = self._local.get(graph_id)
+      if entry is None:
+        return None
+      expires_at, location = entry
+      if expires_at < time.monotonic():
+        del self._local[graph_id]
+        return None
+      self._local.move_to_end(graph_id)
+      return location
+
+  def _local_set(
+    self, graph_id: str, location: "DatabaseLocation", generation: int
+  ) -> None:
+    if self.max_entries <= 0:
+      return
+    with self._lock:
+      # An invalidation arrived while the lookup was in flight
+      if self._generations.get(graph_id, 0) != generation:
+        return
+      self._local[graph_id] = (time.monotonic() + self.ttl, location)
+      self._local.move_to_end(graph_id)
+      while len(self._local) > self.max_entries:
+        self._local.popitem(last=False)
+
+  def invalidate_local(self, graph_id: str) -> None:
+    """Drop a graph's in-process entry without notifying other processes."""
+    with self._lock:
+      self._local.pop(graph_id, None)
+      self._generations[graph_id] = self._generations.get(graph_id, 0) + 1
+
+  def clear_local(self) -> None:
+    """Drop every in-process entry."""
+    with self._lock:
+      for graph_id in self._local:
+        self._generations[graph_id] = self._generations.get(graph_id, 0) + 1
+      self._local.clear()
+
+  # ---------------------------------------------------------------------------
+  # Invalidation listener
+  # ---------------------------------------------------------------------------
+
+  def _ensure_listener(self) -> None:
+    """Start the invalidation listener on the current event loop if needed."""
+    loop = asyncio.get_running_loop()
+    listener = self._listener
+    if listener is not None and not listener.done() and listener.get_loop() is loop:
+      return
+    self._listener = loop.create_task(self._listen())
+
+  async def _listen(self) -> None:
+    """Drop in-process entries named on the invalidation channel."""
+    while True:
+      # The subscription holds its connection, so keep it out of the shared pool
+      redis_client = create_async_redis_client(
+        ValkeyDatabase.LBUG_CACHE, decode_responses=True
+      )
+      pubsub = redis_client.pubsub()
+      try:
+        await pubsub.subscribe(self._channel())
+        while True:
+          message = await pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=1.0
+          )
+          if message and message.get("type") == "message":
+            self.invalidate_local(message["data"])
+      except asyncio.CancelledError:
+        raise
+      except Exception as e:
+        # Invalidations may have been missed while disconnected
+        self.clear_local()
+        logger.warning(f"Graph location invalidation listener failed: {e}")
+        await asyncio.sleep(LISTENER_RETRY_SECONDS)
+      finally:
+        for closable in (pubsub, redis_client):
+          try:
+            await closable.aclose()
+          except Exception:
+            pass
+
+  # ---------------------------------------------------------------------------
+  # Public API
+  # ---------------------------------------------------------------------------
+
+  async def get(
+    self, graph_id: str, lookup: LocationLookup
+  ) -> "DatabaseLocation | None":
+    """
+    Resolve the location of a graph.
+
+    Args:
+        graph_id: Graph whose hosting instance is needed (parent id for subgraphs)
+        lookup: Coroutine factory querying the graph registry on a full miss
+
+    Returns:
+        The database location, or None if the graph is not allocated
+    """
+    location = self._local_get(graph_id)
+    if location is not None:
+      self._stats["local_hits"] += 1
+      return location
+
+    if env.GRAPH_REDIS_CACHE_ENABLED:
+      try:
+        self._ensure_listener()
+      except Exception as e:
+        logger.debug(f"Graph location invalidation listener unavailable: {e}")
+
+    loop = asyncio.get_running_loop()
+    task = self._inflight.get(graph_id)
+    if task is None or task.done() or task.get_loop() is not loop:
+      generation = self._generations.get(graph_id, 0)
+      task = loop.create_task(self._resolve(graph_id, lookup, generation))
+      self._inflight[graph_id] = task
+      task.add_done_callback(lambda t: self._forget_inflight(graph_id, t))
+    else:
+      self._stats["coalesced"] += 1
+
+    return await asyncio.shield(task)
+
+  def _forget_inflight(self, graph_id: str, task: asyncio.Task) -> None:
+    if self._inflight.get(graph_id) is task:
+      del self._inflight[graph_id]
+
+  async def _resolve(
+    self, graph_id: str, lookup: LocationLookup, generation: int
+  ) -> "DatabaseLocation | None":
+    """Resolve a location from Valkey, then the registry."""
+    if env.GRAPH_REDIS_CACHE_ENABLED:
+      try:
+        raw = await self._get_async_redis().get(self._remote_key(graph_id))
+        if raw:
+          location = deserialize_location(raw)
+          self._stats["remote_hits"] += 1
+          self._local_set(graph_id, location, generation)
+          return location
+      except Exception as e:
+        self._stats["errors"] += 1
+        logger.warning(f"Graph location cache read failed for {graph_id}: {e}")
+
+    self._stats["lookups"] += 1
+    location = await lookup()
+    if location is None:
+      return None
+
+    self._local_set(graph_id, location, generation)
+
+    if env.GRAPH_REDIS_CACHE_ENABLED:
+      try:
+        await self._get_async_redis().setex(
+          self._remote_key(graph_id),
+          self.remote_ttl,
+          serialize_location(location),
+        )
+      except Exception as e:
+        self._stats["errors"] += 1
+        logger.warning(f"Graph location cache write failed for {graph_id}: {e}")
+
+    return location
+
+  async def invalidate(self, graph_id: str) -> None:
+    """Invalidate a graph's location in every process (async callers)."""
+    self.invalidate_local(graph_id)
+    self._stats["invalidations"] += 1
+    if not env.GRAPH_REDIS_CACHE_ENABLED:
+      return
+    try:
+      redis_client = self._get_async_redis()
+      await redis_client.delete(self._remote_key(graph_id))
+      await redis_client.publish(self._channel(), graph_id)
+      logger.debug(f"Invalidated graph location for {graph_id}")
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Graph location invalidation failed for {graph_id}: {e}")
+
+  def invalidate_sync(self, graph_id: str) -> None:
+    """Invalidate a graph's location in every process (sync callers)."""
+    self.invalidate_local(graph_id)
+    self._stats["invalidations"] += 1
+    if not env.GRAPH_REDIS_CACHE_ENABLED:
+      return
+    try:
+      redis_client = self._get_sync_redis()
+      redis_client.delete(self._remote_key(graph_id))
+      redis_client.publish(self._channel(), graph_id)
+      logger.debug(f"Invalidated graph location for {graph_id}")
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Graph location invalidation failed for {graph_id}: {e}")
+
+  def get_stats(self) -> dict[str, Any]:
+    """Get cache statistics for monitoring."""
+    hits = self._stats["local_hits"] + self._stats["remote_hits"]
+    resolved = hits + self._stats["lookups"]
+    return {
+      **self._stats,
+      "hit_rate": round(hits / resolved, 3) if resolved else 0.0,
+      "local_entries": len(self._local),
+      "ttl_seconds": self.ttl,
+    }
+
+
+# Global cache instance
+_location_cache: GraphLocationCache | None = None
+_location_cache_lock = threading.Lock()
+
+
+def get_graph_location_cache() -> GraphLocationCache:
+  """Get the global graph location cache instance."""
+  global _location_cache
+  if _location_cache is None:
+    with _location_cache_lock:
+      if _location_cache is None:
+        _location_cache = GraphLocationCache()
+  return _location_cache
+
+
+async def invalidate_graph_location(graph_id: str) -> None:
+  """Invalidate the cached location of a graph after it moved or was removed."""
+  await get_graph_location_cache().invalidate(graph_id)
+
+
+def invalidate_graph_location_sync(graph_id: str) -> None:
+  """Synchronous variant of ``invalidate_graph_location``."""
+  get_graph_location_cache().invalidate_sync(graph_id)
@@ -0,0 +1,366 @@
+"""
+Cypher query result cache.
+
+Caches the results of read-only Cypher queries so that dashboards and agents
+running the same query against the same graph every few seconds are served
+from a cache lookup instead of re-executing against the graph instance.
+
+Design:
+- Cache keys are derived from the graph id, the normalized query text and the
+  canonicalized parameters.
+- Each graph has a generation counter in Valkey. Result keys embed the current
+  generation, so invalidating a graph is a single INCR - stale entries are never
+  read again and simply expire via their TTL.
+- An optional bounded in-process tier avoids transferring large payloads from
+  Valkey for hot queries. Local entries are keyed by generation as well, so a
+  write on any worker invalidates them on the next lookup.
+
+Any write, ingest, materialize, restore or schema change on a graph must call
+``invalidate`` (GraphClient and LadybugService do this automatically).
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from robosystems.config import env
+from robosystems.config.valkey_registry import (
+  ValkeyDatabase,
+  get_shared_async_redis_client,
+  get_shared_redis_client,
+)
+from robosystems.logger import logger
+
+# Functions whose results change between executions - never cache these
+NON_DETERMINISTIC_PATTERN = re.compile(
+  r"\b(RAND|RANDOM|GEN_RANDOM_UUID|UUID|TIMESTAMP|CURRENT_DATE|CURRENT_TIMESTAMP|"
+  r"DATE|DATETIME|LOCALDATETIME|NOW)\s*\(",
+  re.IGNORECASE,
+)
+
+
+class QueryResultCache:
+  """Two-tier (in-process + Valkey) cache for read-only Cypher query results."""
+
+  KEY_PREFIX = "query_cache"
+
+  def __init__(
+    self,
+    ttl: int | None = None,
+    max_bytes: int | None = None,
+    local_enabled: bool | None = None,
+    local_max_entries: int | None = None,
+  ):
+    """
+    Initialize the query result cache.
+
+    Args:
+        ttl: Time-to-live for cached results in seconds
+        max_bytes: Maximum serialized result size to cache
+        local_enabled: Whether to keep an in-process tier in front of Valkey
+        local_max_entries: Maximum number of entries in the in-process tier
+    """
+    self.ttl = ttl if ttl is not None else env.QUERY_RESULT_CACHE_TTL
+    self.max_bytes = (
+      max_bytes if max_bytes is not None else env.QUERY_RESULT_CACHE_MAX_BYTES
+    )
+    self.local_enabled = (
+      local_enabled
+      if local_enabled is not None
+      else env.QUERY_RESULT_CACHE_LOCAL_ENABLED
+    )
+    self.local_max_entries = (
+      local_max_entries
+      if local_max_entries is not None
+      else env.QUERY_RESULT_CACHE_LOCAL_MAX_ENTRIES
+    )
+
+    # In-process tier: (graph_id, generation, fingerprint) -> (expires_at, result)
+    self._local: OrderedDict[tuple[str, int, str], tuple[float, dict[str, Any]]] = (
+      OrderedDict()
+    )
+    self._local_lock = threading.Lock()
+
+    self._stats = {
+      "local_hits": 0,
+      "remote_hits": 0,
+      "misses": 0,
+      "stores": 0,
+      "skipped_too_large": 0,
+      "invalidations": 0,
+      "errors": 0,
+    }
+
+  # ---------------------------------------------------------------------------
+  # Key construction
+  # ---------------------------------------------------------------------------
+
+  @staticmethod
+  def normalize_query(query: str) -> str:
+    """
+    Normalize query text so formatting differences share a cache entry.
+
+    Collapses whitespace outside of string literals and strips trailing
+    semicolons. String literal contents are preserved exactly.
+    """
+    result: list[str] = []
+    quote: str | None = None
+    pending_space = False
+
+    for char in query.strip().rstrip(";").strip():
+      if quote:
+        result.append(char)
+        if char == quote:
+          quote = None
+        continue
+
+      if char.isspace():
+        pending_space = True
+        continue
+
+      if pending_space and result:
+        result.append(" ")
+      pending_space = False
+
+      if char in ("'", '"', "`"):
+        quote = char
+      result.append(char)
+
+    return "".join(result)
+
+  @classmethod
+  def make_fingerprint(cls, query: str, parameters: dict[str, Any] | None) -> str:
+    """Build a stable hash of the normalized query and its parameters."""
+    canonical_params = json.dumps(
+      parameters or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    payload = f"{cls.normalize_query(query)}\x00{canonical_params}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+  @staticmethod
+  def is_cacheable_query(query: str) -> bool:
+    """Check whether a read query is deterministic enough to cache."""
+    return NON_DETERMINISTIC_PATTERN.search(query) is None
+
+  def _env_prefix(self) -> str:
+    return f"{self.KEY_PREFIX}:{env.ENVIRONMENT or 'dev'}"
+
+  def _generation_key(self, graph_id: str) -> str:
+    return f"{self._env_prefix()}:gen:{graph_id}"
+
+  def _result_key(self, graph_id: str, generation: int, fingerprint: str) -> str:
+    return f"{self._env_prefix()}:result:{graph_id}:{generation}:{fingerprint}"
+
+  # ---------------------------------------------------------------------------
+  # Redis clients
+  # ---------------------------------------------------------------------------
+
+  def _get_async_redis(self):
+    """Get the shared async Valkey client for the running event loop."""
+    return get_shared_async_redis_client(
+      ValkeyDatabase.LBUG_CACHE, decode_responses=True
+    )
+
+  def _get_sync_redis(self):
+    """Get the shared sync Valkey client (used from the Graph API worker threads)."""
+    return get_shared_redis_client(ValkeyDatabase.LBUG_CACHE, decode_responses=True)
+
+  # ---------------------------------------------------------------------------
+  # In-process tier
+  # ---------------------------------------------------------------------------
+
+  def _local_get(self, key: tuple[str, int, str]) -> dict[str, Any] | None:
+    if not self.local_enabled:
+      return None
+    with self._local_lock:
+      entry = self._local.get(key)
+      if entry is None:
+        return None
+      expires_at, result = entry
+      if expires_at < time.monotonic():
+        del self._local[key]
+        return None
+      self._local.move_to_end(key)
+      return result
+
+  def _local_set(self, key: tuple[str, int, str], result: dict[str, Any]) -> None:
+    if not self.local_enabled or self.local_max_entries <= 0:
+      return
+    with self._local_lock:
+      self._local[key] = (time.monotonic() + self.ttl, result)
+      self._local.move_to_end(key)
+      while len(self._local) > self.local_max_entries:
+        self._local.popitem(last=False)
+
+  def _local_invalidate(self, graph_id: str) -> None:
+    with self._local_lock:
+      for key in [k for k in self._local if k[0] == graph_id]:
+        del self._local[key]
+
+  # ---------------------------------------------------------------------------
+  # Public API
+  # ---------------------------------------------------------------------------
+
+  async def get(
+    self, graph_id: str, query: str, parameters: dict[str, Any] | None = None
+  ) -> tuple[dict[str, Any] | None, int | None]:
+    """
+    Look up a cached result.
+
+    The returned generation must be passed to ``set`` when storing the result
+    of the query, so a result computed while the graph was being written is
+    stored under the generation it was read against and never served as
+    current.
+
+    Args:
+        graph_id: Graph the query targets
+        query: Cypher query text
+        parameters: Query parameters
+
+    Returns:
+        (cached result dict or None, graph generation or None if unknown)
+    """
+    fingerprint = self.make_fingerprint(query, parameters)
+
+    try:
+      redis_client = self._get_async_redis()
+      generation = int(await redis_client.get(self._generation_key(graph_id)) or 0)
+
+      local_key = (graph_id, generation, fingerprint)
+      cached = self._local_get(local_key)
+      if cached is not None:
+        self._stats["local_hits"] += 1
+        return cached, generation
+
+      raw = await redis_client.get(self._result_key(graph_id, generation, fingerprint))
+      if raw is None:
+        self._stats["misses"] += 1
+        return None, generation
+
+      cached = json.loads(raw)
+      self._local_set(local_key, cached)
+      self._stats["remote_hits"] += 1
+      return cached, generation
+
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Query result cache lookup failed for {graph_id}: {e}")
+      return None, None
+
+  async def set(
+    self,
+    graph_id: str,
+    query: str,
+    parameters: dict[str, Any] | None,
+    data: list[dict[str, Any]],
+    columns: list[str],
+    generation: int | None,
+  ) -> bool:
+    """
+    Store a query result.
+
+    Results larger than ``max_bytes`` once serialized are not cached.
+
+    Args:
+        generation: Graph generation returned by the ``get`` that preceded the
+            query; nothing is stored if it is unknown
+
+    Returns:
+        True if the result was stored
+    """
+    if generation is None:
+      return False
+
+    fingerprint = self.make_fingerprint(query, parameters)
+    result = {
+      "data": data,
+      "columns": columns,
+      "row_count": len(data),
+      "cached_at": time.time(),
+    }
+
+    try:
+      serialized = json.dumps(result, default=str)
+      if len(serialized) > self.max_bytes:
+        self._stats["skipped_too_large"] += 1
+        logger.debug(
+          f"Skipping query cache for {graph_id}: {len(serialized)} bytes exceeds limit"
+        )
+        return False
+
+      redis_client = self._get_async_redis()
+      await redis_client.setex(
+        self._result_key(graph_id, generation, fingerprint), self.ttl, serialized
+      )
+      self._local_set((graph_id, generation, fingerprint), json.loads(serialized))
+      self._stats["stores"] += 1
+      return True
+
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Query result cache store failed for {graph_id}: {e}")
+      return False
+
+  async def invalidate(self, graph_id: str) -> None:
+    """Invalidate every cached result for a graph (async callers)."""
+    self._local_invalidate(graph_id)
+    try:
+      await self._get_async_redis().incr(self._generation_key(graph_id))
+      self._stats["invalidations"] += 1
+      logger.debug(f"Invalidated query result cache for {graph_id}")
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Query result cache invalidation failed for {graph_id}: {e}")
+
+  def invalidate_sync(self, graph_id: str) -> None:
+    """Invalidate every cached result for a graph (sync callers)."""
+    self._local_invalidate(graph_id)
+    try:
+      self._get_sync_redis().incr(self._generation_key(graph_id))
+      self._stats["invalidations"] += 1
+      logger.debug(f"Invalidated query result cache for {graph_id}")
+    except Exception as e:
+      self._stats["errors"] += 1
+      logger.warning(f"Query result cache invalidation failed for {graph_id}: {e}")
+
+  def get_stats(self) -> dict[str, Any]:
+    """Get cache statistics for monitoring."""
+    hits = self._stats["local_hits"] + self._stats["remote_hits"]
+    lookups = hits + self._stats["misses"]
+    return {
+      **self._stats,
+      "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+      "local_entries": len(self._local),
+      "ttl_seconds": self.ttl,
+    }
+
+
+# Global cache instance
+_query_result_cache: QueryResultCache | None = None
+_query_result_cache_lock = threading.Lock()
+
+
+def get_query_result_cache() -> QueryResultCache:
+  """Get the global query result cache instance."""
+  global _query_result_cache
+  if _query_result_cache is None:
+    with _query_result_cache_lock:
+      if _query_result_cache is None:
+        _query_result_cache = QueryResultCache()
+  return _query_result_cache
+
+
+async def invalidate_query_cache(graph_id: str) -> None:
+  """Invalidate cached query results for a graph if caching is enabled."""
+  if env.QUERY_RESULT_CACHE_ENABLED:
+    await get_query_result_cache().invalidate(graph_id)
+
+
+def invalidate_query_cache_sync(graph_id: str) -> None:
+  """Synchronous variant of ``invalidate_query_cache``."""
+  if env.QUERY_RESULT_CACHE_ENABLED:
+    get_query_result_cache().invalidate_sync(graph_id)
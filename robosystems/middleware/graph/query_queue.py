@@ -3,9 +3,24 @@ Lightweight Query Queue Manager
 
 Provides in-memory query queuing with asyncio for the public API layer.
 No external dependencies, minimal latency overhead.
+
+Queries are scheduled fairly across graphs: each graph has its own sub-queue
+and graphs are served in virtual-time order weighted by query priority, so a
+single busy graph cannot delay every other tenant on the instance. Identical
+read-only queries that are already in flight are coalesced, and queue wait
+estimates use service times observed per graph.
+
+Waiters are woken by the worker when their query finishes rather than polling.
+When enabled, finished results are also published to Valkey so a waiter on a
+different worker process is woken the same way.
 """
 
 import asyncio
+import contextlib
+import hashlib
+import heapq
+import itertools
+import json
 import time
 import uuid
 from collections import OrderedDict
@@ -15,12 +30,28 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
+from robosystems.config import env
+from robosystems.config.valkey_registry import (
+  ValkeyDatabase,
+  create_async_redis_client,
+  get_shared_async_redis_client,
+)
 from robosystems.logger import logger
 from robosystems.middleware.graph.admission_control import (
   AdmissionDecision,
   get_admission_controller,
 )
 from robosystems.middleware.otel.metrics import record_query_queue_metrics
+from robosystems.security.cypher_parser import parse_cypher
+
+# Service time assumed for graphs without observed executions (seconds)
+DEFAULT_SERVICE_TIME = 2.0
+
+# Weight of the latest execution in the per-graph service time average
+SERVICE_TIME_ALPHA = 0.2
+
+# How long finished queries stay available (seconds)
+RESULT_RETENTION_SECONDS = 300
 
 
 class QueryStatus(str, Enum):
@@ -50,6 +81,8 @@ class QueuedQuery:
   status: QueryStatus = QueryStatus.PENDING
   result: Any | None = None
   error: str | None = None
+  dedup_key: str | None = None
+  leader_id: str | None = None
 
   @property
   def wait_time_seconds(self) -> float:
@@ -66,16 +99,181 @@ class QueuedQuery:
     return None
 
 
+@dataclass
+class InFlightQuery:
+  """An executing (or queued) query that identical submissions attach to."""
+
+  leader_id: str
+  future: asyncio.Future
+  followers: list[str] = field(default_factory=list)
+
+
+class FairQueryQueue:
+  """
+  Weighted fair queue of query IDs across graphs.
+
+  Each graph has its own sub-queue ordered by priority, then arrival. Graphs
+  are served by start-time fair queuing: dispatching a query advances its
+  graph's virtual time by the graph's estimated service time divided by the
+  query priority. A graph with a deep backlog or slow queries therefore gets
+  its share of the workers without starving the others, and higher tiers
+  (higher priority) get a larger share.
+  """
+
+  def __init__(self, maxsize: int, cost: Callable[[str], float]):
+    """
+    Initialize the queue.
+
+    Args:
+        maxsize: Maximum queued queries
+        cost: Returns the estimated service time of a query on a graph
+    """
+    self.maxsize = maxsize
+    self._cost = cost
+    self._flows: dict[str, list[tuple[int, int, str]]] = {}
+    self._flow_vtime: dict[str, float] = {}
+    self._vtime = 0.0
+    self._graph_of: dict[str, str] = {}
+    self._seq = itertools.count()
+    self._not_empty = asyncio.Event()
+
+  def qsize(self) -> int:
+    """Number of queued queries."""
+    return len(self._graph_of)
+
+  def graph_count(self) -> int:
+    """Number of graphs with queued queries."""
+    return len(self._flows)
+
+  def put(self, query_id: str, graph_id: str, priority: int) -> None:
+    """Add a query to its graph's sub-queue."""
+    heapq.heappush(
+      self._flows.setdefault(graph_id, []), (-priority, next(self._seq), query_id)
+    )
+    self._graph_of[query_id] = graph_id
+    self._not_empty.set()
+
+  async def get(self) -> str:
+    """Wait for and remove the next query to dispatch."""
+    while not self._graph_of:
+      self._not_empty.clear()
+      await self._not_empty.wait()
+    return self.get_nowait()
+
+  def get_nowait(self) -> str:
+    """Remove the next query to dispatch."""
+    heads = {graph_id: flow[0] for graph_id, flow in self._flows.items()}
+    graph_id = self._next_graph(heads, self._flow_vtime, self._vtime)
+    neg_priority, _, query_id = heapq.heappop(self._flows[graph_id])
+    self._vtime = self._advance(graph_id, -neg_priority, self._flow_vtime, self._vtime)
+
+    del self._graph_of[query_id]
+    if not self._flows[graph_id]:
+      self._drop_flow(graph_id)
+    return query_id
+
+  def remove(self, query_id: str) -> bool:
+    """Remove a queued query (e.g. on cancellation)."""
+    graph_id = self._graph_of.pop(query_id, None)
+    if graph_id is None:
+      return False
+    flow = [entry for entry in self._flows[graph_id] if entry[2] != query_id]
+    if flow:
+      heapq.heapify(flow)
+      self._flows[graph_id] = flow
+    else:
+      self._drop_flow(graph_id)
+    return True
+
+  def replace(self, query_id: str, new_query_id: str) -> bool:
+    """Give a queued query's place to another query on the same graph."""
+    graph_id = self._graph_of.pop(query_id, None)
+    if graph_id is None:
+      return False
+    self._flows[graph_id] = [
+      (neg_priority, seq, new_query_id if entry_id == query_id else entry_id)
+      for neg_priority, seq, entry_id in self._flows[graph_id]
+    ]
+    self._graph_of[new_query_id] = graph_id
+    return True
+
+  def ahead_of(self, query_id: str) -> list[str]:
+    """
+    Graph IDs of the queries that will be dispatched before a query.
+
+    Replays the scheduler on a copy of the current state, so the result is
+    exact for the queue as it stands now.
+    """
+    if query_id not in self._graph_of:
+      return []
+
+    flows = {graph_id: sorted(flow) for graph_id, flow in self._flows.items()}
+    positions = dict.fromkeys(flows, 0)
+    flow_vtime = dict(self._flow_vtime)
+    vtime = self._vtime
+    ahead: list[str] = []
+
+    while True:
+      heads = {
+        graph_id: flow[positions[graph_id]]
+        for graph_id, flow in flows.items()
+        if positions[graph_id] < len(flow)
+      }
+      graph_id = self._next_graph(heads, flow_vtime, vtime)
+      neg_priority, _, next_id = heads[graph_id]
+      if next_id == query_id:
+        return ahead
+      positions[graph_id] += 1
+      vtime = self._advance(graph_id, -neg_priority, flow_vtime, vtime)
+      ahead.append(graph_id)
+
+  @staticmethod
+  def _next_graph(
+    heads: dict[str, tuple[int, int, str]],
+    flow_vtime: dict[str, float],
+    vtime: float,
+  ) -> str:
+    """Graph whose head query has the earliest virtual start time."""
+    return min(
+      heads,
+      key=lambda graph_id: (
+        max(vtime, flow_vtime.get(graph_id, 0.0)),
+        heads[graph_id][0],
+        heads[graph_id][1],
+      ),
+    )
+
+  def _advance(
+    self, graph_id: str, priority: int, flow_vtime: dict[str, float], vtime: float
+  ) -> float:
+    """Charge a dispatched query to its graph and return the new virtual time."""
+    start = max(vtime, flow_vtime.get(graph_id, 0.0))
+    flow_vtime[graph_id] = start + self._cost(graph_id) / max(priority, 1)
+    return start
+
+  def _drop_flow(self, graph_id: str) -> None:
+    """Forget an empty graph, keeping only virtual time it has not used up."""
+    del self._flows[graph_id]
+    self._flow_vtime = {
+      flow_id: finish
+      for flow_id, finish in self._flow_vtime.items()
+      if flow_id in self._flows or finish > self._vtime
+    }
+
+
 class QueryQueueManager:
   """
   Lightweight query queue manager using asyncio.
 
   Features:
   - In-memory queue with size limits
-  - Priority-based execution
+  - Weighted fair scheduling across graphs, priority-based within a graph
+  - Coalescing of identical in-flight read-only queries
+  - Wait estimates from observed per-graph service times
+  - Event-driven result delivery, optionally across workers via Valkey
   - Credit reservation before queuing
   - Backpressure handling
-  - No external dependencies
+  - No external dependencies unless remote results are enabled
   """
 
   def __init__(
@@ -84,6 +282,8 @@ class QueryQueueManager:
     max_concurrent_queries: int = 50,
     max_queries_per_user: int = 10,
     query_timeout: int = 300,  # 5 minutes
+    deduplicate_queries: bool = True,
+    remote_results: bool | None = None,
   ):
     """
     Initialize query queue manager.
@@ -93,22 +293,46 @@ class QueryQueueManager:
         max_concurrent_queries: Maximum simultaneous executions
         max_queries_per_user: Maximum queries per user
         query_timeout: Query execution timeout in seconds
+        deduplicate_queries: Attach identical read-only queries to the one
+            already in flight instead of executing them again
+        remote_results: Publish finished results to Valkey for waiters on
+            other workers (defaults to QUERY_QUEUE_REMOTE_RESULTS_ENABLED)
     """
     self.max_queue_size = max_queue_size
     self.max_concurrent_queries = max_concurrent_queries
     self.max_queries_per_user = max_queries_per_user
     self.query_timeout = query_timeout
+    self.deduplicate_queries = deduplicate_queries
+    self.remote_results = (
+      remote_results
+      if remote_results is not None
+      else env.QUERY_QUEUE_REMOTE_RESULTS_ENABLED
+    )
 
     # Query storage
-    self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
+    self._queue = FairQueryQueue(max_queue_size, self._estimated_service_time)
     self._queries: dict[str, QueuedQuery] = {}
     self._user_query_counts: dict[str, int] = {}
 
+    # In-flight queries by deduplication key
+    self._inflight: dict[str, InFlightQuery] = {}
+    self._deduplicated_count = 0
+
+    # Observed service times (EWMA seconds) per graph
+    self._service_times: OrderedDict[str, float] = OrderedDict()
+    self._overall_service_time = DEFAULT_SERVICE_TIME
+    self._max_service_time_graphs = 10000
+
     # Execution tracking
     self._running_queries: dict[str, asyncio.Task] = {}
     self._completed_queries: OrderedDict[str, QueuedQuery] = OrderedDict()
     self._max_completed = 10000  # Keep last N completed queries
 
+    # Completion events for queries someone is waiting on
+    self._done_events: dict[str, asyncio.Event] = {}
+    # Start events for pending queries someone is watching
+    self._start_events: dict[str, asyncio.Event] = {}
+
     # Executor function (set by router)
     self._query_executor: Callable | None = None
 
@@ -192,8 +416,11 @@ class QueryQueueManager:
 
       raise Exception(f"Query rejected: {reason}")
 
-    # Check queue capacity
-    if self._queue.qsize() >= self.max_queue_size:
+    dedup_key = self._dedup_key(cypher, parameters, graph_id)
+    inflight = self._inflight.get(dedup_key) if dedup_key else None
+
+    # Check queue capacity (followers of an in-flight query take no queue slot)
+    if inflight is None and self._queue.qsize() >= self.max_queue_size:
       # Record rejection metric
       record_query_queue_metrics(
         metric_type="submission",
@@ -234,14 +461,22 @@ class QueryQueueManager:
       user_id=user_id,
       credits_reserved=credits_required,
       priority=priority,
+      dedup_key=dedup_key,
     )
 
     # Store query
     self._queries[query_id] = query
     self._user_query_counts[user_id] = user_count + 1
 
-    # Add to priority queue (negative priority for max heap behavior)
-    await self._queue.put((-priority, query.created_at.timestamp(), query_id))
+    if inflight is not None:
+      # Attach to the identical query already in flight
+      self._attach_follower(query, inflight)
+    else:
+      if dedup_key:
+        self._inflight[dedup_key] = InFlightQuery(
+          leader_id=query_id, future=asyncio.get_running_loop().create_future()
+        )
+      self._queue.put(query_id, graph_id, priority)
 
     # Record successful submission metric
     record_query_queue_metrics(
@@ -255,15 +490,73 @@ class QueryQueueManager:
     logger.info(
       f"Query {query_id} submitted: user={user_id}, "
       f"priority={priority}, queue_size={self._queue.qsize()}"
+      + (f", coalesced_with={query.leader_id}" if query.leader_id else "")
     )
 
     return query_id
 
+  def _dedup_key(
+    self, cypher: str, parameters: dict[str, Any] | None, graph_id: str
+  ) -> str | None:
+    """Key identifying identical read-only queries, or None if not coalescable."""
+    if not self.deduplicate_queries or not parse_cypher(cypher).is_read_only:
+      return None
+    payload = json.dumps(
+      [graph_id, cypher.strip(), parameters or {}], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+  def _attach_follower(self, query: QueuedQuery, inflight: InFlightQuery) -> None:
+    """Make a query share the result of an identical in-flight query."""
+    query.leader_id = inflight.leader_id
+    leader = self._queries.get(inflight.leader_id)
+    if leader and leader.status == QueryStatus.RUNNING:
+      query.status = QueryStatus.RUNNING
+      query.started_at = datetime.now(UTC)
+
+    inflight.followers.append(query.id)
+    inflight.future.add_done_callback(
+      lambda future, query_id=query.id: self._complete_follower(query_id, future)
+    )
+    self._deduplicated_count += 1
+
+  def _complete_follower(self, query_id: str, future: asyncio.Future) -> None:
+    """Copy the leader's outcome to a follower once the leader finishes."""
+    query = self._queries.get(query_id)
+    if (
+      not query
+      or query.leader_id is None
+      or query.status not in (QueryStatus.PENDING, QueryStatus.RUNNING)
+    ):
+      return  # Cancelled or promoted to leader
+
+    leader: QueuedQuery = future.result()
+    query.status = leader.status
+    query.result = leader.result
+    query.error = leader.error
+    query.started_at = query.started_at or leader.started_at
+    query.completed_at = leader.completed_at
+
+    self._mark_finished(query)
+    self._release_user_slot(query.user_id)
+    asyncio.create_task(self._cleanup_query(query_id))
+
+  def _finish_inflight(self, query: QueuedQuery) -> None:
+    """Resolve the in-flight entry led by a finished query."""
+    inflight = self._inflight.get(query.dedup_key) if query.dedup_key else None
+    if inflight is None or inflight.leader_id != query.id:
+      return
+    del self._inflight[query.dedup_key]
+    if not inflight.future.done():
+      inflight.future.set_result(query)
+
   async def get_query_status(self, query_id: str) -> dict[str, Any] | None:
     """Get current status of a query."""
-    # Check running queries
-    if query_id in self._running_queries:
-      query = self._queries.get(query_id)
+    # Check running queries (followers run while their leader does)
+    query = self._queries.get(query_id)
+    if query_id in self._running_queries or (
+      query and query.status == QueryStatus.RUNNING
+    ):
       if query:
         return {
           "id": query_id,
@@ -287,13 +580,13 @@ class QueryQueueManager:
     # Check pending queries
     if query_id in self._queries:
       query = self._queries[query_id]
-      position = self._estimate_queue_position(query_id)
+      position, estimated_wait = self._estimate_queue_wait(query.leader_id or query_id)
       return {
         "id": query_id,
         "status": QueryStatus.PENDING,
         "queue_position": position,
         "wait_time": query.wait_time_seconds,
-        "estimated_wait": self._estimate_wait_time(position),
+        "estimated_wait": estimated_wait,
       }
 
     return None
@@ -304,6 +597,9 @@ class QueryQueueManager:
     """
     Get query result, optionally waiting for completion.
 
+    The wait ends as soon as the query finishes. Queries held by another
+    worker are waited on through Valkey when remote results are enabled.
+
     Args:
         query_id: Query to check
         wait_seconds: How long to wait for result (0 = don't wait)
@@ -311,33 +607,159 @@ class QueryQueueManager:
     Returns:
         Query result if available
     """
-    start_time = time.time()
+    result = self._finished_result(query_id)
+    if result is not None:
+      return result
 
-    while True:
-      # Check if completed
-      if query_id in self._completed_queries:
-        query = self._completed_queries[query_id]
-        if query.status == QueryStatus.COMPLETED:
-          return {
-            "status": "completed",
-            "data": query.result,
-            "execution_time": query.execution_time_seconds,
-          }
-        else:
-          return {
-            "status": query.status,
-            "error": query.error,
-          }
-
-      # Check if we should keep waiting
-      elapsed = time.time() - start_time
-      if elapsed >= wait_seconds:
-        # Return current status
-        status = await self.get_query_status(query_id)
-        return status
-
-      # Wait a bit before checking again
-      await asyncio.sleep(0.1)
+    if wait_seconds > 0:
+      query = self._queries.get(query_id)
+      if query is not None:
+        if query.status in (QueryStatus.PENDING, QueryStatus.RUNNING):
+          event = self._done_events.setdefault(query_id, asyncio.Event())
+          with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout=wait_seconds)
+        result = self._finished_result(query_id)
+        if result is not None:
+          return result
+      elif self.remote_results:
+        result = await self._wait_remote_result(query_id, wait_seconds)
+        if result is not None:
+          return result
+
+    # Return current status
+    return await self.get_query_status(query_id)
+
+  async def wait_for_start(self, query_id: str, timeout: float) -> None:
+    """
+    Wait until a pending query leaves the queue.
+
+    Returns as soon as the query starts running or finishes, or once the
+    timeout passes so callers can report its updated queue position.
+
+    Args:
+        query_id: Query to watch
+        timeout: Longest time to wait in seconds
+    """
+    query = self._queries.get(query_id)
+    if query is None or query.status != QueryStatus.PENDING:
+      return
+
+    event = self._start_events.setdefault(query_id, asyncio.Event())
+    with contextlib.suppress(TimeoutError):
+      await asyncio.wait_for(event.wait(), timeout=timeout)
+
+  def _notify_started(self, query_id: str) -> None:
+    """Wake everyone waiting for a query to leave the queue."""
+    event = self._start_events.pop(query_id, None)
+    if event is not None:
+      event.set()
+
+  def _finished_result(self, query_id: str) -> dict[str, Any] | None:
+    """Result of a finished query held by this worker."""
+    query = self._completed_queries.get(query_id)
+    if query is None:
+      return None
+    return self._result_payload(query)
+
+  @staticmethod
+  def _result_payload(query: QueuedQuery) -> dict[str, Any]:
+    """Result returned to callers for a finished query."""
+    if query.status == QueryStatus.COMPLETED:
+      return {
+        "status": "completed",
+        "data": query.result,
+        "execution_time": query.execution_time_seconds,
+      }
+    return {
+      "status": query.status,
+      "error": query.error,
+    }
+
+  def _mark_finished(self, query: QueuedQuery) -> None:
+    """Record a finished query and wake everyone waiting on it."""
+    self._completed_queries[query.id] = query
+    self._cleanup_completed_queries()
+
+    event = self._done_events.pop(query.id, None)
+    if event is not None:
+      event.set()
+    self._notify_started(query.id)
+
+    if self.remote_results:
+      asyncio.create_task(self._publish_result(query))
+
+  # ---------------------------------------------------------------------------
+  # Cross-worker result delivery
+  # ---------------------------------------------------------------------------
+
+  def _get_redis(self):
+    """Get the shared async Valkey client for the running event loop."""
+    return get_shared_async_redis_client(
+      ValkeyDatabase.LBUG_CACHE, decode_responses=True
+    )
+
+  def _create_pubsub_redis(self):
+    """
+    Create a dedicated async Valkey client for a pub/sub wait.
+
+    A subscription holds its connection for the whole wait, so it must not
+    take a slot in the bounded shared pool. The caller closes the client.
+    """
+    return create_async_redis_client(ValkeyDatabase.LBUG_CACHE, decode_responses=True)
+
+  @staticmethod
+  def _remote_key(query_id: str) -> str:
+    return f"query_queue:{env.ENVIRONMENT or 'dev'}:result:{query_id}"
+
+  @staticmethod
+  def _remote_channel(query_id: str) -> str:
+    return f"query_queue:{env.ENVIRONMENT or 'dev'}:done:{query_id}"
+
+  async def _publish_result(self, query: QueuedQuery) -> None:
+    """Store a finished result in Valkey and notify remote waiters."""
+    payload = self._result_payload(query)
+    try:
+      serialized = json.dumps(payload, default=str)
+      if len(serialized) > env.QUERY_QUEUE_REMOTE_RESULT_MAX_BYTES:
+        payload["data"] = None
+        payload["data_omitted"] = True
+        serialized = json.dumps(payload, default=str)
+
+      redis_client = self._get_redis()
+      await redis_client.setex(
+        self._remote_key(query.id), RESULT_RETENTION_SECONDS, serialized
+      )
+      await redis_client.publish(self._remote_channel(query.id), query.status)
+    except Exception as e:
+      logger.warning(f"Failed to publish result for query {query.id}: {e}")
+
+  async def _wait_remote_result(
+    self, query_id: str, wait_seconds: float
+  ) -> dict[str, Any] | None:
+    """Wait for a query finished by another worker."""
+    redis_client = self._get_redis()
+    pubsub_client = self._create_pubsub_redis()
+    pubsub = pubsub_client.pubsub()
+    try:
+      # Subscribe before reading so a result published in between is not missed
+      await pubsub.subscribe(self._remote_channel(query_id))
+      deadline = time.monotonic() + wait_seconds
+      while True:
+        raw = await redis_client.get(self._remote_key(query_id))
+        if raw is not None:
+          return json.loads(raw)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+          return None
+        await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+    except Exception as e:
+      logger.warning(f"Failed to wait for remote result of query {query_id}: {e}")
+      return None
+    finally:
+      with contextlib.suppress(Exception):
+        await pubsub.aclose()
+      with contextlib.suppress(Exception):
+        await pubsub_client.aclose()
 
   async def cancel_query(self, query_id: str, user_id: str) -> bool:
     """
@@ -357,6 +779,8 @@ class QueryQueueManager:
     if query.status != QueryStatus.PENDING:
       return False  # Can't cancel running/completed queries
 
+    self._detach_cancelled(query)
+
     # Mark as cancelled
     query.status = QueryStatus.CANCELLED
     query.completed_at = datetime.now(UTC)
@@ -371,8 +795,7 @@ class QueryQueueManager:
     )
 
     # Move to completed
-    self._completed_queries[query_id] = query
-    self._cleanup_completed_queries()
+    self._mark_finished(query)
 
     # Update user count
     self._user_query_counts[user_id] = max(0, self._user_query_counts[user_id] - 1)
@@ -380,6 +803,30 @@ class QueryQueueManager:
     logger.info(f"Query {query_id} cancelled by user {user_id}")
     return True
 
+  def _detach_cancelled(self, query: QueuedQuery) -> None:
+    """Take a cancelled query out of the queue and its in-flight group."""
+    inflight = self._inflight.get(query.dedup_key) if query.dedup_key else None
+
+    if query.leader_id is not None:
+      # Followers only stop waiting; the leader keeps running for the others
+      if inflight is not None and query.id in inflight.followers:
+        inflight.followers.remove(query.id)
+      return
+
+    if inflight is None or inflight.leader_id != query.id or not inflight.followers:
+      self._queue.remove(query.id)
+      if inflight is not None and inflight.leader_id == query.id:
+        del self._inflight[query.dedup_key]
+      return
+
+    # Promote the oldest follower so the others keep their place in the queue
+    new_leader = self._queries[inflight.followers.pop(0)]
+    new_leader.leader_id = None
+    for follower_id in inflight.followers:
+      self._queries[follower_id].leader_id = new_leader.id
+    inflight.leader_id = new_leader.id
+    self._queue.replace(query.id, new_leader.id)
+
   def set_query_executor(self, executor: Callable):
     """Set the function to execute queries."""
     self._query_executor = executor
@@ -396,9 +843,7 @@ class QueryQueueManager:
 
         # Get next query (with timeout to allow periodic checks)
         try:
-          priority, timestamp, query_id = await asyncio.wait_for(
-            self._queue.get(), timeout=1.0
-          )
+          query_id = await asyncio.wait_for(self._queue.get(), timeout=1.0)
         except TimeoutError:
           continue
 
@@ -410,6 +855,8 @@ class QueryQueueManager:
         # Start execution
         query.status = QueryStatus.RUNNING
         query.started_at = datetime.now(UTC)
+        self._notify_started(query_id)
+        self._start_followers(query)
 
         # Record wait time metric
         record_query_queue_metrics(
@@ -441,6 +888,18 @@ class QueryQueueManager:
         logger.error(f"Queue worker error: {e}")
         await asyncio.sleep(1)
 
+  def _start_followers(self, query: QueuedQuery) -> None:
+    """Mark the followers of a dispatched query as running."""
+    inflight = self._inflight.get(query.dedup_key) if query.dedup_key else None
+    if inflight is None or inflight.leader_id != query.id:
+      return
+    for follower_id in inflight.followers:
+      follower = self._queries.get(follower_id)
+      if follower and follower.status == QueryStatus.PENDING:
+        follower.status = QueryStatus.RUNNING
+        follower.started_at = query.started_at
+        self._notify_started(follower_id)
+
   async def _execute_query(self, query: QueuedQuery):
     """Execute a query with timeout and error handling."""
     try:
@@ -477,6 +936,8 @@ class QueryQueueManager:
 
       # Record execution metrics
       if query.execution_time_seconds is not None:
+        self._record_service_time(query.graph_id, query.execution_time_seconds)
+
         status_map = {
           QueryStatus.COMPLETED: "completed",
           QueryStatus.FAILED: "failed",
@@ -498,8 +959,7 @@ class QueryQueueManager:
           status=status_map.get(query.status, "unknown"),
           error_type=error_type,
         )
-      self._completed_queries[query.id] = query
-      self._cleanup_completed_queries()
+      self._mark_finished(query)
 
       # Remove from running
       self._running_queries.pop(query.id, None)
@@ -513,15 +973,22 @@ class QueryQueueManager:
       )
 
       # Update user count
-      count = self._user_query_counts.get(query.user_id, 0)
-      self._user_query_counts[query.user_id] = max(0, count - 1)
-      if self._user_query_counts[query.user_id] == 0:
-        del self._user_query_counts[query.user_id]
+      self._release_user_slot(query.user_id)
+
+      # Hand the result to coalesced followers
+      self._finish_inflight(query)
 
       # Remove from main storage after a delay
       asyncio.create_task(self._cleanup_query(query.id))
 
-  async def _cleanup_query(self, query_id: str, delay: int = 300):
+  def _release_user_slot(self, user_id: str) -> None:
+    """Decrement a user's active query count."""
+    count = self._user_query_counts.get(user_id, 0)
+    self._user_query_counts[user_id] = max(0, count - 1)
+    if self._user_query_counts[user_id] == 0:
+      del self._user_query_counts[user_id]
+
+  async def _cleanup_query(self, query_id: str, delay: int = RESULT_RETENTION_SECONDS):
     """Remove query from main storage after delay."""
     await asyncio.sleep(delay)  # Keep for 5 minutes
     self._queries.pop(query_id, None)
@@ -531,17 +998,36 @@ class QueryQueueManager:
     while len(self._completed_queries) > self._max_completed:
       self._completed_queries.popitem(last=False)
 
-  def _estimate_queue_position(self, query_id: str) -> int:
-    """Estimate position in queue (approximate)."""
-    # This is approximate since we can't efficiently inspect priority queue
-    return self._queue.qsize()
+  def _record_service_time(self, graph_id: str, seconds: float) -> None:
+    """Fold an observed execution time into the graph's moving average."""
+    previous = self._service_times.pop(graph_id, None)
+    if previous is None:
+      self._service_times[graph_id] = seconds
+    else:
+      self._service_times[graph_id] = previous + SERVICE_TIME_ALPHA * (
+        seconds - previous
+      )
+    while len(self._service_times) > self._max_service_time_graphs:
+      self._service_times.popitem(last=False)
+
+    self._overall_service_time += SERVICE_TIME_ALPHA * (
+      seconds - self._overall_service_time
+    )
+
+  def _estimated_service_time(self, graph_id: str) -> float:
+    """Expected execution time of a query on a graph, in seconds."""
+    return self._service_times.get(graph_id, self._overall_service_time)
 
-  def _estimate_wait_time(self, position: int) -> float:
-    """Estimate wait time based on position."""
-    # Simple estimate: 2 seconds per query
-    avg_query_time = 2.0
-    concurrent = self.max_concurrent_queries
-    return (position / concurrent) * avg_query_time
+  def _estimate_queue_wait(self, query_id: str) -> tuple[int, float]:
+    """
+    Estimate a pending query's queue position and wait time.
+
+    The position comes from replaying the fair scheduler; the wait is the
+    observed service time of every query ahead, spread over the workers.
+    """
+    ahead = self._queue.ahead_of(query_id)
+    work = sum(self._estimated_service_time(graph_id) for graph_id in ahead)
+    return len(ahead), work / max(1, self.max_concurrent_queries)
 
   def get_stats(self) -> dict[str, Any]:
     """Get queue statistics."""
@@ -550,6 +1036,11 @@ class QueryQueueManager:
       "running_queries": len(self._running_queries),
       "completed_queries": len(self._completed_queries),
       "users_with_queries": len(self._user_query_counts),
+      "graphs_with_queries": self._queue.graph_count(),
+      "inflight_queries": len(self._inflight),
+      "deduplicated_queries": self._deduplicated_count,
+      "result_waiters": len(self._done_events),
+      "start_waiters": len(self._start_events),
       "capacity_used": self._queue.qsize() / self.max_queue_size,
     }
 
@@ -178,6 +178,24 @@ class UniversalRepository:
         }
         yield chunk
 
+  @property
+  def supports_arrow(self) -> bool:
+    """Check if the underlying repository can stream Arrow IPC results."""
+    return hasattr(self._repository, "execute_query_arrow_stream")
+
+  async def execute_query_arrow_stream(
+    self, cypher: str, params: dict[str, Any] | None = None
+  ):
+    """
+    Execute a query and stream the result as Arrow IPC bytes.
+
+    Only available for API-based repositories (see ``supports_arrow``).
+
+    Returns:
+        Async generator of Arrow IPC stream bytes
+    """
+    return await self._call_method("execute_query_arrow_stream", cypher, params)
+
   async def execute_single(
     self, cypher: str, params: dict[str, Any] | None = None
   ) -> dict[str, Any] | None:
@@ -17,6 +17,7 @@ from httpx import HTTPError, TimeoutException
 from robosystems.config import env
 from robosystems.graph_api.client import GraphClient
 from robosystems.logger import logger
+from robosystems.security.cypher_parser import CypherAnalysis, parse_cypher
 
 from .exceptions import (
   GraphAPIError,
@@ -208,16 +209,16 @@ class GraphMCPClient:
 
     # Auto-append LIMIT for MCP context safety
     original_query = cypher
-    cypher_upper = cypher.strip().upper()
+    analysis = parse_cypher(cypher.strip())
 
     # Use cached configuration
     max_rows = self.max_result_rows
     auto_limit_enabled = self.auto_limit_enabled
 
     # Check if we should auto-append LIMIT
-    has_limit = "LIMIT" in cypher_upper
-    has_return = "RETURN" in cypher_upper
-    has_aggregation = self._has_aggregation_function(cypher_upper)
+    has_limit = analysis.has_limit
+    has_return = analysis.has_return
+    has_aggregation = self._has_aggregation_function(analysis)
 
     if auto_limit_enabled and has_return and not has_limit and not has_aggregation:
       # Use intelligent LIMIT injection to handle complex queries
@@ -841,7 +842,7 @@ class GraphMCPClient:
 
     return sanitized
 
-  def _has_aggregation_function(self, query_upper: str) -> bool:
+  def _has_aggregation_function(self, analysis: CypherAnalysis) -> bool:
     """
     Check if query contains aggregation functions that naturally limit results.
 
@@ -850,25 +851,17 @@ class GraphMCPClient:
     and can actually break the query semantics.
 
     Args:
-        query_upper: Uppercase query string
+        analysis: Shared Cypher analysis of the query
 
     Returns:
         True if query contains aggregation functions
     """
-    aggregation_functions = [
-      "COUNT(",
-      "SUM(",
-      "AVG(",
-      "MIN(",
-      "MAX(",
-      "COLLECT(",
-      "GROUP BY",
-      "DISTINCT",
-      # Common patterns that indicate aggregation
-      "COUNT{",  # Graph database COUNT subquery syntax
-    ]
-
-    return any(func in query_upper for func in aggregation_functions)
+    # Aggregation calls (including COUNT{} subqueries), GROUP BY or DISTINCT
+    return (
+      analysis.has_aggregation
+      or analysis.has_group_by
+      or "DISTINCT" in analysis.keywords
+    )
 
   def _inject_limit_intelligently(self, query: str, limit: int) -> str:
     """
@@ -903,25 +896,36 @@ class GraphMCPClient:
         >>> _inject_limit_intelligently("MATCH (n) RETURN n ORDER BY n.name", 100)
         "MATCH (n) RETURN n ORDER BY n.name LIMIT 100"
     """
-    import re
-
     # Normalize query for analysis (preserve original for output)
     query_normalized = query.strip()
-    query_upper = query_normalized.upper()
+    analysis = parse_cypher(query_normalized)
 
     # If query already has LIMIT, return as-is
-    if "LIMIT" in query_upper:
+    if analysis.has_limit:
       return query
 
     # Handle UNION queries - need to add LIMIT to each part
-    if "UNION" in query_upper:
-      # Split by UNION and add LIMIT to each part
-      parts = re.split(r"\bUNION\b", query_normalized, flags=re.IGNORECASE)
-      limited_parts = []
+    if analysis.has_union:
+      # Split at UNION tokens (never inside strings or comments)
+      parts = []
+      has_return = []
+      start = 0
+      part_returns = False
+      for token in analysis.tokens:
+        if token.is_word("UNION"):
+          parts.append(query_normalized[start : token.start])
+          has_return.append(part_returns)
+          start = token.end
+          part_returns = False
+        elif token.is_word("RETURN"):
+          part_returns = True
+      parts.append(query_normalized[start:])
+      has_return.append(part_returns)
 
-      for part in parts:
+      limited_parts = []
+      for part, part_returns in zip(parts, has_return, strict=True):
         part_trimmed = part.strip()
-        if part_trimmed and "RETURN" in part_trimmed.upper():
+        if part_trimmed and part_returns:
           # Add LIMIT to this part
           limited_parts.append(self._inject_limit_to_simple_query(part_trimmed, limit))
         else:
@@ -9,6 +9,8 @@ import logging
 import re
 from dataclasses import dataclass, field
 
+from robosystems.security.cypher_parser import CypherAnalysis, parse_cypher
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,18 +42,20 @@ class GraphQueryValidator:
     "foreach": re.compile(r"\bFOREACH\b", re.IGNORECASE),
     "label_pattern": re.compile(r":(\w+)"),
     "property_pattern": re.compile(r"(\w+)\.(\w+)"),
-    "param_pattern": re.compile(r"\$(\w+)"),
-    "var_length_path": re.compile(r"\[\s*\*\s*(\d+)?\.\.(\d+)\s*\]"),
-    "generic_node": re.compile(r"MATCH\s*\(\s*\)"),
-    "metadata_queries": [
-      re.compile(r"CALL\s+show_tables", re.IGNORECASE),
-      re.compile(r"CALL\s+table_info", re.IGNORECASE),
-      re.compile(r"CALL\s+show_functions", re.IGNORECASE),
-      re.compile(r"CALL\s+current_setting", re.IGNORECASE),
-    ],
     "date_format": re.compile(r"\d{4}-\d{2}-\d{2}"),
   }
 
+  # System procedures whose queries skip validation
+  METADATA_PROCEDURES = {
+    "show_tables",
+    "table_info",
+    "show_functions",
+    "current_setting",
+  }
+
+  # Quote characters reported for unterminated literals
+  QUOTE_NAMES = {"'": "single quote", '"': "double quote", "`": "backtick"}
+
   # Neo4j to graph database function mappings
   NEO4J_FUNCTION_MAPPINGS = {
     "toInteger": "cast(value, 'INT64')",
@@ -158,13 +162,14 @@ class GraphQueryValidator:
   def validate(self, query: str, params: dict | None = None) -> ValidationResult:
     """Validate a graph database query comprehensively."""
     result = ValidationResult(is_valid=True)
+    analysis = parse_cypher(query)
 
     # Skip validation for metadata queries
-    if self._is_metadata_query(query):
+    if self._is_metadata_query(analysis):
       return result
 
     # 1. Basic syntax validation
-    syntax_errors = self._validate_basic_syntax(query)
+    syntax_errors = self._validate_basic_syntax(query, analysis)
     result.errors.extend(syntax_errors)
 
     # 2. Neo4j pattern detection and fixes
@@ -180,7 +185,7 @@ class GraphQueryValidator:
       result.warnings.extend(schema_warnings)
 
     # 4. Performance validation
-    perf_warnings, complexity = self._analyze_performance(query)
+    perf_warnings, complexity = self._analyze_performance(analysis)
     result.warnings.extend(perf_warnings)
     result.complexity_score = complexity
 
@@ -207,13 +212,11 @@ class GraphQueryValidator:
 
     return result
 
-  def _is_metadata_query(self, query: str) -> bool:
+  def _is_metadata_query(self, analysis: CypherAnalysis) -> bool:
     """Check if query is a metadata/system query."""
-    return any(
-      pattern.search(query) for pattern in self.COMPILED_PATTERNS["metadata_queries"]
-    )
+    return any(name in self.METADATA_PROCEDURES for name in analysis.procedure_calls)
 
-  def _validate_basic_syntax(self, query: str) -> list[str]:
+  def _validate_basic_syntax(self, query: str, analysis: CypherAnalysis) -> list[str]:
     """Validate basic query syntax."""
     errors = []
 
@@ -222,28 +225,27 @@ class GraphQueryValidator:
       errors.append("Query cannot be empty")
       return errors
 
-    # Check for unclosed quotes
-    single_quotes = query.count("'")
-    double_quotes = query.count('"')
-    if single_quotes % 2 != 0:
-      errors.append("Unclosed single quote detected")
-    if double_quotes % 2 != 0:
-      errors.append("Unclosed double quote detected")
+    # Check for unclosed quotes (the unterminated literal is the last token)
+    if analysis.unclosed_string:
+      quote = query[analysis.tokens[-1].start]
+      errors.append(f"Unclosed {self.QUOTE_NAMES[quote]} detected")
+
+    symbols = [
+      token.value for token in analysis.tokens if token.is_symbol("(", ")", "[", "]")
+    ]
 
     # Check for unmatched parentheses
-    open_parens = query.count("(")
-    close_parens = query.count(")")
-    if open_parens != close_parens:
+    if analysis.paren_balance != 0:
       errors.append(
-        f"Unmatched parentheses: {open_parens} opening, {close_parens} closing"
+        f"Unmatched parentheses: {symbols.count('(')} opening, "
+        f"{symbols.count(')')} closing"
       )
 
     # Check for unmatched brackets
-    open_brackets = query.count("[")
-    close_brackets = query.count("]")
-    if open_brackets != close_brackets:
+    if analysis.bracket_balance != 0:
       errors.append(
-        f"Unmatched brackets: {open_brackets} opening, {close_brackets} closing"
+        f"Unmatched brackets: {symbols.count('[')} opening, "
+        f"{symbols.count(']')} closing"
       )
 
     return errors
@@ -400,68 +402,49 @@ class GraphQueryValidator:
 
     return warnings
 
-  def _analyze_performance(self, query: str) -> tuple[list[str], int]:
+  def _analyze_performance(self, analysis: CypherAnalysis) -> tuple[list[str], int]:
     """Analyze query for performance issues."""
     warnings = []
-    complexity_score = 0
-
-    query_upper = query.upper()
 
     # 1. Missing LIMIT
-    if "RETURN" in query_upper and "LIMIT" not in query_upper:
+    if analysis.has_return and not analysis.has_limit:
       warnings.append("No LIMIT clause - query may return large result set")
-      complexity_score += 20
 
     # 2. Variable-length paths
-    var_paths = self.COMPILED_PATTERNS["var_length_path"].findall(query)
-    for lower, upper in var_paths:
-      lower_bound = int(lower) if lower else 1
-      upper_bound = int(upper)
+    for lower_bound, upper_bound in analysis.var_length_paths:
+      if upper_bound is None:
+        continue
 
       if upper_bound > 5:
         warnings.append(f"Path length up to {upper_bound} hops may be slow")
-        complexity_score += (upper_bound - 5) * 10
 
       if upper_bound - lower_bound > 10:
         warnings.append(
           f"Wide path range [{lower_bound}..{upper_bound}] may impact performance"
         )
-        complexity_score += 15
 
     # 3. Multiple MATCH without WITH
-    match_count = query_upper.count("MATCH")
-    with_count = query_upper.count("WITH")
-
-    if match_count > 2 and with_count == 0:
+    if analysis.match_count > 2 and analysis.with_count == 0:
       warnings.append(
-        f"{match_count} MATCH clauses without WITH may create cartesian product"
+        f"{analysis.match_count} MATCH clauses without WITH may create cartesian product"
       )
-      complexity_score += (match_count - 1) * 20
 
     # 4. Generic node patterns
-    generic_patterns = self.COMPILED_PATTERNS["generic_node"].findall(query)
-    if generic_patterns:
+    if analysis.has_generic_node:
       warnings.append(
         "Generic node pattern () will scan all nodes - add label for better performance"
       )
-      complexity_score += 30
 
     # 5. Multiple ORDER BY
-    order_by_count = query_upper.count("ORDER BY")
-    if order_by_count > 1:
+    if analysis.order_by_count > 1:
       warnings.append("Multiple ORDER BY clauses may impact performance")
-      complexity_score += order_by_count * 10
 
     # 6. String operations in WHERE
-    string_ops = ["CONTAINS", "STARTS WITH", "ENDS WITH", "=~"]
-    for op in string_ops:
-      if op in query_upper:
-        warnings.append(
-          f"String operation '{op}' in query may be slow on large datasets"
-        )
-        complexity_score += 10
+    for op in analysis.string_operators:
+      warnings.append(f"String operation '{op}' in query may be slow on large datasets")
 
-    return warnings, complexity_score
+    # Score uses the same rules and is computed once per distinct query
+    return warnings, analysis.complexity_score
 
   def _check_financial_best_practices(self, query: str) -> list[str]:
     """Check for SEC/financial query best practices."""
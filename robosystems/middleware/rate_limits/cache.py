@@ -1,34 +1,36 @@
 """Rate limiting cache using Valkey/Redis."""
 
-import time
 from typing import Any, cast
 
 import redis
 
 from ...config import env
-from ...config.valkey_registry import ValkeyDatabase, create_redis_client
+from ...config.valkey_registry import ValkeyDatabase, get_shared_redis_client
 from ...logger import logger
+from .gcra import RateLimitResult, gcra_rate_limiter
 
 
 class RateLimitCache:
   """Manages rate limiting using Valkey/Redis DB 7."""
 
-  # Rate limiting configuration
-  RATE_LIMIT_PREFIX = "rate_limit:"
+  # Rate limiting configuration (GCRA buckets; older sliding-window keys used
+  # "rate_limit:<identifier>" sorted sets and expire on their own)
+  RATE_LIMIT_PREFIX = "rate_limit:gcra:"
 
   def __init__(self):
     """Initialize Redis connection for rate limiting."""
     self._redis = None
     # Rate limiting configuration
     self.enabled = env.RATE_LIMIT_ENABLED
+    self.limiter = gcra_rate_limiter
 
   @property
   def redis(self) -> redis.Redis:
     """Get Redis connection, creating if needed."""
     if self._redis is None:
       try:
-        # Use the new connection factory with proper ElastiCache support
-        self._redis = create_redis_client(ValkeyDatabase.RATE_LIMITING)
+        # Use the shared connection pool with proper ElastiCache support
+        self._redis = get_shared_redis_client(ValkeyDatabase.RATE_LIMITING)
         # Test connection
         self._redis.ping()
         logger.info("Connected to Valkey/Redis for rate limiting")
@@ -41,77 +43,57 @@ class RateLimitCache:
     """Get cache key for rate limiting."""
     return f"{self.RATE_LIMIT_PREFIX}{identifier}"
 
-  def check_rate_limit(
-    self, identifier: str, limit: int, window: int
-  ) -> tuple[bool, int]:
+  def check(self, identifier: str, limit: int, window: int) -> RateLimitResult:
     """
-    Check if request is within rate limit using sliding window.
+    Check if a request is within its rate limit.
 
     Args:
         identifier: Unique identifier (e.g., user:123, ip:1.2.3.4)
-        limit: Maximum requests allowed
+        limit: Maximum requests allowed per window
         window: Time window in seconds
 
     Returns:
-        tuple[bool, int]: (allowed, remaining_requests)
+        RateLimitResult with the remaining allowance and retry/reset times
     """
     if not self.enabled:
-      return True, limit
+      return RateLimitResult.unlimited(limit)
 
     try:
-      key = self._get_rate_limit_key(identifier)
-      now = time.time()
-
-      # Use Lua script for atomic sliding window with debugging
-      lua_script = """
-      local key = KEYS[1]
-      local window = tonumber(ARGV[1])
-      local limit = tonumber(ARGV[2])
-      local now = tonumber(ARGV[3])
-
-      -- Remove expired entries
-      local removed = redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
-
-      -- Count current requests
-      local current = redis.call('ZCARD', key)
-
-      if current < limit then
-          -- Add current request with unique member to avoid duplicates
-          -- Use microsecond precision timestamp as member for uniqueness
-          local unique_member = tostring(now) .. ':' .. tostring(math.random(1000000))
-          redis.call('ZADD', key, now, unique_member)
-          redis.call('EXPIRE', key, window + 1)  -- Add 1 second buffer
-          return {1, limit - current - 1}
-      else
-          return {0, 0}
-      end
-      """
-
-      result = cast(
-        list[int],
-        self.redis.eval(lua_script, 1, key, str(window), str(limit), str(now)),
+      result = self.limiter.check(
+        self.redis, self._get_rate_limit_key(identifier), limit, window
       )
-      allowed = bool(result[0])
-      remaining = int(result[1])
-
-      if not allowed:
-        # Log with actual count for debugging
-        try:
-          actual_count = self.redis.zcard(key)
-        except Exception:
-          actual_count = "unknown"
-        logger.warning(
-          f"Rate limit exceeded for {identifier}: limit={limit}/{window}s, actual_count={actual_count}"
-        )
-      else:
-        logger.debug(f"Rate limit check passed for {identifier}: {remaining} remaining")
-
-      return allowed, remaining
-
     except Exception as e:
       logger.error(f"Rate limiting check failed for {identifier}: {e}")
       # Fail open - allow request if rate limiting is broken
-      return True, limit
+      return RateLimitResult.unlimited(limit)
+
+    if not result.allowed:
+      logger.warning(
+        f"Rate limit exceeded for {identifier}: limit={limit}/{window}s, "
+        f"retry_after={result.retry_after:.1f}s"
+      )
+    else:
+      logger.debug(
+        f"Rate limit check passed for {identifier}: {result.remaining} remaining"
+      )
+    return result
+
+  def check_rate_limit(
+    self, identifier: str, limit: int, window: int
+  ) -> tuple[bool, int]:
+    """
+    Check if request is within rate limit.
+
+    Args:
+        identifier: Unique identifier (e.g., user:123, ip:1.2.3.4)
+        limit: Maximum requests allowed
+        window: Time window in seconds
+
+    Returns:
+        tuple[bool, int]: (allowed, remaining_requests)
+    """
+    result = self.check(identifier, limit, window)
+    return result.allowed, result.remaining
 
   def get_rate_limit_stats(self) -> dict[str, Any]:
     """Get rate limiting statistics."""
@@ -144,6 +126,7 @@ class RateLimitCache:
     try:
       key = self._get_rate_limit_key(identifier)
       deleted = self.redis.delete(key)
+      self.limiter.clear_leases(key)
       logger.info(f"Cleared rate limit for {identifier}")
       return bool(deleted)
     except Exception as e:
@@ -0,0 +1,305 @@
+"""
+GCRA rate limiting backend shared by all rate limiters.
+
+The generic cell rate algorithm stores a single "theoretical arrival time"
+(TAT) per limited key instead of one sorted-set member per request, so Valkey
+memory and CPU per check stay constant regardless of request rate. A limit of
+``limit`` requests per ``window`` seconds admits bursts of up to ``limit``
+requests and refills one request every ``window / limit`` seconds.
+
+Design:
+- The script is invoked with EVALSHA; the script body is only sent when
+  Valkey answers NOSCRIPT (first use, restart or failover), after which it is
+  loaded and the call retried.
+- One call returns the decision together with the remaining allowance, the
+  time until the next request is admitted and the time until the bucket is
+  full again, so callers never need a second round trip.
+- Optionally, a process leases a small batch of requests from Valkey and
+  spends it locally, and remembers denials until they expire, so most checks
+  for a busy key never reach Valkey. Leases are short-lived, capped at a
+  fraction of the limit, and unused leased requests simply count as spent,
+  so leasing can only make a limit stricter, never looser.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, cast
+
+import redis
+import redis.asyncio as redis_async
+from redis.exceptions import NoScriptError
+
+from ...config import env
+
+# KEYS[1] = bucket key
+# ARGV = limit, period in milliseconds, requested (0 peeks without spending)
+# Returns {granted, remaining, retry_after_ms, reset_after_ms}
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local interval = period / limit
+
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+
+local available = math.floor((period - (tat - now)) / interval + 1e-6)
+if available < 0 then
+  available = 0
+end
+
+local granted = math.min(requested, available)
+if granted < 1 then
+  local retry_after = math.max(0, math.ceil(tat + interval - period - now))
+  return {0, available, retry_after, math.ceil(tat - now)}
+end
+
+tat = tat + granted * interval
+local reset_after = math.ceil(tat - now)
+redis.call('SET', KEYS[1], string.format('%.3f', tat), 'PX', reset_after)
+return {granted, available - granted, 0, reset_after}
+"""
+
+GCRA_SCRIPT_SHA = hashlib.sha1(GCRA_SCRIPT.encode("utf-8")).hexdigest()
+
+# Leases never take more than this fraction of a limit at once
+LEASE_LIMIT_FRACTION = 20
+
+
+def _run_script(
+  client: redis.Redis, key: str, limit: int, window: int, requested: int
+) -> list[int]:
+  """Run the GCRA script, loading it on NOSCRIPT."""
+  args = (key, limit, window * 1000, requested)
+  try:
+    return cast(list[int], client.evalsha(GCRA_SCRIPT_SHA, 1, *args))
+  except NoScriptError:
+    client.script_load(GCRA_SCRIPT)
+    return cast(list[int], client.evalsha(GCRA_SCRIPT_SHA, 1, *args))
+
+
+async def _run_script_async(
+  client: redis_async.Redis, key: str, limit: int, window: int, requested: int
+) -> list[int]:
+  """Run the GCRA script from async code, loading it on NOSCRIPT."""
+  args = (key, limit, window * 1000, requested)
+  try:
+    return cast(list[int], await client.evalsha(GCRA_SCRIPT_SHA, 1, *args))
+  except NoScriptError:
+    await client.script_load(GCRA_SCRIPT)
+    return cast(list[int], await client.evalsha(GCRA_SCRIPT_SHA, 1, *args))
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+  """Outcome of a rate limit check."""
+
+  allowed: bool
+  limit: int
+  remaining: int
+  # Seconds until the next request would be admitted (0 when allowed)
+  retry_after: float
+  # Seconds until the full allowance is available again
+  reset_after: float
+
+  @classmethod
+  def unlimited(cls, limit: int) -> "RateLimitResult":
+    """Result for a check that was skipped (disabled or failing open)."""
+    return cls(allowed=True, limit=limit, remaining=limit, retry_after=0, reset_after=0)
+
+
+@dataclass
+class _Lease:
+  """Requests granted by Valkey that this process may still spend."""
+
+  tokens: int
+  # Valkey's remaining allowance when the lease was granted
+  remaining: int
+  retry_at: float
+  reset_at: float
+  expires_at: float
+
+
+class GCRARateLimiter:
+  """GCRA rate limiter on Valkey with optional in-process leases."""
+
+  def __init__(
+    self,
+    lease_size: int | None = None,
+    lease_ttl: float | None = None,
+    max_leases: int = 10000,
+  ):
+    self.lease_size = (
+      lease_size if lease_size is not None else env.RATE_LIMIT_LOCAL_LEASE_SIZE
+    )
+    self.lease_ttl = (
+      lease_ttl if lease_ttl is not None else env.RATE_LIMIT_LOCAL_LEASE_TTL
+    )
+    self.max_leases = max_leases
+
+    # (key, limit, window) -> lease; a lease with no tokens is a cached denial
+    self._leases: OrderedDict[tuple[str, int, int], _Lease] = OrderedDict()
+    self._lock = threading.Lock()
+    self._pid = os.getpid()
+
+  @property
+  def leasing(self) -> bool:
+    """Whether checks may be answered from in-process leases."""
+    return self.lease_size > 1 and self.lease_ttl > 0
+
+  def _request_size(self, limit: int) -> int:
+    if not self.leasing:
+      return 1
+    return max(1, min(self.lease_size, limit // LEASE_LIMIT_FRACTION))
+
+  def _take_lease(self, lease_key: tuple[str, int, int]) -> RateLimitResult | None:
+    """Answer a check from a local lease, if one is live."""
+    now = time.monotonic()
+    with self._lock:
+      if self._pid != os.getpid():
+        # Forked worker: the parent's leases belong to the parent
+        self._pid = os.getpid()
+        self._leases.clear()
+        return None
+
+      lease = self._leases.get(lease_key)
+      if lease is None:
+        return None
+      if lease.expires_at <= now:
+        del self._leases[lease_key]
+        return None
+
+      limit = lease_key[1]
+      if lease.tokens == 0:
+        return RateLimitResult(
+          allowed=False,
+          limit=limit,
+          remaining=0,
+          retry_after=max(0.0, lease.retry_at - now),
+          reset_after=max(0.0, lease.reset_at - now),
+        )
+
+      lease.tokens -= 1
+      remaining = lease.remaining + lease.tokens
+      if lease.tokens == 0:
+        del self._leases[lease_key]
+
+    return RateLimitResult(
+      allowed=True,
+      limit=limit,
+      remaining=remaining,
+      retry_after=0,
+      reset_after=max(0.0, lease.reset_at - now),
+    )
+
+  def _record(
+    self, lease_key: tuple[str, int, int], reply: list[Any]
+  ) -> RateLimitResult:
+    """Turn a script reply into a result, keeping any surplus as a lease."""
+    granted, remaining, retry_ms, reset_ms = (int(value) for value in reply)
+    limit = lease_key[1]
+    retry_after = retry_ms / 1000
+    reset_after = reset_ms / 1000
+    surplus = max(0, granted - 1)
+
+    if self.leasing and (surplus or not granted):
+      now = time.monotonic()
+      expires_at = now + self.lease_ttl
+      if not granted:
+        # Nothing changes for this key until the next request is admitted
+        expires_at = min(expires_at, now + retry_after)
+      with self._lock:
+        self._leases[lease_key] = _Lease(
+          tokens=surplus,
+          remaining=remaining,
+          retry_at=now + retry_after,
+          reset_at=now + reset_after,
+          expires_at=expires_at,
+        )
+        self._leases.move_to_end(lease_key)
+        while len(self._leases) > self.max_leases:
+          self._leases.popitem(last=False)
+
+    return RateLimitResult(
+      allowed=granted > 0,
+      limit=limit,
+      remaining=remaining + surplus,
+      retry_after=retry_after,
+      reset_after=reset_after,
+    )
+
+  def check(
+    self, client: redis.Redis, key: str, limit: int, window: int
+  ) -> RateLimitResult:
+    """
+    Spend one request from a key's allowance.
+
+    Args:
+        client: Valkey client holding the bucket
+        key: Bucket key
+        limit: Requests allowed per window
+        window: Window in seconds
+
+    Returns:
+        RateLimitResult for this request
+    """
+    lease_key = (key, limit, window)
+    if self.leasing:
+      leased = self._take_lease(lease_key)
+      if leased is not None:
+        return leased
+
+    reply = _run_script(client, key, limit, window, self._request_size(limit))
+    return self._record(lease_key, reply)
+
+  async def check_async(
+    self, client: redis_async.Redis, key: str, limit: int, window: int
+  ) -> RateLimitResult:
+    """Spend one request from a key's allowance from async code."""
+    lease_key = (key, limit, window)
+    if self.leasing:
+      leased = self._take_lease(lease_key)
+      if leased is not None:
+        return leased
+
+    reply = await _run_script_async(
+      client, key, limit, window, self._request_size(limit)
+    )
+    return self._record(lease_key, reply)
+
+  async def peek_async(
+    self, client: redis_async.Redis, key: str, limit: int, window: int
+  ) -> RateLimitResult:
+    """Read a key's allowance without spending any of it."""
+    _, remaining, retry_ms, reset_ms = (
+      int(value) for value in await _run_script_async(client, key, limit, window, 0)
+    )
+    return RateLimitResult(
+      allowed=remaining > 0,
+      limit=limit,
+      remaining=remaining,
+      retry_after=retry_ms / 1000,
+      reset_after=reset_ms / 1000,
+    )
+
+  def clear_leases(self, key: str | None = None) -> None:
+    """Drop in-process leases and denials for a key, or for every key."""
+    with self._lock:
+      if key is None:
+        self._leases.clear()
+        return
+      for lease_key in [k for k in self._leases if k[0] == key]:
+        del self._leases[lease_key]
+
+
+# Shared so leases outlive the per-request limiter objects that use them
+gcra_rate_limiter = GCRARateLimiter()
@@ -9,6 +9,7 @@ Rate limits are applied to prevent abuse and ensure fair usage across tiers.
 No credits are consumed for any query operations.
 """
 
+import math
 from datetime import UTC, datetime
 from enum import Enum
 
@@ -17,6 +18,10 @@ import redis.asyncio as redis
 from robosystems.config import RepositoryBillingConfig, SharedRepository
 from robosystems.config.billing.repositories import RepositoryPlan
 from robosystems.config.rate_limits import EndpointCategory, RateLimitConfig
+from robosystems.middleware.rate_limits.gcra import (
+  GCRARateLimiter,
+  gcra_rate_limiter,
+)
 
 
 class AllowedSharedEndpoints(str, Enum):
@@ -29,6 +34,13 @@ class AllowedSharedEndpoints(str, Enum):
   STATUS = "status"  # Status checks
 
 
+# Repository volume windows: (name, key suffix, seconds)
+REPOSITORY_LIMIT_WINDOWS = [
+  ("minute", "min", 60),
+  ("hour", "hour", 3600),
+  ("day", "day", 86400),
+]
+
 # Endpoints that are BLOCKED for shared repositories
 BLOCKED_SHARED_ENDPOINTS = [
   "backup",  # No backups of shared data
@@ -82,8 +94,9 @@ class DualLayerRateLimiter:
   2. Repository limits (new) - subscription-based volume control
   """
 
-  def __init__(self, redis_client: redis.Redis):
+  def __init__(self, redis_client: redis.Redis, limiter: GCRARateLimiter | None = None):
     self.redis = redis_client
+    self.limiter = limiter or gcra_rate_limiter
 
   async def check_limits(
     self,
@@ -169,27 +182,18 @@ class DualLayerRateLimiter:
 
     limit, window = limit_config
 
-    # Use sliding window counter
+    key = f"burst:gcra:{user_id}:{operation}"
+    result = await self.limiter.check_async(self.redis, key, limit, window)
     now = int(datetime.now(UTC).timestamp())
-    window_start = now - window
-    key = f"burst:{user_id}:{operation}"
-
-    # Remove old entries and count current window
-    pipe = self.redis.pipeline()
-    pipe.zremrangebyscore(key, 0, window_start)
-    pipe.zadd(key, {str(now): now})
-    pipe.zcount(key, window_start, now)
-    pipe.expire(key, window)
-    results = await pipe.execute()
-
-    count = results[2]
 
     return {
-      "allowed": count <= limit,
+      "allowed": result.allowed,
       "limit": limit,
-      "current": count,
+      "current": limit - result.remaining,
+      "remaining": result.remaining,
       "window": window,
-      "reset_at": now + window,
+      "retry_after": math.ceil(result.retry_after),
+      "reset_at": now + math.ceil(result.reset_after),
     }
 
   async def _check_repository_limit(
@@ -201,79 +205,52 @@ class DualLayerRateLimiter:
     if not limits:
       return {"allowed": False, "message": "No access to repository"}
 
-    # Map operation to limit keys
-    operation_keys = {"query": "queries", "mcp": "mcp_queries", "agent": "agent_calls"}
-
-    base_key = operation_keys.get(operation, "queries")
+    base_key = self._operation_to_limit_key(operation)
 
     # Check different time windows
     checks = []
-    now = datetime.now(UTC)
-
-    # Check minute limit
-    minute_limit_key = f"{base_key}_per_minute"
-    if minute_limit_key in limits:
-      limit = limits[minute_limit_key]
-      if limit != -1:  # -1 means unlimited
-        key = (
-          f"repo:{repository}:{user_id}:{operation}:min:{now.strftime('%Y%m%d%H%M')}"
-        )
-        count = await self.redis.incr(key)
-        if count == 1:
-          await self.redis.expire(key, 60)
-
-        if count > limit:
-          return {
-            "allowed": False,
-            "window": "minute",
-            "limit": limit,
-            "current": count,
-            "reset_in": 60,
-          }
-        checks.append({"window": "minute", "limit": limit, "current": count})
-
-    # Check hour limit
-    hour_limit_key = f"{base_key}_per_hour"
-    if hour_limit_key in limits:
-      limit = limits[hour_limit_key]
-      if limit != -1:
-        key = f"repo:{repository}:{user_id}:{operation}:hour:{now.strftime('%Y%m%d%H')}"
-        count = await self.redis.incr(key)
-        if count == 1:
-          await self.redis.expire(key, 3600)
-
-        if count > limit:
-          return {
-            "allowed": False,
-            "window": "hour",
-            "limit": limit,
-            "current": count,
-            "reset_in": 3600,
-          }
-        checks.append({"window": "hour", "limit": limit, "current": count})
-
-    # Check day limit
-    day_limit_key = f"{base_key}_per_day"
-    if day_limit_key in limits:
-      limit = limits[day_limit_key]
-      if limit != -1:
-        key = f"repo:{repository}:{user_id}:{operation}:day:{now.strftime('%Y%m%d')}"
-        count = await self.redis.incr(key)
-        if count == 1:
-          await self.redis.expire(key, 86400)
-
-        if count > limit:
-          return {
-            "allowed": False,
-            "window": "day",
-            "limit": limit,
-            "current": count,
-            "reset_in": 86400,
-          }
-        checks.append({"window": "day", "limit": limit, "current": count})
+    for window, suffix, seconds in REPOSITORY_LIMIT_WINDOWS:
+      limit = limits.get(f"{base_key}_per_{window}")
+      if limit is None or limit == -1:  # -1 means unlimited
+        continue
+
+      key = self._repository_key(repository, user_id, operation, suffix)
+      result = await self.limiter.check_async(self.redis, key, limit, seconds)
+      current = limit - result.remaining
+
+      if not result.allowed:
+        return {
+          "allowed": False,
+          "window": window,
+          "limit": limit,
+          "current": current,
+          "remaining": 0,
+          "retry_after": math.ceil(result.retry_after),
+          "reset_in": math.ceil(result.reset_after),
+        }
+      checks.append(
+        {
+          "window": window,
+          "limit": limit,
+          "current": current,
+          "remaining": result.remaining,
+        }
+      )
 
     return {"allowed": True, "checks": checks}
 
+  @staticmethod
+  def _repository_key(
+    repository: str, user_id: str, operation: str, suffix: str
+  ) -> str:
+    return f"repo:gcra:{repository}:{user_id}:{operation}:{suffix}"
+
+  @staticmethod
+  def _operation_to_limit_key(operation: str) -> str:
+    """Map operation to the prefix of its repository limit keys."""
+    operation_keys = {"query": "queries", "mcp": "mcp_queries", "agent": "agent_calls"}
+    return operation_keys.get(operation, "queries")
+
   def _is_shared_repository(self, graph_id: str) -> bool:
     """Check if this is a shared repository."""
     return graph_id in [repo.value for repo in SharedRepository]
@@ -295,24 +272,22 @@ class DualLayerRateLimiter:
     if not limits:
       return {}
 
-    now = datetime.now(UTC)
     stats = {}
 
     # Get current usage for each operation type
     for operation in ["query", "mcp", "agent"]:
+      base_key = self._operation_to_limit_key(operation)
       operation_stats = {}
 
-      # Check each time window
-      for window, fmt in [
-        ("minute", "%Y%m%d%H%M"),
-        ("hour", "%Y%m%d%H"),
-        ("day", "%Y%m%d"),
-      ]:
-        key = (
-          f"repo:{repository}:{user_id}:{operation}:{window[:3]}:{now.strftime(fmt)}"
-        )
-        count = await self.redis.get(key)
-        operation_stats[window] = int(count) if count else 0
+      # Check each time window without spending from it
+      for window, suffix, seconds in REPOSITORY_LIMIT_WINDOWS:
+        limit = limits.get(f"{base_key}_per_{window}")
+        if limit is None or limit == -1:
+          operation_stats[window] = 0
+          continue
+        key = self._repository_key(repository, user_id, operation, suffix)
+        result = await self.limiter.peek_async(self.redis, key, limit, seconds)
+        operation_stats[window] = limit - result.remaining
 
       stats[operation] = operation_stats
 
@@ -3,8 +3,16 @@ Redis-based event storage for Server-Sent Events operations.
 
 This module provides persistent event storage with TTL cleanup for SSE operations,
 enabling event replay for late connections and reliable operation monitoring.
+
+Storing an event is a single server-side script call (EVALSHA, with the script
+body only sent on NOSCRIPT) that checks the operation, assigns the sequence
+number, appends the event for replay, publishes it and refreshes the
+operation's ``updated_at``. The event payload is serialized once; the script
+splices in the sequence number. Lifecycle events (started, completed, error,
+cancelled) additionally rewrite the operation metadata.
 """
 
+import hashlib
 import json
 import uuid
 from dataclasses import asdict, dataclass
@@ -14,6 +22,7 @@ from typing import Any, cast
 
 import redis.asyncio as redis_async
 from redis import Redis
+from redis.exceptions import NoScriptError
 
 from robosystems.logger import logger
 
@@ -115,6 +124,56 @@ class OperationMetadata:
     return asdict(self)
 
 
+# Events that change operation status and therefore rewrite its metadata
+LIFECYCLE_EVENT_TYPES = frozenset(
+  {
+    EventType.OPERATION_STARTED,
+    EventType.OPERATION_COMPLETED,
+    EventType.OPERATION_ERROR,
+    EventType.OPERATION_CANCELLED,
+  }
+)
+
+# KEYS = metadata, sequence, events
+# ARGV = event JSON without its closing brace, ttl, pub/sub channel,
+#        "1" to reject events for unknown operations,
+#        updated_at to refresh on the metadata ("" leaves it to the caller)
+# Background (sync) events also renew the metadata TTL, so operations that run
+# longer than the TTL keep their metadata while they report progress.
+# Returns {sequence_number, metadata_found}, or -1 if the operation is unknown
+STORE_EVENT_SCRIPT = """
+local metadata = redis.call('GET', KEYS[1])
+if not metadata and ARGV[4] == '1' then
+  return -1
+end
+
+local ttl = tonumber(ARGV[2])
+local sequence = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ttl)
+
+local event = ARGV[1] .. ', "sequence_number": ' .. sequence .. '}'
+redis.call('ZADD', KEYS[3], sequence, event)
+redis.call('EXPIRE', KEYS[3], ttl)
+redis.call('PUBLISH', ARGV[3], event)
+
+if metadata and ARGV[5] ~= '' then
+  -- First match is the top-level field; nested keys come after it
+  metadata = string.gsub(
+    metadata, '"updated_at": "[^"]*"', '"updated_at": "' .. ARGV[5] .. '"', 1
+  )
+  if ARGV[4] == '1' then
+    redis.call('SET', KEYS[1], metadata, 'KEEPTTL')
+  else
+    redis.call('SET', KEYS[1], metadata, 'EX', ttl)
+  end
+end
+
+return {sequence, metadata and 1 or 0}
+"""
+
+STORE_EVENT_SCRIPT_SHA = hashlib.sha1(STORE_EVENT_SCRIPT.encode("utf-8")).hexdigest()
+
+
 class SSEEventStorage:
   """
   Redis-based storage for SSE events with automatic TTL cleanup.
@@ -156,11 +215,11 @@ class SSEEventStorage:
     """Get default async Redis client from environment."""
     from robosystems.config.valkey_registry import (
       ValkeyDatabase,
-      create_async_redis_client,
+      get_shared_async_redis_client,
     )
 
-    # Use SSE events database from registry with proper ElastiCache support
-    client = create_async_redis_client(ValkeyDatabase.SSE_EVENTS)
+    # Use the shared SSE events pool from registry with proper ElastiCache support
+    client = get_shared_async_redis_client(ValkeyDatabase.SSE_EVENTS)
     # Test connection
     await client.ping()
     return client
@@ -168,10 +227,13 @@ class SSEEventStorage:
   def _get_sync_redis(self) -> Redis:
     """Get synchronous Redis client for background tasks."""
     if self._sync_redis is None:
-      from robosystems.config.valkey_registry import ValkeyDatabase, create_redis_client
+      from robosystems.config.valkey_registry import (
+        ValkeyDatabase,
+        get_shared_redis_client,
+      )
 
-      # Use SSE events database from registry with proper ElastiCache support
-      self._sync_redis = create_redis_client(ValkeyDatabase.SSE_EVENTS)
+      # Use the shared SSE events pool from registry with proper ElastiCache support
+      self._sync_redis = get_shared_redis_client(ValkeyDatabase.SSE_EVENTS)
       # Test connection
       self._sync_redis.ping()
     return self._sync_redis
@@ -233,6 +295,44 @@ class SSEEventStorage:
 
     return operation_id
 
+  def _prepare_event(
+    self,
+    operation_id: str,
+    event_type: EventType,
+    data: dict[str, Any],
+    ttl: int | None,
+    require_operation: bool,
+  ) -> tuple[str, list[str], list[Any]]:
+    """
+    Build the store script call for an event.
+
+    Returns:
+        (timestamp, keys, args) for STORE_EVENT_SCRIPT
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    # Serialized once; the script appends the sequence number and closing brace
+    payload = json.dumps(
+      {
+        "event_type": event_type,
+        "operation_id": operation_id,
+        "timestamp": timestamp,
+        "data": data,
+      }
+    )
+    keys = [
+      f"{self.metadata_prefix}{operation_id}",
+      f"{self.sequence_prefix}{operation_id}",
+      f"{self.event_prefix}{operation_id}",
+    ]
+    args = [
+      payload[:-1],
+      ttl or self.default_ttl,
+      f"sse:events:{operation_id}",
+      "1" if require_operation else "0",
+      "" if event_type in LIFECYCLE_EVENT_TYPES else timestamp,
+    ]
+    return timestamp, keys, args
+
   async def store_event(
     self,
     operation_id: str,
@@ -255,48 +355,36 @@ class SSEEventStorage:
     Raises:
         ValueError: If operation doesn't exist
     """
-    ttl = ttl or self.default_ttl
-
-    # Check if operation exists
     redis = await self._get_redis()
-    metadata_key = f"{self.metadata_prefix}{operation_id}"
-    if not await redis.exists(metadata_key):
+    timestamp, keys, args = self._prepare_event(
+      operation_id, event_type, data, ttl, require_operation=True
+    )
+    try:
+      reply = await redis.evalsha(STORE_EVENT_SCRIPT_SHA, len(keys), *keys, *args)
+    except NoScriptError:
+      await redis.script_load(STORE_EVENT_SCRIPT)
+      reply = await redis.evalsha(STORE_EVENT_SCRIPT_SHA, len(keys), *keys, *args)
+
+    if reply == -1:
       raise ValueError(f"Operation {operation_id} not found")
+    sequence_number = int(reply[0])
 
-    # Get and increment sequence number
-    seq_key = f"{self.sequence_prefix}{operation_id}"
-    sequence_number = await redis.incr(seq_key)
+    if event_type in LIFECYCLE_EVENT_TYPES:
+      await self._update_operation_metadata(operation_id, event_type, data)
+
+    logger.debug(
+      f"Stored event {event_type} for operation {operation_id} "
+      f"(seq: {sequence_number}), published to {args[2]}"
+    )
 
-    # Create event
-    event = SSEEvent(
+    return SSEEvent(
       event_type=event_type,
       operation_id=operation_id,
-      timestamp=datetime.now(UTC).isoformat(),
+      timestamp=timestamp,
       data=data,
       sequence_number=sequence_number,
     )
 
-    # Store event in a sorted set by sequence number
-    events_key = f"{self.event_prefix}{operation_id}"
-    await redis.zadd(events_key, {json.dumps(event.to_dict()): sequence_number})
-
-    # Set TTL on events set
-    await redis.expire(events_key, ttl)
-
-    # Publish event to Redis pub/sub channel for real-time notifications
-    # This allows the API process to receive events from worker processes
-    channel = f"sse:events:{operation_id}"
-    await redis.publish(channel, json.dumps(event.to_dict()))
-
-    # Update operation metadata timestamp and possibly status
-    await self._update_operation_metadata(operation_id, event_type, data)
-
-    logger.debug(
-      f"Stored event {event_type} for operation {operation_id} (seq: {sequence_number}), published to {channel}"
-    )
-
-    return event
-
   def store_event_sync(
     self,
     operation_id: str,
@@ -307,6 +395,9 @@ class SSEEventStorage:
     """
     Synchronous version of store_event for use in background tasks.
 
+    Unlike store_event, an event for an unknown operation is still stored and
+    minimal operation metadata is created for it.
+
     Args:
         operation_id: Operation identifier
         event_type: Type of event
@@ -315,55 +406,40 @@ class SSEEventStorage:
 
     Returns:
         SSEEvent: The stored event
-
-    Raises:
-        ValueError: If operation doesn't exist
     """
-    ttl = ttl or self.default_ttl
-
-    # Check if operation exists
     redis = self._get_sync_redis()
-    metadata_key = f"{self.metadata_prefix}{operation_id}"
-    if not redis.exists(metadata_key):
+    timestamp, keys, args = self._prepare_event(
+      operation_id, event_type, data, ttl, require_operation=False
+    )
+    try:
+      reply = redis.evalsha(STORE_EVENT_SCRIPT_SHA, len(keys), *keys, *args)
+    except NoScriptError:
+      redis.script_load(STORE_EVENT_SCRIPT)
+      reply = redis.evalsha(STORE_EVENT_SCRIPT_SHA, len(keys), *keys, *args)
+
+    sequence_number, metadata_found = (int(value) for value in cast(list, reply))
+    if not metadata_found:
       # For sync context, we might not have the operation created yet
-      # Just log and continue
       logger.warning(
         f"Operation {operation_id} not found in metadata, continuing anyway"
       )
 
-    # Get and increment sequence number
-    seq_key = f"{self.sequence_prefix}{operation_id}"
-    sequence_number = cast(int, redis.incr(seq_key))
+    if event_type in LIFECYCLE_EVENT_TYPES or not metadata_found:
+      self._update_operation_metadata_sync(operation_id, event_type, data)
 
-    # Create event
-    event = SSEEvent(
+    logger.debug(
+      f"[SYNC] Stored event {event_type} for operation {operation_id} "
+      f"(seq: {sequence_number}), published to {args[2]}"
+    )
+
+    return SSEEvent(
       event_type=event_type,
       operation_id=operation_id,
-      timestamp=datetime.now(UTC).isoformat(),
+      timestamp=timestamp,
       data=data,
       sequence_number=sequence_number,
     )
 
-    # Store event in a sorted set by sequence number
-    events_key = f"{self.event_prefix}{operation_id}"
-    redis.zadd(events_key, {json.dumps(event.to_dict()): sequence_number})
-
-    # Set TTL on events set
-    redis.expire(events_key, ttl)
-
-    # Publish event to Redis pub/sub channel for real-time notifications
-    channel = f"sse:events:{operation_id}"
-    redis.publish(channel, json.dumps(event.to_dict()))
-
-    # For sync version, update metadata directly
-    self._update_operation_metadata_sync(operation_id, event_type, data)
-
-    logger.debug(
-      f"[SYNC] Stored event {event_type} for operation {operation_id} (seq: {sequence_number}), published to {channel}"
-    )
-
-    return event
-
   def _update_operation_metadata_sync(
     self, operation_id: str, event_type: EventType, data: dict[str, Any]
   ):
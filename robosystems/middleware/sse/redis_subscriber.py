@@ -40,7 +40,8 @@ class RedisEventSubscriber:
 
     logger.info("Starting Redis SSE event subscriber")
 
-    # Create Redis client for pub/sub with proper ElastiCache support
+    # Pub/sub holds its connection for the subscriber's lifetime, so it gets a
+    # dedicated client instead of a slot in the bounded shared pool
     self.redis_client = create_async_redis_client(ValkeyDatabase.SSE_EVENTS)
     self.pubsub = self.redis_client.pubsub()
 
@@ -60,7 +61,8 @@ class RedisEventSubscriber:
       await self.pubsub.close()
 
     if self.redis_client:
-      await self.redis_client.close()
+      await self.redis_client.aclose()
+      self.redis_client = None
 
     if self._task:
       self._task.cancel()
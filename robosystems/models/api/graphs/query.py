@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
-# Import secure write operation detection
+from robosystems.security.cypher_parser import parse_cypher
 
 # Neo4j to LadybugDB query translation patterns
 NEO4J_DB_COMMANDS = re.compile(
@@ -39,6 +39,10 @@ def translate_neo4j_to_lbug(query: str) -> str:
   Returns:
       Translated query compatible with LadybugDB
   """
+  # Fast path: the cached analysis already knows which procedures are called
+  if not any(name.startswith("db.") for name in parse_cypher(query).procedure_calls):
+    return query
+
   # Check if query contains Neo4j db.* commands
   match = NEO4J_DB_COMMANDS.search(query)
   if not match:
@@ -224,6 +228,9 @@ class CypherQueryResponse(BaseModel):
   graph_id: str = Field(..., description="Graph database identifier")
   timestamp: str = Field(..., description="Query execution timestamp")
   error: str | None = Field(default=None, description="Error message if query failed")
+  cached: bool = Field(
+    default=False, description="Whether the result was served from the query cache"
+  )
 
   class Config:
     json_schema_extra = {
@@ -7,7 +7,7 @@ Access Control Model:
 - Roles: admin (full control), member (read/write), viewer (read-only)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
 from typing import Optional
 
@@ -19,13 +19,19 @@ from sqlalchemy import (
   Index,
   String,
   UniqueConstraint,
+  event,
+  inspect,
 )
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.orm import Session, object_session, relationship
 
 from ...database import Model
+from ...logger import logger
 from ...utils.ulid import generate_prefixed_ulid
 
+# Session.info key collecting users whose graph memberships changed
+_MEMBERSHIP_CHANGES_KEY = "graph_membership_changes"
+
 
 class GraphUser(Model):
   """GraphUser model for managing user access to graph databases."""
@@ -165,6 +171,19 @@ class GraphUser(Model):
       is not None
     )
 
+  @staticmethod
+  def has_access_in(graph_roles: Mapping[str, str], graph_id: str) -> bool:
+    """
+    Check a user's graph roles for access to a specific graph.
+
+    Same rules as ``user_has_access``, against roles already loaded with
+    ``User.get_with_graph_roles_async``.
+    """
+    from ...middleware.graph.types import parse_graph_id
+
+    parent_id, _ = parse_graph_id(graph_id)
+    return parent_id in graph_roles
+
   @classmethod
   def user_has_admin_access(cls, user_id: str, graph_id: str, session: Session) -> bool:
     """
@@ -206,3 +225,63 @@ class GraphUser(Model):
     except SQLAlchemyError:
       session.rollback()
       raise
+
+
+def _invalidate_graph_access(changes: Iterable[tuple[str, str]]) -> None:
+  """Drop cached graph access for changed memberships in every worker."""
+  try:
+    # Dynamically import only when needed to avoid circular dependency
+    import importlib
+
+    cache_module = importlib.import_module("robosystems.middleware.auth.cache")
+    if cache_module.api_key_cache is None:
+      return
+    for user_id, graph_id in changes:
+      cache_module.api_key_cache.invalidate_graph_membership(user_id, graph_id)
+  except Exception as e:
+    logger.error(f"Failed to invalidate graph access cache: {e}")
+
+
+def _record_membership_change(
+  target: GraphUser, user_id: str | None = None, graph_id: str | None = None
+) -> None:
+  session = object_session(target)
+  if session is not None:
+    session.info.setdefault(_MEMBERSHIP_CHANGES_KEY, set()).add(
+      (user_id or target.user_id, graph_id or target.graph_id)
+    )
+
+
+@event.listens_for(GraphUser, "after_insert")
+@event.listens_for(GraphUser, "after_delete")
+def _on_membership_added_or_removed(mapper, connection, target: GraphUser) -> None:
+  _record_membership_change(target)
+
+
+@event.listens_for(GraphUser, "after_update")
+def _on_membership_updated(mapper, connection, target: GraphUser) -> None:
+  state = inspect(target)
+  if not any(
+    state.attrs[name].history.has_changes() for name in ("user_id", "graph_id", "role")
+  ):
+    # Selecting a graph does not change access
+    return
+
+  _record_membership_change(target)
+  # A moved membership also revokes access for its previous user or graph
+  for old_user_id in state.attrs.user_id.history.deleted or ():
+    _record_membership_change(target, user_id=old_user_id)
+  for old_graph_id in state.attrs.graph_id.history.deleted or ():
+    _record_membership_change(target, graph_id=old_graph_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_membership_changes(session: Session) -> None:
+  changes = session.info.pop(_MEMBERSHIP_CHANGES_KEY, None)
+  if changes:
+    _invalidate_graph_access(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_membership_changes(session: Session) -> None:
+  session.info.pop(_MEMBERSHIP_CHANGES_KEY, None)
@@ -4,11 +4,13 @@ from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, String, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, relationship
 
 from ...database import Model
+from ...logger import logger
 from ...utils.ulid import generate_prefixed_ulid
 
 
@@ -54,6 +56,37 @@ class User(Model):
     """Get a user by ID."""
     return session.query(cls).filter(cls.id == user_id).first()
 
+  @classmethod
+  async def get_by_id_async(
+    cls, user_id: str, session: AsyncSession
+  ) -> Optional["User"]:
+    """Get a user by ID on an async session."""
+    result = await session.execute(select(cls).where(cls.id == user_id))
+    return result.scalars().first()
+
+  @classmethod
+  async def get_with_graph_roles_async(
+    cls, user_id: str, session: AsyncSession
+  ) -> tuple[Optional["User"], dict[str, str]]:
+    """
+    Get a user and their graph roles in a single query.
+
+    Returns:
+        The user (or None) and a mapping of graph ID to role for every graph
+        the user has been granted access to
+    """
+    from .graph_user import GraphUser
+
+    result = await session.execute(
+      select(cls, GraphUser.graph_id, GraphUser.role)
+      .outerjoin(GraphUser, GraphUser.user_id == cls.id)
+      .where(cls.id == user_id)
+    )
+    rows = result.all()
+    if not rows:
+      return None, {}
+    return rows[0][0], {graph_id: role for _, graph_id, role in rows if graph_id}
+
   @classmethod
   def get_by_email(cls, email: str, session: Session) -> Optional["User"]:
     """Get a user by email (case-insensitive).
@@ -115,6 +148,7 @@ class User(Model):
     except SQLAlchemyError:
       session.rollback()
       raise
+    self._invalidate_auth_cache()
 
   def verify_email(self, session: Session) -> None:
     """Mark user's email as verified."""
@@ -137,6 +171,7 @@ class User(Model):
     except SQLAlchemyError:
       session.rollback()
       raise
+    self._invalidate_auth_cache()
 
   def activate(self, session: Session) -> None:
     """Activate the user."""
@@ -148,3 +183,16 @@ class User(Model):
     except SQLAlchemyError:
       session.rollback()
       raise
+    self._invalidate_auth_cache()
+
+  def _invalidate_auth_cache(self) -> None:
+    """Drop cached API key and JWT validations for this user in every worker."""
+    try:
+      # Dynamically import only when needed to avoid circular dependency
+      import importlib
+
+      cache_module = importlib.import_module("robosystems.middleware.auth.cache")
+      if cache_module.api_key_cache is not None:
+        cache_module.api_key_cache.invalidate_user_data(str(self.id))
+    except Exception as e:
+      logger.error(f"Failed to invalidate auth cache for user {self.id}: {e}")
@@ -13,6 +13,13 @@ from sqlalchemy.orm import Session, relationship
 from ...database import Model
 from ...logger import logger
 from ...security import SecurityAuditLogger, SecurityEventType
+from ...security.api_key_hashing import (
+  api_key_verifier,
+  hmac_hash_api_key,
+  hmac_hashing_enabled,
+  needs_rehash,
+  verify_api_key_hash,
+)
 from ...utils.ulid import generate_prefixed_ulid
 
 
@@ -26,7 +33,7 @@ class UserAPIKey(Model):
   name = Column(String, nullable=False)  # User-friendly name for the key
   key_hash = Column(
     String, nullable=False, unique=True, index=True
-  )  # bcrypt hashed API key
+  )  # bcrypt (or peppered HMAC-SHA256) hashed API key
   prefix = Column(
     String, nullable=False, index=True
   )  # First few chars for identification
@@ -127,8 +134,42 @@ class UserAPIKey(Model):
   @classmethod
   def get_by_key(cls, plain_key: str, session: Session) -> Optional["UserAPIKey"]:
     """
-    Get a user API key by its plain text value using secure bcrypt verification.
+    Get a user API key by its plain text value using secure hash verification.
+
+    bcrypt checks run on the bounded verifier pool; the calling thread waits.
+    """
+    potential_keys = cls._find_candidates(plain_key, session)
+    if potential_keys is None:
+      return None
+
+    match = api_key_verifier.verify(
+      plain_key, [str(api_key.key_hash) for api_key in potential_keys]
+    )
+    return cls._complete_verification(plain_key, potential_keys, match, session)
+
+  @classmethod
+  async def get_by_key_async(
+    cls, plain_key: str, session: Session
+  ) -> Optional["UserAPIKey"]:
+    """
+    Get a user API key by its plain text value without blocking the event loop.
+
+    Concurrent lookups of the same key share a single hash verification.
     """
+    potential_keys = cls._find_candidates(plain_key, session)
+    if potential_keys is None:
+      return None
+
+    match = await api_key_verifier.verify_async(
+      plain_key, [str(api_key.key_hash) for api_key in potential_keys]
+    )
+    return cls._complete_verification(plain_key, potential_keys, match, session)
+
+  @classmethod
+  def _find_candidates(
+    cls, plain_key: str, session: Session
+  ) -> list["UserAPIKey"] | None:
+    """Active keys that may match a plain key, or None if the key is malformed."""
     if not plain_key or not isinstance(plain_key, str):
       SecurityAuditLogger.log_input_validation_failure(
         field_name="api_key",
@@ -137,34 +178,62 @@ class UserAPIKey(Model):
       )
       return None
 
+    # HMAC hashes are deterministic, so look the key up directly first
+    if hmac_hashing_enabled():
+      api_key = (
+        session.query(cls)
+        .filter(cls.key_hash == hmac_hash_api_key(plain_key), cls.is_active)
+        .first()
+      )
+      if api_key is not None:
+        return [api_key]
+
     # Get all active API keys with matching prefix for efficiency
     prefix = plain_key[:8] if len(plain_key) >= 8 else plain_key
-    potential_keys = (
-      session.query(cls).filter(cls.prefix == prefix, cls.is_active).all()
-    )
+    return session.query(cls).filter(cls.prefix == prefix, cls.is_active).all()
 
-    for api_key in potential_keys:
+  @classmethod
+  def _complete_verification(
+    cls,
+    plain_key: str,
+    potential_keys: list["UserAPIKey"],
+    match: int | None,
+    session: Session,
+  ) -> Optional["UserAPIKey"]:
+    """Apply expiry, bookkeeping and audit logging to a verification result."""
+    if match is not None:
+      api_key = potential_keys[match]
       try:
-        if cls._verify_api_key(plain_key, str(api_key.key_hash)):
-          # Check if API key is expired
-          if api_key.expires_at and datetime.now(UTC) > api_key.expires_at:
-            logger.warning(f"API key {api_key.id} is expired")
-            SecurityAuditLogger.log_security_event(
-              event_type=SecurityEventType.AUTHORIZATION_DENIED,
-              details={
-                "action": "api_key_expired",
-                "api_key_id": api_key.id,
-                "user_id": api_key.user_id,
-                "expired_at": api_key.expires_at.isoformat(),
-              },
-              risk_level="low",
-            )
-            continue  # Try next potential key
+        # Check if API key is expired
+        if api_key.expires_at and datetime.now(UTC) > api_key.expires_at:
+          logger.warning(f"API key {api_key.id} is expired")
+          SecurityAuditLogger.log_security_event(
+            event_type=SecurityEventType.AUTHORIZATION_DENIED,
+            details={
+              "action": "api_key_expired",
+              "api_key_id": api_key.id,
+              "user_id": api_key.user_id,
+              "expired_at": api_key.expires_at.isoformat(),
+            },
+            risk_level="low",
+          )
+        else:
+          # Migrate to the HMAC scheme now that the plain key is known
+          rehashed = needs_rehash(str(api_key.key_hash))
+          if rehashed:
+            api_key.key_hash = hmac_hash_api_key(plain_key)
 
           # Update last used timestamp
           api_key.update_last_used(session, auto_commit=False)
           session.commit()
 
+          if rehashed:
+            SecurityAuditLogger.log_security_event(
+              event_type=SecurityEventType.AUTH_SUCCESS,
+              details={"action": "api_key_rehashed", "api_key_id": api_key.id},
+              risk_level="low",
+            )
+
           # Log successful API key verification
           SecurityAuditLogger.log_security_event(
             event_type=SecurityEventType.AUTH_SUCCESS,
@@ -195,7 +264,7 @@ class UserAPIKey(Model):
       event_type=SecurityEventType.AUTHORIZATION_DENIED,
       details={
         "action": "api_key_verification_failed",
-        "key_prefix": prefix,
+        "key_prefix": plain_key[:8],
         "attempted_keys_checked": len(potential_keys),
       },
       risk_level="medium",
@@ -281,7 +350,7 @@ class UserAPIKey(Model):
   @staticmethod
   def _hash_api_key(plain_key: str) -> str:
     """
-    Hash an API key using bcrypt with high work factor.
+    Hash an API key using bcrypt with high work factor (or peppered HMAC-SHA256).
 
     Args:
         plain_key: The plain text API key
@@ -289,6 +358,9 @@ class UserAPIKey(Model):
     Returns:
         Bcrypt hash string
     """
+    if hmac_hashing_enabled():
+      return hmac_hash_api_key(plain_key)
+
     try:
       # Use a high work factor (cost) for security
       # 12 rounds = ~250ms on modern hardware, good security/performance balance
@@ -302,18 +374,18 @@ class UserAPIKey(Model):
   @staticmethod
   def _verify_api_key(plain_key: str, stored_hash: str) -> bool:
     """
-    Verify an API key against its bcrypt hash.
+    Verify an API key against its bcrypt or HMAC hash.
 
     Args:
         plain_key: The plain text API key to verify
-        stored_hash: The stored bcrypt hash from database
+        stored_hash: The stored hash from database
 
     Returns:
         True if verification succeeds
     """
     try:
-      # Use bcrypt verification (constant-time, secure)
-      return bcrypt.checkpw(plain_key.encode("utf-8"), stored_hash.encode("utf-8"))
+      # Constant-time comparison for both schemes
+      return verify_api_key_hash(plain_key, stored_hash)
     except Exception as e:
       logger.error(f"API key verification failed: {e}")
       return False
@@ -327,7 +399,7 @@ class UserAPIKey(Model):
       cache_module = importlib.import_module("robosystems.middleware.auth.cache")
       api_key_cache = cache_module.api_key_cache
 
-      api_key_cache.invalidate_api_key(self.key_hash)
+      api_key_cache.invalidate_api_key_by_id(self.id)
 
       # Log cache invalidation
       SecurityAuditLogger.log_security_event(
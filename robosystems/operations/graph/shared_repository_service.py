@@ -23,6 +23,7 @@ Key differences from user graphs:
 from datetime import UTC, datetime
 from typing import Any
 
+from ...config import env
 from ...config.graph_tier import GraphTier
 from ...logger import logger
 
@@ -129,6 +130,8 @@ class SharedRepositoryService:
           name=f"{repository_name.upper()} Repository Schema",
           description=f"Schema for {config['name']}",
           extensions=config["extensions"],
+          # Must match the IDs the SEC processor writes
+          compact_identifiers=repository_name == "sec" and env.XBRL_COMPACT_IDS,
         )
         schema = manager.load_and_compile_schema(schema_config)
         schema_ddl = schema.to_cypher()
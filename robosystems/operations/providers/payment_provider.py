@@ -10,7 +10,7 @@ from typing import Any
 
 from ...config import env
 from ...config.billing import BillingConfig
-from ...config.valkey_registry import ValkeyDatabase, create_redis_client
+from ...config.valkey_registry import ValkeyDatabase, get_shared_redis_client
 from ...logger import get_logger
 
 logger = get_logger(__name__)
@@ -153,7 +153,7 @@ class StripePaymentProvider(PaymentProvider):
   def redis_client(self):
     """Lazy-load Redis client for billing cache."""
     if self._redis_client is None:
-      self._redis_client = create_redis_client(
+      self._redis_client = get_shared_redis_client(
         ValkeyDatabase.BILLING_CACHE, decode_responses=True
       )
     return self._redis_client
@@ -338,7 +338,7 @@ async def call_mcp_tool(
     if MultiTenantUtils.is_shared_repository(graph_id):
       from robosystems.config.valkey_registry import (
         ValkeyDatabase,
-        create_async_redis_client,
+        get_shared_async_redis_client,
       )
       from robosystems.middleware.rate_limits import DualLayerRateLimiter
       from robosystems.models.iam.user_repository import UserRepository
@@ -354,73 +354,70 @@ async def call_mcp_tool(
           detail=f"Access to {graph_id.upper()} repository requires a subscription. Visit https://roboledger.ai/pricing",
         )
 
-      # Get Redis client for rate limiting with proper ElastiCache support
-      redis_client = create_async_redis_client(ValkeyDatabase.RATE_LIMITING)
-
-      try:
-        limiter = DualLayerRateLimiter(redis_client)
-
-        # Get user's subscription tier for burst protection
-        user_tier = "ladybug-standard"  # Default for authenticated users
-        if hasattr(current_user, "subscription") and current_user.subscription:
-          if current_user.subscription.billing_plan:
-            user_tier = current_user.subscription.billing_plan.name
-
-        # Check both rate limit layers
-        limit_check = await limiter.check_limits(
-          user_id=str(current_user.id),
-          graph_id=graph_id,
-          operation="mcp",
-          endpoint=f"mcp/call-tool/{tool_call.name}",
-          user_tier=user_tier,
-          repository_plan=repo_access.repository_plan,
-        )
+      # Get the shared rate limiting client with proper ElastiCache support
+      redis_client = get_shared_async_redis_client(ValkeyDatabase.RATE_LIMITING)
 
-        if not limit_check["allowed"]:
-          reason = limit_check.get("reason", "unknown")
-          message = limit_check.get("message", "Rate limit exceeded")
+      limiter = DualLayerRateLimiter(redis_client)
 
-          if reason == "no_access":
-            raise HTTPException(
-              status_code=http_status.HTTP_403_FORBIDDEN,
-              detail=f"{message}. Subscribe at https://roboledger.ai/pricing",
-            )
-          elif reason == "endpoint_not_allowed":
-            raise HTTPException(
-              status_code=http_status.HTTP_403_FORBIDDEN,
-              detail=message,
-            )
-          elif reason == "burst_limit":
-            detail = limit_check.get("detail", {})
-            raise HTTPException(
-              status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
-              detail=f"Rate limit exceeded: {detail.get('current', 0)}/{detail.get('limit', 0)} "
-              f"requests per {detail.get('window', 0)} seconds",
-              headers={
-                "Retry-After": str(detail.get("window", 60)),
-                "X-RateLimit-Limit": str(detail.get("limit", 0)),
-                "X-RateLimit-Remaining": str(detail.get("remaining", 0)),
-              },
-            )
-          elif reason == "repository_limit":
-            detail = limit_check.get("detail", {})
-            raise HTTPException(
-              status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
-              detail=f"{message}. Limit: {detail.get('limit', 0)} per {detail.get('window', 'period')}. "
-              f"Upgrade for higher limits at https://roboledger.ai/pricing",
-              headers={
-                "Retry-After": str(detail.get("retry_after", 60)),
-                "X-RateLimit-Repository": graph_id,
-                "X-RateLimit-Plan": str(repo_access.repository_plan),
-              },
-            )
-          else:
-            raise HTTPException(
-              status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
-              detail=message,
-            )
-      finally:
-        await redis_client.close()
+      # Get user's subscription tier for burst protection
+      user_tier = "ladybug-standard"  # Default for authenticated users
+      if hasattr(current_user, "subscription") and current_user.subscription:
+        if current_user.subscription.billing_plan:
+          user_tier = current_user.subscription.billing_plan.name
+
+      # Check both rate limit layers
+      limit_check = await limiter.check_limits(
+        user_id=str(current_user.id),
+        graph_id=graph_id,
+        operation="mcp",
+        endpoint=f"mcp/call-tool/{tool_call.name}",
+        user_tier=user_tier,
+        repository_plan=repo_access.repository_plan,
+      )
+
+      if not limit_check["allowed"]:
+        reason = limit_check.get("reason", "unknown")
+        message = limit_check.get("message", "Rate limit exceeded")
+
+        if reason == "no_access":
+          raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail=f"{message}. Subscribe at https://roboledger.ai/pricing",
+          )
+        elif reason == "endpoint_not_allowed":
+          raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail=message,
+          )
+        elif reason == "burst_limit":
+          detail = limit_check.get("detail", {})
+          raise HTTPException(
+            status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded: {detail.get('current', 0)}/{detail.get('limit', 0)} "
+            f"requests per {detail.get('window', 0)} seconds",
+            headers={
+              "Retry-After": str(detail.get("retry_after", 60)),
+              "X-RateLimit-Limit": str(detail.get("limit", 0)),
+              "X-RateLimit-Remaining": str(detail.get("remaining", 0)),
+            },
+          )
+        elif reason == "repository_limit":
+          detail = limit_check.get("detail", {})
+          raise HTTPException(
+            status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"{message}. Limit: {detail.get('limit', 0)} per {detail.get('window', 'period')}. "
+            f"Upgrade for higher limits at https://roboledger.ai/pricing",
+            headers={
+              "Retry-After": str(detail.get("retry_after", 60)),
+              "X-RateLimit-Repository": graph_id,
+              "X-RateLimit-Plan": str(repo_access.repository_plan),
+            },
+          )
+        else:
+          raise HTTPException(
+            status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=message,
+          )
 
     # Get repository
     operation_type = _get_mcp_operation_type(graph_id)
@@ -647,7 +644,8 @@ async def call_mcp_tool(
                     yield {"event": "result", "data": result}
                   break
 
-                await asyncio.sleep(1)
+                # Returns early when the query finishes
+                await queue_manager.get_query_result(queue_id, wait_seconds=1)
 
             await handler.close()
             return EventSourceResponse(monitor_queue())
@@ -5,7 +5,6 @@ This module provides intelligent strategy selection for MCP tool execution,
 optimized for AI agent consumption and shared repository scalability.
 """
 
-import re
 from enum import Enum
 from typing import Any
 
@@ -15,6 +14,7 @@ from robosystems.middleware.graph.execution_strategies import (
   BaseStrategySelector,
 )
 from robosystems.middleware.graph.utils import MultiTenantUtils
+from robosystems.security.cypher_parser import parse_cypher
 
 
 class MCPExecutionStrategy(Enum):
@@ -120,11 +120,11 @@ class MCPToolAnalyzer(BaseAnalyzer):
   def _estimate_duration(cls, tool_name: str, arguments: dict[str, Any]) -> int:
     """Estimate execution duration in milliseconds."""
     if tool_name in cls.QUERY_TOOLS:
-      query = arguments.get("query", "")
+      analysis = parse_cypher(arguments.get("query", ""))
       # Complex queries take longer
-      if "SHORTEST" in query.upper() or "ALL" in query.upper():
+      if analysis.has_shortest_path or "ALL" in analysis.keywords:
         return 5000
-      elif "MATCH" in query.upper():
+      elif "MATCH" in analysis.keywords:
         return 1000
       else:
         return 500
@@ -139,9 +139,8 @@ class MCPToolAnalyzer(BaseAnalyzer):
     if tool_name in cls.QUERY_TOOLS:
       query = arguments.get("query", "")
       # Check for LIMIT clause
-      limit_match = re.search(r"LIMIT\s+(\d+)", query, re.IGNORECASE)
-      if limit_match:
-        limit = int(limit_match.group(1))
+      limit = parse_cypher(query).limit_value
+      if limit is not None:
         if limit <= 100:
           return "small"
         elif limit <= 1000:
@@ -158,19 +157,15 @@ class MCPToolAnalyzer(BaseAnalyzer):
   @classmethod
   def _analyze_cypher_query(cls, query: str) -> dict[str, Any]:
     """Analyze a Cypher query for MCP-specific optimizations."""
-    query_upper = query.upper()
+    analysis = parse_cypher(query)
 
     # Detect patterns that benefit from streaming
-    has_match = "MATCH" in query_upper
-    has_aggregation = any(
-      agg in query_upper for agg in ["COUNT(", "SUM(", "AVG(", "COLLECT("]
-    )
-    has_order_by = "ORDER BY" in query_upper
+    has_match = "MATCH" in analysis.keywords
+    has_aggregation = analysis.has_aggregation
+    has_order_by = analysis.order_by_count > 0
 
     # Determine if streaming would help
-    requires_streaming = (
-      has_match and "LIMIT" not in query_upper and not has_aggregation
-    )
+    requires_streaming = has_match and not analysis.has_limit and not has_aggregation
 
     return {
       "requires_streaming": requires_streaming,
@@ -28,6 +28,10 @@ from robosystems.database import get_db_session
 from robosystems.logger import api_logger, log_metric, logger
 from robosystems.middleware.auth.dependencies import get_current_user_with_graph
 from robosystems.middleware.graph import get_universal_repository
+from robosystems.middleware.graph.query_cache import (
+  QueryResultCache,
+  get_query_result_cache,
+)
 from robosystems.middleware.graph.query_queue import get_query_queue
 from robosystems.middleware.graph.types import GRAPH_OR_SUBGRAPH_ID_PATTERN
 from robosystems.middleware.graph.utils import MultiTenantUtils
@@ -61,6 +65,7 @@ from .handlers import (
   get_user_priority as get_user_priority_from_handler,
 )
 from .strategies import (
+  CACHEABLE_STRATEGIES,
   ClientDetector,
   ExecutionStrategy,
   QueryAnalyzer,
@@ -70,6 +75,7 @@ from .strategies import (
 )
 from .streaming import (
   execute_query_with_timeout,
+  stream_arrow_response,
   stream_ndjson_response,
   stream_sse_response,
   stream_sse_with_queue,
@@ -454,6 +460,62 @@ async def execute_cypher_query(
       },
     )
 
+    # Serve repeated read-only queries from the result cache when possible
+    use_cache = StrategySelector.should_use_cache(
+      is_cacheable=(
+        not is_write
+        and strategy in CACHEABLE_STRATEGIES
+        and "no-cache" not in headers.get("cache-control", "").lower()
+        and QueryResultCache.is_cacheable_query(request.query)
+      ),
+      cache_available=env.QUERY_RESULT_CACHE_ENABLED,
+      cache_ttl=env.QUERY_RESULT_CACHE_TTL,
+    )
+    result_cache = get_query_result_cache() if use_cache else None
+    cache_generation = None
+
+    if result_cache:
+      cached_result, cache_generation = await result_cache.get(
+        graph_id, request.query, request.parameters
+      )
+      if cached_result is not None:
+        strategy = ExecutionStrategy.CACHED
+        execution_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+
+        circuit_breaker.record_success(graph_id, "cypher_query")
+
+        api_logger.info(
+          "Cypher query served from result cache",
+          extra={
+            "component": "query_api",
+            "action": "query_cache_hit",
+            "user_id": str(current_user.id),
+            "database": graph_id,
+            "duration_ms": execution_time,
+            "row_count": cached_result["row_count"],
+            "strategy": strategy.value,
+          },
+        )
+
+        log_metric(
+          "cypher_query_cache_hit",
+          1,
+          "count",
+          "query_api",
+          {"database": graph_id, "execution_time_ms": execution_time},
+        )
+
+        return CypherQueryResponse(
+          success=True,
+          data=cached_result["data"],
+          columns=cached_result["columns"],
+          row_count=cached_result["row_count"],
+          execution_time_ms=execution_time,
+          graph_id=graph_id,
+          timestamp=start_time.isoformat(),
+          cached=True,
+        )
+
     # Execute based on strategy
     if strategy == ExecutionStrategy.SSE_QUEUE_STREAM:
       # Queue with SSE then stream results
@@ -487,6 +549,16 @@ async def execute_cypher_query(
         start_time=start_time,
       )
 
+    elif strategy == ExecutionStrategy.ARROW_STREAMING:
+      # Columnar Arrow IPC streaming (passed through from the Graph API)
+      return await stream_arrow_response(
+        repository=repository,
+        request=request,
+        graph_id=graph_id,
+        current_user=current_user,
+        start_time=start_time,
+      )
+
     elif strategy == ExecutionStrategy.NDJSON_STREAMING:
       # NDJSON streaming
       return await stream_ndjson_response(
@@ -557,6 +629,17 @@ async def execute_cypher_query(
         # Record success
         circuit_breaker.record_success(graph_id, "cypher_query")
 
+        # Populate the result cache for subsequent identical queries
+        if result_cache:
+          await result_cache.set(
+            graph_id,
+            request.query,
+            request.parameters,
+            result,
+            columns,
+            cache_generation,
+          )
+
         # Record business event for successful execution
         metrics_instance = get_endpoint_metrics()
         metrics_instance.record_business_event(
@@ -897,7 +980,7 @@ async def _check_shared_repository_limits(
   from robosystems.config.billing.repositories import SharedRepository
   from robosystems.config.valkey_registry import (
     ValkeyDatabase,
-    create_async_redis_client,
+    get_shared_async_redis_client,
   )
   from robosystems.middleware.rate_limits import DualLayerRateLimiter
   from robosystems.models.iam.user_repository import UserRepository
@@ -906,61 +989,57 @@ async def _check_shared_repository_limits(
   if graph_id not in [repo.value for repo in SharedRepository]:
     return
 
-  # Get Redis client for rate limiting with proper ElastiCache support
-  redis_client = create_async_redis_client(ValkeyDatabase.RATE_LIMITING)
+  # Get the shared rate limiting client with proper ElastiCache support
+  redis_client = get_shared_async_redis_client(ValkeyDatabase.RATE_LIMITING)
 
-  try:
-    limiter = DualLayerRateLimiter(redis_client)
-
-    # Get user's subscription tier (for burst protection)
-    user_tier = getattr(user, "subscription_tier", "ladybug-standard")
-
-    # Get user's repository access plan
-    repo_access = UserRepository.get_by_user_and_repository(user.id, graph_id, session)
-    repo_plan = repo_access.repository_plan if repo_access else None
-
-    # Check both rate limit layers
-    limit_check = await limiter.check_limits(
-      user_id=user.id,
-      graph_id=graph_id,
-      operation="query",  # Direct queries
-      endpoint=endpoint,
-      user_tier=user_tier,
-      repository_plan=repo_plan,
-    )
+  limiter = DualLayerRateLimiter(redis_client)
 
-    if not limit_check["allowed"]:
-      reason = limit_check.get("reason", "unknown")
-      message = limit_check.get("message", "Rate limit exceeded")
+  # Get user's subscription tier (for burst protection)
+  user_tier = getattr(user, "subscription_tier", "ladybug-standard")
 
-      if reason == "no_access":
-        raise HTTPException(
-          status_code=http_status.HTTP_403_FORBIDDEN,
-          detail=f"{message}. Subscribe at https://roboledger.ai/upgrade",
-        )
-      elif reason == "endpoint_not_allowed":
-        raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=message)
-      elif reason == "burst_limit":
-        detail = limit_check.get("detail", {})
-        raise HTTPException(
-          status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
-          detail=f"Rate limit exceeded: {detail.get('current', 0)}/{detail.get('limit', 0)} "
-          f"requests per {detail.get('window', 0)} seconds",
-        )
-      elif reason == "repository_limit":
-        detail = limit_check.get("detail", {})
-        raise HTTPException(
-          status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
-          detail=f"{message}. Limit: {detail.get('limit', 0)} per {detail.get('window', 'period')}. "
-          f"Upgrade for higher limits at https://roboledger.ai/upgrade",
-        )
-      else:
-        raise HTTPException(
-          status_code=http_status.HTTP_429_TOO_MANY_REQUESTS, detail=message
-        )
+  # Get user's repository access plan
+  repo_access = UserRepository.get_by_user_and_repository(user.id, graph_id, session)
+  repo_plan = repo_access.repository_plan if repo_access else None
+
+  # Check both rate limit layers
+  limit_check = await limiter.check_limits(
+    user_id=user.id,
+    graph_id=graph_id,
+    operation="query",  # Direct queries
+    endpoint=endpoint,
+    user_tier=user_tier,
+    repository_plan=repo_plan,
+  )
+
+  if not limit_check["allowed"]:
+    reason = limit_check.get("reason", "unknown")
+    message = limit_check.get("message", "Rate limit exceeded")
 
-  finally:
-    await redis_client.close()
+    if reason == "no_access":
+      raise HTTPException(
+        status_code=http_status.HTTP_403_FORBIDDEN,
+        detail=f"{message}. Subscribe at https://roboledger.ai/upgrade",
+      )
+    elif reason == "endpoint_not_allowed":
+      raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=message)
+    elif reason == "burst_limit":
+      detail = limit_check.get("detail", {})
+      raise HTTPException(
+        status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=f"Rate limit exceeded: {detail.get('current', 0)}/{detail.get('limit', 0)} "
+        f"requests per {detail.get('window', 0)} seconds",
+      )
+    elif reason == "repository_limit":
+      detail = limit_check.get("detail", {})
+      raise HTTPException(
+        status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=f"{message}. Limit: {detail.get('limit', 0)} per {detail.get('window', 'period')}. "
+        f"Upgrade for higher limits at https://roboledger.ai/upgrade",
+      )
+    else:
+      raise HTTPException(
+        status_code=http_status.HTTP_429_TOO_MANY_REQUESTS, detail=message
+      )
 
   # Note: Direct API queries are included - no credit consumption
   # Only MCP queries (AI-mediated) consume credits
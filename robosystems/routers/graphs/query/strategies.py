@@ -19,6 +19,7 @@ from robosystems.middleware.graph.execution_strategies import (
   ResponseMode as BaseResponseMode,
 )
 from robosystems.middleware.robustness import TimeoutCoordinator
+from robosystems.security.cypher_parser import CypherAnalysis
 
 
 class ExecutionStrategy(Enum):
@@ -30,6 +31,7 @@ class ExecutionStrategy(Enum):
   NDJSON_STREAMING = "ndjson_streaming"
   SSE_STREAMING = "sse_streaming"
   SSE_PROGRESS = "sse_progress"
+  ARROW_STREAMING = "arrow_streaming"
   QUEUE_WITH_MONITORING = "queue_monitoring"
   QUEUE_SIMPLE = "queue_simple"
   CACHED = "cached"
@@ -43,6 +45,15 @@ class ExecutionStrategy(Enum):
 # Re-export ResponseMode for backward compatibility
 ResponseMode = BaseResponseMode
 
+# Strategies that return a complete JSON result and may be served from cache
+CACHEABLE_STRATEGIES = frozenset(
+  {
+    ExecutionStrategy.JSON_IMMEDIATE,
+    ExecutionStrategy.JSON_COMPLETE,
+    ExecutionStrategy.SYNC_TESTING,
+  }
+)
+
 
 class QueryAnalyzer(BaseAnalyzer):
   """Analyze Cypher queries to estimate characteristics."""
@@ -78,32 +89,34 @@ class QueryAnalyzer(BaseAnalyzer):
     return self.analyze_query(query)
 
   @classmethod
-  def _estimate_result_size(cls, query_upper: str, limit_value: int | None) -> int:
+  def _estimate_result_size(cls, analysis: CypherAnalysis) -> int:
     """Estimate the number of rows a query will return."""
-    if limit_value:
-      return limit_value
+    if analysis.limit_value:
+      return analysis.limit_value
 
     # Parameterized LIMIT (e.g., LIMIT $limit) - assume medium size
-    if "LIMIT" in query_upper and limit_value is None:
+    if analysis.has_limit and analysis.limit_value is None:
       return cls.MEDIUM_RESULT
 
+    keywords = analysis.keywords
+
     # Single aggregation without GROUP BY
-    if "COUNT(" in query_upper and "GROUP BY" not in query_upper:
+    if "COUNT" in keywords and analysis.has_aggregation and not analysis.has_group_by:
       return 1
 
     # Simple queries without MATCH
-    if "MATCH" not in query_upper:
+    if "MATCH" not in keywords:
       return 10
 
     # Queries with WHERE clause (filtered)
-    if "WHERE" in query_upper:
+    if "WHERE" in keywords:
       # Very specific filters
-      if query_upper.count("AND") >= 2:
+      if analysis.keyword_sequence.split().count("AND") >= 2:
         return 50
       return 100
 
     # Path queries can be very large
-    if "PATH" in query_upper:
+    if any("PATH" in keyword for keyword in keywords):
       return cls.LARGE_RESULT * 10
 
     # Unfiltered MATCH - assume large
@@ -150,6 +163,7 @@ class ClientDetector(BaseClientDetector):
       "capabilities": {
         "sse": base_info["supports_sse"],
         "ndjson": base_info["supports_ndjson"],
+        "arrow": base_info["supports_arrow"],
         "json": True,  # Always support JSON
       },
       "preferences": {
@@ -203,7 +217,9 @@ class StrategySelector(BaseStrategySelector):
       return ExecutionStrategy.TRADITIONAL_QUEUE, metadata
     elif mode_override == ResponseMode.STREAM:
       # Force streaming - choose based on capabilities
-      if client_info["capabilities"]["sse"]:
+      if client_info["capabilities"].get("arrow"):
+        return ExecutionStrategy.ARROW_STREAMING, metadata
+      elif client_info["capabilities"]["sse"]:
         return ExecutionStrategy.SSE_STREAMING, metadata
       elif client_info["capabilities"]["ndjson"]:
         return ExecutionStrategy.NDJSON_STREAMING, metadata
@@ -247,6 +263,10 @@ class StrategySelector(BaseStrategySelector):
         # Fallback to traditional queuing
         return ExecutionStrategy.TRADITIONAL_QUEUE, metadata
 
+    # Columnar clients asked for Arrow explicitly - stream it regardless of size
+    if client_info["capabilities"].get("arrow"):
+      return ExecutionStrategy.ARROW_STREAMING, metadata
+
     # System has capacity - decide based on result size
     estimated_rows = query_analysis["estimated_rows"]
 
@@ -318,6 +338,7 @@ class QueryTimeoutCoordinator(TimeoutCoordinator):
     elif strategy in [
       ExecutionStrategy.SSE_STREAMING,
       ExecutionStrategy.NDJSON_STREAMING,
+      ExecutionStrategy.ARROW_STREAMING,
     ]:
       endpoint_timeout = min(requested_timeout, cls.MAX_STREAMING_TIMEOUT)
     else:
@@ -12,9 +12,15 @@ import json
 from datetime import UTC, datetime
 from typing import Any
 
+import pyarrow as pa
 from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
+from robosystems.graph_api.core.arrow_ipc import (
+  ARROW_STREAM_MEDIA_TYPE,
+  DEFAULT_BATCH_ROWS,
+  iter_ipc_stream,
+)
 from robosystems.logger import api_logger, logger
 from robosystems.middleware.graph.query_queue import QueryStatus, get_query_queue
 from robosystems.middleware.robustness import CircuitBreakerManager
@@ -29,6 +35,9 @@ from robosystems.models.iam import User
 # Initialize circuit breaker
 circuit_breaker = CircuitBreakerManager()
 
+# Longest a queued SSE stream waits before re-checking its queue position
+QUEUE_POSITION_UPDATE_SECONDS = 2.0
+
 
 async def execute_query_with_timeout(
   repository: Any, query: str, parameters: dict[str, Any] | None, timeout: int
@@ -233,6 +242,104 @@ async def stream_ndjson_response(
   )
 
 
+async def stream_arrow_response(
+  repository: Any,
+  request: CypherQueryRequest,
+  graph_id: str,
+  current_user: User,
+  start_time: datetime | None = None,
+) -> StreamingResponse:
+  """
+  Stream query results as an Arrow IPC stream.
+
+  When the repository is backed by the Graph API, the columnar bytes produced
+  by the graph database instance are passed through without decoding them
+  into rows. Other repositories fall back to executing the query and encoding
+  the result.
+
+  Args:
+      repository: Graph repository instance
+      request: Query request
+      graph_id: Graph identifier
+      current_user: Current authenticated user
+      start_time: Request start time for metrics
+
+  Returns:
+      StreamingResponse with Arrow IPC content
+  """
+  if not start_time:
+    start_time = datetime.now(UTC)
+
+  if getattr(repository, "supports_arrow", False):
+    byte_stream = await repository.execute_query_arrow_stream(
+      request.query, request.parameters
+    )
+  else:
+    result = await execute_query_with_timeout(
+      repository,
+      request.query,
+      request.parameters,
+      request.timeout or DEFAULT_QUERY_TIMEOUT,
+    )
+    table = pa.Table.from_pylist(result)
+
+    async def encode_table():
+      for data in iter_ipc_stream(
+        table.schema, table.to_batches(max_chunksize=DEFAULT_BATCH_ROWS)
+      ):
+        yield data
+
+    byte_stream = encode_table()
+
+  # Pull the first chunk before responding so Graph API errors surface as
+  # regular HTTP errors instead of a truncated stream
+  try:
+    first_chunk = await byte_stream.__anext__()
+  except StopAsyncIteration:
+    first_chunk = b""
+
+  async def generate_arrow():
+    total_bytes = len(first_chunk)
+    try:
+      yield first_chunk
+      async for data in byte_stream:
+        total_bytes += len(data)
+        yield data
+
+      circuit_breaker.record_success(graph_id, "cypher_query")
+
+      execution_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+      api_logger.info(
+        "Arrow streaming completed successfully",
+        extra={
+          "component": "query_streaming",
+          "action": "arrow_stream_completed",
+          "user_id": str(current_user.id),
+          "database": graph_id,
+          "total_bytes": total_bytes,
+          "duration_ms": execution_time,
+        },
+      )
+
+    except Exception as e:
+      # The IPC stream cannot carry an error payload; the client sees a
+      # truncated stream without the end-of-stream marker
+      circuit_breaker.record_failure(graph_id, "cypher_query")
+      logger.error(f"Arrow streaming failed: {e}")
+
+  return StreamingResponse(
+    generate_arrow(),
+    media_type=ARROW_STREAM_MEDIA_TYPE,
+    headers={
+      "X-Streaming": "true",
+      "X-Stream-Format": "arrow",
+      "X-Graph-ID": graph_id,
+      "Cache-Control": "no-cache",
+      "X-Accel-Buffering": "no",  # Disable nginx buffering
+    },
+  )
+
+
 async def stream_sse_response(
   repository: Any,
   request: CypherQueryRequest,
@@ -525,7 +632,10 @@ async def stream_sse_with_queue(
       last_position = initial_status.get("queue_position", 0)
 
       while True:
-        await asyncio.sleep(1)
+        # Wakes as soon as the query starts or finishes
+        await queue_manager.wait_for_start(
+          query_id, timeout=QUEUE_POSITION_UPDATE_SECONDS
+        )
         status = await queue_manager.get_query_status(query_id)
 
         if status and status["status"] == QueryStatus.PENDING:
@@ -537,7 +647,7 @@ async def stream_sse_with_queue(
               "data": json.dumps(
                 {
                   "position": current_position,
-                  "estimated_wait_seconds": current_position * 2,
+                  "estimated_wait_seconds": status.get("estimated_wait", 0),
                   "message": f"Queue position: {current_position}",
                 }
               ),
@@ -659,6 +769,11 @@ async def stream_sse_with_queue(
           yield {"event": event_type, "data": json.dumps(status)}
           break
 
+        else:
+          # Cancelled or no longer tracked; nothing left to wait for
+          yield {"event": "error", "data": json.dumps(status or {"id": query_id})}
+          break
+
     except Exception as e:
       logger.error(f"Queue SSE error: {e}")
       yield {
@@ -53,6 +53,7 @@ class LadybugSchemaBuilder:
       version=self.config.get("version", "1.0.0"),
       base_schema=self.config.get("base_schema", "base"),
       extensions=self.config.get("extensions", []),
+      compact_identifiers=self.config.get("compact_identifiers", False),
     )
 
     # Load and compile schema
@@ -10,14 +10,38 @@ Supports context-aware loading for unified schemas like RoboLedger.
 import importlib
 import logging
 import pkgutil
+from dataclasses import replace
 from typing import Any
 
 import robosystems.schemas.extensions as extensions_pkg
+from robosystems.config import env
 from robosystems.schemas.base import BASE_NODES, BASE_RELATIONSHIPS
 from robosystems.schemas.models import Node, Relationship
 
 logger = logging.getLogger(__name__)
 
+# SEC node tables keyed by compact INT64 identifiers when XBRL_COMPACT_IDS is
+# enabled (see robosystems.adapters.sec.processors.ids)
+SEC_COMPACT_ID_NODES = frozenset({"Fact", "Element", "Period", "Unit", "FactDimension"})
+
+
+def with_compact_identifiers(nodes: list[Node]) -> list[Node]:
+  """Switch the identifier primary key of the SEC compact ID nodes to INT64."""
+  return [
+    replace(
+      node,
+      properties=[
+        replace(prop, type="INT64")
+        if prop.is_primary_key and prop.name == "identifier"
+        else prop
+        for prop in node.properties
+      ],
+    )
+    if node.name in SEC_COMPACT_ID_NODES
+    else node
+    for node in nodes
+  ]
+
 
 class LadybugSchemaLoader:
   """Loads and manages LadybugDB schema definitions with selective extension loading."""
@@ -509,6 +533,9 @@ class ContextAwareSchemaLoader(LadybugSchemaLoader):
       logger.error(f"Error loading context-aware extension '{extension}': {e}")
       # Fall back to base schema only
 
+    if context == "sec_repository" and env.XBRL_COMPACT_IDS:
+      all_nodes = with_compact_identifiers(all_nodes)
+
     # Create lookup dictionaries
     self.nodes = {node.name: node for node in all_nodes}
     self.relationships = {rel.name: rel for rel in all_relationships}
@@ -12,6 +12,7 @@ from typing import Any
 
 from robosystems.logger import logger
 
+from .loader import with_compact_identifiers
 from .models import Schema
 
 
@@ -37,6 +38,8 @@ class SchemaConfiguration:
   version: str
   base_schema: str  # "base"
   extensions: list[str]  # ["roboledger", "roboinvestor"]
+  # Key the SEC high-volume nodes by INT64 compact IDs (XBRL_COMPACT_IDS)
+  compact_identifiers: bool = False
 
 
 @dataclass
@@ -67,6 +70,7 @@ class SchemaManager:
     description: str,
     version: str = "1.0.0",
     extensions: list[str] | None = None,
+    compact_identifiers: bool = False,
   ) -> SchemaConfiguration:
     """Create a schema configuration."""
     return SchemaConfiguration(
@@ -75,6 +79,7 @@ class SchemaManager:
       version=version,
       base_schema="base",
       extensions=extensions or [],
+      compact_identifiers=compact_identifiers,
     )
 
   def load_and_compile_schema(self, config: SchemaConfiguration) -> Schema:
@@ -88,6 +93,8 @@ class SchemaManager:
         Complete compiled schema
     """
     cache_key = f"{config.base_schema}+{'+'.join(sorted(config.extensions))}"
+    if config.compact_identifiers:
+      cache_key += ":compact"
 
     if cache_key in self._schema_cache:
       logger.debug(f"Using cached schema: {cache_key}")
@@ -127,6 +134,9 @@ class SchemaManager:
           f"Loaded {len(extension_module.EXTENSION_RELATIONSHIPS)} relationships from {extension_name}"
         )
 
+    if config.compact_identifiers:
+      schema.nodes = with_compact_identifiers(schema.nodes)
+
     # Validate schema consistency
     self._validate_schema_consistency(schema)
 
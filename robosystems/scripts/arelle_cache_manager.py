@@ -4,23 +4,36 @@ Arelle Cache Manager - Download, bundle, and manage Arelle schemas and EDGAR plu
 
 This script handles:
 1. Downloading XBRL schemas for offline processing
-2. Fetching the EDGAR plugin from GitHub
-3. Creating tar.gz bundles for fast Docker builds
-4. Extracting bundles during Docker build
-5. Checking if cache needs updating
+2. Discovering the taxonomy and linkbase set used by a sample of filings
+3. Fetching the EDGAR plugin from GitHub
+4. Creating content-addressed tar.gz bundles for fast Docker builds
+5. Extracting and verifying bundles during Docker build
+6. Checking if cache needs updating
+
+Schemas are fetched concurrently and the imports, includes and linkbase
+references of every fetched document are followed, so the cache holds the full
+closure of the taxonomies in use. A local mirror directory (laid out like the
+cache, host/path) is preferred over the network. Runs are resumable: files that
+are already cached and parse are not fetched again.
 """
 
 import argparse
+import gzip
+import hashlib
 import json
 import logging
+import re
 import shutil
 import subprocess
 import sys
 import tarfile
 import time
 import urllib.request
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import urldefrag, urljoin, urlparse
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +43,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bundle layout version, bumped when the bundle or manifest format changes
+BUNDLE_FORMAT_VERSION = 1
+# Manifest of an extracted cache (file hashes and bundle digest)
+BUNDLE_MANIFEST = "bundle_manifest.json"
+# Cache files that are not schemas and are excluded from the manifest
+CACHE_METADATA_FILES = {BUNDLE_MANIFEST, "cache_metadata.json"}
+
+# References to other taxonomy documents: xs:import/xs:include schemaLocation,
+# xsi:schemaLocation pairs and link:schemaRef/linkbaseRef/loc hrefs
+REFERENCE_PATTERN = re.compile(
+  r"""(?:schemaLocation|xlink:href)\s*=\s*["']([^"']+)["']"""
+)
+TAXONOMY_SUFFIXES = (".xsd", ".xml", ".dtd")
+FILING_SUFFIXES = (".xsd", ".xml", ".htm", ".html")
+
 
 class ArelleCacheManager:
   """Manages Arelle schema cache and EDGAR plugin bundles."""
@@ -291,6 +319,92 @@ class ArelleCacheManager:
       self.project_root / "robosystems" / "adapters" / "sec" / "arelle" / "bundles"
     )
 
+  @staticmethod
+  def cache_path_for(url: str) -> str:
+    """Relative cache path of a URL (Arelle webcache layout: host/path)."""
+    parsed = urlparse(url)
+    return f"{parsed.netloc}{parsed.path}"
+
+  @staticmethod
+  def is_valid_schema(path: Path) -> bool:
+    """Check that a cached file is non-empty and, for XML documents, parses."""
+    # Imported here: the Docker build runs extract with the bare interpreter
+    from lxml import etree
+
+    try:
+      if path.stat().st_size == 0:
+        return False
+      if path.suffix in (".xsd", ".xml"):
+        # Downloaded content: never expand entities or reach the network
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        etree.parse(str(path), parser)
+      return True
+    except (OSError, etree.XMLSyntaxError):
+      return False
+
+  @staticmethod
+  def find_references(content: bytes, base_url: str | None = None) -> set[str]:
+    """
+    Find the taxonomy documents referenced by a schema, linkbase or filing.
+
+    Relative references are resolved against ``base_url``; without one (local
+    filing documents) only absolute http(s) references are returned.
+    """
+    text = content.decode("utf-8", errors="ignore")
+    references = set()
+    for match in REFERENCE_PATTERN.finditer(text):
+      # xsi:schemaLocation holds whitespace-separated namespace/location pairs
+      for location in match.group(1).split():
+        if base_url:
+          location = urljoin(base_url, location)
+        url = urldefrag(location).url
+        if url.startswith(("http://", "https://")) and url.endswith(TAXONOMY_SUFFIXES):
+          references.add(url)
+    return references
+
+  def discover_references(self, sample_dir: Path, limit: int = 0) -> set[str]:
+    """
+    Discover the taxonomies used by a sample of filings.
+
+    Args:
+        sample_dir: Directory of filing ZIPs and/or extracted filing documents
+        limit: Maximum number of filings (ZIPs or directories) to scan, 0 for all
+
+    Returns:
+        Absolute URLs of the schemas and linkbases the filings reference
+    """
+    sample_dir = Path(sample_dir)
+    # A filing is either a ZIP or a directory of extracted filing documents
+    filings = sorted(sample_dir.rglob("*.zip")) + sorted(
+      {
+        path.parent
+        for path in sample_dir.rglob("*")
+        if path.is_file() and path.suffix.lower() in FILING_SUFFIXES
+      }
+    )
+    if limit:
+      filings = filings[:limit]
+
+    references: set[str] = set()
+    for filing in filings:
+      if filing.suffix == ".zip":
+        try:
+          with zipfile.ZipFile(filing) as zf:
+            for name in zf.namelist():
+              if name.lower().endswith(FILING_SUFFIXES):
+                references |= self.find_references(zf.read(name))
+        except zipfile.BadZipFile:
+          logger.warning(f"Skipping invalid filing archive: {filing}")
+      else:
+        for path in filing.iterdir():
+          if path.is_file() and path.suffix.lower() in FILING_SUFFIXES:
+            references |= self.find_references(path.read_bytes())
+
+    logger.info(
+      f"Discovered {len(references)} taxonomy references in {len(filings)} filings"
+    )
+    return references
+
   def download_schema(self, url: str, cache_path: Path, retries: int = 3) -> bool:
     """Download a single schema file."""
     for attempt in range(retries):
@@ -304,9 +418,11 @@ class ArelleCacheManager:
         with urllib.request.urlopen(url, timeout=30) as response:
           content = response.read()
 
-        # Write to cache
-        cache_path.write_bytes(content)
-        logger.info(f"Successfully cached: {cache_path.name} ({len(content)} bytes)")
+        # Write to a temporary file first so interrupted runs leave no partial files
+        tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(cache_path)
+        logger.debug(f"Successfully cached: {cache_path.name} ({len(content)} bytes)")
         return True
 
       except Exception as e:
@@ -317,47 +433,113 @@ class ArelleCacheManager:
     logger.error(f"Failed to download after {retries} attempts: {url}")
     return False
 
-  def download_schemas(self) -> int:
-    """Download all XBRL schemas."""
-    logger.info("Downloading XBRL schemas...")
+  def fetch_schema(self, url: str, mirror_dir: Path | None = None) -> str:
+    """
+    Make sure a schema is cached and valid, preferring the local mirror.
 
-    # Create cache directory
-    self.cache_dir.mkdir(parents=True, exist_ok=True)
+    Returns:
+        "cached", "mirrored", "downloaded" or "failed"
+    """
+    relative_path = self.cache_path_for(url)
+    cache_path = self.cache_dir / relative_path
 
-    downloaded = 0
-    skipped = 0
-    failed = 0
+    if cache_path.exists():
+      if self.is_valid_schema(cache_path):
+        return "cached"
+      logger.warning(f"Re-fetching invalid cached schema: {relative_path}")
 
-    for url, relative_path in self.SCHEMAS:
-      cache_path = self.cache_dir / relative_path
+    if mirror_dir:
+      mirror_path = Path(mirror_dir) / relative_path
+      if mirror_path.exists() and self.is_valid_schema(mirror_path):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+        shutil.copyfile(mirror_path, tmp_path)
+        tmp_path.replace(cache_path)
+        return "mirrored"
+
+    if self.download_schema(url, cache_path) and self.is_valid_schema(cache_path):
+      return "downloaded"
+
+    cache_path.unlink(missing_ok=True)
+    return "failed"
+
+  def download_schemas(
+    self,
+    sample_dir: Path | None = None,
+    mirror_dir: Path | None = None,
+    workers: int = 8,
+    sample_limit: int = 0,
+  ) -> int:
+    """
+    Download all XBRL schemas and the documents they reference.
+
+    Args:
+        sample_dir: Filings whose taxonomies should be cached as well
+        mirror_dir: Local mirror preferred over the network
+        workers: Concurrent fetches
+        sample_limit: Maximum number of sample filings to scan
+
+    Returns:
+        Number of schemas available in the cache
+    """
+    logger.info(f"Downloading XBRL schemas ({workers} workers)...")
 
-      # Skip if already cached
-      if cache_path.exists():
-        logger.debug(f"Already cached: {relative_path}")
-        skipped += 1
-        continue
+    # Create cache directory
+    self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-      # Download the schema
-      if self.download_schema(url, cache_path):
-        downloaded += 1
-      else:
-        failed += 1
+    urls = {url for url, _ in self.SCHEMAS}
+    if sample_dir:
+      urls |= self.discover_references(sample_dir, sample_limit)
+
+    counts = {"cached": 0, "mirrored": 0, "downloaded": 0, "failed": 0}
+    seen = set(urls)
+    reported = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+      futures = {
+        executor.submit(self.fetch_schema, url, mirror_dir): url for url in urls
+      }
+      while futures:
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+          url = futures.pop(future)
+          status = future.result()
+          counts[status] += 1
+          if status == "failed":
+            continue
+
+          # Follow imports, includes and linkbase references of the document
+          cache_path = self.cache_dir / self.cache_path_for(url)
+          for reference in self.find_references(cache_path.read_bytes(), url):
+            if reference not in seen:
+              seen.add(reference)
+              futures[executor.submit(self.fetch_schema, reference, mirror_dir)] = (
+                reference
+              )
+
+        total = sum(counts.values())
+        if total // 100 > reported:
+          reported = total // 100
+          logger.info(f"  {total}/{len(seen)} schemas fetched")
 
     # Create metadata file
     metadata_path = self.cache_dir / "cache_metadata.json"
     metadata = {
       "created": datetime.now().isoformat(),
-      "total_schemas": len(self.SCHEMAS),
-      "downloaded": downloaded,
-      "skipped": skipped,
-      "failed": failed,
+      "total_schemas": len(seen),
+      "downloaded": counts["downloaded"],
+      "mirrored": counts["mirrored"],
+      "skipped": counts["cached"],
+      "failed": counts["failed"],
     }
     metadata_path.write_text(json.dumps(metadata, indent=2))
 
     logger.info(
-      f"Schema download complete: {downloaded} new, {skipped} existing, {failed} failed"
+      f"Schema download complete: {counts['downloaded']} downloaded, "
+      f"{counts['mirrored']} from mirror, {counts['cached']} existing, "
+      f"{counts['failed']} failed"
     )
-    return downloaded + skipped
+    return len(seen) - counts["failed"]
 
   def fetch_edgar_plugin(self) -> bool:
     """Fetch EDGAR plugin from GitHub."""
@@ -406,6 +588,131 @@ class ArelleCacheManager:
       logger.error(f"Failed to fetch EDGAR plugin: {e}")
       return False
 
+  def build_manifest(self) -> dict:
+    """Hash every cached schema; the digest identifies the cache contents."""
+    files = {}
+    for path in sorted(self.cache_dir.rglob("*")):
+      if (
+        path.is_file()
+        and path.name not in CACHE_METADATA_FILES
+        and not path.name.endswith(".tmp")
+      ):
+        relative_path = path.relative_to(self.cache_dir).as_posix()
+        files[relative_path] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    return {
+      "format_version": BUNDLE_FORMAT_VERSION,
+      "digest": self._manifest_digest(files),
+      "files": files,
+    }
+
+  @staticmethod
+  def _manifest_digest(files: dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(files, sort_keys=True).encode()).hexdigest()
+
+  @staticmethod
+  def _normalize_tarinfo(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Strip build-machine metadata so bundles only depend on file contents."""
+    tarinfo.mtime = 0
+    tarinfo.mode = 0o644
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    return tarinfo
+
+  @staticmethod
+  def read_bundle_manifest(bundle_path: Path) -> dict | None:
+    """Read the manifest stored at the start of a schema bundle."""
+    with tarfile.open(bundle_path, "r:gz") as tar:
+      member = tar.next()
+      if member is None or member.name != f"cache/{BUNDLE_MANIFEST}":
+        return None
+      manifest_file = tar.extractfile(member)
+      return json.load(manifest_file) if manifest_file else None
+
+  def read_cache_manifest(self) -> dict | None:
+    """Read the manifest of the extracted cache, if any."""
+    manifest_path = self.cache_dir / BUNDLE_MANIFEST
+    if not manifest_path.exists():
+      return None
+    try:
+      return json.loads(manifest_path.read_text())
+    except (OSError, json.JSONDecodeError):
+      return None
+
+  def verify_bundle(self, bundle_path: Path) -> bool:
+    """Check a schema bundle's files against its manifest and name."""
+    bundle_path = Path(bundle_path)
+    logger.info(f"Verifying bundle: {bundle_path.resolve().name}")
+
+    manifest = self.read_bundle_manifest(bundle_path)
+    if manifest is None:
+      logger.error("  Bundle has no manifest (created before content addressing)")
+      return False
+
+    expected = manifest["files"]
+    actual = {}
+    with tarfile.open(bundle_path, "r:gz") as tar:
+      for member in tar:
+        if not member.isfile() or member.name == f"cache/{BUNDLE_MANIFEST}":
+          continue
+        content = tar.extractfile(member)
+        if content is not None:
+          relative_path = member.name.removeprefix("cache/")
+          actual[relative_path] = hashlib.sha256(content.read()).hexdigest()
+
+    ok = self._compare_files(expected, actual)
+    if self._manifest_digest(expected) != manifest["digest"]:
+      logger.error("  Manifest digest does not match its file list")
+      ok = False
+    if manifest["digest"][:16] not in bundle_path.resolve().name:
+      logger.error("  Bundle name does not match its content digest")
+      ok = False
+
+    if ok:
+      logger.info(
+        f"  Bundle OK: {len(expected)} files, digest {manifest['digest'][:16]}"
+      )
+    return ok
+
+  def verify_cache(self) -> bool:
+    """Check the extracted cache against its manifest."""
+    logger.info(f"Verifying cache: {self.cache_dir}")
+
+    manifest = self.read_cache_manifest()
+    if manifest is None:
+      logger.error("  Cache has no manifest")
+      return False
+
+    expected = manifest["files"]
+    actual = self.build_manifest()["files"]
+    # Arelle adds schemas it fetches at runtime; those are not part of the bundle
+    extra = actual.keys() - expected.keys()
+    if extra:
+      logger.info(f"  {len(extra)} schemas cached since extraction")
+
+    ok = self._compare_files(
+      expected, {path: actual[path] for path in expected if path in actual}
+    )
+    if ok:
+      logger.info(f"  Cache OK: {len(manifest['files'])} files")
+    return ok
+
+  @staticmethod
+  def _compare_files(expected: dict[str, str], actual: dict[str, str]) -> bool:
+    missing = expected.keys() - actual.keys()
+    unexpected = actual.keys() - expected.keys()
+    mismatched = [
+      path for path in expected.keys() & actual.keys() if expected[path] != actual[path]
+    ]
+    for label, paths in (
+      ("Missing", missing),
+      ("Unexpected", unexpected),
+      ("Corrupt", mismatched),
+    ):
+      if paths:
+        logger.error(f"  {label}: {len(paths)} files (e.g. {sorted(paths)[0]})")
+    return not (missing or unexpected or mismatched)
+
   def create_bundles(self) -> tuple[Path | None, Path | None]:
     """Create tar.gz bundles for schemas and EDGAR plugin."""
     logger.info("Creating cache bundles...")
@@ -419,13 +726,40 @@ class ArelleCacheManager:
     schema_bundle = None
     edgar_bundle = None
 
-    # Create schemas bundle
+    # Create schemas bundle (content-addressed: same schemas, same bundle name)
     if self.cache_dir.exists() and list(self.cache_dir.iterdir()):
-      schema_bundle_path = self.bundles_dir / f"arelle-schemas-{date_str}.tar.gz"
-      logger.info(f"  Creating schema bundle: {schema_bundle_path.name}")
-
-      with tarfile.open(schema_bundle_path, "w:gz") as tar:
-        tar.add(self.cache_dir, arcname="cache")
+      manifest = self.build_manifest()
+      (self.cache_dir / BUNDLE_MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+      schema_bundle_path = (
+        self.bundles_dir
+        / f"arelle-schemas-v{BUNDLE_FORMAT_VERSION}-{manifest['digest'][:16]}.tar.gz"
+      )
+      if schema_bundle_path.exists():
+        logger.info(f"  Schema bundle unchanged: {schema_bundle_path.name}")
+        schema_bundle_path.touch()
+      else:
+        logger.info(f"  Creating schema bundle: {schema_bundle_path.name}")
+        tmp_path = schema_bundle_path.with_name(f".{schema_bundle_path.name}.tmp")
+        # No name or timestamp in the gzip header, so equal contents give equal bytes
+        with (
+          open(tmp_path, "wb") as raw,
+          gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as gz,
+          tarfile.open(fileobj=gz, mode="w") as tar,
+        ):
+          # Manifest first so extraction can compare digests without a full read
+          tar.add(
+            self.cache_dir / BUNDLE_MANIFEST,
+            arcname=f"cache/{BUNDLE_MANIFEST}",
+            filter=self._normalize_tarinfo,
+          )
+          for relative_path in manifest["files"]:
+            tar.add(
+              self.cache_dir / relative_path,
+              arcname=f"cache/{relative_path}",
+              filter=self._normalize_tarinfo,
+            )
+        tmp_path.replace(schema_bundle_path)
 
       # Create symlink to latest
       latest_link = self.bundles_dir / "arelle-schemas-latest.tar.gz"
@@ -434,7 +768,9 @@ class ArelleCacheManager:
       latest_link.symlink_to(schema_bundle_path.name)
 
       size_mb = schema_bundle_path.stat().st_size / (1024 * 1024)
-      logger.info(f"  Schema bundle created: {size_mb:.1f}MB")
+      logger.info(
+        f"  Schema bundle ready: {size_mb:.1f}MB, {len(manifest['files'])} files"
+      )
       schema_bundle = schema_bundle_path
     else:
       logger.warning("  No schemas found to bundle")
@@ -478,10 +814,19 @@ class ArelleCacheManager:
     # Extract schemas
     schema_bundle = self.bundles_dir / "arelle-schemas-latest.tar.gz"
     if schema_bundle.exists():
-      logger.info("  Extracting schema bundle...")
-      with tarfile.open(schema_bundle, "r:gz") as tar:
-        tar.extractall(self.cache_dir.parent)
-      logger.info("  Schemas extracted")
+      bundle_manifest = self.read_bundle_manifest(schema_bundle)
+      cache_manifest = self.read_cache_manifest()
+      if (
+        bundle_manifest
+        and cache_manifest
+        and bundle_manifest["digest"] == cache_manifest.get("digest")
+      ):
+        logger.info("  Schemas already extracted from this bundle")
+      else:
+        logger.info("  Extracting schema bundle...")
+        with tarfile.open(schema_bundle, "r:gz") as tar:
+          tar.extractall(self.cache_dir.parent)
+        logger.info("  Schemas extracted")
     else:
       logger.warning("  No schema bundle found")
       success = False
@@ -545,18 +890,26 @@ class ArelleCacheManager:
 
     logger.info("Cleaned")
 
-  def update(self):
+  def update(
+    self,
+    sample_dir: Path | None = None,
+    mirror_dir: Path | None = None,
+    workers: int = 8,
+    sample_limit: int = 0,
+  ):
     """Full update: download schemas, fetch EDGAR, create bundles."""
     logger.info("Updating all caches...")
 
     # Download schemas
-    self.download_schemas()
+    self.download_schemas(sample_dir, mirror_dir, workers, sample_limit)
 
     # Fetch EDGAR plugin
     self.fetch_edgar_plugin()
 
     # Create bundles
-    self.create_bundles()
+    schema_bundle, _ = self.create_bundles()
+    if schema_bundle:
+      self.verify_bundle(schema_bundle)
 
     logger.info("\nCache update complete!")
     logger.info("\nNext steps:")
@@ -574,13 +927,36 @@ def main():
 
   subparsers = parser.add_subparsers(dest="command", help="Commands")
 
+  # Options shared by the commands that download schemas
+  download_options = argparse.ArgumentParser(add_help=False)
+  download_options.add_argument(
+    "--sample",
+    type=Path,
+    help="Filing ZIPs or extracted filings whose taxonomies should be cached",
+  )
+  download_options.add_argument(
+    "--sample-limit", type=int, default=0, help="Max sample filings to scan"
+  )
+  download_options.add_argument(
+    "--mirror",
+    type=Path,
+    help="Local mirror directory (host/path layout) preferred over the network",
+  )
+  download_options.add_argument(
+    "--workers", type=int, default=8, help="Concurrent downloads (default: 8)"
+  )
+
   # Update command
   subparsers.add_parser(
-    "update", help="Download schemas, fetch EDGAR, and create bundles"
+    "update",
+    parents=[download_options],
+    help="Download schemas, fetch EDGAR, and create bundles",
   )
 
   # Download command
-  subparsers.add_parser("download", help="Download XBRL schemas only")
+  subparsers.add_parser(
+    "download", parents=[download_options], help="Download XBRL schemas only"
+  )
 
   # Fetch-edgar command
   subparsers.add_parser("fetch-edgar", help="Fetch EDGAR plugin only")
@@ -596,6 +972,14 @@ def main():
   # Extract command
   subparsers.add_parser("extract", help="Extract bundles (used in Docker build)")
 
+  # Verify command
+  verify_parser = subparsers.add_parser(
+    "verify", help="Verify a schema bundle and the extracted cache"
+  )
+  verify_parser.add_argument(
+    "--bundle", type=Path, help="Bundle to verify (default: latest schema bundle)"
+  )
+
   # Check command
   subparsers.add_parser("check", help="Check if bundles need updating")
 
@@ -617,9 +1001,9 @@ def main():
 
   # Execute command
   if args.command == "update":
-    manager.update()
+    manager.update(args.sample, args.mirror, args.workers, args.sample_limit)
   elif args.command == "download":
-    manager.download_schemas()
+    manager.download_schemas(args.sample, args.mirror, args.workers, args.sample_limit)
   elif args.command == "fetch-edgar":
     manager.fetch_edgar_plugin()
   elif args.command == "dev-init":
@@ -646,6 +1030,13 @@ def main():
   elif args.command == "extract":
     if not manager.extract_bundles():
       sys.exit(1)
+  elif args.command == "verify":
+    bundle = args.bundle or manager.bundles_dir / "arelle-schemas-latest.tar.gz"
+    ok = manager.verify_bundle(bundle)
+    if manager.read_cache_manifest() is not None:
+      ok = manager.verify_cache() and ok
+    if not ok:
+      sys.exit(1)
   elif args.command == "check":
     if manager.check_update_needed():
       logger.info("\nRun: just cache-arelle-update")
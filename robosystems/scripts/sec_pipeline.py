@@ -10,6 +10,8 @@ This script manages SEC XBRL data processing through 3 independent phases:
 
   Phase 2 - Process: sec_process job (parallel)
     Processes each filing to parquet via dynamic partitions.
+    For backfills, the sec_process_batch job processes a whole year on a
+    worker process pool in one run (process-batch command).
 
   Phase 3 - Materialize: sec_materialize job
     Stages parquet files in DuckDB and materializes to LadybugDB.
@@ -22,6 +24,7 @@ Usage:
     # Step-by-step (for production use):
     just sec-download 10 2024      # Phase 1: Download top 10 companies
     just sec-process-parallel 2024 # Phase 2: Process in parallel
+    just sec-process-batch 2024    # Phase 2 (backfills): Worker process pool
     just sec-materialize           # Phase 3: Materialize to graph
 
     # Reset database
@@ -79,6 +82,7 @@ ALL_YEAR_PARTITIONS = ["2019", "2020", "2021", "2022", "2023", "2024", "2025"]
 # Default timeouts in seconds (generous for large batch processing)
 DEFAULT_DOWNLOAD_TIMEOUT = 7200  # 2 hours per year partition
 DEFAULT_MATERIALIZE_TIMEOUT = 14400  # 4 hours for full materialization
+DEFAULT_PROCESS_BATCH_TIMEOUT = 43200  # 12 hours per year partition
 
 
 def get_top_companies(count: int, use_sec_api: bool = False) -> list[str]:
@@ -154,20 +158,33 @@ class SECPipeline:
     year: str | None = None,
     skip_existing: bool = True,
     job_type: str = "download_only",
+    rebuild: bool = False,
+    process_config: dict[str, Any] | None = None,
   ) -> str:
     """Create YAML config for Dagster job.
 
     Args:
-        job_type: "download_only" or "materialize"
+        job_type: "download_only", "process_batch" or "materialize"
+        rebuild: Rebuild the graph from all files (materialize only)
+        process_config: SECBatchProcessConfig values (process_batch only)
     """
-    if job_type == "materialize":
-      # sec_materialize job - ingests all processed data to graph
-      # Always rebuilds graph from scratch - incremental not yet supported
+    if job_type == "process_batch":
+      # sec_process_batch job - processes a year's filings on a worker pool
+      config = {
+        "ops": {
+          "sec_process_batch": {
+            "config": {"skip_existing": skip_existing, **(process_config or {})}
+          },
+        }
+      }
+    elif job_type == "materialize":
+      # sec_materialize job - ingests new processed data to graph
+      # (everything when rebuilding or when the graph was reset)
       config = {
         "ops": {
           "sec_duckdb_staging": {"config": {}},
           "sec_graph_materialized": {
-            "config": {"graph_id": "sec", "ignore_errors": True}
+            "config": {"graph_id": "sec", "ignore_errors": True, "rebuild": rebuild}
           },
         }
       }
@@ -797,11 +814,14 @@ def cmd_download(args):
 
 
 def cmd_materialize(args):
-  """Materialize command - ingests all processed parquet files to graph."""
+  """Materialize command - ingests processed parquet files to graph."""
   logger.info("=" * 60)
   logger.info("SEC Materialization (Phase 3)")
   logger.info("=" * 60)
-  logger.info("Ingesting all processed parquet files to LadybugDB graph")
+  if args.rebuild:
+    logger.info("Rebuilding LadybugDB graph from all processed parquet files")
+  else:
+    logger.info("Ingesting new processed parquet files to LadybugDB graph")
   logger.info("=" * 60)
 
   # Log timeout settings if non-default
@@ -826,6 +846,7 @@ def cmd_materialize(args):
     tickers=[],
     year=None,
     job_type="materialize",
+    rebuild=args.rebuild,
   )
 
   result = pipeline.run_stage(
@@ -854,6 +875,81 @@ def cmd_materialize(args):
   return 0 if result.success else 1
 
 
+def cmd_process_batch(args):
+  """Process a year's filings on a worker process pool (Phase 2, backfills).
+
+  Runs the sec_process_batch job once per year. Each run processes every
+  unprocessed filing of the year in worker processes that keep a warm Arelle
+  controller across filings, instead of one Dagster run per filing.
+  """
+  years = args.years or ([args.year] if args.year else ALL_YEAR_PARTITIONS)
+
+  logger.info("=" * 60)
+  logger.info("SEC Batch Processing (Phase 2)")
+  logger.info("=" * 60)
+  logger.info(f"Years: {', '.join(years)}")
+  logger.info(f"Workers: {args.workers or 'one per CPU core'}")
+
+  pipeline = SECPipeline(
+    tickers=[],
+    years=years,
+    skip_download=True,
+    skip_reset=True,
+    verbose=args.verbose,
+  )
+
+  process_config = {
+    "max_workers": args.workers,
+    "filings_per_worker": args.filings_per_worker,
+    "max_filings": args.limit,
+  }
+
+  results = []
+  for year in years:
+    logger.info(f"Processing {year}...")
+    config_path = pipeline._create_job_config(
+      tickers=[],
+      year=year,
+      job_type="process_batch",
+      process_config=process_config,
+    )
+    result = pipeline.run_stage(
+      job_name="sec_process_batch",
+      config_path=config_path,
+      year=year,
+      timeout=args.timeout,
+    )
+    results.append(result)
+
+    if result.success:
+      logger.info(f"  {year} complete ({result.duration_seconds:.1f}s)")
+    else:
+      logger.error(f"  {year} failed: {result.error}")
+
+  failed = [result for result in results if not result.success]
+
+  if args.json:
+    print(
+      json.dumps(
+        {
+          "status": "success" if not failed else "partial_failure",
+          "years": [
+            {
+              "year": result.year,
+              "success": result.success,
+              "duration_seconds": result.duration_seconds,
+              "error": result.error,
+            }
+            for result in results
+          ],
+        },
+        indent=2,
+      )
+    )
+
+  return 0 if not failed else 1
+
+
 def cmd_process_parallel(args):
   """Process filings in parallel via Dagster dynamic partitions.
 
@@ -1144,10 +1240,15 @@ def main():
 
   # Materialize command - ingests all processed data to graph
   mat_parser = subparsers.add_parser(
-    "materialize", help="Ingest all processed parquet files to LadybugDB graph"
+    "materialize", help="Ingest new processed parquet files to LadybugDB graph"
   )
   mat_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
   mat_parser.add_argument("--json", action="store_true", help="JSON output")
+  mat_parser.add_argument(
+    "--rebuild",
+    action="store_true",
+    help="Rebuild the graph from all processed files (default: new files only)",
+  )
   mat_parser.add_argument(
     "--materialize-timeout",
     type=int,
@@ -1174,6 +1275,39 @@ def main():
   )
   parallel_parser.add_argument("--json", action="store_true", help="JSON output")
 
+  # Process-batch command
+  batch_parser = subparsers.add_parser(
+    "process-batch",
+    help="Process a year's filings on a worker process pool (Phase 2, backfills)",
+  )
+  batch_parser.add_argument("--year", type=str, help="Single year")
+  batch_parser.add_argument("--years", nargs="+", help="Specific years")
+  batch_parser.add_argument(
+    "--workers",
+    type=int,
+    default=0,
+    help="Worker processes (default: SEC_PROCESS_WORKERS or one per CPU core)",
+  )
+  batch_parser.add_argument(
+    "--filings-per-worker",
+    type=int,
+    default=0,
+    help="Filings before a worker is replaced (default: SEC_PROCESS_FILINGS_PER_WORKER)",
+  )
+  batch_parser.add_argument(
+    "--limit", type=int, default=0, help="Limit number of filings per year"
+  )
+  batch_parser.add_argument(
+    "--timeout",
+    type=int,
+    default=DEFAULT_PROCESS_BATCH_TIMEOUT,
+    help=f"Timeout in seconds per year (default: {DEFAULT_PROCESS_BATCH_TIMEOUT})",
+  )
+  batch_parser.add_argument(
+    "-v", "--verbose", action="store_true", help="Verbose output"
+  )
+  batch_parser.add_argument("--json", action="store_true", help="JSON output")
+
   args = parser.parse_args()
 
   if args.command == "run":
@@ -1186,6 +1320,8 @@ def main():
     sys.exit(cmd_materialize(args))
   elif args.command == "process-parallel":
     sys.exit(cmd_process_parallel(args))
+  elif args.command == "process-batch":
+    sys.exit(cmd_process_batch(args))
   else:
     parser.print_help()
     sys.exit(0)
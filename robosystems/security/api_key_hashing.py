@@ -0,0 +1,165 @@
+"""
+API key hashing and verification.
+
+API keys are verified against their stored hash on every auth cache miss.
+bcrypt at 12 rounds costs about 250ms of CPU per check, so verification runs
+on a small bounded thread pool (bcrypt releases the GIL) instead of on the
+request path, and concurrent misses for the same key share one verification.
+
+Generated API keys carry 256 bits of entropy, so a slow hash adds no brute
+force protection for them. With ``API_KEY_HMAC_HASHING_ENABLED`` and a
+configured ``API_KEY_HMAC_PEPPER``, new keys are stored as HMAC-SHA256 keyed
+with the server pepper, and bcrypt-hashed keys are re-hashed after their next
+successful verification. HMAC hashes are deterministic, so they can also be
+looked up directly instead of checking every key sharing a prefix.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import bcrypt
+
+from ..config import env
+from ..logger import logger
+
+HMAC_HASH_PREFIX = "hmac-sha256$"
+
+
+def hmac_hashing_enabled() -> bool:
+  """Whether new and re-verified keys are stored as peppered HMAC-SHA256."""
+  return env.API_KEY_HMAC_HASHING_ENABLED and bool(env.API_KEY_HMAC_PEPPER)
+
+
+def hmac_hash_api_key(plain_key: str) -> str:
+  """Hash an API key with HMAC-SHA256 keyed by the server pepper."""
+  digest = hmac.new(
+    env.API_KEY_HMAC_PEPPER.encode("utf-8"), plain_key.encode("utf-8"), hashlib.sha256
+  ).hexdigest()
+  return f"{HMAC_HASH_PREFIX}{digest}"
+
+
+def is_hmac_hash(stored_hash: str) -> bool:
+  """Whether a stored hash was produced by ``hmac_hash_api_key``."""
+  return stored_hash.startswith(HMAC_HASH_PREFIX)
+
+
+def needs_rehash(stored_hash: str) -> bool:
+  """Whether a verified key should be migrated to the HMAC scheme."""
+  return hmac_hashing_enabled() and not is_hmac_hash(stored_hash)
+
+
+def verify_api_key_hash(plain_key: str, stored_hash: str) -> bool:
+  """
+  Verify an API key against a stored bcrypt or HMAC hash.
+
+  Args:
+      plain_key: The plain text API key
+      stored_hash: The stored hash from the database
+
+  Returns:
+      True if the key matches
+  """
+  if is_hmac_hash(stored_hash):
+    if not env.API_KEY_HMAC_PEPPER:
+      logger.error("HMAC API key hash found but API_KEY_HMAC_PEPPER is not set")
+      return False
+    return hmac.compare_digest(hmac_hash_api_key(plain_key), stored_hash)
+  return bcrypt.checkpw(plain_key.encode("utf-8"), stored_hash.encode("utf-8"))
+
+
+def _match_api_key(plain_key: str, stored_hashes: Sequence[str]) -> int | None:
+  """Index of the first stored hash matching the key, if any."""
+  for index, stored_hash in enumerate(stored_hashes):
+    try:
+      if verify_api_key_hash(plain_key, stored_hash):
+        return index
+    except Exception as e:
+      logger.error(f"API key verification failed: {e}")
+  return None
+
+
+class APIKeyVerifier:
+  """Bounded, single-flight API key verification off the calling thread."""
+
+  def __init__(self, max_workers: int | None = None):
+    self.max_workers = max_workers or env.API_KEY_VERIFY_WORKERS
+    self._executor: ThreadPoolExecutor | None = None
+    self._pid = os.getpid()
+    self._lock = threading.Lock()
+    self._inflight: dict[tuple[bytes, tuple[str, ...]], Future] = {}
+
+  def _get_executor(self) -> ThreadPoolExecutor:
+    # Worker threads do not survive a fork, so rebuild the pool in children
+    if self._executor is None or self._pid != os.getpid():
+      self._pid = os.getpid()
+      self._inflight.clear()
+      self._executor = ThreadPoolExecutor(
+        max_workers=self.max_workers, thread_name_prefix="api-key-verify"
+      )
+    return self._executor
+
+  def submit(self, plain_key: str, stored_hashes: Sequence[str]) -> Future:
+    """
+    Start verifying a key against candidate hashes.
+
+    Concurrent calls for the same key and candidates share one verification.
+
+    Returns:
+        Future resolving to the index of the matching hash, or None
+    """
+    hashes = tuple(stored_hashes)
+    if all(is_hmac_hash(stored_hash) for stored_hash in hashes):
+      # HMAC checks are cheap enough to run inline
+      future: Future = Future()
+      future.set_result(_match_api_key(plain_key, hashes))
+      return future
+
+    flight_key = (hashlib.sha256(plain_key.encode("utf-8")).digest(), hashes)
+    with self._lock:
+      executor = self._get_executor()
+      existing: Future | None = self._inflight.get(flight_key)
+      if existing is not None:
+        return existing
+      future = executor.submit(_match_api_key, plain_key, hashes)
+      self._inflight[flight_key] = future
+
+    future.add_done_callback(lambda f: self._forget(flight_key, f))
+    return future
+
+  def _forget(self, flight_key: tuple[bytes, tuple[str, ...]], future: Future) -> None:
+    with self._lock:
+      if self._inflight.get(flight_key) is future:
+        del self._inflight[flight_key]
+
+  def verify(self, plain_key: str, stored_hashes: Sequence[str]) -> int | None:
+    """Verify from synchronous code, blocking only the calling thread."""
+    if not stored_hashes:
+      return None
+    return self.submit(plain_key, stored_hashes).result()
+
+  async def verify_async(
+    self, plain_key: str, stored_hashes: Sequence[str]
+  ) -> int | None:
+    """Verify without blocking the event loop."""
+    if not stored_hashes:
+      return None
+    # Shielded so a cancelled request does not cancel a verification it shares
+    return await asyncio.shield(
+      asyncio.wrap_future(self.submit(plain_key, stored_hashes))
+    )
+
+  def shutdown(self) -> None:
+    """Stop the verification threads."""
+    with self._lock:
+      if self._executor is not None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+      self._inflight.clear()
+
+
+api_key_verifier = APIKeyVerifier()
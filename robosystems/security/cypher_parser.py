@@ -0,0 +1,733 @@
+"""
+Single-pass Cypher tokenizer and shared query analysis.
+
+Several layers need to know the same things about a Cypher query: whether it
+writes, which clauses it uses, its RETURN aliases, whether it has a LIMIT, and
+how expensive it is likely to be. Instead of each layer running its own regex
+passes over the raw text, ``parse_cypher`` tokenizes the query once and returns
+an immutable ``CypherAnalysis`` that every consumer reads from.
+
+Analyses are cached by query hash, so repeated dashboard and agent queries skip
+tokenization entirely. Because keywords are taken from tokens, text inside
+string literals, comments and backtick-quoted identifiers never triggers a
+match.
+"""
+
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+
+# Maximum number of distinct query analyses kept in memory
+ANALYSIS_CACHE_SIZE = 2048
+
+# Queries longer than this are rejected by the security checks
+MAX_ANALYZED_QUERY_LENGTH = 100000
+
+# Definitive write operation keywords
+WRITE_KEYWORDS = frozenset(
+  {
+    "CREATE",
+    "MERGE",
+    "SET",
+    "DELETE",
+    "REMOVE",
+    "DETACH",
+    "DROP",
+    "ALTER",
+    "INSERT",
+    "UPDATE",
+  }
+)
+
+# Bulk operation keywords that should use dedicated endpoints
+BULK_KEYWORDS = frozenset({"COPY", "LOAD", "IMPORT"})
+
+# Administrative operations that require special permissions
+ADMIN_KEYWORDS = frozenset({"EXPORT", "INSTALL", "ATTACH", "USE"})
+
+# System procedure calls that may need restrictions
+SYSTEM_PROCEDURES = frozenset(
+  {
+    "show_warnings",
+    "clear_warnings",
+    "current_setting",
+    "db_version",
+    "table_info",
+    "show_tables",
+    "show_connection",
+  }
+)
+
+# Read-only keywords
+READ_KEYWORDS = frozenset(
+  {
+    "MATCH",
+    "RETURN",
+    "WHERE",
+    "WITH",
+    "UNWIND",
+    "ORDER",
+    "LIMIT",
+    "SKIP",
+    "DISTINCT",
+    "COUNT",
+    "COLLECT",
+    "SUM",
+    "AVG",
+    "MIN",
+    "MAX",
+    "CASE",
+    "WHEN",
+    "THEN",
+    "ELSE",
+    "END",
+  }
+)
+
+# Aggregation functions (when followed by an opening parenthesis)
+AGGREGATION_FUNCTIONS = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX", "COLLECT"})
+
+# Keywords that end a RETURN projection list
+_RETURN_TERMINATORS = frozenset({"ORDER", "SKIP", "LIMIT", "UNION", "WHERE", "WITH"})
+
+# String operators that tend to be slow on large datasets
+STRING_OPERATORS = ("CONTAINS", "STARTS WITH", "ENDS WITH", "=~")
+
+# Multi-character symbols, longest first
+_SYMBOLS = ("..", "=~", "+=", "<>", "<=", ">=", "->", "<-", "::")
+
+
+class TokenType(Enum):
+  """Types of Cypher tokens."""
+
+  WORD = "word"  # Keywords, identifiers and function names
+  NUMBER = "number"
+  STRING = "string"  # Quoted string literal
+  IDENTIFIER = "identifier"  # Backtick-quoted identifier
+  PARAMETER = "parameter"  # $name
+  SYMBOL = "symbol"
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+  """A single token with its position in the original query."""
+
+  type: TokenType
+  value: str
+  start: int
+  end: int
+
+  @property
+  def upper(self) -> str:
+    return self.value.upper()
+
+  def is_word(self, *words: str) -> bool:
+    return self.type is TokenType.WORD and self.value.upper() in words
+
+  def is_symbol(self, *symbols: str) -> bool:
+    return self.type is TokenType.SYMBOL and self.value in symbols
+
+
+@dataclass(frozen=True, slots=True)
+class CypherAnalysis:
+  """Immutable analysis of a Cypher query, shared by all consumers."""
+
+  query_hash: str
+  tokens: tuple[Token, ...]
+
+  # Keyword classification (upper-case words outside literals and comments)
+  keywords: frozenset[str]
+  keyword_sequence: str  # Upper-case words joined by single spaces
+  write_keywords: frozenset[str]
+  read_keywords: frozenset[str]
+  bulk_keywords: frozenset[str]
+  admin_operations: frozenset[str]
+  schema_ddl_operations: frozenset[str]
+  procedure_calls: tuple[str, ...]  # Lower-case names of CALLed procedures
+  system_calls: frozenset[str]
+
+  # Clause structure
+  clauses: tuple[str, ...]
+  match_count: int
+  with_count: int
+  order_by_count: int
+  has_return: bool
+  has_union: bool
+  has_limit: bool
+  limit_value: int | None  # None when absent or parameterized
+  return_aliases: tuple[str, ...]
+  parameters: frozenset[str]
+
+  # Cost indicators
+  has_aggregation: bool
+  has_group_by: bool
+  has_shortest_path: bool
+  has_all_paths: bool
+  has_cartesian: bool
+  has_generic_node: bool  # MATCH ()
+  var_length_paths: tuple[tuple[int, int | None], ...]  # (min, max) hop bounds
+  string_operators: tuple[str, ...]
+  complexity_score: int
+
+  # Syntax and security
+  unclosed_string: bool
+  unclosed_comment: bool
+  paren_balance: int
+  bracket_balance: int
+  security_error: str | None
+
+  @property
+  def is_write(self) -> bool:
+    """Whether the query writes (unanalyzable queries are treated as writes)."""
+    return self.security_error is not None or bool(self.write_keywords)
+
+  @property
+  def is_read_only(self) -> bool:
+    return not self.is_write
+
+  @property
+  def is_mixed(self) -> bool:
+    return bool(self.write_keywords) and bool(self.read_keywords)
+
+  @property
+  def is_schema_ddl(self) -> bool:
+    return bool(self.schema_ddl_operations)
+
+  @property
+  def is_bulk(self) -> bool:
+    return bool(self.bulk_keywords)
+
+  @property
+  def is_admin(self) -> bool:
+    return bool(self.admin_operations)
+
+  def has_phrase(self, phrase: str) -> bool:
+    """Check for a keyword phrase such as ``LOAD CSV`` (case-insensitive)."""
+    return f" {phrase.upper()} " in f" {self.keyword_sequence} "
+
+
+def tokenize_cypher(query: str) -> tuple[tuple[Token, ...], bool, bool]:
+  """
+  Tokenize a Cypher query in a single pass.
+
+  Comments are skipped. String literals, backtick identifiers and parameters
+  become single tokens so their contents never look like keywords.
+
+  Returns:
+      Tuple of (tokens, unclosed_string, unclosed_comment)
+  """
+  tokens: list[Token] = []
+  unclosed_string = False
+  unclosed_comment = False
+  length = len(query)
+  i = 0
+
+  while i < length:
+    ch = query[i]
+
+    if ch.isspace():
+      i += 1
+      continue
+
+    # Comments
+    if ch == "/" and i + 1 < length:
+      nxt = query[i + 1]
+      if nxt == "/":
+        newline = query.find("\n", i + 2)
+        i = length if newline == -1 else newline + 1
+        continue
+      if nxt == "*":
+        close = query.find("*/", i + 2)
+        if close == -1:
+          unclosed_comment = True
+          i = length
+        else:
+          i = close + 2
+        continue
+
+    # String literals and backtick identifiers
+    if ch in ("'", '"', "`"):
+      j = i + 1
+      closed = False
+      while j < length:
+        c = query[j]
+        if c == "\\" and ch != "`":
+          j += 2
+          continue
+        if c == ch:
+          closed = True
+          j += 1
+          break
+        j += 1
+      if not closed:
+        unclosed_string = True
+        j = length
+      token_type = TokenType.IDENTIFIER if ch == "`" else TokenType.STRING
+      value = query[i + 1 : j - 1] if closed else query[i + 1 : j]
+      tokens.append(Token(token_type, value, i, j))
+      i = j
+      continue
+
+    # Parameters
+    if ch == "$":
+      j = i + 1
+      while j < length and (query[j].isalnum() or query[j] == "_"):
+        j += 1
+      tokens.append(Token(TokenType.PARAMETER, query[i + 1 : j], i, j))
+      i = j
+      continue
+
+    # Numbers (a following ".." is a range, not a decimal point)
+    if ch.isdigit():
+      j = i + 1
+      while j < length and query[j].isdigit():
+        j += 1
+      if (
+        j + 1 < length
+        and query[j] == "."
+        and query[j + 1].isdigit()
+        and not query.startswith("..", j)
+      ):
+        j += 1
+        while j < length and query[j].isdigit():
+          j += 1
+      tokens.append(Token(TokenType.NUMBER, query[i:j], i, j))
+      i = j
+      continue
+
+    # Words
+    if ch.isalpha() or ch == "_":
+      j = i + 1
+      while j < length and (query[j].isalnum() or query[j] == "_"):
+        j += 1
+      tokens.append(Token(TokenType.WORD, query[i:j], i, j))
+      i = j
+      continue
+
+    # Symbols
+    for symbol in _SYMBOLS:
+      if query.startswith(symbol, i):
+        tokens.append(Token(TokenType.SYMBOL, symbol, i, i + len(symbol)))
+        i += len(symbol)
+        break
+    else:
+      tokens.append(Token(TokenType.SYMBOL, ch, i, i + 1))
+      i += 1
+
+  return tuple(tokens), unclosed_string, unclosed_comment
+
+
+def query_hash(query: str) -> str:
+  """Stable hash of the exact query text, used as the analysis cache key."""
+  return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _security_error(
+  query: str,
+  tokens: tuple[Token, ...],
+  unclosed_string: bool,
+  unclosed_comment: bool,
+) -> str | None:
+  """Basic security validation; returns an error message or None."""
+  if len(query) > MAX_ANALYZED_QUERY_LENGTH:
+    return "Query exceeds maximum allowed length"
+
+  # An unterminated literal swallows the rest of the query, hiding its keywords
+  if unclosed_string:
+    return "Unterminated string literal detected"
+
+  # Unterminated block comment, or a stray comment terminator outside one
+  if unclosed_comment or any(
+    token.is_symbol("*") and following.is_symbol("/") and token.end == following.start
+    for token, following in itertools.pairwise(tokens)
+  ):
+    return "Unbalanced comment blocks detected"
+
+  # Statement-chained admin commands (``; CREATE USER`` and friends)
+  for index, token in enumerate(tokens):
+    if not token.is_symbol(";"):
+      continue
+    following = [t.upper for t in tokens[index + 1 : index + 4]]
+    if following[:2] in (["CREATE", "USER"], ["DROP", "DATABASE"], ["SHOW", "USERS"]):
+      return "Query contains potentially dangerous patterns"
+    if following == ["CALL", "DBMS", "."]:
+      return "Query contains potentially dangerous patterns"
+
+  return None
+
+
+def _return_aliases(tokens: tuple[Token, ...], query: str) -> tuple[str, ...]:
+  """Column names of the final top-level RETURN projection."""
+  depth = 0
+  return_index = None
+  for index, token in enumerate(tokens):
+    if token.is_symbol("(", "[", "{"):
+      depth += 1
+    elif token.is_symbol(")", "]", "}"):
+      depth -= 1
+    elif depth == 0 and token.is_word("RETURN"):
+      return_index = index
+
+  if return_index is None:
+    return ()
+
+  items: list[list[Token]] = [[]]
+  depth = 0
+  for token in tokens[return_index + 1 :]:
+    if depth == 0 and (token.is_word(*_RETURN_TERMINATORS) or token.is_symbol(";")):
+      break
+    if token.is_symbol("(", "[", "{"):
+      depth += 1
+    elif token.is_symbol(")", "]", "}"):
+      depth -= 1
+    if depth == 0 and token.is_symbol(","):
+      items.append([])
+      continue
+    items[-1].append(token)
+
+  aliases = []
+  for item in items:
+    if item and item[0].is_word("DISTINCT"):
+      item = item[1:]
+    if not item:
+      continue
+    if (
+      len(item) >= 3
+      and item[-2].is_word("AS")
+      and item[-1].type in (TokenType.WORD, TokenType.IDENTIFIER)
+    ):
+      aliases.append(item[-1].value)
+    else:
+      aliases.append(" ".join(query[item[0].start : item[-1].end].split()))
+
+  return tuple(aliases)
+
+
+def _var_length_paths(tokens: tuple[Token, ...]) -> tuple[tuple[int, int | None], ...]:
+  """Extract hop bounds of variable-length relationship patterns."""
+  bounds = []
+  inside = False
+  for index, token in enumerate(tokens):
+    if token.is_symbol("["):
+      inside = True
+    elif token.is_symbol("]"):
+      inside = False
+    elif inside and token.is_symbol("*"):
+      rest = tokens[index + 1 : index + 4]
+      lower: int | None = None
+      upper: int | None = None
+      if rest and rest[0].type is TokenType.NUMBER:
+        lower = int(rest[0].value)
+        rest = rest[1:]
+        upper = lower
+      if rest and rest[0].is_symbol(".."):
+        upper = (
+          int(rest[1].value)
+          if len(rest) > 1 and rest[1].type is TokenType.NUMBER
+          else None
+        )
+      bounds.append((lower if lower is not None else 1, upper))
+  return tuple(bounds)
+
+
+def _complexity_score(
+  has_return: bool,
+  has_limit: bool,
+  var_length_paths: tuple[tuple[int, int | None], ...],
+  match_count: int,
+  with_count: int,
+  has_generic_node: bool,
+  order_by_count: int,
+  string_operators: tuple[str, ...],
+) -> int:
+  """Heuristic cost estimate used for query warnings and strategy selection."""
+  score = 0
+  if has_return and not has_limit:
+    score += 20
+  for lower, upper in var_length_paths:
+    if upper is None:
+      continue
+    if upper > 5:
+      score += (upper - 5) * 10
+    if upper - lower > 10:
+      score += 15
+  if match_count > 2 and with_count == 0:
+    score += (match_count - 1) * 20
+  if has_generic_node:
+    score += 30
+  if order_by_count > 1:
+    score += order_by_count * 10
+  score += len(string_operators) * 10
+  return score
+
+
+def _analyze(query: str, digest: str) -> CypherAnalysis:
+  tokens, unclosed_string, unclosed_comment = tokenize_cypher(query)
+
+  words = [t for t in tokens if t.type is TokenType.WORD]
+  upper_words = [t.upper for t in words]
+  keywords = frozenset(upper_words)
+  keyword_sequence = " ".join(upper_words)
+
+  def phrase(*parts: str) -> bool:
+    return f" {' '.join(parts)} " in f" {keyword_sequence} "
+
+  # Statement classification
+  write_keywords = keywords & WRITE_KEYWORDS
+  read_keywords = keywords & READ_KEYWORDS
+  bulk_keywords = keywords & BULK_KEYWORDS
+
+  admin_operations = set(keywords & ADMIN_KEYWORDS)
+  if phrase("IMPORT", "DATABASE") or phrase("EXPORT", "DATABASE"):
+    admin_operations.add("DATABASE_MIGRATION")
+  if phrase("DETACH", "DATABASE"):
+    admin_operations.add("DETACH_DATABASE")
+
+  schema_ddl = set()
+  if phrase("CREATE", "NODE", "TABLE") or phrase("CREATE", "REL", "TABLE"):
+    schema_ddl.add("CREATE_TABLE")
+  if phrase("DROP", "NODE", "TABLE") or phrase("DROP", "REL", "TABLE"):
+    schema_ddl.add("DROP_TABLE")
+  if phrase("ALTER", "TABLE"):
+    schema_ddl.add("ALTER_TABLE")
+  if phrase("ADD", "COLUMN") or phrase("DROP", "COLUMN") or phrase("RENAME", "COLUMN"):
+    schema_ddl.add("MODIFY_COLUMN")
+  if phrase("RENAME", "TABLE"):
+    schema_ddl.add("RENAME_TABLE")
+
+  # Procedure calls (CALL name(...) or CALL ns.name(...))
+  procedure_calls = []
+  has_aggregation = False
+  has_generic_node = False
+  clauses = []
+  string_operators = []
+  paren_balance = 0
+  bracket_balance = 0
+  depth = 0
+  previous: Token | None = None
+  for index, token in enumerate(tokens):
+    following = tokens[index + 1] if index + 1 < len(tokens) else None
+
+    if token.is_symbol("(", "{"):
+      paren_balance += token.value == "("
+      depth += 1
+    elif token.is_symbol(")", "}"):
+      paren_balance -= token.value == ")"
+      depth -= 1
+    elif token.is_symbol("["):
+      bracket_balance += 1
+    elif token.is_symbol("]"):
+      bracket_balance -= 1
+    elif token.is_symbol("=~"):
+      string_operators.append("=~")
+
+    if token.type is TokenType.WORD:
+      upper = token.upper
+      if upper == "CALL" and following is not None:
+        name_parts = []
+        for part in tokens[index + 1 :]:
+          if part.type is TokenType.WORD or part.is_symbol("."):
+            name_parts.append(part.value)
+          else:
+            break
+        if name_parts:
+          procedure_calls.append("".join(name_parts).lower())
+
+      if upper in AGGREGATION_FUNCTIONS and following is not None:
+        if following.is_symbol("(") or (upper == "COUNT" and following.is_symbol("{")):
+          has_aggregation = True
+
+      if upper == "MATCH" and following is not None and following.is_symbol("("):
+        after = tokens[index + 2] if index + 2 < len(tokens) else None
+        if after is not None and after.is_symbol(")"):
+          has_generic_node = True
+
+      if upper == "CONTAINS":
+        string_operators.append("CONTAINS")
+      elif upper == "WITH" and previous is not None and previous.is_word("STARTS"):
+        string_operators.append("STARTS WITH")
+      elif upper == "WITH" and previous is not None and previous.is_word("ENDS"):
+        string_operators.append("ENDS WITH")
+
+      if depth == 0 and upper in (
+        "MATCH",
+        "OPTIONAL",
+        "WHERE",
+        "WITH",
+        "UNWIND",
+        "RETURN",
+        "ORDER",
+        "SKIP",
+        "LIMIT",
+        "UNION",
+        "CALL",
+        "CREATE",
+        "MERGE",
+        "SET",
+        "DELETE",
+        "REMOVE",
+        "COPY",
+      ):
+        if not (
+          upper == "WITH"
+          and previous is not None
+          and previous.is_word("STARTS", "ENDS")
+        ):
+          clauses.append(upper)
+
+    previous = token
+
+  system_calls = frozenset(
+    name for name in procedure_calls if name.split(".")[-1] in SYSTEM_PROCEDURES
+  )
+
+  # LIMIT (literal value if present)
+  limit_value = None
+  has_limit = "LIMIT" in keywords
+  for index, token in enumerate(tokens):
+    if token.is_word("LIMIT") and index + 1 < len(tokens):
+      following = tokens[index + 1]
+      if following.type is TokenType.NUMBER and following.value.isdigit():
+        limit_value = int(following.value)
+      break
+
+  match_count = upper_words.count("MATCH")
+  with_count = upper_words.count("WITH") - sum(
+    1 for op in string_operators if op.endswith("WITH")
+  )
+  order_by_count = keyword_sequence.count("ORDER BY")
+  has_return = "RETURN" in keywords
+  var_length_paths = _var_length_paths(tokens)
+  has_cartesian = match_count > 1 and any(t.is_symbol(",") for t in tokens)
+  has_shortest_path = any("SHORTEST" in word for word in keywords)
+  has_all_paths = "ALL" in keywords and any("PATH" in word for word in keywords)
+
+  security_error = _security_error(query, tokens, unclosed_string, unclosed_comment)
+
+  operators = tuple(dict.fromkeys(string_operators))
+
+  return CypherAnalysis(
+    query_hash=digest,
+    tokens=tokens,
+    keywords=keywords,
+    keyword_sequence=keyword_sequence,
+    write_keywords=write_keywords,
+    read_keywords=read_keywords,
+    bulk_keywords=bulk_keywords,
+    admin_operations=frozenset(admin_operations),
+    schema_ddl_operations=frozenset(schema_ddl),
+    procedure_calls=tuple(procedure_calls),
+    system_calls=system_calls,
+    clauses=tuple(clauses),
+    match_count=match_count,
+    with_count=with_count,
+    order_by_count=order_by_count,
+    has_return=has_return,
+    has_union="UNION" in keywords,
+    has_limit=has_limit,
+    limit_value=limit_value,
+    return_aliases=_return_aliases(tokens, query),
+    parameters=frozenset(
+      t.value for t in tokens if t.type is TokenType.PARAMETER and t.value
+    ),
+    has_aggregation=has_aggregation,
+    has_group_by=phrase("GROUP", "BY"),
+    has_shortest_path=has_shortest_path,
+    has_all_paths=has_all_paths,
+    has_cartesian=has_cartesian,
+    has_generic_node=has_generic_node,
+    var_length_paths=var_length_paths,
+    string_operators=operators,
+    complexity_score=_complexity_score(
+      has_return,
+      has_limit,
+      var_length_paths,
+      match_count,
+      with_count,
+      has_generic_node,
+      order_by_count,
+      operators,
+    ),
+    unclosed_string=unclosed_string,
+    unclosed_comment=unclosed_comment,
+    paren_balance=paren_balance,
+    bracket_balance=bracket_balance,
+    security_error=security_error,
+  )
+
+
+class _AnalysisCache:
+  """Thread-safe LRU of analyses keyed by query hash."""
+
+  def __init__(self, max_entries: int):
+    self.max_entries = max_entries
+    self._entries: OrderedDict[str, CypherAnalysis] = OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, digest: str) -> CypherAnalysis | None:
+    with self._lock:
+      analysis = self._entries.get(digest)
+      if analysis is None:
+        self.misses += 1
+        return None
+      self._entries.move_to_end(digest)
+      self.hits += 1
+      return analysis
+
+  def put(self, analysis: CypherAnalysis) -> None:
+    with self._lock:
+      self._entries[analysis.query_hash] = analysis
+      self._entries.move_to_end(analysis.query_hash)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self.hits = 0
+      self.misses = 0
+
+  def stats(self) -> dict[str, int]:
+    with self._lock:
+      return {
+        "entries": len(self._entries),
+        "max_entries": self.max_entries,
+        "hits": self.hits,
+        "misses": self.misses,
+      }
+
+
+_analysis_cache = _AnalysisCache(ANALYSIS_CACHE_SIZE)
+
+
+def parse_cypher(query: str) -> CypherAnalysis:
+  """
+  Analyze a Cypher query, reusing the cached analysis for identical text.
+
+  Args:
+      query: The Cypher query to analyze
+
+  Returns:
+      Immutable CypherAnalysis
+  """
+  digest = query_hash(query)
+  analysis = _analysis_cache.get(digest)
+  if analysis is None:
+    analysis = _analyze(query, digest)
+    _analysis_cache.put(analysis)
+  return analysis
+
+
+def get_analysis_cache_stats() -> dict[str, int]:
+  """Get analysis cache statistics."""
+  return _analysis_cache.stats()
+
+
+def clear_analysis_cache() -> None:
+  """Drop all cached analyses."""
+  _analysis_cache.clear()
@@ -184,6 +184,28 @@ class TestArelleClient:
     # Verify - should copy .xsd and .xml files but not .txt
     assert mock_copy2.call_count == 2  # Only .xsd and .xml files
 
+  def test_populate_cache_skips_already_extracted_bundle(self, temp_dir):
+    """Test cache population is skipped when the target holds the same bundle."""
+    source_dir = temp_dir / "source"
+    target_dir = temp_dir / "target"
+    (source_dir / "www.xbrl.org").mkdir(parents=True)
+    (source_dir / "www.xbrl.org" / "test.xsd").write_text("<schema/>")
+    (source_dir / "bundle_manifest.json").write_text('{"digest": "abc123"}')
+    target_dir.mkdir()
+
+    client = ArelleClient.__new__(ArelleClient)
+
+    # First start copies the schemas and records the bundle
+    client._populate_cache_from_bundle(source_dir, target_dir)
+    assert (target_dir / "www.xbrl.org" / "test.xsd").exists()
+    assert (target_dir / "bundle_manifest.json").exists()
+
+    # Later starts do not walk the bundle again
+    with patch("robosystems.adapters.sec.client.arelle.shutil.copy2") as mock_copy2:
+      (target_dir / "www.xbrl.org" / "test.xsd").unlink()
+      client._populate_cache_from_bundle(source_dir, target_dir)
+      mock_copy2.assert_not_called()
+
   @patch("robosystems.adapters.sec.client.arelle.Path.glob")
   def test_check_cache_health_success(self, mock_glob, temp_dir):
     """Test cache health check with sufficient schemas."""
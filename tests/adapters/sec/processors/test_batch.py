@@ -0,0 +1,67 @@
+"""Tests for process-pool parallel processing of SEC filings."""
+
+import os
+
+import pytest
+
+from robosystems.adapters.sec.processors.batch import FilingProcessPool
+
+
+# Worker functions must be importable by spawned worker processes
+def _process(key: str) -> dict:
+  if key == "raise":
+    raise ValueError("bad filing")
+  if key == "crash":
+    os._exit(1)
+  if key == "status":
+    return {"status": "error", "reason": "No XBRL files found"}
+  return {"status": "success", "pid": os.getpid()}
+
+
+@pytest.mark.slow
+class TestFilingProcessPool:
+  """Test parallel filing processing with worker processes."""
+
+  def test_results_in_input_order_with_progress(self):
+    pool = FilingProcessPool(max_workers=2, filings_per_worker=0)
+    progress = []
+
+    results = pool.run(
+      ["a", "b", "c", "a"],
+      _process,
+      on_result=lambda result, completed, total: progress.append((completed, total)),
+    )
+
+    assert [result.key for result in results] == ["a", "b", "c"]
+    assert all(result.success for result in results)
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+  def test_failures_are_isolated_per_filing(self):
+    pool = FilingProcessPool(max_workers=2, filings_per_worker=0)
+
+    results = {
+      result.key: result for result in pool.run(["a", "raise", "status", "b"], _process)
+    }
+
+    assert results["a"].success and results["b"].success
+    assert results["raise"].status == "error"
+    assert results["raise"].error == "ValueError: bad filing"
+    assert results["status"].error == "No XBRL files found"
+
+  def test_dead_worker_only_fails_its_filing(self):
+    pool = FilingProcessPool(max_workers=2, filings_per_worker=0)
+
+    results = {
+      result.key: result for result in pool.run(["a", "crash", "b", "c", "d"], _process)
+    }
+
+    assert results["crash"].status == "error"
+    assert "died" in results["crash"].error
+    assert all(results[key].success for key in ("a", "b", "c", "d"))
+
+  def test_workers_are_recycled(self):
+    pool = FilingProcessPool(max_workers=1, filings_per_worker=1)
+
+    results = pool.run(["a", "b", "c"], _process)
+
+    assert len({result.metadata["pid"] for result in results}) == 3
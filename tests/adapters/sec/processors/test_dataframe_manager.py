@@ -1,9 +1,55 @@
+import io
+from datetime import date
 from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
 
-from robosystems.adapters.sec.processors.dataframe import DataFrameManager
+from robosystems.adapters.sec.processors.dataframe import (
+  DataFrameManager,
+  TableBuffer,
+)
+from robosystems.adapters.sec.processors.ids import safe_concat
+
+FACT_COLUMNS = [
+  "identifier",
+  "uri",
+  "value",
+  "numeric_value",
+  "fact_type",
+  "decimals",
+  "value_type",
+  "content_type",
+]
+
+
+def _fact_rows(count):
+  """Fact rows shaped like a filing: interleaved numeric/text facts, some repeated."""
+  for i in range(count):
+    numeric = i % 3 != 0
+    yield {
+      "identifier": f"fact-{i % (count - count // 10)}",
+      "uri": f"file:///filing.xml#fact-{i}",
+      "value": str(i * 1000) if numeric else "<p>Policy text</p>",
+      "numeric_value": float(i) if numeric else None,
+      "fact_type": "Numeric" if numeric else "Nonnumeric",
+      "decimals": "-3" if numeric else None,
+      "value_type": "inline",
+      "content_type": None,
+    }
+
+
+def _concat_rows(df, rows):
+  """Append rows one at a time the way the processor used to."""
+  for row in rows:
+    df = safe_concat(df, pd.DataFrame([row]))
+  return df
+
+
+def _parquet_bytes(df):
+  buffer = io.BytesIO()
+  df.to_parquet(buffer, index=False)
+  return buffer.getvalue()
 
 
 class TestDataFrameManagerInitialization:
@@ -485,3 +531,82 @@ class TestEnsureSchemaCompleteness:
     result = manager.ensure_schema_completeness(df, "TestTable")
 
     pd.testing.assert_frame_equal(result, df)
+
+
+class TestTableBuffer:
+  def test_matches_row_by_row_concat(self):
+    rows = [
+      {"identifier": "a", "weight": None, "order": 1, "root": True},
+      {"identifier": "b", "weight": 1.0, "order": 2, "root": False},
+      {"identifier": "c", "order": 3, "label": "x"},
+      {"identifier": "d", "weight": -1.0, "order": 2.5, "root": True},
+      {"identifier": "e", "date": date(2024, 12, 31), "label": None},
+    ]
+    initial = pd.DataFrame(columns=["identifier", "weight", "order", "root"])
+
+    buffer = TableBuffer(initial)
+    for row in rows:
+      buffer.append(row)
+    result = buffer.to_dataframe()
+    expected = _concat_rows(initial, rows)
+
+    assert list(result.columns) == list(expected.columns)
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert _parquet_bytes(result) == _parquet_bytes(expected)
+
+  def test_find_returns_first_matching_row(self):
+    buffer = TableBuffer(pd.DataFrame(columns=["identifier", "uri"]))
+
+    assert buffer.find(uri="u1") is None
+    buffer.append({"identifier": "1", "uri": "u1"})
+    buffer.append({"identifier": "2", "uri": "u1"})
+
+    assert buffer.find(uri="u1") == {"identifier": "1", "uri": "u1"}
+    assert buffer.find(identifier="2", uri="u1")["identifier"] == "2"
+    assert buffer.find(identifier="3") is None
+    assert len(buffer) == 2
+
+  def test_in_place_changes_survive_appends(self):
+    buffer = TableBuffer(pd.DataFrame([{"identifier": "r1", "failed": False}]))
+
+    df = buffer.to_dataframe()
+    df.loc[df["identifier"] == "r1", "failed"] = True
+    buffer.append({"identifier": "r2", "failed": False})
+
+    assert buffer.to_dataframe()["failed"].tolist() == [True, False]
+    assert buffer.find(identifier="r1")["failed"]
+
+  def test_untracked_dtype_falls_back_to_concat(self):
+    rows = [
+      {"identifier": "a", "at": None},
+      {"identifier": "b", "at": pd.Timestamp("2024-01-01")},
+      {"identifier": "c", "at": None},
+    ]
+
+    buffer = TableBuffer()
+    for row in rows:
+      buffer.append(row)
+
+    pd.testing.assert_frame_equal(
+      buffer.to_dataframe(), _concat_rows(pd.DataFrame(), rows)
+    )
+    assert buffer.find(identifier="c") is not None
+
+  @pytest.mark.slow
+  def test_large_filing_matches_concat(self):
+    """Buffered fact rows for a large filing match per-row concatenation."""
+    count = 2000
+
+    expected = pd.DataFrame(columns=FACT_COLUMNS)
+    for row in _fact_rows(count):
+      if expected[expected["identifier"] == row["identifier"]].empty:
+        expected = safe_concat(expected, pd.DataFrame([row]))
+
+    buffer = TableBuffer(pd.DataFrame(columns=FACT_COLUMNS))
+    for row in _fact_rows(count):
+      if buffer.find(identifier=row["identifier"]) is None:
+        buffer.append(row)
+    result = buffer.to_dataframe()
+
+    assert len(result) == count - count // 10
+    assert _parquet_bytes(result) == _parquet_bytes(expected)
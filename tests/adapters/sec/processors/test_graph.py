@@ -323,16 +323,12 @@ class TestEntityCreation:
     mock_schema_instance.create_schema_compatible_dataframe.return_value = (
       pd.DataFrame()
     )
-    # Mock the process_dataframe_for_schema method used in make_entity
-    mock_schema_instance.process_dataframe_for_schema.return_value = pd.DataFrame(
-      [
-        {
-          "identifier": "test_kg1a2b3c",
-          "name": None,
-          "cik": None,
-        }
-      ]
-    )
+    # Mock the process_row_for_schema method used in make_entity
+    mock_schema_instance.process_row_for_schema.return_value = {
+      "identifier": "test_kg1a2b3c",
+      "name": None,
+      "cik": None,
+    }
     mock_schema_instance.populate_dataframe.return_value = pd.DataFrame(
       [
         {
@@ -514,15 +510,11 @@ class TestReportCreation:
     mock_schema_instance.create_schema_compatible_dataframe.return_value = (
       pd.DataFrame()
     )
-    # Mock the process_dataframe_for_schema method used in make_report
-    mock_schema_instance.process_dataframe_for_schema.return_value = pd.DataFrame(
-      [
-        {
-          "identifier": "test_id",
-          "uri": "file:///test.xml",
-        }
-      ]
-    )
+    # Mock the process_row_for_schema method used in make_report
+    mock_schema_instance.process_row_for_schema.return_value = {
+      "identifier": "test_id",
+      "uri": "file:///test.xml",
+    }
     mock_schema_instance.populate_dataframe.return_value = pd.DataFrame(
       [
         {
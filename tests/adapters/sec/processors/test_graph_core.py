@@ -77,15 +77,11 @@ def processor(temp_dir, mock_schema_config):
     mock_schema_builder.schema = mock_schema
     mock_schema_instance.schema_builder = mock_schema_builder
 
-    def mock_process_dataframe(table_name, data):
-      """Mock schema adapter to convert data dict to DataFrame."""
-      if isinstance(data, dict):
-        return pd.DataFrame([data])
+    def mock_process_row(table_name, data):
+      """Mock schema adapter to pass rows through unchanged."""
       return data
 
-    mock_schema_instance.process_dataframe_for_schema.side_effect = (
-      mock_process_dataframe
-    )
+    mock_schema_instance.process_row_for_schema.side_effect = mock_process_row
 
     dataframes = {
       "facts_df": pd.DataFrame(
@@ -1,4 +1,13 @@
+import io
+
+import pandas as pd
+import pytest
+import real_ladybug as lbug
+
+from robosystems.adapters.sec.processors import ids
+from robosystems.adapters.sec.processors.dataframe import DataFrameManager
 from robosystems.adapters.sec.processors.ids import (
+  IdInterner,
   create_dimension_id,
   create_element_id,
   create_entity_id,
@@ -11,7 +20,16 @@ from robosystems.adapters.sec.processors.ids import (
   create_structure_id,
   create_taxonomy_id,
   create_unit_id,
+  generate_compact_id,
+)
+from robosystems.adapters.sec.processors.parquet import ParquetWriter
+from robosystems.adapters.sec.processors.schema import (
+  XBRLSchemaAdapter,
+  XBRLSchemaConfigGenerator,
 )
+from robosystems.config import env
+from robosystems.schemas.loader import LadybugSchemaLoader, get_sec_schema_loader
+from robosystems.schemas.manager import SchemaManager
 
 
 class TestElementID:
@@ -272,3 +290,206 @@ class TestIDConsistencyAcrossFunctions:
     assert elem_id != fact_id
     assert fact_id != entity_id
     assert elem_id != entity_id
+
+
+@pytest.fixture
+def compact_ids(monkeypatch):
+  monkeypatch.setattr(env, "XBRL_COMPACT_IDS", True)
+  monkeypatch.setattr(ids, "_id_interner", IdInterner())
+
+
+class TestCompactIDs:
+  def test_compact_ids_are_deterministic_int64(self):
+    compact_id = generate_compact_id("http://example.com/fact#1", "fact")
+
+    assert compact_id == generate_compact_id("http://example.com/fact#1", "fact")
+    assert -(2**63) <= compact_id < 2**63
+    assert compact_id != generate_compact_id("http://example.com/fact#1", "element")
+
+  def test_high_volume_entities_use_compact_ids(self, compact_ids):
+    assert isinstance(create_fact_id("fact"), int)
+    assert isinstance(create_element_id("element"), int)
+    assert isinstance(create_period_id("period"), int)
+    assert isinstance(create_unit_id("unit"), int)
+    assert isinstance(create_dimension_id("dimension"), int)
+    # Entities, reports and taxonomy structure keep their UUIDs
+    assert isinstance(create_entity_id("entity"), str)
+    assert isinstance(create_report_id("report"), str)
+    assert isinstance(create_label_id("label", "type", "en"), str)
+
+  def test_fact_ids_stable_across_processes(self, compact_ids):
+    assert create_fact_id("fact") == generate_compact_id("fact", "fact")
+
+  def test_uuid_ids_by_default(self):
+    assert isinstance(create_fact_id("fact"), str)
+    assert isinstance(create_element_id("element"), str)
+
+  def test_sec_schema_uses_int64_identifiers(self, compact_ids):
+    loader = get_sec_schema_loader()
+
+    for node_name in ("Fact", "Element", "Period", "Unit", "FactDimension"):
+      primary_key = next(
+        prop
+        for prop in loader.get_node_schema(node_name).properties
+        if prop.is_primary_key
+      )
+      assert primary_key.type == "INT64"
+    entity_key = next(
+      prop
+      for prop in loader.get_node_schema("Entity").properties
+      if prop.is_primary_key
+    )
+    assert entity_key.type == "STRING"
+
+  def test_plain_schema_keeps_string_identifiers(self, compact_ids):
+    loader = LadybugSchemaLoader()
+
+    primary_key = next(
+      prop for prop in loader.get_node_schema("Fact").properties if prop.is_primary_key
+    )
+    assert primary_key.type == "STRING"
+
+  def test_schema_manager_compiles_compact_identifiers(self):
+    manager = SchemaManager()
+
+    def fact_key_type(compact_identifiers: bool) -> str:
+      config = manager.create_schema_configuration(
+        name="SEC Repository Schema",
+        description="Schema for SEC",
+        extensions=["roboledger"],
+        compact_identifiers=compact_identifiers,
+      )
+      schema = manager.load_and_compile_schema(config)
+      fact = next(node for node in schema.nodes if node.name == "Fact")
+      return next(prop.type for prop in fact.properties if prop.is_primary_key)
+
+    assert fact_key_type(True) == "INT64"
+    assert fact_key_type(False) == "STRING"
+
+
+def test_compact_fact_parquet_loads_into_installed_sec_schema(compact_ids, tmp_path):
+  """Processor-written compact IDs COPY into the DDL the SEC repository installs."""
+  schema_config = {
+    "name": "SEC Database Schema",
+    "base_schema": "base",
+    "extensions": ["roboledger"],
+    "compact_identifiers": True,
+  }
+  schema_adapter = XBRLSchemaAdapter(schema_config)
+  ingest_adapter = XBRLSchemaConfigGenerator(schema_config)
+  df_manager = DataFrameManager(schema_adapter, ingest_adapter)
+  writer = ParquetWriter(
+    tmp_path / "output", schema_adapter, ingest_adapter, df_manager
+  )
+  (tmp_path / "output" / "nodes").mkdir(parents=True)
+  (tmp_path / "output" / "relationships").mkdir(parents=True)
+
+  fact_id = create_fact_id("http://example.com/fact#1")
+  element_id = create_element_id("http://fasb.org/us-gaap#Assets")
+  writer.write_dataframe_schema_driven(
+    pd.DataFrame(
+      {
+        "identifier": [fact_id],
+        "uri": ["http://example.com/fact#1"],
+        "value": ["100"],
+        "numeric_value": [100.0],
+      }
+    ),
+    "Fact.parquet",
+    "Fact",
+  )
+  writer.write_dataframe_schema_driven(
+    pd.DataFrame(
+      {"identifier": [element_id], "uri": ["http://fasb.org/us-gaap#Assets"]}
+    ),
+    "Element.parquet",
+    "Element",
+  )
+  writer.write_dataframe_schema_driven(
+    pd.DataFrame({"from": [fact_id], "to": [element_id]}),
+    "FACT_HAS_ELEMENT.parquet",
+    "FACT_HAS_ELEMENT",
+  )
+
+  # Compile the DDL the same way SharedRepositoryService installs it
+  manager = SchemaManager()
+  schema = manager.load_and_compile_schema(
+    manager.create_schema_configuration(
+      name="SEC Repository Schema",
+      description="Schema for SEC",
+      extensions=["roboledger"],
+      compact_identifiers=True,
+    )
+  )
+  db = lbug.Database(str(tmp_path / "sec.lbug"))
+  conn = lbug.Connection(db)
+  for statement in schema.to_cypher().split(";"):
+    if statement.strip():
+      conn.execute(statement)
+
+  for subdir, table in (
+    ("nodes", "Fact"),
+    ("nodes", "Element"),
+    ("relationships", "FACT_HAS_ELEMENT"),
+  ):
+    (path,) = (tmp_path / "output" / subdir).glob(f"{table}*.parquet")
+    conn.execute(f"COPY {table} FROM '{path}'")
+
+  result = conn.execute(
+    "MATCH (f:Fact)-[:FACT_HAS_ELEMENT]->(e:Element) RETURN f.identifier, e.identifier"
+  )
+  assert result.get_next() == [fact_id, element_id]
+  conn.close()
+  db.close()
+
+
+class TestIdInterner:
+  def test_persistent_table_records_shared_ids(self, tmp_path):
+    path = str(tmp_path / "ids.db")
+    interner = IdInterner(path)
+    element_id = interner.intern("element", "us-gaap:Assets")
+    interner.close()
+
+    reopened = IdInterner(path)
+    assert reopened.lookup("element", element_id) == "us-gaap:Assets"
+    assert reopened.intern("element", "us-gaap:Assets") == element_id
+    reopened.close()
+
+  def test_collision_between_keys_fails(self, tmp_path, monkeypatch):
+    interner = IdInterner(str(tmp_path / "ids.db"))
+    monkeypatch.setattr(ids, "generate_compact_id", lambda content, namespace: 42)
+
+    assert interner.intern("unit", "usd") == 42
+    with pytest.raises(ValueError, match="collision"):
+      interner.intern("unit", "eur")
+    interner.close()
+
+  def test_in_memory_interner(self):
+    interner = IdInterner()
+
+    assert interner.intern("period", "2024") == generate_compact_id("2024", "period")
+    assert interner.lookup("period", generate_compact_id("2024", "period")) is None
+
+
+def _relationship_parquet_bytes(create_from, create_to, count: int) -> int:
+  df = pd.DataFrame(
+    {
+      "from": [create_from(f"fact-{i}") for i in range(count)],
+      "to": [create_to(f"element-{i % 500}") for i in range(count)],
+    }
+  )
+  buffer = io.BytesIO()
+  df.to_parquet(buffer, index=False)
+  return buffer.tell()
+
+
+def test_compact_ids_shrink_relationship_parquet(compact_ids, monkeypatch):
+  """Compact IDs shrink relationship parquet files versus UUID strings."""
+  count = 20000
+
+  compact_bytes = _relationship_parquet_bytes(create_fact_id, create_element_id, count)
+  monkeypatch.setattr(env, "XBRL_COMPACT_IDS", False)
+  uuid_bytes = _relationship_parquet_bytes(create_fact_id, create_element_id, count)
+
+  assert compact_bytes > 0
+  assert compact_bytes * 2 < uuid_bytes
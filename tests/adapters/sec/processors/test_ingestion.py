@@ -0,0 +1,111 @@
+"""Tests for incremental DuckDB-based SEC graph ingestion."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from robosystems.adapters.sec.processors.ingestion import XBRLDuckDBGraphProcessor
+
+TABLES = {
+  "Entity": ["sec/year=2024/nodes/Entity/1_a.parquet"],
+  "ENTITY_HAS_REPORT": ["sec/year=2024/relationships/ENTITY_HAS_REPORT/1_a.parquet"],
+}
+
+
+@pytest.fixture
+def processor():
+  with patch("robosystems.adapters.sec.processors.ingestion.S3Client"):
+    processor = XBRLDuckDBGraphProcessor(graph_id="sec", source_prefix="sec")
+  processor.bucket = "processed"
+  processor._discover_processed_files = AsyncMock(return_value=TABLES)
+  processor._rebuild_database = AsyncMock()
+  return processor
+
+
+@pytest.fixture
+def client():
+  client = AsyncMock()
+  client.list_tables.return_value = [
+    {"table_name": "Entity"},
+    {"table_name": "ENTITY_HAS_REPORT"},
+  ]
+  client.materialize_table.return_value = {"status": "success", "rows_ingested": 1}
+  return client
+
+
+async def _run(processor, client, **kwargs):
+  with patch(
+    "robosystems.adapters.sec.processors.ingestion.get_graph_client",
+    AsyncMock(return_value=client),
+  ):
+    return await processor.process_files(**kwargs)
+
+
+class TestIncrementalIngestion:
+  """Test staging and materializing only new processed files."""
+
+  @pytest.mark.asyncio
+  async def test_incremental_run_materializes_new_files_only(self, processor, client):
+    new_key = "sec/year=2024/nodes/Entity/1_a.parquet"
+    client.create_table.side_effect = [
+      {"mode": "incremental", "files_scanned": 1, "file_ids": [new_key]},
+      {"mode": "incremental", "files_scanned": 0, "file_ids": []},
+    ]
+
+    result = await _run(processor, client)
+
+    assert result["mode"] == "incremental"
+    assert result["files_staged"] == 1
+    processor._rebuild_database.assert_not_called()
+
+    create_kwargs = client.create_table.call_args_list[0].kwargs
+    assert create_kwargs["file_id_map"] == {f"s3://processed/{new_key}": new_key}
+
+    # Tables without new files are not materialized
+    client.materialize_table.assert_called_once()
+    materialize_kwargs = client.materialize_table.call_args.kwargs
+    assert materialize_kwargs["table_name"] == "Entity"
+    assert materialize_kwargs["file_ids"] == [new_key]
+
+  @pytest.mark.asyncio
+  async def test_restaged_table_escalates_to_rebuild(self, processor, client):
+    client.create_table.side_effect = [
+      {"mode": "full", "files_scanned": 1},
+      {"mode": "incremental", "files_scanned": 0, "file_ids": []},
+      {"mode": "full", "files_scanned": 1},
+      {"mode": "full", "files_scanned": 1},
+    ]
+
+    result = await _run(processor, client)
+
+    assert result["mode"] == "rebuild"
+    processor._rebuild_database.assert_awaited_once()
+    assert client.create_table.call_count == 4
+    assert [
+      call.kwargs["file_ids"] for call in client.materialize_table.call_args_list
+    ] == [None, None]
+
+  @pytest.mark.asyncio
+  async def test_failed_materialization_unstages_new_files(self, processor, client):
+    new_key = "sec/year=2024/nodes/Entity/1_a.parquet"
+    client.create_table.side_effect = [
+      {"mode": "incremental", "files_scanned": 1, "file_ids": [new_key]},
+      {"mode": "incremental", "files_scanned": 0, "file_ids": []},
+    ]
+    client.materialize_table.side_effect = RuntimeError("COPY failed")
+
+    result = await _run(processor, client)
+
+    assert result["ingestion_results"]["tables"][0]["status"] == "error"
+    client.delete_file_data.assert_awaited_once_with("sec", "Entity", new_key)
+
+  @pytest.mark.asyncio
+  async def test_nothing_staged_builds_from_scratch(self, processor, client):
+    client.list_tables.return_value = []
+    client.create_table.return_value = {"mode": "full", "files_scanned": 1}
+
+    result = await _run(processor, client)
+
+    assert result["mode"] == "rebuild"
+    processor._rebuild_database.assert_awaited_once()
+    assert client.materialize_table.call_count == 2
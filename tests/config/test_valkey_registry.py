@@ -1,12 +1,16 @@
 """Tests for Valkey/Redis registry and URL builder."""
 
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from robosystems.config.valkey_registry import (
+  ValkeyConnectionRegistry,
   ValkeyDatabase,
   ValkeyURLBuilder,
   get_database_purpose,
+  get_shared_redis_client,
   print_database_registry,
 )
 
@@ -338,3 +342,54 @@ class TestIntegration:
 
       # CloudFormation should only be called once due to caching
       assert mock_cf.call_count == 1
+
+
+class TestValkeyConnectionRegistry:
+  """Tests for the shared connection pool registry."""
+
+  @pytest.fixture(autouse=True)
+  def clean_registry(self):
+    ValkeyConnectionRegistry._pools.clear()
+    ValkeyConnectionRegistry._clients.clear()
+    ValkeyConnectionRegistry._stats.clear()
+    yield
+    ValkeyConnectionRegistry._pools.clear()
+    ValkeyConnectionRegistry._clients.clear()
+    ValkeyConnectionRegistry._stats.clear()
+
+  @patch("redis.Redis")
+  @patch("redis.BlockingConnectionPool.from_url")
+  def test_shared_client_reuses_pool(self, mock_from_url, mock_redis):
+    """Test repeated lookups share one pool per database and settings."""
+    with patch.dict(os.environ, {"VALKEY_URL": "redis://localhost:6379"}):
+      first = get_shared_redis_client(ValkeyDatabase.AUTH_CACHE)
+      second = get_shared_redis_client(ValkeyDatabase.AUTH_CACHE)
+      raw = get_shared_redis_client(ValkeyDatabase.AUTH_CACHE, False)
+
+    assert first is second
+    assert mock_from_url.call_count == 2
+    assert mock_redis.call_count == 2
+    assert raw is mock_redis.return_value
+    assert "max_connections" in mock_from_url.call_args_list[0].kwargs
+
+  @patch("redis.Redis")
+  @patch("redis.BlockingConnectionPool.from_url")
+  def test_stats_and_close(self, mock_from_url, mock_redis):
+    """Test pool statistics and that close disconnects sync pools."""
+    pool = MagicMock(max_connections=50, _connections=[])
+    pool.pool.queue = []
+    mock_from_url.return_value = pool
+
+    with patch.dict(os.environ, {"VALKEY_URL": "redis://localhost:6379"}):
+      get_shared_redis_client(ValkeyDatabase.RATE_LIMITING)
+      get_shared_redis_client(ValkeyDatabase.RATE_LIMITING)
+
+    stats = ValkeyConnectionRegistry.get_pool_stats()
+    assert len(stats) == 1
+    assert stats[0]["database"] == "RATE_LIMITING"
+    assert stats[0]["checkouts"] == 2
+    assert stats[0]["max_connections"] == 50
+
+    ValkeyConnectionRegistry.close()
+    pool.disconnect.assert_called_once()
+    assert ValkeyConnectionRegistry.get_pool_stats() == []
@@ -36,6 +36,7 @@ class TestDefinitionsLoad:
       "backup_graph_job",
       "sec_download",
       "sec_process",
+      "sec_process_batch",
       "sec_materialize",
     ]
     for expected in expected_jobs:
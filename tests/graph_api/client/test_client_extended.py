@@ -5,6 +5,7 @@ import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import pyarrow as pa
 import pytest
 
 from robosystems.graph_api.client.client import GraphClient
@@ -16,6 +17,11 @@ from robosystems.graph_api.client.exceptions import (
   GraphTimeoutError,
   GraphTransientError,
 )
+from robosystems.graph_api.core.arrow_ipc import (
+  ARROW_STREAM_MEDIA_TYPE,
+  ArrowStreamDecoder,
+  table_to_ipc_bytes,
+)
 
 
 class TestLadybugClientExtended:
@@ -151,6 +157,56 @@ class TestLadybugClientExtended:
         async for _ in result_gen:
           pass
 
+  # Test Arrow IPC query methods
+  @pytest.mark.asyncio
+  async def test_query_arrow(self, client):
+    """Test non-streaming Arrow query decodes the IPC body."""
+    table = pa.table({"ticker": ["AAPL", "MSFT"], "value": [1.5, 2.5]})
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = table_to_ipc_bytes(table)
+
+    with patch.object(
+      client.client, "request", return_value=mock_response
+    ) as mock_request:
+      result = await client.query_arrow("MATCH (n) RETURN n", graph_id="test_db")
+
+      assert result.equals(table)
+      assert (
+        mock_request.call_args.kwargs["headers"]["Accept"] == ARROW_STREAM_MEDIA_TYPE
+      )
+
+  @pytest.mark.asyncio
+  async def test_query_arrow_stream_passes_bytes_through(self, client):
+    """Test streaming Arrow query yields raw IPC bytes."""
+    table = pa.table({"id": list(range(5))})
+    payload = table_to_ipc_bytes(table, batch_rows=2)
+
+    mock_stream = AsyncMock()
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+
+    async def mock_aiter_bytes():
+      yield payload[:50]
+      yield payload[50:]
+
+    mock_response.aiter_bytes = mock_aiter_bytes
+    mock_stream.__aenter__.return_value = mock_response
+    mock_stream.__aexit__.return_value = None
+
+    with patch.object(client.client, "stream", return_value=mock_stream):
+      byte_stream = await client.query_arrow_stream(
+        "MATCH (n) RETURN n", graph_id="test_db"
+      )
+
+      decoder = ArrowStreamDecoder()
+      batches = []
+      async for data in byte_stream:
+        batches.extend(decoder.feed(data))
+      decoder.close()
+
+      assert pa.Table.from_batches(batches).equals(table)
+
   # Test get_info method
   @pytest.mark.asyncio
   async def test_get_info(self, client):
@@ -1,5 +1,6 @@
 """Tests for LadybugDB client factory."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -293,6 +294,109 @@ class TestGraphClientFactory:
     assert len(GraphClientFactory._connection_pools) == 0
 
 
+class TestGraphClientPool:
+  """Test cases for pooled graph client transports."""
+
+  @pytest.fixture(autouse=True)
+  def reset_pool(self):
+    """Start every test with an empty pool."""
+    GraphClientFactory._connection_pools = {}
+    GraphClientFactory._pool_stats = {}
+    yield
+    GraphClientFactory._connection_pools = {}
+    GraphClientFactory._pool_stats = {}
+
+  @pytest.mark.asyncio
+  async def test_clients_share_http_pool_per_instance(self):
+    """Test repeated clients for one instance reuse the same HTTP client."""
+    first = GraphClientFactory._build_client("http://10.0.0.1:8001", "key")
+    second = GraphClientFactory._build_client("http://10.0.0.1:8001/", "key")
+    other = GraphClientFactory._build_client("http://10.0.0.2:8001", "key")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert GraphClientFactory._pool_stats["http://10.0.0.1:8001"]["requests"] == 2
+
+    # Closing a per-request client leaves the pooled connection open
+    await first.close()
+    assert not second.client.is_closed
+
+    await GraphClientFactory.cleanup()
+    assert second.client.is_closed
+
+  @pytest.mark.asyncio
+  async def test_pool_is_bounded(self):
+    """Test least recently used clients are evicted beyond the size limit."""
+    with (
+      patch.object(GraphClientFactory, "_pool_max_size", 2),
+      patch.object(GraphClientFactory, "_read_timeout", 0),
+    ):
+      GraphClientFactory._build_client("http://10.0.0.1:8001", "key")
+      evicted = GraphClientFactory._build_client("http://10.0.0.2:8001", "key")
+      GraphClientFactory._build_client("http://10.0.0.1:8001", "key")
+      GraphClientFactory._build_client("http://10.0.0.3:8001", "key")
+
+    assert list(GraphClientFactory._connection_pools) == [
+      "http://10.0.0.1:8001",
+      "http://10.0.0.3:8001",
+    ]
+    await asyncio.sleep(0.01)
+    assert evicted.client.is_closed
+    await GraphClientFactory.cleanup()
+
+  @pytest.mark.asyncio
+  async def test_evict_instance(self):
+    """Test deallocated instances are dropped from the pool."""
+    client = GraphClientFactory._build_client("http://10.0.0.1:8001", "key")
+    GraphClientFactory._build_client("http://10.0.0.2:8001", "key")
+
+    assert GraphClientFactory.evict_instance("10.0.0.1") == 1
+    assert "http://10.0.0.1:8001" not in GraphClientFactory._connection_pools
+    assert "http://10.0.0.2:8001" in GraphClientFactory._connection_pools
+
+    await asyncio.sleep(0.01)
+    assert client.client.is_closed
+    await GraphClientFactory.cleanup()
+
+  @pytest.mark.asyncio
+  async def test_pool_disabled(self):
+    """Test a pool size of zero gives every client its own HTTP client."""
+    with patch.object(GraphClientFactory, "_pool_max_size", 0):
+      client = GraphClientFactory._build_client("http://10.0.0.1:8001", "key")
+
+    assert GraphClientFactory._connection_pools == {}
+    await client.close()
+    assert client.client.is_closed
+
+  @pytest.mark.asyncio
+  async def test_redis_client_is_shared(self):
+    """Test the shared Redis client is pinged once and left open on cleanup."""
+    mock_redis = AsyncMock()
+    with (
+      patch("robosystems.graph_api.client.factory.env") as mock_env,
+      patch(
+        "robosystems.config.valkey_registry.get_shared_async_redis_client",
+        return_value=mock_redis,
+      ) as mock_get,
+    ):
+      mock_env.GRAPH_REDIS_CACHE_ENABLED = True
+      mock_env.ENVIRONMENT = "test"
+      mock_env.GRAPH_CIRCUIT_BREAKER_THRESHOLD = 5
+      mock_env.GRAPH_CIRCUIT_BREAKER_TIMEOUT = 60
+
+      first = await GraphClientFactory._get_redis()
+      second = await GraphClientFactory._get_redis()
+
+      assert first is mock_redis
+      assert second is mock_redis
+      assert mock_get.call_count == 2
+      mock_redis.ping.assert_awaited_once()
+
+      await GraphClientFactory.cleanup()
+      mock_redis.aclose.assert_not_awaited()
+      assert GraphClientFactory._redis_client is None
+
+
 class TestFactoryFunctions:
   """Test cases for factory convenience functions."""
 
@@ -0,0 +1,94 @@
+"""Tests for the Arrow IPC result transport helpers."""
+
+import pyarrow as pa
+import pytest
+
+from robosystems.graph_api.core.arrow_ipc import (
+  ARROW_STREAM_MEDIA_TYPE,
+  ArrowStreamDecoder,
+  iter_ipc_stream,
+  read_ipc_table,
+  rename_columns,
+  table_to_ipc_bytes,
+  wants_arrow,
+)
+
+
+@pytest.fixture
+def sample_table():
+  return pa.table(
+    {
+      "ticker": [f"T{i}" for i in range(25)],
+      "value": [float(i) for i in range(25)],
+    }
+  )
+
+
+class TestArrowIpc:
+  """Tests for encoding and decoding Arrow IPC streams."""
+
+  def test_wants_arrow(self):
+    assert wants_arrow(ARROW_STREAM_MEDIA_TYPE)
+    assert wants_arrow(f"application/json, {ARROW_STREAM_MEDIA_TYPE}")
+    assert not wants_arrow("application/json")
+    assert not wants_arrow(None)
+
+  def test_round_trip(self, sample_table):
+    data = table_to_ipc_bytes(sample_table, batch_rows=10)
+
+    result = read_ipc_table(data)
+
+    assert result.equals(sample_table)
+
+  def test_stream_yields_per_batch(self, sample_table):
+    chunks = list(
+      iter_ipc_stream(sample_table.schema, sample_table.to_batches(max_chunksize=10))
+    )
+
+    # Three batches plus the end-of-stream marker
+    assert len(chunks) == 4
+    assert read_ipc_table(b"".join(chunks)).num_rows == 25
+
+  def test_empty_result_keeps_schema(self, sample_table):
+    empty = sample_table.slice(0, 0)
+
+    result = read_ipc_table(table_to_ipc_bytes(empty))
+
+    assert result.num_rows == 0
+    assert result.schema.names == ["ticker", "value"]
+
+  def test_rename_columns(self, sample_table):
+    renamed = rename_columns(sample_table, ["symbol", "amount"])
+    assert renamed.column_names == ["symbol", "amount"]
+
+    # Mismatched alias count leaves the table untouched
+    assert rename_columns(sample_table, ["symbol"]).column_names == [
+      "ticker",
+      "value",
+    ]
+
+
+class TestArrowStreamDecoder:
+  """Tests for incremental decoding of network chunks."""
+
+  def test_decodes_arbitrary_chunk_boundaries(self, sample_table):
+    data = table_to_ipc_bytes(sample_table, batch_rows=7)
+    decoder = ArrowStreamDecoder()
+
+    batches = []
+    for i in range(0, len(data), 13):
+      batches.extend(decoder.feed(data[i : i + 13]))
+    decoder.close()
+
+    assert decoder.finished
+    assert decoder.schema == sample_table.schema
+    assert pa.Table.from_batches(batches).equals(sample_table)
+
+  def test_truncated_stream_raises_on_close(self, sample_table):
+    data = table_to_ipc_bytes(sample_table)
+    decoder = ArrowStreamDecoder()
+
+    decoder.feed(data[:-20])
+
+    with pytest.raises(ValueError):
+      decoder.close()
@@ -0,0 +1,127 @@
+"""Tests for reading LadybugDB results as Arrow record batches."""
+
+import pyarrow as pa
+
+from robosystems.graph_api.core.ladybug.service import _read_arrow_batches
+
+
+class FakeQueryResult:
+  """Row-at-a-time query result without a native Arrow export."""
+
+  def __init__(self, rows):
+    self.rows = list(rows)
+    self.read = 0
+    self.closed = False
+
+  def has_next(self):
+    return self.read < len(self.rows)
+
+  def get_next(self):
+    row = self.rows[self.read]
+    self.read += 1
+    return row
+
+  def close(self):
+    self.closed = True
+
+
+class NativeQueryResult(FakeQueryResult):
+  """Query result that reports its size and exports Arrow natively."""
+
+  def get_num_tuples(self):
+    return len(self.rows)
+
+  def get_as_arrow(self, chunk_size):
+    return pa.table(
+      {"col0": [row[0] for row in self.rows], "col1": [row[1] for row in self.rows]}
+    )
+
+
+def test_reads_batches_up_to_max_rows():
+  result = FakeQueryResult([i, f"n{i}"] for i in range(25))
+
+  batches = list(
+    _read_arrow_batches(result, ["id", "name"], batch_rows=10, max_rows=15)
+  )
+
+  assert [batch.num_rows for batch in batches] == [10, 5]
+  assert batches[0].schema.names == ["id", "name"]
+  # Stops reading at the limit instead of draining the result
+  assert result.read == 15
+  assert result.closed
+
+
+def test_reads_whole_result_without_limit():
+  result = FakeQueryResult([i, None] for i in range(7))
+
+  batches = list(_read_arrow_batches(result, ["id", "parent"], batch_rows=3))
+
+  assert [batch.num_rows for batch in batches] == [3, 3, 1]
+  assert result.read == 7
+  assert not result.closed
+
+
+def test_later_floats_promote_earlier_ints():
+  result = FakeQueryResult([[1], [2], [1.5]])
+
+  batches = list(_read_arrow_batches(result, ["value"], batch_rows=2))
+
+  table = pa.Table.from_batches(batches)
+  assert table.schema.field("value").type == pa.float64()
+  assert table.column("value").to_pylist() == [1.0, 2.0, 1.5]
+
+
+def test_null_first_column_takes_later_type():
+  result = FakeQueryResult([[None], [None], ["a"]])
+
+  batches = list(_read_arrow_batches(result, ["name"], batch_rows=2))
+
+  assert all(batch.schema == batches[0].schema for batch in batches)
+  table = pa.Table.from_batches(batches)
+  assert table.schema.field("name").type == pa.string()
+  assert table.column("name").to_pylist() == [None, None, "a"]
+
+
+def test_late_map_keys_are_kept():
+  result = FakeQueryResult([[{"a": 1}], [{"a": 2}], [{"a": 3, "b": 4}]])
+
+  batches = list(_read_arrow_batches(result, ["props"], batch_rows=2))
+
+  table = pa.Table.from_batches(batches)
+  assert table.column("props").to_pylist() == [
+    {"a": 1, "b": None},
+    {"a": 2, "b": None},
+    {"a": 3, "b": 4},
+  ]
+
+
+def test_native_export_without_limit():
+  result = NativeQueryResult([i, str(i)] for i in range(30))
+
+  batches = list(_read_arrow_batches(result, ["id", "name"], batch_rows=10))
+
+  assert [batch.num_rows for batch in batches] == [10, 10, 10]
+  assert batches[0].schema.names == ["id", "name"]
+  assert result.read == 0
+
+
+def test_small_results_use_native_export():
+  result = NativeQueryResult([[1, "a"], [2, "b"]])
+
+  batches = list(
+    _read_arrow_batches(result, ["id", "name"], batch_rows=10, max_rows=10)
+  )
+
+  table = pa.Table.from_batches(batches)
+  assert table.column_names == ["id", "name"]
+  assert table.column("name").to_pylist() == ["a", "b"]
+  assert result.read == 0
+
+
+def test_large_results_skip_native_export():
+  result = NativeQueryResult([i, str(i)] for i in range(30))
+
+  batches = list(_read_arrow_batches(result, ["id", "name"], batch_rows=10, max_rows=5))
+
+  assert sum(batch.num_rows for batch in batches) == 5
+  assert result.read == 5
@@ -0,0 +1,204 @@
+"""Tests for the LadybugDB buffer pool memory governor."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from robosystems.graph_api.core.ladybug.memory import (
+  HOT_ACTIVITY_THRESHOLD,
+  MemoryGovernor,
+)
+from robosystems.graph_api.core.ladybug.pool import LadybugConnectionPool
+
+
+def _write_database(path: Path, size_mb: int) -> Path:
+  """Create a sparse file standing in for a database of the given size."""
+  with open(path, "wb") as f:
+    f.truncate(size_mb * 1024 * 1024)
+  return path
+
+
+class TestMemoryGovernor:
+  """Test buffer pool sizing and eviction planning."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.temp_dir = Path(tempfile.mkdtemp())
+
+  def teardown_method(self):
+    """Clean up test fixtures."""
+    shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+  def test_buffer_pool_sized_from_disk_and_activity(self):
+    """Test small databases get small pools and busy ones get more headroom."""
+    governor = MemoryGovernor(budget_mb=8192, max_per_db_mb=2048, min_per_db_mb=64)
+    db_path = _write_database(self.temp_dir / "kg1.lbug", 400)
+
+    assert governor.plan("new", self.temp_dir / "new.lbug", []) == (64, [])
+    assert governor.plan("kg1", db_path, []) == (500, [])
+
+    for _ in range(int(HOT_ACTIVITY_THRESHOLD) + 1):
+      governor.record_access("kg1")
+    assert governor.plan("kg1", db_path, []) == (800, [])
+
+  def test_pressure_evicts_least_recently_used(self):
+    """Test opening past the budget picks idle databases in LRU order."""
+    governor = MemoryGovernor(budget_mb=1024, max_per_db_mb=512, min_per_db_mb=512)
+    for name in ("kg1", "kg2"):
+      governor.record_access(name)
+      governor.reserve(name, 512)
+    governor.record_access("kg1")
+
+    size, victims = governor.plan("kg3", self.temp_dir / "kg3.lbug", ["kg1", "kg2"])
+
+    assert size == 512
+    assert victims == ["kg2"]
+
+  def test_reserve_overcommits_when_nothing_is_evictable(self):
+    """Test a database still opens at the minimum when the budget is spent."""
+    governor = MemoryGovernor(budget_mb=1024, max_per_db_mb=1024, min_per_db_mb=256)
+    governor.reserve("kg1", 1024)
+
+    assert governor.reserve("kg2", 512) == 256
+
+    stats = governor.get_stats()
+    assert stats["overcommits"] == 1
+    assert stats["reserved_mb"] == 1280
+
+    governor.release("kg1")
+    assert governor.get_stats()["open_databases"] == 1
+
+  def test_idle_databases(self):
+    """Test only open databases past the idle threshold are reported."""
+    governor = MemoryGovernor(budget_mb=1024, max_per_db_mb=512, idle_evict_seconds=60)
+    governor.reserve("kg1", 256)
+    governor.reserve("kg2", 256)
+    governor._databases["kg1"].last_access -= 120
+
+    assert governor.idle_databases() == ["kg1"]
+
+  def test_bulk_load_plans_full_buffer_pool(self):
+    """Test a new database being loaded is not sized from its empty file."""
+    governor = MemoryGovernor(budget_mb=8192, max_per_db_mb=2048, min_per_db_mb=256)
+    governor.reserve("kg1", 256)
+
+    assert governor.begin_bulk_load("kg1") is True
+    assert governor.plan("kg1", self.temp_dir / "kg1.lbug", []) == (2048, [])
+
+    governor.end_bulk_load("kg1")
+    assert governor.plan("kg1", self.temp_dir / "kg1.lbug", []) == (256, [])
+
+  def test_undersized_databases(self):
+    """Test open databases that grew well past their buffer pool are reported."""
+    governor = MemoryGovernor(budget_mb=8192, max_per_db_mb=2048, min_per_db_mb=256)
+    kg1 = self.temp_dir / "kg1.lbug"
+    kg2 = self.temp_dir / "kg2.lbug"
+    for name, path in (("kg1", kg1), ("kg2", kg2)):
+      governor.reserve(name, governor.plan(name, path, [])[0])
+
+    _write_database(kg1, 1024)
+    _write_database(kg2, 300)
+
+    assert governor.undersized_databases() == ["kg1"]
+    assert governor.get_stats()["databases"]["kg1"]["disk_mb"] == 1024
+
+
+class TestPoolMemoryGovernance:
+  """Test the connection pool honoring the memory budget."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.temp_dir = tempfile.mkdtemp()
+
+  def teardown_method(self):
+    """Clean up test fixtures."""
+    shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_opening_past_budget_evicts_idle_database(
+    self, mock_conn_class, mock_db_class
+  ):
+    """Test an idle database is checkpointed, closed and reopened on demand."""
+    mock_db_class.side_effect = lambda *args, **kwargs: MagicMock()
+    governor = MemoryGovernor(budget_mb=512, max_per_db_mb=256, min_per_db_mb=256)
+    pool = LadybugConnectionPool(base_path=self.temp_dir, memory_governor=governor)
+
+    with pool.get_connection("kg1"):
+      pass
+    with pool.get_connection("kg2"):
+      pass
+    first_kg1 = pool._databases["kg1"]
+
+    with pool.get_connection("kg3"):
+      pass
+
+    assert "kg1" not in pool._databases
+    first_kg1.close.assert_called_once()
+    assert governor.get_stats()["pressure_evictions"] == 1
+    assert mock_db_class.call_args.kwargs["buffer_pool_size"] == 256 * 1024 * 1024
+
+    # Reopened transparently on the next request
+    with pool.get_connection("kg1"):
+      pass
+    assert pool._databases["kg1"] is not first_kg1
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_busy_database_is_not_evicted(self, mock_conn_class, mock_db_class):
+    """Test a database with a checked-out connection keeps its buffer pool."""
+    mock_db_class.side_effect = lambda *args, **kwargs: MagicMock()
+    governor = MemoryGovernor(budget_mb=512, max_per_db_mb=256, min_per_db_mb=256)
+    pool = LadybugConnectionPool(base_path=self.temp_dir, memory_governor=governor)
+
+    with pool.get_connection("kg1"):
+      with pool.get_connection("kg2"):
+        with pool.get_connection("kg3"):
+          assert {"kg1", "kg2", "kg3"} <= set(pool._databases)
+
+    stats = pool.get_memory_stats()
+    assert stats["pressure_evictions"] == 0
+    assert stats["overcommits"] == 1
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_bulk_load_reopens_with_full_buffer_pool(
+    self, mock_conn_class, mock_db_class
+  ):
+    """Test an idle database opened small is reopened before a bulk load."""
+    mock_db_class.side_effect = lambda *args, **kwargs: MagicMock()
+    governor = MemoryGovernor(budget_mb=4096, max_per_db_mb=1024, min_per_db_mb=256)
+    pool = LadybugConnectionPool(base_path=self.temp_dir, memory_governor=governor)
+
+    with pool.get_connection("kg1"):
+      pass
+    assert mock_db_class.call_args.kwargs["buffer_pool_size"] == 256 * 1024 * 1024
+
+    with pool.bulk_load("kg1"), pool.get_connection("kg1"):
+      assert mock_db_class.call_args.kwargs["buffer_pool_size"] == 1024 * 1024 * 1024
+
+    stats = governor.get_stats()
+    assert stats["resizes"] == 1
+    assert stats["pressure_evictions"] == 0
+    assert stats["databases"]["kg1"]["bulk_loading"] is False
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_maintenance_reopens_grown_database(self, mock_conn_class, mock_db_class):
+    """Test an idle database that outgrew its buffer pool is re-planned."""
+    mock_db_class.side_effect = lambda *args, **kwargs: MagicMock()
+    governor = MemoryGovernor(budget_mb=4096, max_per_db_mb=1024, min_per_db_mb=256)
+    pool = LadybugConnectionPool(base_path=self.temp_dir, memory_governor=governor)
+
+    with pool.get_connection("kg1"):
+      pass
+    _write_database(Path(self.temp_dir) / "kg1.lbug", 600)
+
+    pool._resize_grown_databases()
+
+    assert "kg1" not in pool._databases
+    with pool.get_connection("kg1"):
+      pass
+    assert mock_db_class.call_args.kwargs["buffer_pool_size"] == 750 * 1024 * 1024
+    assert governor.get_stats()["resizes"] == 1
@@ -0,0 +1,148 @@
+"""Tests for the LadybugDB prepared statement cache."""
+
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robosystems.graph_api.core.ladybug import Engine, QueryError
+from robosystems.graph_api.core.ladybug.engine import _validate_flat_parameter_shape
+from robosystems.graph_api.core.ladybug.statements import (
+  PreparedStatementCache,
+  bump_schema_version,
+  discard_statement_cache,
+  get_statement_cache,
+)
+
+LOOKUP = "MATCH (p:Person) WHERE p.id = $id RETURN p.name AS name"
+
+
+@pytest.fixture
+def people_engine():
+  """Engine with a small Person table."""
+  with tempfile.TemporaryDirectory() as temp_dir:
+    engine = Engine(os.path.join(temp_dir, "people.lbug"))
+    engine.execute_query(
+      "CREATE NODE TABLE Person(id INT64, name STRING, PRIMARY KEY(id))"
+    )
+    engine.execute_query(
+      "UNWIND range(1, 10) AS i CREATE (:Person {id: i, name: 'p' + cast(i, 'STRING')})"
+    )
+    yield engine
+    engine.close()
+
+
+class TestEnginePreparedStatements:
+  """Test prepared statement reuse in Engine."""
+
+  def test_parameterized_queries_reuse_statement(self, people_engine):
+    """Test repeated query shapes are prepared once."""
+    for person_id in (1, 2, 3):
+      result = people_engine.execute_query(LOOKUP, {"id": person_id})
+      assert result == [{"name": f"p{person_id}"}]
+
+    stats = people_engine._statements.get_stats()
+    assert stats["size"] == 1
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+  def test_schema_change_invalidates_statements(self, people_engine):
+    """Test DDL through the engine drops statements bound to the old schema."""
+    people_engine.execute_query(LOOKUP, {"id": 1})
+
+    people_engine.execute_query("ALTER TABLE Person DROP name")
+    people_engine.execute_query("ALTER TABLE Person ADD name STRING DEFAULT 'new'")
+
+    assert people_engine.execute_query(LOOKUP, {"id": 1}) == [{"name": "new"}]
+    stats = people_engine._statements.get_stats()
+    assert stats["invalidations"] == 1
+    assert stats["misses"] == 2
+
+  def test_prepare_errors_are_not_cached(self, people_engine):
+    """Test a statement that fails to prepare raises and is not cached."""
+    with pytest.raises(QueryError, match="Binder exception"):
+      people_engine.execute_query(
+        "MATCH (x:Missing) WHERE x.id = $id RETURN x", {"id": 1}
+      )
+
+    assert people_engine._statements.get_stats()["size"] == 0
+
+
+class TestPreparedStatementCache:
+  """Test PreparedStatementCache behavior."""
+
+  @patch("robosystems.graph_api.core.ladybug.statements.lbug.PreparedStatement")
+  def test_lru_eviction(self, mock_prepared):
+    """Test least recently used statements are evicted at capacity."""
+    cache = PreparedStatementCache("lru_db", max_size=2)
+    conn = MagicMock()
+
+    for query in ("RETURN $a", "RETURN $b", "RETURN $a", "RETURN $c"):
+      cache.execute(conn, query, {"a": 1})
+
+    assert list(cache._statements) == ["RETURN $a", "RETURN $c"]
+    assert cache.get_stats()["evictions"] == 1
+
+  @patch("robosystems.graph_api.core.ladybug.statements.lbug.PreparedStatement")
+  def test_stale_statement_is_prepared_again(self, mock_prepared):
+    """Test a binder error on a cached statement re-prepares once."""
+    cache = PreparedStatementCache("stale_db", max_size=4)
+    conn = MagicMock()
+    cache.execute(conn, LOOKUP, {"id": 1})
+
+    conn.execute.side_effect = [
+      RuntimeError("Binder exception: Cannot find property name for p."),
+      "fresh result",
+    ]
+
+    assert cache.execute(conn, LOOKUP, {"id": 1}) == "fresh result"
+    assert mock_prepared.call_count == 2
+
+  @patch("robosystems.graph_api.core.ladybug.statements.lbug.PreparedStatement")
+  def test_schema_version_bump_clears_cache(self, mock_prepared):
+    """Test out-of-band schema changes recorded by version clear the cache."""
+    cache = PreparedStatementCache("bump_db", max_size=4)
+    conn = MagicMock()
+    cache.execute(conn, LOOKUP, {"id": 1})
+
+    bump_schema_version("bump_db")
+    cache.execute(conn, LOOKUP, {"id": 2})
+
+    assert mock_prepared.call_count == 2
+    assert cache.get_stats()["invalidations"] == 1
+
+  def test_pooled_connection_cache_lifecycle(self):
+    """Test pooled connections get one cache each until discarded."""
+    conn = MagicMock()
+
+    cache = get_statement_cache(conn, "pooled_db")
+    assert get_statement_cache(conn, "pooled_db") is cache
+
+    discard_statement_cache(conn)
+    assert get_statement_cache(conn, "pooled_db") is not cache
+
+
+class TestParameterShapeValidation:
+  """Test cached validation of flat parameter shapes."""
+
+  def test_valid_shape_is_cached(self, people_engine):
+    """Test a repeated flat parameter shape is validated once."""
+    _validate_flat_parameter_shape.cache_clear()
+
+    people_engine._validate_parameters({"id": 1, "name": "a"})
+    people_engine._validate_parameters({"id": 2, "name": "b"})
+
+    info = _validate_flat_parameter_shape.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+  def test_invalid_shape_still_rejected(self, people_engine):
+    """Test invalid names and long strings are rejected on every call."""
+    with pytest.raises(QueryError, match="Invalid parameter name"):
+      people_engine._validate_parameters({"bad-name": 1})
+    with pytest.raises(QueryError, match="Invalid parameter name"):
+      people_engine._validate_parameters({"bad-name": 1})
+
+    with pytest.raises(QueryError, match="too long"):
+      people_engine._validate_parameters({"name": "x" * 10001})
@@ -35,3 +35,40 @@ def test_materialize_rejects_read_only(monkeypatch, app_client):
 
   assert response.status_code == 403
   assert "not allowed" in response.json()["detail"]
+
+
+def test_staging_scan_projects_away_file_id():
+  scan = materialize._staging_scan(
+    "duck.Entity", ["identifier", "file_id", "name"], ["f1", "o'brien"]
+  )
+
+  assert scan == (
+    "LOAD FROM duck.Entity WHERE `file_id` IN ['f1', 'o\\'brien'] "
+    "RETURN `identifier`, `name`"
+  )
+  assert materialize._staging_scan("duck.Entity", ["identifier"], ["f1"]) == (
+    "LOAD FROM duck.Entity RETURN `identifier`"
+  )
+
+
+def test_copy_from_staging_counts_rows(tmp_path):
+  import real_ladybug as lbug
+
+  db = lbug.Database(str(tmp_path / "graph.lbug"))
+  conn = lbug.Connection(db)
+  conn.execute("CREATE NODE TABLE Entity(id INT64, name STRING, PRIMARY KEY(id))")
+  conn.execute("CREATE REL TABLE OWNS(FROM Entity TO Entity)")
+
+  nodes = materialize._copy_from_staging(
+    conn, "Entity", "UNWIND [1, 2, 3] AS i RETURN i, 'e'", ignore_errors=False
+  )
+  duplicates = materialize._copy_from_staging(
+    conn, "Entity", "UNWIND [3, 4] AS i RETURN i, 'e'", ignore_errors=True
+  )
+  rels = materialize._copy_from_staging(
+    conn, "OWNS", "UNWIND [1, 2] AS i RETURN i, i + 1", ignore_errors=False
+  )
+
+  assert (nodes, duplicates, rels) == (3, 1, 2)
+  conn.close()
+  db.close()
@@ -3,12 +3,15 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pyarrow as pa
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from robosystems.graph_api.app import create_app
 from robosystems.graph_api.core.admission_control import AdmissionDecision
+from robosystems.graph_api.core.arrow_ipc import ARROW_STREAM_MEDIA_TYPE, read_ipc_table
+from robosystems.graph_api.core.ladybug.service import MAX_RESULT_ROWS
 
 
 class TestDatabaseQueryRouter:
@@ -197,6 +200,75 @@ class TestDatabaseQueryRouter:
         assert chunk["count"] == 1
         assert chunk["rows"][0]["n"]["id"] == i + 1
 
+  def test_execute_query_arrow(self, client, mock_query_request):
+    """Test Arrow IPC response when requested via the Accept header."""
+    table = pa.table({"ticker": ["AAPL", "MSFT"], "value": [1.5, 2.5]})
+
+    from robosystems.graph_api.routers.databases.query import (
+      _get_service_for_request,
+    )
+
+    mock_service = client.app.dependency_overrides[_get_service_for_request]()
+    mock_service.execute_query_arrow.return_value = (table, 12.5)
+
+    with patch(
+      "robosystems.graph_api.routers.databases.query.get_admission_controller"
+    ) as mock_get_admission:
+      mock_admission = MagicMock()
+      mock_admission.check_admission.return_value = (AdmissionDecision.ACCEPT, "OK")
+      mock_get_admission.return_value = mock_admission
+
+      response = client.post(
+        "/databases/kg1a2b3c4d5/query",
+        json=mock_query_request,
+        headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+      )
+
+      assert response.status_code == status.HTTP_200_OK
+      assert ARROW_STREAM_MEDIA_TYPE in response.headers["content-type"]
+      assert response.headers["X-Row-Count"] == "2"
+      assert read_ipc_table(response.content).equals(table)
+
+      # Non-streaming Arrow responses are row-limited like JSON ones
+      assert (
+        mock_service.execute_query_arrow.call_args.kwargs["max_rows"] == MAX_RESULT_ROWS
+      )
+      mock_service.execute_query.assert_not_called()
+
+  def test_execute_query_arrow_streaming(self, client, mock_query_request):
+    """Test that streaming Arrow responses send record batches as read."""
+    table = pa.table({"ticker": ["AAPL", "MSFT", "GOOG"], "value": [1.5, 2.5, 3.5]})
+    batches = table.to_batches(max_chunksize=2)
+
+    from robosystems.graph_api.routers.databases.query import (
+      _get_service_for_request,
+    )
+
+    mock_service = client.app.dependency_overrides[_get_service_for_request]()
+    mock_service.stream_query_arrow.return_value = (
+      table.schema,
+      iter(batches),
+      12.5,
+    )
+
+    with patch(
+      "robosystems.graph_api.routers.databases.query.get_admission_controller"
+    ) as mock_get_admission:
+      mock_admission = MagicMock()
+      mock_admission.check_admission.return_value = (AdmissionDecision.ACCEPT, "OK")
+      mock_get_admission.return_value = mock_admission
+
+      response = client.post(
+        "/databases/kg1a2b3c4d5/query?streaming=true",
+        json=mock_query_request,
+        headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+      )
+
+      assert response.status_code == status.HTTP_200_OK
+      assert response.headers["X-Streaming"] == "true"
+      assert read_ipc_table(response.content).equals(table)
+      mock_service.execute_query_arrow.assert_not_called()
+
   def test_execute_query_empty_result(self, client):
     """Test query with empty result set."""
     empty_query = {
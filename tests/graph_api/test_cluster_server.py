@@ -301,7 +301,7 @@ class TestLadybugService:
     )
 
     # Mock database manager
-    mock_db_manager.return_value.list_databases.return_value = ["other_db"]
+    mock_db_manager.return_value.database_exists.return_value = False
 
     request = QueryRequest(
       database="nonexistent_db",
@@ -315,60 +315,68 @@ class TestLadybugService:
     assert "not found" in str(exc_info.value.detail)
 
   @patch("robosystems.graph_api.core.ladybug.service.LadybugDatabaseManager")
-  @patch("robosystems.graph_api.core.ladybug.service.ThreadPoolExecutor")
-  def test_execute_query_timeout(self, mock_executor_class, mock_db_manager):
-    """Test query execution timeout using ThreadPoolExecutor."""
-    from concurrent.futures import TimeoutError as FuturesTimeoutError
-
+  @patch("robosystems.graph_api.core.ladybug.service.get_query_executor")
+  def test_execute_query_timeout(self, mock_get_executor, mock_db_manager):
+    """Test query execution timeout on the shared query executor."""
     from fastapi import HTTPException
 
-    # Mock the env instance's GRAPH_QUERY_TIMEOUT
     from robosystems.config import env
+    from robosystems.graph_api.core.ladybug.executor import QueryTimeoutError
 
     with patch.object(env, "GRAPH_QUERY_TIMEOUT", 1.0):
-      # Mock database manager
       mock_db_instance = MagicMock()
       mock_db_instance.list_databases.return_value = ["test_db"]
       mock_db_manager.return_value = mock_db_instance
 
-      # Create service
       service = LadybugService(
         base_path=self.base_path,
         node_type=NodeType.WRITER,
         repository_type=RepositoryType.ENTITY,
       )
 
-      # Mock the executor and future
       mock_executor = MagicMock()
-      mock_future = MagicMock()
-
-      # Configure the executor to return our mock
-      mock_executor_class.return_value.__enter__.return_value = mock_executor
-      mock_executor.submit.return_value = mock_future
-
-      # Simulate a timeout
-      mock_future.result.side_effect = FuturesTimeoutError("Query execution timed out")
+      mock_executor.run.side_effect = QueryTimeoutError("Query exceeded timeout")
+      mock_get_executor.return_value = mock_executor
 
-      # Create request (no timeout field needed)
       request = QueryRequest(database="test_db", cypher="MATCH (n) RETURN n")
 
-      # Execute and expect timeout exception
       with pytest.raises(HTTPException) as exc_info:
         service.execute_query(request)
 
-      # Note: Due to a bug in the exception handling, the 408 timeout error
-      # is caught and wrapped in a 500 error. This should be fixed in the future.
-      assert exc_info.value.status_code == 500  # Currently wrapped in 500
+      assert exc_info.value.status_code == 408
       assert "timeout" in str(exc_info.value.detail).lower()
-      assert "408" in str(
-        exc_info.value.detail
-      )  # Original error code is in the message
 
-      # Verify that the future was cancelled
-      mock_future.cancel.assert_called_once()
+      # Verify timeout was passed to the executor
+      assert mock_executor.run.call_args.kwargs["timeout"] == 1.0
+
+  @patch("robosystems.graph_api.core.ladybug.service.LadybugDatabaseManager")
+  @patch("robosystems.graph_api.core.ladybug.service.get_query_executor")
+  def test_execute_query_executor_saturated(self, mock_get_executor, mock_db_manager):
+    """Test queries are rejected with 503 when the executor queue is full."""
+    from fastapi import HTTPException
+
+    from robosystems.graph_api.core.ladybug.executor import (
+      QueryExecutorSaturatedError,
+    )
+
+    mock_db_manager.return_value = MagicMock()
+
+    service = LadybugService(
+      base_path=self.base_path,
+      node_type=NodeType.WRITER,
+      repository_type=RepositoryType.ENTITY,
+    )
+
+    mock_executor = MagicMock()
+    mock_executor.run.side_effect = QueryExecutorSaturatedError("saturated")
+    mock_get_executor.return_value = mock_executor
+
+    request = QueryRequest(database="test_db", cypher="MATCH (n) RETURN n")
+
+    with pytest.raises(HTTPException) as exc_info:
+      service.execute_query(request)
 
-      # Verify timeout was used correctly
-      mock_future.result.assert_called_once_with(timeout=1.0)
+    assert exc_info.value.status_code == 503
 
   @patch("robosystems.graph_api.core.ladybug.service.LadybugDatabaseManager")
   def test_execute_query_large_result_set(self, mock_db_manager):
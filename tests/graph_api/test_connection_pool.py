@@ -12,6 +12,7 @@ import pytest
 
 from robosystems.graph_api.core.ladybug.pool import (
   ConnectionInfo,
+  ConnectionPoolTimeoutError,
   LadybugConnectionPool,
   get_connection_pool,
   initialize_connection_pool,
@@ -633,6 +634,124 @@ class TestLadybugConnectionPool:
     # Database is not closed - it's shared across connections
 
 
+class TestConnectionCheckout:
+  """Test exclusive checkout and return of pooled connections."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.temp_dir = tempfile.mkdtemp()
+    self.base_path = str(self.temp_dir)
+
+  def teardown_method(self):
+    """Clean up test fixtures."""
+    shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_checked_out_connection_is_not_shared(self, mock_conn_class, mock_db_class):
+    """Test a second caller gets a different connection while one is held."""
+    mock_conn_class.side_effect = lambda db: MagicMock()
+    pool = LadybugConnectionPool(base_path=self.base_path, max_connections_per_db=2)
+
+    with pool.get_connection("test_db") as first:
+      with pool.get_connection("test_db") as second:
+        assert first is not second
+        stats = pool.get_stats()["database_pools"]["test_db"]
+        assert stats["in_use_connections"] == 2
+        assert stats["utilization"] == 1.0
+
+    assert pool.get_stats()["database_pools"]["test_db"]["idle_connections"] == 2
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_acquire_times_out_when_saturated(self, mock_conn_class, mock_db_class):
+    """Test acquiring from a saturated pool raises after the timeout."""
+    mock_conn_class.side_effect = lambda db: MagicMock()
+    pool = LadybugConnectionPool(base_path=self.base_path, max_connections_per_db=1)
+
+    with pool.get_connection("test_db"):
+      with pytest.raises(ConnectionPoolTimeoutError):
+        with pool.get_connection("test_db", timeout=0.05):
+          pass
+
+    stats = pool.get_stats()["database_pools"]["test_db"]
+    assert stats["acquire_timeouts"] == 1
+    assert stats["waiting"] == 0
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_waiter_gets_returned_connection(self, mock_conn_class, mock_db_class):
+    """Test a waiting caller receives the connection once it is returned."""
+    mock_conn_class.side_effect = lambda db: MagicMock()
+    pool = LadybugConnectionPool(base_path=self.base_path, max_connections_per_db=1)
+    acquired = []
+
+    def waiter():
+      with pool.get_connection("test_db", timeout=5) as conn:
+        acquired.append(conn)
+
+    with pool.get_connection("test_db") as held:
+      thread = threading.Thread(target=waiter)
+      thread.start()
+      time.sleep(0.05)
+      assert acquired == []
+
+    thread.join(timeout=5)
+    assert acquired == [held]
+    assert pool.get_stats()["database_pools"]["test_db"]["waits"] == 1
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_invalidation_defers_close_until_return(self, mock_conn_class, mock_db_class):
+    """Test invalidating a checked-out connection closes it on return."""
+    mock_conn_class.side_effect = lambda db: MagicMock()
+    pool = LadybugConnectionPool(base_path=self.base_path)
+
+    with pool.get_connection("test_db") as conn:
+      pool.invalidate_connection("test_db")
+      conn.close.assert_not_called()
+      assert pool.get_stats()["retired_connections"] == 1
+
+    conn.close.assert_called_once()
+    assert pool.get_stats()["retired_connections"] == 0
+
+  @patch("real_ladybug.Database")
+  @patch("real_ladybug.Connection")
+  def test_health_check_does_not_deadlock_with_database_lock(
+    self, mock_conn_class, mock_db_class
+  ):
+    """Test maintenance never holds the global lock while waiting on a database."""
+    mock_conn_class.side_effect = lambda db: MagicMock()
+    pool = LadybugConnectionPool(base_path=self.base_path)
+    with pool.get_connection("test_db"):
+      pass
+    finished = []
+
+    def checkout():
+      # Holds the database lock, then needs the global lock (lock lookups)
+      with pool._get_database_lock("test_db"):
+        time.sleep(0.1)
+        pool._get_database_lock("other_db")
+      finished.append("checkout")
+
+    def health_check():
+      pool._check_connection_health()
+      pool._cleanup_expired_connections()
+      finished.append("health_check")
+
+    threads = [
+      threading.Thread(target=checkout, daemon=True),
+      threading.Thread(target=health_check, daemon=True),
+    ]
+    threads[0].start()
+    time.sleep(0.02)
+    threads[1].start()
+    for thread in threads:
+      thread.join(timeout=5)
+
+    assert sorted(finished) == ["checkout", "health_check"]
+
+
 class TestConnectionPoolGlobals:
   """Test global connection pool functions."""
 
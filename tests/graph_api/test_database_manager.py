@@ -360,6 +360,58 @@ class TestLadybugDatabaseManager:
 
     assert databases == []
 
+  @patch("robosystems.graph_api.core.ladybug.manager.initialize_connection_pool")
+  def test_database_exists_uses_registry(self, mock_init_pool):
+    """Test existence checks are served from the registry without a scan."""
+    mock_init_pool.return_value = MagicMock()
+    (self.base_path / "db1.lbug").touch()
+    manager = LadybugDatabaseManager(str(self.base_path), self.max_databases)
+
+    with patch.object(manager, "refresh_registry") as mock_refresh:
+      assert manager.database_exists("db1") is True
+      assert manager.database_exists("missing") is False
+
+    mock_refresh.assert_not_called()
+
+  @patch("robosystems.graph_api.core.ladybug.manager.initialize_connection_pool")
+  def test_database_exists_finds_out_of_band_database(self, mock_init_pool):
+    """Test a database file added outside the manager is picked up."""
+    mock_init_pool.return_value = MagicMock()
+    manager = LadybugDatabaseManager(str(self.base_path), self.max_databases)
+
+    (self.base_path / "restored.lbug").touch()
+
+    assert manager.database_exists("restored") is True
+    assert "restored" in manager.list_databases()
+
+  @patch("robosystems.graph_api.core.ladybug.manager.initialize_connection_pool")
+  def test_registry_reconciles_out_of_band_removal(self, mock_init_pool):
+    """Test a removed database file drops out of the registry."""
+    mock_init_pool.return_value = MagicMock()
+    (self.base_path / "db1.lbug").touch()
+    (self.base_path / "db2.lbug").touch()
+    manager = LadybugDatabaseManager(str(self.base_path), self.max_databases)
+    assert manager.list_databases() == ["db1", "db2"]
+
+    (self.base_path / "db2.lbug").unlink()
+    manager._registry_checked_at = 0.0
+
+    assert manager.database_exists("db2") is False
+    assert manager.list_databases() == ["db1"]
+
+  @patch("robosystems.graph_api.core.ladybug.manager.initialize_connection_pool")
+  def test_delete_database_unregisters(self, mock_init_pool):
+    """Test deleting a database removes it from the registry."""
+    mock_init_pool.return_value = MagicMock()
+    (self.base_path / "test_db.lbug").touch()
+    manager = LadybugDatabaseManager(str(self.base_path), self.max_databases)
+    assert manager.database_exists("test_db") is True
+
+    manager.delete_database("test_db")
+
+    with patch.object(manager, "_reconcile_registry"):
+      assert manager.database_exists("test_db") is False
+
   @patch("robosystems.graph_api.core.ladybug.manager.initialize_connection_pool")
   def test_get_database_info_success(self, mock_init_pool):
     """Test successful database info retrieval."""
@@ -1,7 +1,10 @@
+import os
 import shutil
 import tempfile
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
+import duckdb
 import pytest
 from fastapi import HTTPException
 
@@ -373,6 +376,117 @@ class TestDuckDBTableManager:
     assert "Failed to delete table" in exc_info.value.detail
 
 
+class TestIncrementalStaging:
+  """Test file_id tracked staging against a real DuckDB connection."""
+
+  def setup_method(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.conn = duckdb.connect()
+    self.manager = DuckDBTableManager()
+
+    pool = MagicMock()
+
+    @contextmanager
+    def get_connection(graph_id):
+      yield self.conn
+
+    pool.get_connection.side_effect = get_connection
+    self.pool_patcher = patch(
+      "robosystems.graph_api.core.duckdb.manager.get_duckdb_pool", return_value=pool
+    )
+    self.pool_patcher.start()
+
+  def teardown_method(self):
+    self.pool_patcher.stop()
+    self.conn.close()
+    shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+  def _write_parquet(self, name, rows, columns):
+    path = os.path.join(self.temp_dir, name)
+    values = ", ".join(
+      "(" + ", ".join(f"'{value}'" for value in row) + ")" for row in rows
+    )
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    self.conn.execute(
+      f"COPY (SELECT * FROM (VALUES {values}) AS t({column_list})) TO '{path}'"
+    )
+    return path
+
+  def _create(self, table_name, files, file_id_map, rebuild=False):
+    # Local paths bypass the s3:// validation; the scan is the same
+    request = TableCreateRequest.model_construct(
+      graph_id="test_graph",
+      table_name=table_name,
+      s3_pattern=files,
+      file_id_map=file_id_map,
+      rebuild=rebuild,
+    )
+    return self.manager.create_table(request)
+
+  def _rows(self, table_name):
+    return self.conn.execute(f'SELECT * FROM "{table_name}" ORDER BY ALL').fetchall()
+
+  def test_new_files_are_appended_without_rescanning(self):
+    first = self._write_parquet(
+      "a.parquet", [("n1", "a"), ("n2", "a")], ["identifier", "name"]
+    )
+    second = self._write_parquet(
+      "b.parquet", [("n2", "b"), ("n3", "b")], ["identifier", "name"]
+    )
+    file_ids = {first: "f1", second: "f2"}
+
+    response = self._create("entities", [first], file_ids)
+    assert (response.mode, response.files_scanned) == ("full", 1)
+
+    response = self._create("entities", [first, second], file_ids)
+    assert (response.mode, response.files_scanned) == ("incremental", 1)
+    assert response.file_ids == ["f2"]
+    # Existing rows win for keys that are already staged
+    assert self._rows("entities") == [
+      ("n1", "a", "f1"),
+      ("n2", "a", "f1"),
+      ("n3", "b", "f2"),
+    ]
+
+    response = self._create("entities", [first, second], file_ids)
+    assert (response.mode, response.files_scanned) == ("incremental", 0)
+
+    # The registry lives outside the main schema
+    tables = [row[0] for row in self.conn.execute("SHOW TABLES").fetchall()]
+    assert tables == ["entities"]
+
+  def test_removed_file_triggers_rebuild(self):
+    first = self._write_parquet(
+      "a.parquet", [("n1", "n2", "1")], ["from", "to", "weight"]
+    )
+    second = self._write_parquet(
+      "b.parquet", [("n2", "n3", "2")], ["from", "to", "weight"]
+    )
+    file_ids = {first: "f1", second: "f2"}
+
+    self._create("links", [first, second], file_ids)
+    response = self._create("links", [second], file_ids)
+
+    assert (response.mode, response.files_scanned) == ("full", 1)
+    assert self._rows("links") == [("n2", "n3", "2", "f2")]
+    columns = [row[0] for row in self.conn.execute('DESCRIBE "links"').fetchall()]
+    assert columns == ["src", "dst", "weight", "file_id"]
+
+  def test_delete_file_data_unregisters_file(self):
+    first = self._write_parquet("a.parquet", [("n1", "a")], ["identifier", "name"])
+    second = self._write_parquet("b.parquet", [("n2", "b")], ["identifier", "name"])
+    file_ids = {first: "f1", second: "f2"}
+    self._create("entities", [first, second], file_ids)
+
+    result = self.manager.delete_file_data("test_graph", "entities", "f1")
+    assert result["rows_deleted"] == 1
+
+    # Dropping the deleted file from the list does not force a rebuild
+    response = self._create("entities", [second], file_ids)
+    assert (response.mode, response.files_scanned) == ("incremental", 0)
+    assert self._rows("entities") == [("n2", "b", "f2")]
+
+
 class TestTableRequestModels:
   def test_table_create_request_valid(self):
     request = TableCreateRequest(
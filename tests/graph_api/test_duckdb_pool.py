@@ -13,6 +13,7 @@ import pytest
 from robosystems.graph_api.core.duckdb.pool import (
   DuckDBConnectionInfo,
   DuckDBConnectionPool,
+  DuckDBPoolTimeoutError,
   get_duckdb_pool,
   initialize_duckdb_pool,
 )
@@ -428,6 +429,126 @@ class TestDuckDBConnectionPool:
     assert len(pool._pools.get("test_graph", {})) == 0
 
 
+class TestDuckDBConnectionCheckout:
+  """Test exclusive checkout and return of pooled connections."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.temp_dir = tempfile.mkdtemp()
+    self.base_path = str(self.temp_dir)
+
+  def teardown_method(self):
+    """Clean up test fixtures."""
+    shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+  @staticmethod
+  def _healthy_connection(path):
+    """Create a mock connection that passes the health check."""
+    conn = MagicMock()
+    conn.execute.return_value.fetchone.return_value = (1,)
+    return conn
+
+  @patch("duckdb.connect")
+  def test_checked_out_connection_is_not_shared(self, mock_connect):
+    """Test a second caller gets a different connection while one is held."""
+    mock_connect.side_effect = self._healthy_connection
+    pool = DuckDBConnectionPool(base_path=self.base_path, max_connections_per_db=2)
+
+    with pool.get_connection("test_graph") as first:
+      with pool.get_connection("test_graph") as second:
+        assert first is not second
+        stats = pool.get_stats()["database_pools"]["test_graph"]
+        assert stats["in_use_connections"] == 2
+        assert stats["utilization"] == 1.0
+
+    assert pool.get_stats()["database_pools"]["test_graph"]["idle_connections"] == 2
+
+  @patch("duckdb.connect")
+  def test_acquire_times_out_when_saturated(self, mock_connect):
+    """Test acquiring from a saturated pool raises after the timeout."""
+    mock_connect.side_effect = self._healthy_connection
+    pool = DuckDBConnectionPool(base_path=self.base_path, max_connections_per_db=1)
+
+    with pool.get_connection("test_graph"):
+      with pytest.raises(DuckDBPoolTimeoutError):
+        with pool.get_connection("test_graph", timeout=0.05):
+          pass
+
+    stats = pool.get_stats()["database_pools"]["test_graph"]
+    assert stats["acquire_timeouts"] == 1
+    assert stats["waiting"] == 0
+
+  @patch("duckdb.connect")
+  def test_waiter_gets_returned_connection(self, mock_connect):
+    """Test a waiting caller receives the connection once it is returned."""
+    mock_connect.side_effect = self._healthy_connection
+    pool = DuckDBConnectionPool(base_path=self.base_path, max_connections_per_db=1)
+    acquired = []
+
+    def waiter():
+      with pool.get_connection("test_graph", timeout=5) as conn:
+        acquired.append(conn)
+
+    with pool.get_connection("test_graph") as held:
+      thread = threading.Thread(target=waiter)
+      thread.start()
+      time.sleep(0.05)
+      assert acquired == []
+
+    thread.join(timeout=5)
+    assert acquired == [held]
+    stats = pool.get_stats()["database_pools"]["test_graph"]
+    assert stats["waits"] == 1
+    assert stats["max_wait_ms"] > 0
+
+  @patch("duckdb.connect")
+  def test_invalidation_defers_close_until_return(self, mock_connect):
+    """Test invalidating a checked-out connection closes it on return."""
+    mock_connect.side_effect = self._healthy_connection
+    pool = DuckDBConnectionPool(base_path=self.base_path)
+
+    with pool.get_connection("test_graph") as conn:
+      pool.invalidate_connection("test_graph")
+      conn.close.assert_not_called()
+      assert pool.get_stats()["retired_connections"] == 1
+
+    conn.close.assert_called_once()
+    assert pool.get_stats()["retired_connections"] == 0
+
+  @patch("duckdb.connect")
+  def test_health_check_does_not_deadlock_with_database_lock(self, mock_connect):
+    """Test maintenance never holds the global lock while waiting on a database."""
+    mock_connect.side_effect = self._healthy_connection
+    pool = DuckDBConnectionPool(base_path=self.base_path)
+    with pool.get_connection("test_graph"):
+      pass
+    finished = []
+
+    def checkout():
+      # Holds the database lock, then needs the global lock (lock lookups)
+      with pool._get_database_lock("test_graph"):
+        time.sleep(0.1)
+        pool._get_database_lock("other_graph")
+      finished.append("checkout")
+
+    def health_check():
+      pool._check_connection_health()
+      pool._cleanup_expired_connections()
+      finished.append("health_check")
+
+    threads = [
+      threading.Thread(target=checkout, daemon=True),
+      threading.Thread(target=health_check, daemon=True),
+    ]
+    threads[0].start()
+    time.sleep(0.02)
+    threads[1].start()
+    for thread in threads:
+      thread.join(timeout=5)
+
+    assert sorted(finished) == ["checkout", "health_check"]
+
+
 class TestConnectionPoolGlobals:
   """Test global connection pool functions."""
 
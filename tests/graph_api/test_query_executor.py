@@ -0,0 +1,129 @@
+"""Tests for the shared LadybugDB query executor."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robosystems.graph_api.core.ladybug.executor import (
+  LadybugQueryExecutor,
+  QueryExecutorSaturatedError,
+  QueryTimeoutError,
+)
+
+
+class BlockingConnection:
+  """Connection stand-in whose query blocks until interrupted."""
+
+  def __init__(self):
+    self.timeouts: list[int] = []
+    self.interrupted = threading.Event()
+
+  def set_query_timeout(self, timeout_ms):
+    self.timeouts.append(timeout_ms)
+
+  def interrupt(self):
+    self.interrupted.set()
+
+  def execute(self):
+    self.interrupted.wait(5)
+    raise RuntimeError("Interrupted.")
+
+
+@pytest.fixture
+def executor():
+  query_executor = LadybugQueryExecutor(max_workers=2, max_queue=1)
+  yield query_executor
+  query_executor.shutdown()
+
+
+class TestLadybugQueryExecutor:
+  """Test LadybugQueryExecutor class."""
+
+  def test_run_returns_result_and_sets_native_timeout(self, executor):
+    """Test the native timeout is applied for the query and then cleared."""
+    conn = MagicMock()
+
+    result = executor.run(conn, lambda: "ok", timeout=2.0)
+
+    assert result == "ok"
+    assert [c.args[0] for c in conn.set_query_timeout.call_args_list] == [2000, 0]
+    assert executor.get_metrics()["completed"] == 1
+
+  def test_errors_propagate(self, executor):
+    """Test query errors surface to the caller unchanged."""
+
+    def failing():
+      raise RuntimeError("Binder exception: bad query")
+
+    with pytest.raises(RuntimeError, match="Binder exception"):
+      executor.run(MagicMock(), failing, timeout=1.0)
+
+    assert executor.get_metrics()["failed"] == 1
+
+  def test_native_interrupt_maps_to_timeout(self, executor):
+    """Test LadybugDB's own timeout interruption raises QueryTimeoutError."""
+
+    def interrupted():
+      raise RuntimeError("Interrupted.")
+
+    with pytest.raises(QueryTimeoutError):
+      executor.run(MagicMock(), interrupted, timeout=1.0)
+
+    assert executor.get_metrics()["timed_out"] == 1
+
+  def test_timeout_interrupts_running_query(self, executor):
+    """Test a query still running after the timeout is interrupted, not leaked."""
+    conn = BlockingConnection()
+
+    with patch("robosystems.graph_api.core.ladybug.executor.TIMEOUT_SLACK_SECONDS", 0):
+      with pytest.raises(QueryTimeoutError):
+        executor.run(conn, conn.execute, timeout=0.05)
+
+    assert conn.interrupted.is_set()
+    metrics = executor.get_metrics()
+    assert metrics["active"] == 0
+    assert metrics["timed_out"] == 1
+    assert metrics["stuck"] == 0
+
+  def test_rejects_when_queue_full(self, executor):
+    """Test queries beyond workers plus queue capacity are rejected."""
+    release = threading.Event()
+    started = threading.Barrier(3)
+
+    def blocking():
+      started.wait(1)
+      release.wait(5)
+
+    threads = [
+      threading.Thread(target=executor.run, args=(MagicMock(), blocking, 5.0))
+      for _ in range(2)
+    ]
+    for thread in threads:
+      thread.start()
+    started.wait(1)
+
+    # Two workers busy; one more may queue
+    queued = threading.Thread(
+      target=executor.run, args=(MagicMock(), lambda: None, 5.0)
+    )
+    queued.start()
+
+    try:
+      for _ in range(100):
+        if executor.get_metrics()["queue_depth"] == 1:
+          break
+        time.sleep(0.01)
+
+      with pytest.raises(QueryExecutorSaturatedError):
+        executor.run(MagicMock(), lambda: None, timeout=5.0)
+    finally:
+      release.set()
+      for thread in [*threads, queued]:
+        thread.join(5)
+
+    metrics = executor.get_metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["active"] == 0
@@ -19,7 +19,7 @@ def redis_client():
 @pytest.fixture
 def task_manager(monkeypatch, redis_client):
   monkeypatch.setattr(
-    "robosystems.config.valkey_registry.create_async_redis_client",
+    "robosystems.config.valkey_registry.get_shared_async_redis_client",
     lambda *args, **kwargs: redis_client,
   )
   manager = GenericTaskManager(task_prefix="test")
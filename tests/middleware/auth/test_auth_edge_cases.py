@@ -15,7 +15,7 @@ pytestmark = pytest.mark.slow
 class TestKeyRotationEdgeCases:
   """Test key rotation with rollback and error handling."""
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_key_rotation_successful_validation(self, mock_redis):
     """Test successful key rotation with validation."""
     mock_redis_client = MagicMock()
@@ -36,7 +36,7 @@ class TestKeyRotationEdgeCases:
     assert call_args[1] == cache.KEY_ROTATION_INTERVAL * 2  # TTL
     assert call_args[2] != old_key  # New key generated
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_key_rotation_rollback_on_validation_failure(self, mock_redis):
     """Test key rotation rollback when validation fails."""
     mock_redis_client = MagicMock()
@@ -65,7 +65,7 @@ class TestKeyRotationEdgeCases:
     rollback_call = setex_calls[-1][0]
     assert rollback_call[2] == old_key.encode()  # Old key restored (as bytes)
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   @patch("robosystems.middleware.auth.cache.SecurityAuditLogger")
   def test_key_rotation_critical_rollback_failure(self, mock_audit, mock_redis):
     """Test handling of critical rollback failure during key rotation."""
@@ -107,7 +107,7 @@ class TestKeyRotationEdgeCases:
 class TestCacheSignatureEdgeCases:
   """Test signature cache LRU eviction and memory management."""
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_signature_cache_lru_eviction(self, mock_redis):
     """Test LRU eviction when cache exceeds max size."""
     mock_redis_client = MagicMock()
@@ -140,7 +140,7 @@ class TestCacheSignatureEdgeCases:
     assert "hash_14" in cache._signature_cache
     assert "hash_8" in cache._signature_cache
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_signature_cache_expired_entry_cleanup(self, mock_redis):
     """Test removal of expired entries before LRU eviction."""
     mock_redis_client = MagicMock()
@@ -177,7 +177,7 @@ class TestCacheSignatureEdgeCases:
 class TestConcurrentAccessEdgeCases:
   """Test concurrent access patterns and race conditions."""
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_concurrent_cache_writes(self, mock_redis):
     """Test handling of concurrent cache write operations."""
     mock_redis_client = MagicMock()
@@ -209,7 +209,7 @@ class TestConcurrentAccessEdgeCases:
 class TestMemoryLeakPrevention:
   """Test memory leak prevention in cache operations."""
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_signature_cache_memory_bounded(self, mock_redis):
     """Test that signature cache memory usage is bounded."""
     mock_redis_client = MagicMock()
@@ -231,7 +231,7 @@ class TestMemoryLeakPrevention:
     # Final size should be at or below max
     assert len(cache._signature_cache) <= cache.MAX_SIGNATURE_CACHE_SIZE
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_validation_failure_counter_reset(self, mock_redis):
     """Test that validation failure counter resets appropriately."""
     mock_redis_client = MagicMock()
@@ -256,7 +256,7 @@ class TestMemoryLeakPrevention:
 class TestRedisConnectionFailures:
   """Test handling of Redis connection failures."""
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   def test_cache_operations_with_redis_down(self, mock_redis):
     """Test graceful degradation when Redis is unavailable."""
     mock_redis_client = MagicMock()
@@ -286,7 +286,7 @@ class TestRedisConnectionFailures:
     )
     # Should complete without raising
 
-  @patch("robosystems.middleware.auth.cache.create_redis_client")
+  @patch("robosystems.middleware.auth.cache.get_shared_redis_client")
   @patch("robosystems.middleware.auth.cache.SecurityAuditLogger")
   def test_cache_security_event_logging_on_failures(self, mock_audit, mock_redis):
     """Test that security events are logged for cache operation failures."""
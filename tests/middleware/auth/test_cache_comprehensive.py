@@ -43,11 +43,13 @@ class TestAPIKeyCacheInitialization:
 
   def test_redis_connection_lazy_loading(self):
     """Test Redis connection lazy loading."""
-    with patch("robosystems.middleware.auth.cache.redis.Redis") as MockRedis:
+    with patch(
+      "robosystems.middleware.auth.cache.get_shared_redis_client"
+    ) as mock_get_client:
       mock_redis = Mock()
       mock_redis.ping.return_value = True
       mock_redis.keys.return_value = []  # Return empty list for keys() calls
-      MockRedis.from_url.return_value = mock_redis
+      mock_get_client.return_value = mock_redis
 
       cache = APIKeyCache()
       assert cache._redis is None
@@ -55,13 +57,15 @@ class TestAPIKeyCacheInitialization:
       # Access redis property triggers connection
       redis_conn = cache.redis
       assert redis_conn is mock_redis
-      MockRedis.from_url.assert_called_once()
+      mock_get_client.assert_called_once()
       mock_redis.ping.assert_called_once()
 
   def test_redis_connection_failure(self):
     """Test Redis connection failure handling."""
-    with patch("robosystems.middleware.auth.cache.redis.Redis") as MockRedis:
-      MockRedis.from_url.side_effect = Exception("Connection failed")
+    with patch(
+      "robosystems.middleware.auth.cache.get_shared_redis_client"
+    ) as mock_get_client:
+      mock_get_client.side_effect = Exception("Connection failed")
 
       cache = APIKeyCache()
       with pytest.raises(Exception, match="Connection failed"):
@@ -818,11 +822,13 @@ class TestCachePerformance:
   def test_lazy_connection_performance(self, cache):
     """Test lazy connection initialization for performance."""
     # Create a fresh cache instance to test lazy loading
-    with patch("robosystems.middleware.auth.cache.redis.Redis") as MockRedis:
+    with patch(
+      "robosystems.middleware.auth.cache.get_shared_redis_client"
+    ) as mock_get_client:
       mock_redis = Mock()
       mock_redis.ping.return_value = True
       mock_redis.keys.return_value = []  # Return empty list for keys() calls
-      MockRedis.from_url.return_value = mock_redis
+      mock_get_client.return_value = mock_redis
 
       fresh_cache = APIKeyCache()
 
@@ -832,7 +838,7 @@ class TestCachePerformance:
       # Accessing redis property should trigger connection
       redis_conn = fresh_cache.redis
       assert redis_conn is mock_redis
-      MockRedis.from_url.assert_called_once()
+      mock_get_client.assert_called_once()
 
   def test_encryption_performance(self, cache):
     """Test encryption performance with various data sizes."""
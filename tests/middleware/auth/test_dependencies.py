@@ -6,12 +6,13 @@ including JWT token verification, user authentication, graph access validation,
 and repository access controls.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import jwt
 import pytest
 from fastapi import HTTPException, Request, status
 
+from robosystems.config import env
 from robosystems.middleware.auth.dependencies import (
   API_KEY_HEADER,
   _create_user_from_cache,
@@ -23,6 +24,7 @@ from robosystems.middleware.auth.dependencies import (
   get_optional_user,
   get_repository_user_dependency,
   verify_jwt_token,
+  verify_jwt_token_async,
 )
 from robosystems.models.iam import User
 
@@ -369,7 +371,10 @@ class TestGetOptionalUser:
   """Test optional user authentication dependency."""
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies._create_user_from_cache")
   async def test_get_optional_user_jwt_token_cached(
@@ -397,7 +402,10 @@ class TestGetOptionalUser:
     mock_create_user.assert_called_once_with(cached_data["user_data"])
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   async def test_get_optional_user_jwt_token_database_fallback(
@@ -424,8 +432,14 @@ class TestGetOptionalUser:
     mock_user_class.get_by_id.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_async",
+    new_callable=AsyncMock,
+  )
   async def test_get_optional_user_api_key_fallback(
     self, mock_validate_api_key, mock_verify_jwt
   ):
@@ -459,8 +473,14 @@ class TestGetOptionalUser:
     assert result is None
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_async",
+    new_callable=AsyncMock,
+  )
   async def test_get_optional_user_both_invalid(
     self, mock_validate_api_key, mock_verify_jwt
   ):
@@ -491,7 +511,10 @@ class TestGetCurrentUser:
     self.mock_request.url.path = "/test/endpoint"
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies._create_user_from_cache")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -518,7 +541,10 @@ class TestGetCurrentUser:
     mock_audit_logger.log_auth_success.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -546,7 +572,10 @@ class TestGetCurrentUser:
     mock_audit_logger.log_auth_success.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_get_current_user_invalid_jwt_token(
     self, mock_audit_logger, mock_verify_jwt
@@ -566,7 +595,10 @@ class TestGetCurrentUser:
     mock_audit_logger.log_security_event.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key")
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_get_current_user_api_key_success(
     self, mock_audit_logger, mock_validate_api_key
@@ -587,7 +619,10 @@ class TestGetCurrentUser:
     mock_audit_logger.log_auth_success.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key")
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_get_current_user_invalid_api_key(
     self, mock_audit_logger, mock_validate_api_key
@@ -621,7 +656,10 @@ class TestGetCurrentUser:
     mock_audit_logger.log_auth_failure.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -660,7 +698,10 @@ class TestGetCurrentUserWithGraph:
     self.graph_id = "graph123"
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -696,7 +737,10 @@ class TestGetCurrentUserWithGraph:
     mock_audit_logger.log_auth_success.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -733,7 +777,10 @@ class TestGetCurrentUserWithGraph:
       mock_cache.cache_jwt_graph_access.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -767,7 +814,10 @@ class TestGetCurrentUserWithGraph:
     mock_audit_logger.log_authorization_denied.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key_with_graph")
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_with_graph_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_get_current_user_with_graph_api_key_success(
     self, mock_audit_logger, mock_validate_api_key_with_graph
@@ -791,7 +841,10 @@ class TestGetCurrentUserWithGraph:
     mock_audit_logger.log_auth_success.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.validate_api_key_with_graph")
+  @patch(
+    "robosystems.middleware.auth.dependencies.validate_api_key_with_graph_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_get_current_user_with_graph_api_key_invalid(
     self, mock_audit_logger, mock_validate_api_key_with_graph
@@ -815,7 +868,10 @@ class TestGetCurrentUserWithGraph:
     mock_audit_logger.log_security_event.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   @patch("robosystems.middleware.auth.dependencies.User")
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
@@ -864,6 +920,159 @@ class TestGetCurrentUserWithGraph:
       mock_audit_logger.log_auth_success.assert_called_once()
 
 
+class TestAsyncDatabaseAccess:
+  """Test user and graph access resolution on the async database engine."""
+
+  def setup_method(self):
+    """Setup test fixtures."""
+    self.mock_request = Mock(spec=Request)
+    self.mock_request.client.host = "192.168.1.100"
+    self.mock_request.headers = {"authorization": "Bearer valid.jwt.token"}
+    self.mock_request.url.path = "/test/endpoint"
+    self.user_id = "user123"
+    self.graph_id = "kg1a2b3c4d5e6f7a8b9"
+
+  @pytest.fixture(autouse=True)
+  def async_database(self):
+    with (
+      patch.object(env, "DATABASE_ASYNC_AUTH_ENABLED", True),
+      patch("robosystems.middleware.auth.dependencies.async_session") as mock_session,
+    ):
+      self.mock_session = mock_session
+      self.mock_db = AsyncMock()
+      mock_session.return_value.__aenter__.return_value = self.mock_db
+      yield
+
+  def _mock_user(self):
+    mock_user = Mock(spec=User)
+    mock_user.id = self.user_id
+    mock_user.is_active = True
+    return mock_user
+
+  @pytest.mark.asyncio
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
+  @patch("robosystems.middleware.auth.dependencies.api_key_cache")
+  @patch("robosystems.middleware.auth.dependencies.User")
+  @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
+  async def test_user_and_graph_access_resolved_in_one_query(
+    self, mock_audit_logger, mock_user_class, mock_cache, mock_verify_jwt
+  ):
+    """Test a cold request loads the user and access matrix together."""
+    mock_user = self._mock_user()
+    mock_verify_jwt.return_value = self.user_id
+    mock_cache.get_cached_jwt_validation.return_value = None
+    mock_cache.get_cached_jwt_graph_access.return_value = None
+    mock_cache.get_cached_graph_access_matrix.return_value = None
+    mock_user_class.get_with_graph_roles_async = AsyncMock(
+      return_value=(mock_user, {self.graph_id: "member"})
+    )
+
+    result = await get_current_user_with_graph(
+      self.mock_request, f"{self.graph_id}_dev", api_key=None
+    )
+
+    assert result == mock_user
+    mock_user_class.get_with_graph_roles_async.assert_awaited_once_with(
+      self.user_id, self.mock_db
+    )
+    mock_user_class.get_by_id.assert_not_called()
+    mock_cache.cache_graph_access_matrix.assert_called_once_with(
+      self.user_id, {self.graph_id: "member"}
+    )
+    mock_cache.cache_jwt_graph_access.assert_called_once_with(
+      self.user_id, f"{self.graph_id}_dev", True
+    )
+
+  @pytest.mark.asyncio
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
+  @patch("robosystems.middleware.auth.dependencies.api_key_cache")
+  @patch("robosystems.middleware.auth.dependencies._create_user_from_cache")
+  @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
+  async def test_cached_access_matrix_skips_database(
+    self, mock_audit_logger, mock_create_user, mock_cache, mock_verify_jwt
+  ):
+    """Test a cached user and access matrix answer without the database."""
+    mock_create_user.return_value = self._mock_user()
+    mock_verify_jwt.return_value = self.user_id
+    mock_cache.get_cached_jwt_validation.return_value = {
+      "user_data": {"id": self.user_id, "email": "test@example.com"}
+    }
+    mock_cache.get_cached_jwt_graph_access.return_value = None
+    mock_cache.get_cached_graph_access_matrix.return_value = {"kg0000000000": "admin"}
+
+    with pytest.raises(HTTPException) as exc_info:
+      await get_current_user_with_graph(self.mock_request, self.graph_id, api_key=None)
+
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+    self.mock_session.assert_not_called()
+    mock_cache.cache_jwt_graph_access.assert_called_once_with(
+      self.user_id, self.graph_id, False
+    )
+
+  @pytest.mark.asyncio
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
+  @patch("robosystems.middleware.auth.dependencies.api_key_cache")
+  @patch("robosystems.middleware.auth.dependencies.User")
+  @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
+  async def test_user_loaded_on_async_session(
+    self, mock_audit_logger, mock_user_class, mock_cache, mock_verify_jwt
+  ):
+    """Test the database fallback for a user uses the async session."""
+    mock_user = self._mock_user()
+    mock_verify_jwt.return_value = self.user_id
+    mock_cache.get_cached_jwt_validation.return_value = None
+    mock_user_class.get_by_id_async = AsyncMock(return_value=mock_user)
+
+    result = await get_current_user(self.mock_request, api_key=None)
+
+    assert result == mock_user
+    mock_user_class.get_by_id_async.assert_awaited_once_with(self.user_id, self.mock_db)
+    mock_user_class.get_by_id.assert_not_called()
+
+  @pytest.mark.asyncio
+  @patch("robosystems.middleware.auth.jwt.is_jwt_token_revoked")
+  @patch("robosystems.middleware.auth.jwt.jwt.decode")
+  @patch("robosystems.middleware.auth.dependencies.api_key_cache")
+  @patch("robosystems.middleware.auth.dependencies.User")
+  async def test_verify_jwt_token_async_loads_user_on_async_session(
+    self, mock_user_class, mock_cache, mock_jwt_decode, mock_is_revoked
+  ):
+    """Test a JWT cache miss verifies the user without the sync session."""
+    mock_user = self._mock_user()
+    mock_user.email = "test@example.com"
+    mock_user.name = "Test User"
+    mock_is_revoked.return_value = False
+    mock_jwt_decode.return_value = {"user_id": self.user_id, "jti": "test-jti"}
+    mock_cache.get_cached_jwt_validation.return_value = None
+    mock_user_class.get_by_id_async = AsyncMock(return_value=mock_user)
+
+    with patch("robosystems.middleware.auth.dependencies.session") as mock_sync:
+      result = await verify_jwt_token_async("valid.jwt.token")
+
+    assert result == self.user_id
+    self.mock_session.assert_called_once()
+    mock_user_class.get_by_id_async.assert_awaited_once_with(self.user_id, self.mock_db)
+    mock_sync.assert_not_called()
+    mock_cache.cache_jwt_validation.assert_called_once_with(
+      "valid.jwt.token",
+      {
+        "id": self.user_id,
+        "email": "test@example.com",
+        "name": "Test User",
+        "is_active": True,
+      },
+    )
+
+
 class TestRepositoryAccess:
   """Test repository access validation functionality."""
 
@@ -951,7 +1160,10 @@ class TestSecurityScenarios:
   """Test security-focused edge cases and attack scenarios."""
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   async def test_jwt_injection_attempt(self, mock_verify_jwt):
     """Test handling of JWT injection attempts."""
     # Malicious JWT token with injection attempt
@@ -1002,7 +1214,10 @@ class TestSecurityScenarios:
     assert _validate_cached_user_data(sql_injection_data) is True
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.SecurityAuditLogger")
   async def test_brute_force_token_attack_logging(
     self, mock_audit_logger, mock_verify_jwt
@@ -1089,7 +1304,10 @@ class TestPerformanceAndCaching:
   """Test performance-related functionality and caching behavior."""
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   @patch("robosystems.middleware.auth.dependencies.api_key_cache")
   async def test_cache_hit_performance(self, mock_cache, mock_verify_jwt):
     """Test that cache hits avoid expensive operations."""
@@ -1118,7 +1336,10 @@ class TestPerformanceAndCaching:
       mock_create_user.assert_called_once()
 
   @pytest.mark.asyncio
-  @patch("robosystems.middleware.auth.dependencies.verify_jwt_token")
+  @patch(
+    "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+    new_callable=AsyncMock,
+  )
   async def test_multiple_auth_method_precedence(self, mock_verify_jwt):
     """Test that JWT token takes precedence over API key."""
     auth_token = "valid.jwt.token"
@@ -1140,7 +1361,8 @@ class TestPerformanceAndCaching:
         mock_user_class.get_by_id.return_value = mock_user
 
         with patch(
-          "robosystems.middleware.auth.dependencies.validate_api_key"
+          "robosystems.middleware.auth.dependencies.validate_api_key_async",
+          new_callable=AsyncMock,
         ) as mock_validate_api_key:
           result = await get_optional_user(request=mock_request, api_key=api_key)
 
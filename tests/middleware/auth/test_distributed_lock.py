@@ -475,12 +475,12 @@ class TestSSOTokenLockManager:
 class TestGetSSOLockManager:
   """Tests for get_sso_lock_manager function."""
 
-  @patch("robosystems.config.valkey_registry.create_redis_client")
-  def test_get_sso_lock_manager_success(self, mock_create_redis_client):
+  @patch("robosystems.config.valkey_registry.get_shared_redis_client")
+  def test_get_sso_lock_manager_success(self, mock_get_redis_client):
     """Test successful SSO lock manager creation."""
     mock_redis = Mock()
     mock_redis.ping.return_value = True
-    mock_create_redis_client.return_value = mock_redis
+    mock_get_redis_client.return_value = mock_redis
 
     manager = get_sso_lock_manager()
 
@@ -490,19 +490,19 @@ class TestGetSSOLockManager:
     # Verify correct database was requested
     from robosystems.config.valkey_registry import ValkeyDatabase
 
-    mock_create_redis_client.assert_called_once_with(
+    mock_get_redis_client.assert_called_once_with(
       ValkeyDatabase.DISTRIBUTED_LOCKS, decode_responses=True
     )
 
   @patch("robosystems.middleware.auth.distributed_lock.logger")
-  @patch("robosystems.config.valkey_registry.create_redis_client")
+  @patch("robosystems.config.valkey_registry.get_shared_redis_client")
   def test_get_sso_lock_manager_connection_error(
-    self, mock_create_redis_client, mock_logger
+    self, mock_get_redis_client, mock_logger
   ):
     """Test SSO lock manager creation with connection error."""
     mock_redis = Mock()
     mock_redis.ping.side_effect = RedisError("Connection refused")
-    mock_create_redis_client.return_value = mock_redis
+    mock_get_redis_client.return_value = mock_redis
 
     manager = get_sso_lock_manager()
 
@@ -510,12 +510,10 @@ class TestGetSSOLockManager:
     mock_logger.error.assert_called_once()
 
   @patch("robosystems.middleware.auth.distributed_lock.logger")
-  @patch("robosystems.config.valkey_registry.create_redis_client")
-  def test_get_sso_lock_manager_import_error(
-    self, mock_create_redis_client, mock_logger
-  ):
+  @patch("robosystems.config.valkey_registry.get_shared_redis_client")
+  def test_get_sso_lock_manager_import_error(self, mock_get_redis_client, mock_logger):
     """Test SSO lock manager creation with import error."""
-    mock_create_redis_client.side_effect = ImportError("Module not found")
+    mock_get_redis_client.side_effect = ImportError("Module not found")
 
     manager = get_sso_lock_manager()
 
@@ -0,0 +1,173 @@
+"""Tests for the in-process auth cache."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from robosystems.config import env
+from robosystems.middleware.auth.cache import APIKeyCache
+from robosystems.middleware.auth.local_cache import LocalAuthCache
+
+USER_DATA = {
+  "id": "user_123",
+  "email": "test@example.com",
+  "name": "Test User",
+  "is_active": True,
+}
+
+
+@pytest.fixture
+def mock_redis():
+  with patch(
+    "robosystems.middleware.auth.local_cache.get_shared_redis_client"
+  ) as mock_get_client:
+    yield mock_get_client.return_value
+
+
+@pytest.fixture
+def local_cache(mock_redis):
+  cache = LocalAuthCache(ttl=30, max_entries=3, refresh_interval=60)
+  with (
+    patch.object(env, "AUTH_LOCAL_CACHE_ENABLED", True),
+    patch.object(cache, "_ensure_listener"),
+  ):
+    cache._subscribed.set()
+    yield cache
+
+
+class TestLocalAuthCache:
+  """Test the in-process tier on its own."""
+
+  def test_hit_returns_copy(self, local_cache):
+    local_cache.set("apikey:abc", {"user_data": dict(USER_DATA)}, ["apikey:abc"])
+
+    first = local_cache.get("apikey:abc")
+    first["user_data"]["id"] = "tampered"
+
+    assert local_cache.get("apikey:abc")["user_data"]["id"] == "user_123"
+    assert local_cache.get_stats()["hits"] == 2
+
+  def test_not_served_until_subscribed(self, local_cache):
+    local_cache._subscribed.clear()
+    local_cache.set("apikey:abc", {"is_active": True}, ["apikey:abc"])
+
+    local_cache._subscribed.set()
+    assert local_cache.get("apikey:abc") is None
+
+  def test_expired_entry_is_a_miss(self, local_cache):
+    local_cache.ttl = 0
+    local_cache.set("jwt:abc", {"is_active": True}, ["jwt:abc"])
+
+    assert local_cache.get("jwt:abc") is None
+
+  def test_bounded(self, local_cache):
+    for index in range(4):
+      local_cache.set(f"jwt:{index}", {"index": index}, [f"jwt:{index}"])
+
+    assert local_cache.get("jwt:0") is None
+    assert local_cache.get("jwt:3") == {"index": 3}
+    assert local_cache.get_stats()["evictions"] == 1
+
+  def test_invalidate_publishes_tags(self, local_cache, mock_redis):
+    local_cache.set("jwt:abc", {"is_active": True}, ["jwt:abc", "user:user_123"])
+
+    local_cache.invalidate("user:user_123")
+
+    assert local_cache.get("jwt:abc") is None
+    channel, payload = mock_redis.publish.call_args.args
+    assert channel == local_cache._channel()
+    assert json.loads(payload) == ["user:user_123"]
+
+  def test_invalidation_requires_all_tags(self, local_cache):
+    local_cache.set("jwt_graph:u1:g1", True, ["jwt_graph", "user:u1", "graph:g1"])
+    local_cache.set("jwt_graph:u1:g2", True, ["jwt_graph", "user:u1", "graph:g2"])
+
+    local_cache.invalidate_local(["jwt_graph", "user:u1", "graph:g1"])
+
+    assert local_cache.get("jwt_graph:u1:g1") is None
+    assert local_cache.get("jwt_graph:u1:g2") is True
+
+  def test_user_invalidation_drops_api_key_graph_grants(self, local_cache):
+    local_cache.set("apikey:h1", {"is_active": True}, ["apikey:h1", "user:u1"])
+    local_cache.set("apikey_graph:h1:g1", True, ["apikey_graph", "apikey:h1"])
+
+    local_cache.invalidate_local(["user:u1"])
+
+    assert local_cache.get("apikey:h1") is None
+    assert local_cache.get("apikey_graph:h1:g1") is None
+
+  def test_store_skipped_after_invalidation(self, local_cache):
+    generation = local_cache.generation()
+    local_cache.invalidate_local(["apikey:abc"])
+
+    local_cache.set("apikey:abc", {"is_active": True}, ["apikey:abc"], generation)
+
+    assert local_cache.get("apikey:abc") is None
+    assert local_cache.get_stats()["stale_skipped"] == 1
+
+  def test_should_refresh_is_rate_limited(self, local_cache):
+    assert local_cache.should_refresh("apikey:abc") is True
+    assert local_cache.should_refresh("apikey:abc") is False
+    assert local_cache.should_refresh("apikey:def") is True
+    assert local_cache.get_stats()["refreshes_skipped"] == 1
+
+
+class TestAPIKeyCacheLocalTier:
+  """Test the Valkey auth cache with the in-process tier in front."""
+
+  @pytest.fixture
+  def api_key_cache(self, local_cache):
+    cache = APIKeyCache()
+    cache.local = local_cache
+    cache._redis = Mock()
+    return cache
+
+  def test_api_key_hit_skips_valkey(self, api_key_cache):
+    api_key_cache.cache_api_key_validation("hash123", USER_DATA)
+    api_key_cache._redis.reset_mock()
+
+    cached = api_key_cache.get_cached_api_key_validation("hash123")
+
+    assert cached["user_data"] == USER_DATA
+    assert cached["is_active"] is True
+    api_key_cache._redis.pipeline.assert_not_called()
+
+  def test_revocation_drops_local_entries(self, api_key_cache):
+    api_key_cache._redis.keys.return_value = []
+    api_key_cache.cache_api_key_validation("hash123", USER_DATA)
+    api_key_cache.cache_graph_access("hash123", "kg1", True)
+
+    api_key_cache.invalidate_api_key("hash123")
+
+    assert api_key_cache.local.get("apikey:hash123") is None
+    assert api_key_cache.local.get("apikey_graph:hash123:kg1") is None
+
+  def test_jwt_logout_drops_local_entry(self, api_key_cache):
+    api_key_cache.cache_jwt_validation("token", USER_DATA)
+    jwt_key = api_key_cache._get_jwt_cache_key(api_key_cache._hash_jwt_token("token"))
+    assert api_key_cache.local.get(jwt_key) is not None
+
+    api_key_cache.invalidate_jwt_token("token")
+
+    assert api_key_cache.local.get(jwt_key) is None
+
+  def test_revocation_by_id_drops_local_entries(self, api_key_cache):
+    api_key_cache._redis.get.return_value = None
+    api_key_cache.cache_api_key_validation("hash123", USER_DATA, api_key_id="uak_123")
+    api_key_cache.cache_graph_access("hash123", "kg1", True)
+
+    api_key_cache.invalidate_api_key_by_id("uak_123")
+
+    assert api_key_cache.local.get("apikey:hash123") is None
+    assert api_key_cache.local.get("apikey_graph:hash123:kg1") is None
+
+  def test_revocation_during_valkey_read_is_not_cached(self, api_key_cache):
+    def revoke_during_read(key):
+      api_key_cache.local.invalidate_local(["apikey:hash123"])
+      return json.dumps({"has_access": True})
+
+    api_key_cache._redis.get.side_effect = revoke_during_read
+
+    assert api_key_cache.get_cached_graph_access("hash123", "kg1") is True
+    assert api_key_cache.local.get("apikey_graph:hash123:kg1") is None
@@ -0,0 +1,162 @@
+"""Tests for the in-process graph location cache."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from robosystems.config import env
+from robosystems.middleware.graph.allocation_manager import (
+  DatabaseLocation,
+  DatabaseStatus,
+)
+from robosystems.middleware.graph.location_cache import (
+  GraphLocationCache,
+  deserialize_location,
+  serialize_location,
+)
+
+
+class FakeAsyncRedis:
+  """Minimal in-memory async Valkey stand-in."""
+
+  def __init__(self):
+    self.store: dict[str, str] = {}
+    self.published: list[tuple[str, str]] = []
+
+  async def get(self, key):
+    return self.store.get(key)
+
+  async def setex(self, key, ttl, value):
+    self.store[key] = value
+
+  async def delete(self, key):
+    self.store.pop(key, None)
+
+  async def publish(self, channel, message):
+    self.published.append((channel, message))
+
+
+def make_location(graph_id: str = "kg123", private_ip: str = "10.0.0.1"):
+  return DatabaseLocation(
+    graph_id=graph_id,
+    instance_id="i-abc123",
+    private_ip=private_ip,
+    availability_zone="us-east-1a",
+    created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    status=DatabaseStatus.ACTIVE,
+  )
+
+
+class CountingLookup:
+  """Registry lookup stand-in that counts calls."""
+
+  def __init__(self, location, delay: float = 0.0):
+    self.location = location
+    self.delay = delay
+    self.calls = 0
+
+  async def __call__(self):
+    self.calls += 1
+    if self.delay:
+      await asyncio.sleep(self.delay)
+    return self.location
+
+
+@pytest.fixture
+def fake_redis():
+  return FakeAsyncRedis()
+
+
+@pytest.fixture
+def cache(fake_redis):
+  location_cache = GraphLocationCache(ttl=30, max_entries=2, remote_ttl=60)
+  with (
+    patch.object(env, "GRAPH_REDIS_CACHE_ENABLED", True),
+    patch.object(location_cache, "_get_async_redis", return_value=fake_redis),
+    patch.object(location_cache, "_ensure_listener"),
+  ):
+    yield location_cache
+
+
+def test_location_round_trip():
+  location = make_location()
+  assert deserialize_location(serialize_location(location)) == location
+
+
+@pytest.mark.asyncio
+async def test_local_hit_skips_valkey_and_registry(cache, fake_redis):
+  lookup = CountingLookup(make_location())
+
+  first = await cache.get("kg123", lookup)
+  fake_redis.store.clear()
+  second = await cache.get("kg123", lookup)
+
+  assert first == second
+  assert lookup.calls == 1
+  assert cache.get_stats()["local_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_valkey_hit_fills_local_tier(cache, fake_redis):
+  location = make_location()
+  fake_redis.store[cache._remote_key("kg123")] = serialize_location(location)
+  lookup = CountingLookup(None)
+
+  assert await cache.get("kg123", lookup) == location
+  assert lookup.calls == 0
+  assert cache.get_stats()["remote_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup(cache):
+  lookup = CountingLookup(make_location(), delay=0.01)
+
+  results = await asyncio.gather(*(cache.get("kg123", lookup) for _ in range(10)))
+
+  assert lookup.calls == 1
+  assert all(result == results[0] for result in results)
+  assert cache.get_stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_missing_graph_not_cached(cache):
+  lookup = CountingLookup(None)
+
+  assert await cache.get("kg404", lookup) is None
+  assert await cache.get("kg404", lookup) is None
+  assert lookup.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_clears_tiers_and_publishes(cache, fake_redis):
+  lookup = CountingLookup(make_location())
+  await cache.get("kg123", lookup)
+
+  await cache.invalidate("kg123")
+
+  assert cache._remote_key("kg123") not in fake_redis.store
+  assert fake_redis.published == [(cache._channel(), "kg123")]
+  lookup.location = make_location(private_ip="10.0.0.2")
+  assert (await cache.get("kg123", lookup)).private_ip == "10.0.0.2"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_lookup_is_not_overwritten(cache, fake_redis):
+  lookup = CountingLookup(make_location(), delay=0.01)
+
+  pending = asyncio.ensure_future(cache.get("kg123", lookup))
+  await asyncio.sleep(0)
+  cache.invalidate_local("kg123")
+  await pending
+
+  assert cache._local_get("kg123") is None
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded(cache):
+  for graph_id in ("kg1", "kg2", "kg3"):
+    await cache.get(graph_id, CountingLookup(make_location(graph_id)))
+
+  assert list(cache._local) == ["kg2", "kg3"]
@@ -0,0 +1,191 @@
+"""Tests for the Cypher query result cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from robosystems.middleware.graph.query_cache import (
+  QueryResultCache,
+  invalidate_query_cache,
+)
+
+
+class FakeAsyncRedis:
+  """Minimal in-memory async Valkey stand-in."""
+
+  def __init__(self):
+    self.store: dict[str, str] = {}
+    self.get_calls = 0
+
+  async def get(self, key):
+    self.get_calls += 1
+    return self.store.get(key)
+
+  async def setex(self, key, ttl, value):
+    self.store[key] = value
+
+  async def incr(self, key):
+    self.store[key] = str(int(self.store.get(key, 0)) + 1)
+    return int(self.store[key])
+
+
+@pytest.fixture
+def fake_redis():
+  return FakeAsyncRedis()
+
+
+@pytest.fixture
+def cache(fake_redis):
+  result_cache = QueryResultCache(
+    ttl=60, max_bytes=10_000, local_enabled=True, local_max_entries=2
+  )
+  with patch.object(result_cache, "_get_async_redis", return_value=fake_redis):
+    yield result_cache
+
+
+class TestQueryNormalization:
+  """Tests for query normalization and fingerprinting."""
+
+  def test_whitespace_collapsed_outside_literals(self):
+    query = "MATCH  (n:Entity)\n\tWHERE n.name = 'Acme   Corp'\nRETURN n;"
+    assert (
+      QueryResultCache.normalize_query(query)
+      == "MATCH (n:Entity) WHERE n.name = 'Acme   Corp' RETURN n"
+    )
+
+  def test_fingerprint_ignores_formatting_and_param_order(self):
+    a = QueryResultCache.make_fingerprint(
+      "MATCH (n) RETURN n LIMIT $limit", {"limit": 10, "type": "Company"}
+    )
+    b = QueryResultCache.make_fingerprint(
+      "MATCH (n)\n  RETURN n LIMIT $limit;", {"type": "Company", "limit": 10}
+    )
+    assert a == b
+
+  def test_fingerprint_differs_by_parameters(self):
+    a = QueryResultCache.make_fingerprint("MATCH (n) RETURN n LIMIT $l", {"l": 10})
+    b = QueryResultCache.make_fingerprint("MATCH (n) RETURN n LIMIT $l", {"l": 20})
+    assert a != b
+
+  def test_non_deterministic_queries_not_cacheable(self):
+    assert QueryResultCache.is_cacheable_query("MATCH (n) RETURN n LIMIT 5")
+    assert not QueryResultCache.is_cacheable_query("RETURN rand()")
+    assert not QueryResultCache.is_cacheable_query(
+      "MATCH (n) WHERE n.created < current_timestamp() RETURN n"
+    )
+
+
+class TestQueryResultCache:
+  """Tests for cache get/set/invalidate behavior."""
+
+  async def test_miss_then_hit(self, cache, fake_redis):
+    cached, generation = await cache.get("kg1", "MATCH (n) RETURN n")
+    assert cached is None
+    assert generation == 0
+
+    stored = await cache.set(
+      "kg1", "MATCH (n) RETURN n", None, [{"n": 1}], ["n"], generation
+    )
+    assert stored is True
+
+    result, _ = await cache.get("kg1", "MATCH (n) RETURN n")
+    assert result["data"] == [{"n": 1}]
+    assert result["columns"] == ["n"]
+    assert result["row_count"] == 1
+
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["stores"] == 1
+    assert stats["local_hits"] == 1
+
+  async def test_remote_hit_when_local_tier_cold(self, cache, fake_redis):
+    await cache.set("kg1", "MATCH (n) RETURN n", None, [{"n": 1}], ["n"], 0)
+    cache._local.clear()
+
+    result, _ = await cache.get("kg1", "MATCH (n) RETURN n")
+    assert result["data"] == [{"n": 1}]
+    assert cache.get_stats()["remote_hits"] == 1
+
+  async def test_invalidate_hides_previous_results(self, cache, fake_redis):
+    await cache.set("kg1", "MATCH (n) RETURN n", None, [{"n": 1}], ["n"], 0)
+    await cache.set("kg2", "MATCH (n) RETURN n", None, [{"n": 2}], ["n"], 0)
+
+    await cache.invalidate("kg1")
+
+    assert (await cache.get("kg1", "MATCH (n) RETURN n"))[0] is None
+    other, _ = await cache.get("kg2", "MATCH (n) RETURN n")
+    assert other["data"] == [{"n": 2}]
+
+  async def test_generation_change_from_another_worker(self, cache, fake_redis):
+    await cache.set("kg1", "MATCH (n) RETURN n", None, [{"n": 1}], ["n"], 0)
+
+    # Simulate another process bumping the generation without touching our tier
+    await fake_redis.incr(cache._generation_key("kg1"))
+
+    assert (await cache.get("kg1", "MATCH (n) RETURN n"))[0] is None
+
+  async def test_write_during_query_does_not_store_stale_result(
+    self, cache, fake_redis
+  ):
+    _, generation = await cache.get("kg1", "MATCH (n) RETURN n")
+
+    # A write lands while the query is running
+    await cache.invalidate("kg1")
+    await cache.set("kg1", "MATCH (n) RETURN n", None, [{"n": 1}], ["n"], generation)
+
+    assert (await cache.get("kg1", "MATCH (n) RETURN n"))[0] is None
+
+  async def test_unknown_generation_not_stored(self, cache, fake_redis):
+    stored = await cache.set("kg1", "MATCH (n) RETURN n", None, [], ["n"], None)
+
+    assert stored is False
+    assert cache.get_stats()["stores"] == 0
+
+  async def test_large_results_skipped(self, cache, fake_redis):
+    data = [{"value": "x" * 1000} for _ in range(20)]
+
+    stored = await cache.set("kg1", "MATCH (n) RETURN n", None, data, ["value"], 0)
+
+    assert stored is False
+    assert cache.get_stats()["skipped_too_large"] == 1
+    assert (await cache.get("kg1", "MATCH (n) RETURN n"))[0] is None
+
+  async def test_local_tier_is_bounded(self, cache, fake_redis):
+    for i in range(3):
+      await cache.set("kg1", f"MATCH (n) RETURN n LIMIT {i}", None, [], ["n"], 0)
+
+    assert len(cache._local) == 2
+
+  async def test_redis_errors_degrade_to_miss(self, fake_redis):
+    result_cache = QueryResultCache(ttl=60)
+
+    async def failing_get(key):
+      raise ConnectionError("valkey down")
+
+    async def failing_setex(key, ttl, value):
+      raise ConnectionError("valkey down")
+
+    fake_redis.get = failing_get
+    fake_redis.setex = failing_setex
+    with patch.object(result_cache, "_get_async_redis", return_value=fake_redis):
+      assert await result_cache.get("kg1", "MATCH (n) RETURN n") == (None, None)
+      stored = await result_cache.set("kg1", "MATCH (n) RETURN n", None, [], [], 0)
+      assert stored is False
+
+    assert result_cache.get_stats()["errors"] == 2
+
+
+class TestInvalidateHelper:
+  """Tests for the module-level invalidation helper."""
+
+  async def test_noop_when_disabled(self):
+    with (
+      patch("robosystems.middleware.graph.query_cache.env") as mock_env,
+      patch(
+        "robosystems.middleware.graph.query_cache.get_query_result_cache"
+      ) as mock_get_cache,
+    ):
+      mock_env.QUERY_RESULT_CACHE_ENABLED = False
+      await invalidate_query_cache("kg1")
+
+    mock_get_cache.assert_not_called()
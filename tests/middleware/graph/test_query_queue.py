@@ -9,6 +9,7 @@ import pytest
 
 from robosystems.middleware.graph.admission_control import AdmissionDecision
 from robosystems.middleware.graph.query_queue import (
+  FairQueryQueue,
   QueryQueueManager,
   QueryStatus,
   QueuedQuery,
@@ -238,10 +239,10 @@ class TestQueryQueueManager:
       priority=5,
     )
 
-    # Second query should fail
+    # Second (different) query should fail
     with pytest.raises(Exception, match="Query queue is full"):
       await queue_manager.submit_query(
-        cypher="MATCH (n) RETURN n",
+        cypher="MATCH (n) RETURN n LIMIT 5",
         parameters=None,
         graph_id="test_graph",
         user_id="user_456",
@@ -456,6 +457,156 @@ class TestQueryQueueManager:
     assert 0.19 < elapsed < 0.3  # Allow for timing variations
     assert result["status"] == QueryStatus.PENDING
 
+  @pytest.mark.asyncio
+  async def test_get_query_result_wakes_on_completion(
+    self, queue_manager, mock_metrics
+  ):
+    """Test a waiter returns as soon as the query finishes."""
+
+    async def mock_executor(cypher, params, graph_id):
+      return {"rows": []}
+
+    queue_manager._query_executor = mock_executor
+    query = QueuedQuery(
+      id="test_query",
+      cypher="MATCH (n) RETURN n",
+      parameters=None,
+      graph_id="test_graph",
+      user_id="user_123",
+      credits_reserved=5.0,
+    )
+    queue_manager._queries["test_query"] = query
+
+    waiter = asyncio.create_task(
+      queue_manager.get_query_result("test_query", wait_seconds=5)
+    )
+    await asyncio.sleep(0)
+    assert "test_query" in queue_manager._done_events
+
+    start = time.time()
+    query.started_at = datetime.now(UTC)
+    await queue_manager._execute_query(query)
+    result = await waiter
+
+    assert time.time() - start < 0.1
+    assert result["status"] == "completed"
+    assert result["data"] == {"rows": []}
+    assert queue_manager._done_events == {}
+
+  @pytest.mark.asyncio
+  async def test_wait_for_start_wakes_on_dispatch(self, queue_manager, mock_metrics):
+    """Test a queue watcher wakes as soon as its query is dispatched."""
+
+    async def mock_executor(cypher, params, graph_id):
+      return {"rows": []}
+
+    queue_manager._query_executor = mock_executor
+    query = QueuedQuery(
+      id="test_query",
+      cypher="MATCH (n) RETURN n",
+      parameters=None,
+      graph_id="test_graph",
+      user_id="user_123",
+      credits_reserved=5.0,
+    )
+    queue_manager._queries["test_query"] = query
+    queue_manager._queue.put("test_query", "test_graph", query.priority)
+
+    watcher = asyncio.create_task(queue_manager.wait_for_start("test_query", timeout=5))
+    await asyncio.sleep(0)
+    assert "test_query" in queue_manager._start_events
+
+    start = time.time()
+    await queue_manager._ensure_started()
+    await watcher
+
+    assert time.time() - start < 0.5
+    assert query.status != QueryStatus.PENDING
+    assert queue_manager._start_events == {}
+
+    queue_manager._worker_task.cancel()
+    try:
+      await queue_manager._worker_task
+    except asyncio.CancelledError:
+      pass
+
+  @pytest.mark.asyncio
+  async def test_wait_for_start_times_out_while_pending(
+    self, queue_manager, mock_metrics
+  ):
+    """Test a watcher regains control to report the queue position."""
+    query = QueuedQuery(
+      id="test_query",
+      cypher="MATCH (n) RETURN n",
+      parameters=None,
+      graph_id="test_graph",
+      user_id="user_123",
+      credits_reserved=5.0,
+    )
+    queue_manager._queries["test_query"] = query
+    queue_manager._queue.put("test_query", "test_graph", query.priority)
+
+    queue_manager._user_query_counts["user_123"] = 1
+
+    await queue_manager.wait_for_start("test_query", timeout=0.1)
+    assert query.status == QueryStatus.PENDING
+
+    watcher = asyncio.create_task(queue_manager.wait_for_start("test_query", timeout=5))
+    await asyncio.sleep(0)
+    await queue_manager.cancel_query("test_query", "user_123")
+    await asyncio.wait_for(watcher, timeout=0.5)
+
+    assert queue_manager._start_events == {}
+
+  @pytest.mark.asyncio
+  async def test_remote_result_delivery(self, mock_metrics):
+    """Test finished results reach waiters on another worker via Valkey."""
+    store = {}
+    redis_client = Mock()
+
+    async def setex(key, ttl, value):
+      store[key] = value
+
+    async def get(key):
+      return store.get(key)
+
+    async def noop(*args, **kwargs):
+      return None
+
+    redis_client.setex = setex
+    redis_client.get = get
+    redis_client.publish = Mock(side_effect=noop)
+    pubsub = Mock(subscribe=noop, get_message=noop, aclose=noop)
+    pubsub_client = Mock(aclose=Mock(side_effect=noop))
+    pubsub_client.pubsub.return_value = pubsub
+
+    executor_worker = QueryQueueManager(remote_results=True)
+    waiter_worker = QueryQueueManager(remote_results=True)
+    for manager in (executor_worker, waiter_worker):
+      manager._get_redis = Mock(return_value=redis_client)
+      manager._create_pubsub_redis = Mock(return_value=pubsub_client)
+
+    query = QueuedQuery(
+      id="remote_query",
+      cypher="MATCH (n) RETURN n",
+      parameters=None,
+      graph_id="test_graph",
+      user_id="user_123",
+      credits_reserved=5.0,
+      status=QueryStatus.COMPLETED,
+      result={"rows": [1]},
+    )
+    executor_worker._mark_finished(query)
+    await asyncio.sleep(0)
+
+    redis_client.publish.assert_called_once()
+    result = await waiter_worker.get_query_result("remote_query", wait_seconds=1)
+    assert result["status"] == "completed"
+    assert result["data"] == {"rows": [1]}
+    # The subscription used its own client, closed after the wait
+    redis_client.pubsub.assert_not_called()
+    pubsub_client.aclose.assert_called_once()
+
   @pytest.mark.asyncio
   async def test_cancel_query_success(self, queue_manager, mock_metrics):
     """Test cancelling a pending query."""
@@ -656,18 +807,27 @@ class TestQueryQueueManager:
     assert "query_1" not in queue_manager._completed_queries
     assert "query_4" in queue_manager._completed_queries
 
-  def test_estimate_queue_position(self, queue_manager):
-    """Test queue position estimation."""
-    # Mock the queue size
-    with patch.object(queue_manager._queue, "qsize", return_value=5):
-      position = queue_manager._estimate_queue_position("any_query")
-      assert position == 5
+  def test_estimate_queue_wait(self, queue_manager):
+    """Test queue position and wait come from the fair schedule."""
+    for i in range(3):
+      queue_manager._queue.put(f"busy_{i}", "busy_graph", 5)
+    queue_manager._queue.put("quiet_0", "quiet_graph", 5)
+    queue_manager._record_service_time("busy_graph", 10.0)
+    queue_manager._record_service_time("quiet_graph", 1.0)
+
+    # The quiet graph is served after one busy query, not the whole backlog
+    position, wait_time = queue_manager._estimate_queue_wait("quiet_0")
+    assert position == 1
+    # 10 seconds of work ahead / 10 concurrent
+    assert wait_time == 1.0
 
-  def test_estimate_wait_time(self, queue_manager):
-    """Test wait time estimation."""
-    wait_time = queue_manager._estimate_wait_time(20)
-    # 20 queries / 10 concurrent * 2 seconds per query = 4 seconds
-    assert wait_time == 4.0
+  def test_service_time_moving_average(self, queue_manager):
+    """Test observed service times update the per-graph estimate."""
+    queue_manager._record_service_time("test_graph", 4.0)
+    queue_manager._record_service_time("test_graph", 9.0)
+
+    # 4 + 0.2 * (9 - 4)
+    assert queue_manager._estimated_service_time("test_graph") == 5.0
 
   def test_get_stats(self, queue_manager):
     """Test getting queue statistics."""
@@ -723,6 +883,169 @@ class TestQueryQueueManager:
     assert metrics[10] == 1
 
 
+class TestFairQueryQueue:
+  """Tests for weighted fair scheduling across graphs."""
+
+  def test_graphs_are_interleaved(self):
+    """Test a backlog on one graph does not delay other graphs."""
+    queue = FairQueryQueue(100, cost=lambda graph_id: 1.0)
+    for i in range(4):
+      queue.put(f"a{i}", "graph_a", 5)
+    queue.put("b0", "graph_b", 5)
+    queue.put("b1", "graph_b", 5)
+
+    order = [queue.get_nowait() for _ in range(6)]
+
+    assert order == ["a0", "b0", "a1", "b1", "a2", "a3"]
+    assert queue.qsize() == 0
+
+  def test_priority_weights_share(self):
+    """Test higher priority graphs get a proportionally larger share."""
+    queue = FairQueryQueue(100, cost=lambda graph_id: 1.0)
+    for i in range(6):
+      queue.put(f"hi{i}", "premium", 10)
+      queue.put(f"lo{i}", "standard", 5)
+
+    first_six = [queue.get_nowait() for _ in range(6)]
+
+    assert sum(query_id.startswith("hi") for query_id in first_six) == 4
+
+  def test_slow_graph_is_charged_more(self):
+    """Test graphs with slower observed queries are dispatched less often."""
+    costs = {"slow": 4.0, "fast": 1.0}
+    queue = FairQueryQueue(100, cost=costs.__getitem__)
+    for i in range(5):
+      queue.put(f"slow{i}", "slow", 5)
+      queue.put(f"fast{i}", "fast", 5)
+
+    first_five = [queue.get_nowait() for _ in range(5)]
+
+    assert first_five == ["slow0", "fast0", "fast1", "fast2", "fast3"]
+
+  def test_ahead_of_matches_dispatch_order(self):
+    """Test the position replay agrees with actual dispatch."""
+    queue = FairQueryQueue(100, cost=lambda graph_id: 1.0)
+    for i in range(3):
+      queue.put(f"a{i}", "graph_a", 5)
+    queue.put("b0", "graph_b", 7)
+    queue.put("a_urgent", "graph_a", 9)
+
+    ahead = queue.ahead_of("a1")
+    dispatched = []
+    while (query_id := queue.get_nowait()) != "a1":
+      dispatched.append(query_id)
+
+    assert len(ahead) == len(dispatched) == 3
+
+  def test_remove(self):
+    """Test cancelled queries leave the queue."""
+    queue = FairQueryQueue(100, cost=lambda graph_id: 1.0)
+    queue.put("a0", "graph_a", 5)
+    queue.put("a1", "graph_a", 5)
+
+    assert queue.remove("a0") is True
+    assert queue.remove("a0") is False
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == "a1"
+    assert queue.graph_count() == 0
+
+
+class TestQueryDeduplication:
+  """Tests for coalescing identical in-flight queries."""
+
+  @pytest.fixture
+  def queue_manager(self):
+    """Queue manager whose worker is not started."""
+    manager = QueryQueueManager(
+      max_queue_size=100,
+      max_concurrent_queries=10,
+      max_queries_per_user=5,
+      query_timeout=60,
+    )
+    manager._started = True
+    return manager
+
+  @pytest.fixture(autouse=True)
+  def mock_dependencies(self):
+    """Accept every query and skip metrics."""
+    with (
+      patch(
+        "robosystems.middleware.graph.query_queue.get_admission_controller"
+      ) as mock_admission,
+      patch("robosystems.middleware.graph.query_queue.record_query_queue_metrics"),
+    ):
+      mock_admission.return_value.check_admission.return_value = (
+        AdmissionDecision.ACCEPT,
+        None,
+      )
+      yield
+
+  async def _submit(self, manager, cypher, user_id="user_1", parameters=None):
+    return await manager.submit_query(
+      cypher=cypher,
+      parameters=parameters,
+      graph_id="test_graph",
+      user_id=user_id,
+      credits_required=1.0,
+    )
+
+  @pytest.mark.asyncio
+  async def test_identical_queries_share_one_execution(self, queue_manager):
+    """Test followers get the leader's result without executing again."""
+    calls = []
+
+    async def executor(cypher, params, graph_id):
+      calls.append(cypher)
+      return {"rows": [1]}
+
+    queue_manager.set_query_executor(executor)
+    cypher = "MATCH (n) WHERE n.id = $id RETURN n"
+
+    leader_id = await self._submit(queue_manager, cypher, parameters={"id": 1})
+    follower_id = await self._submit(
+      queue_manager, cypher, user_id="user_2", parameters={"id": 1}
+    )
+    other_id = await self._submit(queue_manager, cypher, parameters={"id": 2})
+
+    assert queue_manager._queue.qsize() == 2
+    assert queue_manager.get_stats()["deduplicated_queries"] == 1
+
+    leader = queue_manager._queries[leader_id]
+    leader.started_at = datetime.now(UTC)
+    await queue_manager._execute_query(leader)
+    await asyncio.sleep(0)
+
+    result = await queue_manager.get_query_result(follower_id)
+    assert result["status"] == "completed"
+    assert result["data"] == {"rows": [1]}
+    assert calls == [cypher]
+    assert "user_2" not in queue_manager._user_query_counts
+    assert other_id in queue_manager._queries
+
+  @pytest.mark.asyncio
+  async def test_write_queries_are_not_coalesced(self, queue_manager):
+    """Test queries with side effects always execute."""
+    cypher = "CREATE (n:Note {text: 'x'})"
+
+    await self._submit(queue_manager, cypher)
+    await self._submit(queue_manager, cypher)
+
+    assert queue_manager._queue.qsize() == 2
+    assert queue_manager._inflight == {}
+
+  @pytest.mark.asyncio
+  async def test_cancelled_leader_promotes_follower(self, queue_manager):
+    """Test cancelling the leader keeps the followers' place in the queue."""
+    cypher = "MATCH (n) RETURN count(n)"
+    leader_id = await self._submit(queue_manager, cypher)
+    follower_id = await self._submit(queue_manager, cypher, user_id="user_2")
+
+    assert await queue_manager.cancel_query(leader_id, "user_1") is True
+
+    assert queue_manager._queue.get_nowait() == follower_id
+    assert queue_manager._queries[follower_id].leader_id is None
+
+
 class TestGetQueryQueue:
   """Tests for get_query_queue singleton function."""
 
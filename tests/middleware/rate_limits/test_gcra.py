@@ -0,0 +1,219 @@
+"""Tests for the GCRA rate limiting backend."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from redis.exceptions import NoScriptError
+
+from robosystems.config.billing.repositories import RepositoryPlan
+from robosystems.middleware.rate_limits.cache import RateLimitCache
+from robosystems.middleware.rate_limits.gcra import (
+  GCRA_SCRIPT,
+  GCRA_SCRIPT_SHA,
+  GCRARateLimiter,
+  RateLimitResult,
+)
+from robosystems.middleware.rate_limits.repository_rate_limits import (
+  DualLayerRateLimiter,
+  SharedRepositoryRateLimits,
+)
+
+
+@pytest.fixture
+def client():
+  return Mock()
+
+
+@pytest.fixture
+def limiter():
+  return GCRARateLimiter(lease_size=0, lease_ttl=0)
+
+
+@pytest.fixture
+def leasing_limiter():
+  return GCRARateLimiter(lease_size=5, lease_ttl=60)
+
+
+class TestGCRARateLimiter:
+  """Test script invocation and in-process leases."""
+
+  def test_check_uses_evalsha(self, limiter, client):
+    client.evalsha.return_value = [1, 9, 0, 6000]
+
+    result = limiter.check(client, "rate_limit:gcra:user:1", 10, 60)
+
+    client.evalsha.assert_called_once_with(
+      GCRA_SCRIPT_SHA, 1, "rate_limit:gcra:user:1", 10, 60000, 1
+    )
+    client.script_load.assert_not_called()
+    assert result == RateLimitResult(
+      allowed=True, limit=10, remaining=9, retry_after=0, reset_after=6.0
+    )
+
+  def test_noscript_loads_script_and_retries(self, limiter, client):
+    client.evalsha.side_effect = [NoScriptError("NOSCRIPT"), [1, 4, 0, 12000]]
+
+    result = limiter.check(client, "key", 5, 60)
+
+    client.script_load.assert_called_once_with(GCRA_SCRIPT)
+    assert client.evalsha.call_count == 2
+    assert result.allowed is True
+    assert result.remaining == 4
+
+  def test_denied_reports_retry_after(self, limiter, client):
+    client.evalsha.return_value = [0, 0, 1500, 60000]
+
+    result = limiter.check(client, "key", 10, 60)
+
+    assert result.allowed is False
+    assert result.remaining == 0
+    assert result.retry_after == 1.5
+    assert result.reset_after == 60.0
+
+  def test_lease_is_spent_locally(self, leasing_limiter, client):
+    client.evalsha.return_value = [5, 90, 0, 3000]
+
+    results = [leasing_limiter.check(client, "key", 100, 60) for _ in range(5)]
+
+    client.evalsha.assert_called_once_with(GCRA_SCRIPT_SHA, 1, "key", 100, 60000, 5)
+    assert all(result.allowed for result in results)
+    assert [result.remaining for result in results] == [94, 93, 92, 91, 90]
+
+    leasing_limiter.check(client, "key", 100, 60)
+    assert client.evalsha.call_count == 2
+
+  def test_lease_capped_by_limit(self, leasing_limiter, client):
+    client.evalsha.return_value = [1, 9, 0, 6000]
+
+    leasing_limiter.check(client, "key", 10, 60)
+
+    assert client.evalsha.call_args.args[-1] == 1
+
+  def test_denial_is_cached_until_retry(self, leasing_limiter, client):
+    client.evalsha.return_value = [0, 0, 30000, 60000]
+
+    first = leasing_limiter.check(client, "key", 100, 60)
+    second = leasing_limiter.check(client, "key", 100, 60)
+
+    assert first.allowed is False
+    assert second.allowed is False
+    assert 0 < second.retry_after <= 30
+    client.evalsha.assert_called_once()
+
+  def test_clear_leases(self, leasing_limiter, client):
+    client.evalsha.return_value = [0, 0, 30000, 60000]
+    leasing_limiter.check(client, "key", 100, 60)
+
+    leasing_limiter.clear_leases("key")
+    leasing_limiter.check(client, "key", 100, 60)
+
+    assert client.evalsha.call_count == 2
+
+  async def test_check_async_loads_script(self, limiter):
+    client = Mock()
+    client.evalsha = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), [1, 2, 0, 500]])
+    client.script_load = AsyncMock()
+
+    result = await limiter.check_async(client, "key", 3, 1)
+
+    client.script_load.assert_awaited_once_with(GCRA_SCRIPT)
+    assert result.allowed is True
+    assert result.remaining == 2
+
+  async def test_peek_does_not_spend(self, leasing_limiter):
+    client = Mock()
+    client.evalsha = AsyncMock(return_value=[0, 7, 0, 1800])
+
+    result = await leasing_limiter.peek_async(client, "key", 10, 60)
+
+    assert client.evalsha.await_args.args[-1] == 0
+    assert result.remaining == 7
+
+
+class TestRateLimitCache:
+  """Test the dependency-facing rate limit cache on the GCRA backend."""
+
+  @pytest.fixture
+  def cache(self, limiter, client):
+    cache = RateLimitCache()
+    cache.enabled = True
+    cache.limiter = limiter
+    cache._redis = client
+    return cache
+
+  def test_check_rate_limit_returns_tuple(self, cache, client):
+    client.evalsha.return_value = [1, 4, 0, 12000]
+
+    assert cache.check_rate_limit("user:1", 5, 60) == (True, 4)
+    assert client.evalsha.call_args.args[2] == "rate_limit:gcra:user:1"
+
+  def test_fails_open(self, cache, client):
+    client.evalsha.side_effect = ConnectionError("down")
+
+    result = cache.check("user:1", 5, 60)
+
+    assert result.allowed is True
+    assert result.remaining == 5
+
+
+class TestDualLayerRateLimiter:
+  """Test burst and repository limits on the shared backend."""
+
+  @pytest.fixture
+  def gcra(self):
+    gcra = Mock()
+    gcra.check_async = AsyncMock()
+    return gcra
+
+  async def test_burst_limit_denied(self, gcra):
+    gcra.check_async.return_value = RateLimitResult(
+      allowed=False, limit=10, remaining=0, retry_after=2.2, reset_after=60
+    )
+    limiter = DualLayerRateLimiter(Mock(), limiter=gcra)
+
+    with patch(
+      "robosystems.middleware.rate_limits.repository_rate_limits."
+      "RateLimitConfig.get_rate_limit",
+      return_value=(10, 60),
+    ):
+      result = await limiter.check_limits(
+        "user_1", "kg123", "query", "query", "ladybug-standard"
+      )
+
+    assert result["reason"] == "burst_limit"
+    assert result["detail"]["current"] == 10
+    assert result["detail"]["retry_after"] == 3
+    assert gcra.check_async.await_args.args[1] == "burst:gcra:user_1:query"
+
+  async def test_repository_limit_checks_each_window(self, gcra):
+    gcra.check_async.side_effect = [
+      RateLimitResult(
+        allowed=True, limit=10, remaining=7, retry_after=0, reset_after=18
+      ),
+      RateLimitResult(
+        allowed=False, limit=100, remaining=0, retry_after=36, reset_after=3600
+      ),
+    ]
+    limiter = DualLayerRateLimiter(Mock(), limiter=gcra)
+    limits = {
+      "queries_per_minute": 10,
+      "queries_per_hour": 100,
+      "queries_per_day": -1,
+    }
+
+    with patch.object(SharedRepositoryRateLimits, "get_limits", return_value=limits):
+      result = await limiter._check_repository_limit(
+        "user_1", "sec", "query", RepositoryPlan.STARTER
+      )
+
+    assert result == {
+      "allowed": False,
+      "window": "hour",
+      "limit": 100,
+      "current": 100,
+      "remaining": 0,
+      "retry_after": 36,
+      "reset_in": 3600,
+    }
+    keys = [call.args[1] for call in gcra.check_async.await_args_list]
+    assert keys == ["repo:gcra:sec:user_1:query:min", "repo:gcra:sec:user_1:query:hour"]
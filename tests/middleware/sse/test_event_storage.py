@@ -3,9 +3,13 @@
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
+import fakeredis
 import pytest
+from redis.exceptions import NoScriptError
 
 from robosystems.middleware.sse.event_storage import (
+  STORE_EVENT_SCRIPT,
+  STORE_EVENT_SCRIPT_SHA,
   EventType,
   OperationMetadata,
   OperationStatus,
@@ -299,7 +303,7 @@ class TestSSEEventStorage:
     assert op_id1 != op_id2
     assert len(op_id1) > 20  # UUIDs are longer than 20 chars
 
-  @patch("robosystems.config.valkey_registry.create_async_redis_client")
+  @patch("robosystems.config.valkey_registry.get_shared_async_redis_client")
   async def test_get_default_async_redis(self, mock_create_client):
     """Test getting default async Redis client."""
     mock_client = AsyncMock()
@@ -315,7 +319,7 @@ class TestSSEEventStorage:
 
     mock_create_client.assert_called_once_with(ValkeyDatabase.SSE_EVENTS)
 
-  @patch("robosystems.config.valkey_registry.create_redis_client")
+  @patch("robosystems.config.valkey_registry.get_shared_redis_client")
   def test_get_sync_redis(self, mock_create_client):
     """Test getting sync Redis client."""
     mock_client = Mock()
@@ -388,9 +392,7 @@ class TestSSEEventStorage:
   async def test_store_event(self):
     """Test storing an event."""
     mock_redis = AsyncMock()
-    mock_redis.exists.return_value = True
-    mock_redis.incr.return_value = 5
-    mock_redis.get.return_value = None  # No existing metadata
+    mock_redis.evalsha.return_value = [5, 1]
 
     storage = SSEEventStorage(redis_client=mock_redis)
 
@@ -413,17 +415,65 @@ class TestSSEEventStorage:
       assert event.data == event_data
       assert event.sequence_number == 5
 
-      # Verify Redis operations
-      mock_redis.exists.assert_called_with("sse:operation:meta:op123")
-      mock_redis.incr.assert_called_with("sse:operation:seq:op123")
-      mock_redis.zadd.assert_called_once()
-      mock_redis.expire.assert_called_with("sse:operation:events:op123", 3600)
-      mock_redis.publish.assert_called_once()
+      # One script call stores, publishes and refreshes the metadata
+      mock_redis.evalsha.assert_called_once()
+      args = mock_redis.evalsha.call_args.args
+      assert args[:5] == (
+        STORE_EVENT_SCRIPT_SHA,
+        3,
+        "sse:operation:meta:op123",
+        "sse:operation:seq:op123",
+        "sse:operation:events:op123",
+      )
+      assert args[6:] == (3600, "sse:events:op123", "1", "2023-01-01T12:30:00Z")
+      mock_redis.get.assert_not_called()
+      mock_redis.publish.assert_not_called()
+
+  async def test_store_event_payload_matches_event(self):
+    """Test that the script payload serializes to the stored event."""
+    mock_redis = AsyncMock()
+    mock_redis.evalsha.return_value = [7, 1]
+
+    storage = SSEEventStorage(redis_client=mock_redis)
+    event = await storage.store_event(
+      "op123", EventType.OPERATION_PROGRESS, {"message": "Halfway"}
+    )
+
+    payload = mock_redis.evalsha.call_args.args[5]
+    stored = f'{payload}, "sequence_number": {event.sequence_number}}}'
+    assert stored == json.dumps(event.to_dict())
+
+  async def test_store_event_loads_script_on_noscript(self):
+    """Test that the script is loaded once Valkey reports NOSCRIPT."""
+    mock_redis = AsyncMock()
+    mock_redis.evalsha.side_effect = [NoScriptError("NOSCRIPT"), [1, 1]]
+
+    storage = SSEEventStorage(redis_client=mock_redis)
+    event = await storage.store_event("op123", EventType.OPERATION_PROGRESS, {})
+
+    mock_redis.script_load.assert_called_once_with(STORE_EVENT_SCRIPT)
+    assert mock_redis.evalsha.call_count == 2
+    assert event.sequence_number == 1
+
+  async def test_store_lifecycle_event_updates_metadata(self):
+    """Test that status-changing events rewrite the operation metadata."""
+    mock_redis = AsyncMock()
+    mock_redis.evalsha.return_value = [2, 1]
+
+    storage = SSEEventStorage(redis_client=mock_redis)
+
+    with patch.object(storage, "_update_operation_metadata") as mock_update:
+      await storage.store_event("op123", EventType.OPERATION_COMPLETED, {"result": {}})
+
+    mock_update.assert_called_once_with(
+      "op123", EventType.OPERATION_COMPLETED, {"result": {}}
+    )
+    assert mock_redis.evalsha.call_args.args[-1] == ""
 
   async def test_store_event_operation_not_found(self):
     """Test storing event for non-existent operation."""
     mock_redis = AsyncMock()
-    mock_redis.exists.return_value = False
+    mock_redis.evalsha.return_value = -1
 
     storage = SSEEventStorage(redis_client=mock_redis)
 
@@ -437,8 +487,7 @@ class TestSSEEventStorage:
   def test_store_event_sync(self):
     """Test synchronous event storage."""
     mock_redis = Mock()
-    mock_redis.exists.return_value = True
-    mock_redis.incr.return_value = 3
+    mock_redis.evalsha.return_value = [3, 1]
     mock_redis.get.return_value = None  # No existing metadata
 
     storage = SSEEventStorage()
@@ -460,16 +509,69 @@ class TestSSEEventStorage:
       assert event.data == event_data
       assert event.sequence_number == 3
 
-      mock_redis.incr.assert_called_with("sse:operation:seq:op456")
-      mock_redis.zadd.assert_called_once()
-      mock_redis.expire.assert_called_once()
-      mock_redis.publish.assert_called_once()
+      mock_redis.evalsha.assert_called_once()
+      assert mock_redis.evalsha.call_args.args[2:5] == (
+        "sse:operation:meta:op456",
+        "sse:operation:seq:op456",
+        "sse:operation:events:op456",
+      )
+      # Unknown operations are accepted from background tasks
+      assert mock_redis.evalsha.call_args.args[-2] == "0"
+      stored_metadata = json.loads(mock_redis.setex.call_args.args[2])
+      assert stored_metadata["status"] == "failed"
+
+  def test_store_event_sync_progress_skips_metadata_rewrite(self):
+    """Test that progress events are stored in a single call."""
+    mock_redis = Mock()
+    mock_redis.evalsha.return_value = [4, 1]
+
+    storage = SSEEventStorage()
+    storage._sync_redis = mock_redis
+
+    storage.store_event_sync("op456", EventType.OPERATION_PROGRESS, {"step": 2})
+
+    mock_redis.evalsha.assert_called_once()
+    mock_redis.get.assert_not_called()
+    mock_redis.setex.assert_not_called()
+
+  def test_store_event_sync_progress_renews_metadata_ttl(self):
+    """Test background progress keeps long-running operation metadata alive."""
+    redis = fakeredis.FakeRedis()
+    storage = SSEEventStorage(default_ttl=3600)
+    storage._sync_redis = redis
+    metadata = OperationMetadata(
+      operation_id="op789",
+      operation_type="graph_creation",
+      user_id="user_1",
+      graph_id=None,
+      status=OperationStatus.RUNNING,
+      created_at="2023-01-01T12:00:00+00:00",
+      updated_at="2023-01-01T12:00:00+00:00",
+    )
+    redis.setex("sse:operation:meta:op789", 60, json.dumps(metadata.to_dict()))
+
+    storage.store_event_sync("op789", EventType.OPERATION_PROGRESS, {"step": 3})
+
+    assert redis.ttl("sse:operation:meta:op789") > 3500
+    stored = json.loads(redis.get("sse:operation:meta:op789"))
+    assert stored["user_id"] == "user_1"
+    assert stored["updated_at"] != metadata.updated_at
+
+  @pytest.mark.asyncio
+  async def test_store_event_progress_keeps_metadata_ttl(self):
+    """Test request-path progress events leave the metadata TTL alone."""
+    redis = fakeredis.FakeAsyncRedis()
+    storage = SSEEventStorage(redis_client=redis, default_ttl=3600)
+    operation_id = await storage.create_operation("agent_analysis", "user_1", ttl=60)
+
+    await storage.store_event(operation_id, EventType.OPERATION_PROGRESS, {"step": 1})
+
+    assert 0 < await redis.ttl(f"sse:operation:meta:{operation_id}") <= 60
 
   def test_store_event_sync_operation_not_found(self):
     """Test sync event storage with missing operation (warns but continues)."""
     mock_redis = Mock()
-    mock_redis.exists.return_value = False
-    mock_redis.incr.return_value = 1
+    mock_redis.evalsha.return_value = [1, 0]
     mock_redis.get.return_value = None  # No existing metadata
 
     storage = SSEEventStorage()
@@ -483,7 +585,7 @@ class TestSSEEventStorage:
 
         event = storage.store_event_sync(
           operation_id="missing_op",
-          event_type=EventType.OPERATION_STARTED,
+          event_type=EventType.OPERATION_PROGRESS,
           data={"test": "data"},
         )
 
@@ -491,6 +593,8 @@ class TestSSEEventStorage:
         mock_logger.warning.assert_called_with(
           "Operation missing_op not found in metadata, continuing anyway"
         )
+        # Minimal metadata is created for the operation
+        mock_redis.setex.assert_called_once()
 
   async def test_get_events(self):
     """Test retrieving events for an operation."""
@@ -759,8 +863,7 @@ class TestIntegrationScenarios:
   async def test_operation_lifecycle(self):
     """Test complete operation lifecycle."""
     mock_redis = AsyncMock()
-    mock_redis.exists.return_value = True
-    mock_redis.incr.side_effect = [1, 2, 3]  # Sequence numbers
+    mock_redis.evalsha.side_effect = [[1, 1], [2, 1], [3, 1]]  # Sequence numbers
     mock_redis.get.return_value = None  # No existing metadata
 
     storage = SSEEventStorage(redis_client=mock_redis)
@@ -808,8 +911,7 @@ class TestIntegrationScenarios:
   async def test_error_scenario(self):
     """Test error handling scenario."""
     mock_redis = AsyncMock()
-    mock_redis.exists.return_value = True
-    mock_redis.incr.side_effect = [1, 2]
+    mock_redis.evalsha.side_effect = [[1, 1], [2, 1]]
     mock_redis.get.return_value = None  # No existing metadata
 
     storage = SSEEventStorage(redis_client=mock_redis)
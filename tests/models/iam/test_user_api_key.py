@@ -6,6 +6,7 @@ import bcrypt
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
+from robosystems.config import env
 from robosystems.models.iam import User, UserAPIKey
 
 
@@ -254,6 +255,55 @@ class TestUserAPIKeyModel:
     found = UserAPIKey.get_by_key(plain_key, db_session)
     assert found is None
 
+  @patch("robosystems.models.iam.user_api_key.SecurityAuditLogger")
+  async def test_get_by_key_async(self, mock_audit_logger, db_session):
+    """Test async lookup verifies the key off the event loop."""
+    user = User.create(
+      email="asynckey@example.com",
+      name="Async Key User",
+      password_hash="hashed_password",
+      session=db_session,
+    )
+    api_key, plain_key = UserAPIKey.create(
+      user_id=user.id,
+      name="Async Key",
+      session=db_session,
+    )
+
+    found = await UserAPIKey.get_by_key_async(plain_key, db_session)
+    assert found is not None
+    assert found.id == api_key.id
+
+    wrong_key = plain_key[:8] + "x" * 59
+    assert await UserAPIKey.get_by_key_async(wrong_key, db_session) is None
+
+  @patch("robosystems.models.iam.user_api_key.SecurityAuditLogger")
+  def test_get_by_key_rehashes_to_hmac(self, mock_audit_logger, db_session):
+    """Test bcrypt keys migrate to HMAC-SHA256 on successful verification."""
+    user = User.create(
+      email="rehash@example.com",
+      name="Rehash User",
+      password_hash="hashed_password",
+      session=db_session,
+    )
+    api_key, plain_key = UserAPIKey.create(
+      user_id=user.id,
+      name="Legacy Key",
+      session=db_session,
+    )
+    assert api_key.key_hash.startswith("$2")
+
+    with (
+      patch.object(env, "API_KEY_HMAC_HASHING_ENABLED", True),
+      patch.object(env, "API_KEY_HMAC_PEPPER", "test-pepper"),
+    ):
+      found = UserAPIKey.get_by_key(plain_key, db_session)
+      assert found is not None
+      assert found.key_hash.startswith("hmac-sha256$")
+
+      # The migrated hash is found by direct lookup and still verifies
+      assert UserAPIKey.get_by_key(plain_key, db_session).id == api_key.id
+
   def test_get_by_hash(self, db_session):
     """Test getting API key by hash."""
     # Create a test user and API key
@@ -522,7 +572,7 @@ class TestUserAPIKeyModel:
     api_key._invalidate_cache()
 
     # Verify cache invalidation was called
-    mock_api_key_cache.invalidate_api_key.assert_called_once_with("test_hash")
+    mock_api_key_cache.invalidate_api_key_by_id.assert_called_once_with("uak_test")
 
     # Verify security audit logging
     mock_audit_logger.log_security_event.assert_called_once()
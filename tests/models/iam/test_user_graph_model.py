@@ -1,6 +1,6 @@
 """Comprehensive tests for the GraphUser model."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
@@ -421,6 +421,59 @@ class TestGraphUserModel:
     )
     assert no_access is False
 
+  def test_has_access_in(self):
+    """Test checking loaded graph roles, including subgraphs of a parent."""
+    graph_roles = {"kg0123456789abcdef": "viewer"}
+
+    assert GraphUser.has_access_in(graph_roles, "kg0123456789abcdef") is True
+    assert GraphUser.has_access_in(graph_roles, "kg0123456789abcdef_dev") is True
+    assert GraphUser.has_access_in(graph_roles, "kgfedcba9876543210") is False
+    assert GraphUser.has_access_in({}, "kg0123456789abcdef") is False
+
+  def test_membership_changes_invalidate_graph_access(self, test_org, db_session):
+    """Test committed membership changes drop cached graph access."""
+    user = User.create(
+      email="invalidate@example.com",
+      name="Invalidate User",
+      password_hash="hashed_password",
+      session=db_session,
+    )
+    graph = Graph.create(
+      graph_id="kg_invalidate",
+      graph_name="Invalidate Graph",
+      graph_type="entity",
+      org_id=test_org.id,
+      session=db_session,
+    )
+
+    with patch("robosystems.middleware.auth.cache.api_key_cache") as mock_cache:
+      graph_user = GraphUser.create(
+        user_id=user.id,
+        graph_id=graph.graph_id,
+        role="member",
+        session=db_session,
+      )
+      mock_cache.invalidate_graph_membership.assert_called_once_with(
+        user.id, graph.graph_id
+      )
+
+      # Selecting a graph does not change access
+      mock_cache.reset_mock()
+      graph_user.is_selected = True
+      db_session.commit()
+      mock_cache.invalidate_graph_membership.assert_not_called()
+
+      graph_user.update_role("admin", db_session)
+      mock_cache.invalidate_graph_membership.assert_called_once_with(
+        user.id, graph.graph_id
+      )
+
+      mock_cache.reset_mock()
+      graph_user.delete(db_session)
+      mock_cache.invalidate_graph_membership.assert_called_once_with(
+        user.id, graph.graph_id
+      )
+
   def test_user_has_admin_access(self, test_org, db_session):
     """Test checking if a user has admin access to a specific graph."""
     # Create test user and graphs
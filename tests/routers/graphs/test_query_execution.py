@@ -13,7 +13,9 @@ from robosystems.middleware.auth.jwt import create_jwt_token
 from robosystems.middleware.graph.query_queue import QueryStatus
 from robosystems.models.iam import User
 from robosystems.routers.graphs.query.strategies import (
+  ClientDetector,
   ExecutionStrategy,
+  QueryAnalyzer,
   StrategySelector,
 )
 from robosystems.routers.graphs.query.streaming import execute_query_with_timeout
@@ -212,6 +214,22 @@ class TestExecutionStrategies:
       # High load should force QUEUE_WITH_MONITORING strategy
       assert strategy == ExecutionStrategy.QUEUE_WITH_MONITORING
 
+  @pytest.mark.unit
+  def test_select_strategy_arrow_client(self, strategy_selector):
+    """Test that clients accepting Arrow IPC get the columnar stream."""
+    client_info = ClientDetector.detect_client_type(
+      {"accept": "application/vnd.apache.arrow.stream"}
+    )
+
+    strategy, _ = strategy_selector.select_strategy(
+      query_analysis=QueryAnalyzer.analyze_query("MATCH (n) RETURN n LIMIT 10"),
+      client_info=client_info,
+      system_state={"queue_size": 0, "running_queries": 0, "max_concurrent": 5},
+    )
+
+    assert client_info["capabilities"]["arrow"] is True
+    assert strategy == ExecutionStrategy.ARROW_STREAMING
+
 
 class TestQueryStreaming:
   """Test query result streaming."""
@@ -0,0 +1,208 @@
+import io
+import json
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from robosystems.scripts.arelle_cache_manager import (
+  BUNDLE_MANIFEST,
+  ArelleCacheManager,
+)
+
+SCHEMA = b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"/>'
+
+
+@pytest.fixture
+def manager(tmp_path):
+  return ArelleCacheManager(project_root=tmp_path / "project")
+
+
+def _write(path, content: bytes = SCHEMA):
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_bytes(content)
+  return path
+
+
+def _populate_cache(manager):
+  _write(manager.cache_dir / "xbrl.fasb.org" / "us-gaap" / "us-gaap.xsd")
+  _write(manager.cache_dir / "www.xbrl.org" / "2003" / "xbrl-instance.xsd")
+
+
+class TestFindReferences:
+  def test_resolves_relative_references_against_base(self):
+    content = b"""
+      <xs:import namespace="x" schemaLocation="../elts/us-gaap-2024.xsd"/>
+      <link:linkbaseRef xlink:href="us-gaap-lab.xml#label"/>
+    """
+
+    references = ArelleCacheManager.find_references(
+      content, "https://xbrl.fasb.org/us-gaap/2024/entire/us-gaap-entryPoint.xsd"
+    )
+
+    assert references == {
+      "https://xbrl.fasb.org/us-gaap/2024/elts/us-gaap-2024.xsd",
+      "https://xbrl.fasb.org/us-gaap/2024/entire/us-gaap-lab.xml",
+    }
+
+  def test_keeps_absolute_references(self):
+    content = b"""
+      <link:schemaRef xlink:href="http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd"/>
+      <xbrl xsi:schemaLocation="http://xbrl.sec.gov/dei https://xbrl.sec.gov/dei/2024/dei-2024.xsd"/>
+    """
+
+    references = ArelleCacheManager.find_references(
+      content, "https://example.com/filing/report.xsd"
+    )
+
+    assert references == {
+      "http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd",
+      "https://xbrl.sec.gov/dei/2024/dei-2024.xsd",
+    }
+
+  def test_drops_relative_references_without_base(self):
+    content = b"""
+      <link:schemaRef xlink:href="aapl-20240928.xsd"/>
+      <link:schemaRef xlink:href="https://xbrl.sec.gov/dei/2024/dei-2024.xsd"/>
+    """
+
+    assert ArelleCacheManager.find_references(content) == {
+      "https://xbrl.sec.gov/dei/2024/dei-2024.xsd"
+    }
+
+  def test_discovers_references_in_filing_zips_and_directories(self, manager, tmp_path):
+    sample_dir = tmp_path / "sample"
+    sample_dir.mkdir()
+    with zipfile.ZipFile(sample_dir / "filing.zip", "w") as zf:
+      zf.writestr(
+        "report.xsd",
+        '<xs:import schemaLocation="https://xbrl.fasb.org/us-gaap/2024/elts/us-gaap-2024.xsd"/>',
+      )
+    _write(
+      sample_dir / "extracted" / "report.htm",
+      b'<link:schemaRef xlink:href="https://xbrl.sec.gov/dei/2024/dei-2024.xsd"/>',
+    )
+
+    assert manager.discover_references(sample_dir) == {
+      "https://xbrl.fasb.org/us-gaap/2024/elts/us-gaap-2024.xsd",
+      "https://xbrl.sec.gov/dei/2024/dei-2024.xsd",
+    }
+
+
+class TestFetchSchema:
+  URL = "https://xbrl.fasb.org/us-gaap/2024/elts/us-gaap-2024.xsd"
+
+  def test_mirror_hit_skips_download(self, manager, tmp_path, monkeypatch):
+    mirror_dir = tmp_path / "mirror"
+    _write(
+      mirror_dir / "xbrl.fasb.org" / "us-gaap" / "2024" / "elts" / "us-gaap-2024.xsd"
+    )
+    downloads = []
+    monkeypatch.setattr(
+      manager, "download_schema", lambda url, path: downloads.append(url)
+    )
+
+    assert manager.fetch_schema(self.URL, mirror_dir) == "mirrored"
+    assert downloads == []
+    cache_path = manager.cache_dir / manager.cache_path_for(self.URL)
+    assert cache_path.read_bytes() == SCHEMA
+
+  def test_mirror_miss_downloads(self, manager, tmp_path, monkeypatch):
+    downloads = []
+
+    def download(url, path):
+      downloads.append(url)
+      _write(path)
+      return True
+
+    monkeypatch.setattr(manager, "download_schema", download)
+
+    assert manager.fetch_schema(self.URL, tmp_path / "mirror") == "downloaded"
+    assert downloads == [self.URL]
+    # A resumed run finds the schema in the cache
+    assert manager.fetch_schema(self.URL, tmp_path / "mirror") == "cached"
+    assert downloads == [self.URL]
+
+  def test_invalid_download_is_not_cached(self, manager, monkeypatch):
+    monkeypatch.setattr(
+      manager, "download_schema", lambda url, path: bool(_write(path, b"<broken"))
+    )
+
+    assert manager.fetch_schema(self.URL) == "failed"
+    assert not (manager.cache_dir / manager.cache_path_for(self.URL)).exists()
+
+
+class TestBundles:
+  def test_bundle_and_cache_verify_against_manifest(self, manager):
+    _populate_cache(manager)
+
+    schema_bundle, _ = manager.create_bundles()
+
+    assert manager.verify_bundle(schema_bundle)
+    assert manager.verify_cache()
+    manifest = manager.build_manifest()
+    assert set(manifest["files"]) == {
+      "www.xbrl.org/2003/xbrl-instance.xsd",
+      "xbrl.fasb.org/us-gaap/us-gaap.xsd",
+    }
+    assert manifest["digest"][:16] in schema_bundle.name
+
+  def test_verify_cache_detects_corrupted_file(self, manager):
+    _populate_cache(manager)
+    manager.create_bundles()
+
+    _write(manager.cache_dir / "xbrl.fasb.org" / "us-gaap" / "us-gaap.xsd", b"<x/>")
+
+    assert not manager.verify_cache()
+
+  def test_verify_bundle_detects_corrupted_file(self, manager, tmp_path):
+    _populate_cache(manager)
+    schema_bundle, _ = manager.create_bundles()
+
+    # Rewrite the bundle with one schema altered but the original manifest
+    corrupted = tmp_path / schema_bundle.name
+    with (
+      tarfile.open(schema_bundle, "r:gz") as source,
+      tarfile.open(corrupted, "w:gz") as target,
+    ):
+      for member in source:
+        content = source.extractfile(member)
+        if member.name.endswith("us-gaap.xsd"):
+          data = b"<x/>"
+          member.size = len(data)
+          target.addfile(member, io.BytesIO(data))
+        else:
+          target.addfile(member, content)
+
+    assert not manager.verify_bundle(corrupted)
+
+  def test_bundles_are_deterministic(self, tmp_path):
+    bundles = []
+    for name in ("first", "second"):
+      manager = ArelleCacheManager(project_root=tmp_path / name)
+      _populate_cache(manager)
+      bundles.append(manager.create_bundles()[0])
+      # Different build times must not change the bundle
+      time.sleep(1.1)
+
+    assert bundles[0].name == bundles[1].name
+    assert bundles[0].read_bytes() == bundles[1].read_bytes()
+
+  def test_extract_skips_when_digests_match(self, manager):
+    _populate_cache(manager)
+    manager.create_bundles()
+    schema = manager.cache_dir / "xbrl.fasb.org" / "us-gaap" / "us-gaap.xsd"
+
+    # The cache already holds this bundle: extraction leaves it untouched
+    _write(schema, b"<edited/>")
+    manager.extract_bundles()
+    assert schema.read_bytes() == b"<edited/>"
+
+    # A different digest extracts the bundle again
+    manifest_path = manager.cache_dir / BUNDLE_MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    manifest_path.write_text(json.dumps({**manifest, "digest": "0" * 64}))
+    manager.extract_bundles()
+    assert schema.read_bytes() == SCHEMA
+    assert manager.verify_cache()
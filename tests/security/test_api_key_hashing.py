@@ -0,0 +1,98 @@
+"""Tests for API key hashing and verification."""
+
+import threading
+from unittest.mock import patch
+
+import bcrypt
+import pytest
+
+from robosystems.config import env
+from robosystems.security import api_key_hashing
+from robosystems.security.api_key_hashing import (
+  APIKeyVerifier,
+  hmac_hash_api_key,
+  needs_rehash,
+  verify_api_key_hash,
+)
+
+PLAIN_KEY = "rfs" + "a" * 64
+
+
+@pytest.fixture
+def pepper():
+  with (
+    patch.object(env, "API_KEY_HMAC_HASHING_ENABLED", True),
+    patch.object(env, "API_KEY_HMAC_PEPPER", "test-pepper"),
+  ):
+    yield
+
+
+@pytest.fixture
+def bcrypt_hash():
+  return bcrypt.hashpw(PLAIN_KEY.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.fixture
+def verifier():
+  verifier = APIKeyVerifier(max_workers=2)
+  yield verifier
+  verifier.shutdown()
+
+
+def test_hmac_hash_round_trip(pepper):
+  stored = hmac_hash_api_key(PLAIN_KEY)
+
+  assert stored.startswith("hmac-sha256$")
+  assert verify_api_key_hash(PLAIN_KEY, stored) is True
+  assert verify_api_key_hash(PLAIN_KEY[:-1] + "b", stored) is False
+
+
+def test_hmac_hash_rejected_without_pepper(pepper):
+  stored = hmac_hash_api_key(PLAIN_KEY)
+
+  with patch.object(env, "API_KEY_HMAC_PEPPER", ""):
+    assert verify_api_key_hash(PLAIN_KEY, stored) is False
+
+
+def test_needs_rehash(pepper, bcrypt_hash):
+  assert needs_rehash(bcrypt_hash) is True
+  assert needs_rehash(hmac_hash_api_key(PLAIN_KEY)) is False
+
+  with patch.object(env, "API_KEY_HMAC_HASHING_ENABLED", False):
+    assert needs_rehash(bcrypt_hash) is False
+
+
+def test_verify_returns_matching_index(verifier, bcrypt_hash):
+  other_hash = bcrypt.hashpw(b"other", bcrypt.gensalt(rounds=4)).decode()
+
+  assert verifier.verify(PLAIN_KEY, [other_hash, bcrypt_hash]) == 1
+  assert verifier.verify(PLAIN_KEY, [other_hash]) is None
+  assert verifier.verify(PLAIN_KEY, []) is None
+
+
+def test_concurrent_verifications_share_one_check(verifier, bcrypt_hash):
+  release = threading.Event()
+  calls = []
+
+  def slow_match(plain_key, stored_hashes):
+    calls.append(plain_key)
+    release.wait(timeout=5)
+    return 0
+
+  with patch.object(api_key_hashing, "_match_api_key", slow_match):
+    first = verifier.submit(PLAIN_KEY, [bcrypt_hash])
+    second = verifier.submit(PLAIN_KEY, [bcrypt_hash])
+    release.set()
+
+    assert first is second
+    assert first.result(timeout=5) == 0
+  assert len(calls) == 1
+
+
+async def test_verify_async(verifier, bcrypt_hash):
+  assert await verifier.verify_async(PLAIN_KEY, [bcrypt_hash]) == 0
+
+
+def test_hmac_candidates_verified_inline(pepper, verifier):
+  assert verifier.verify(PLAIN_KEY, [hmac_hash_api_key(PLAIN_KEY)]) == 0
+  assert verifier._executor is None
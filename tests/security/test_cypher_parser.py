@@ -0,0 +1,112 @@
+"""Tests for the single-pass Cypher parser and shared analysis cache."""
+
+import pytest
+
+from robosystems.security.cypher_analyzer import (
+  is_admin_operation,
+  is_bulk_operation,
+  is_write_operation,
+)
+from robosystems.security.cypher_parser import (
+  clear_analysis_cache,
+  get_analysis_cache_stats,
+  parse_cypher,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+  clear_analysis_cache()
+  yield
+  clear_analysis_cache()
+
+
+@pytest.mark.security
+@pytest.mark.unit
+class TestParseCypher:
+  def test_keywords_inside_literals_and_comments_are_ignored(self):
+    analysis = parse_cypher(
+      "MATCH (n) WHERE n.note = 'CREATE DELETE LIMIT 5' "
+      "// SET n.x = 1\nRETURN n.`delete` AS d"
+    )
+
+    assert analysis.write_keywords == frozenset()
+    assert analysis.is_read_only
+    assert not analysis.has_limit
+    assert analysis.return_aliases == ("d",)
+
+  def test_return_aliases_handle_nested_commas(self):
+    analysis = parse_cypher(
+      "MATCH (c:Entity) RETURN DISTINCT c.name, coalesce(c.cik, 'n/a') AS cik, "
+      "count(c) as total ORDER BY total"
+    )
+
+    assert analysis.return_aliases == ("c.name", "cik", "total")
+    assert analysis.has_aggregation
+    assert analysis.order_by_count == 1
+
+  def test_limit_literal_and_parameter(self):
+    assert parse_cypher("MATCH (n) RETURN n LIMIT 25").limit_value == 25
+
+    parameterized = parse_cypher("MATCH (n) RETURN n LIMIT $limit")
+    assert parameterized.has_limit
+    assert parameterized.limit_value is None
+    assert parameterized.parameters == frozenset({"limit"})
+
+  def test_schema_ddl_and_procedure_calls(self):
+    ddl = parse_cypher("CREATE NODE TABLE Foo(id STRING, PRIMARY KEY(id))")
+    assert ddl.is_schema_ddl
+    assert ddl.schema_ddl_operations == frozenset({"CREATE_TABLE"})
+
+    neo4j_call = parse_cypher("CALL db.schema()")
+    assert neo4j_call.procedure_calls == ("db.schema",)
+    assert neo4j_call.system_calls == frozenset()
+
+    call = parse_cypher("CALL show_tables() RETURN *")
+    assert call.system_calls == frozenset({"show_tables"})
+
+  def test_chained_admin_command_is_flagged(self):
+    analysis = parse_cypher("MATCH (n) RETURN n; CALL dbms.security.listUsers()")
+
+    assert analysis.security_error == "Query contains potentially dangerous patterns"
+    assert analysis.is_write
+
+  def test_unterminated_string_is_treated_as_write(self):
+    analysis = parse_cypher(
+      "MATCH (n) WHERE n.name = 'x RETURN n; MATCH (m) DETACH DELETE m"
+    )
+
+    assert analysis.unclosed_string
+    assert analysis.security_error == "Unterminated string literal detected"
+    assert analysis.is_write
+
+  def test_complexity_score(self):
+    analysis = parse_cypher(
+      "MATCH (a)-[:REL*1..12]-(b) WHERE a.name CONTAINS 'x' RETURN a"
+    )
+
+    assert analysis.var_length_paths == ((1, 12),)
+    # No LIMIT (20) + 12 hops (70) + wide range (15) + CONTAINS (10)
+    assert analysis.complexity_score == 115
+
+  def test_identical_queries_share_cached_analysis(self):
+    query = "MATCH (n:Entity) RETURN n.name LIMIT 10"
+
+    first = parse_cypher(query)
+    second = parse_cypher(query)
+
+    assert first is second
+    stats = get_analysis_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+@pytest.mark.security
+@pytest.mark.unit
+class TestAnalyzerDefaults:
+  def test_empty_query_is_treated_as_write_but_not_admin(self):
+    # Empty queries fail write analysis (fail safe) without looking like admin
+    assert is_write_operation("")
+    assert not is_admin_operation("")
+    assert not is_bulk_operation("")
@@ -5,7 +5,7 @@ Tests that users cannot access graphs they don't own, validating the
 graph-scoped authorization system across all endpoint patterns.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import status
@@ -56,7 +56,10 @@ class TestGraphAccessControlDependency:
     mock_request.url.path = f"/v1/graphs/{sample_graph.graph_id}/info"
 
     with (
-      patch("robosystems.middleware.auth.dependencies.verify_jwt_token") as mock_verify,
+      patch(
+        "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+        new_callable=AsyncMock,
+      ) as mock_verify,
       patch("robosystems.middleware.auth.dependencies.User.get_by_id") as mock_get_user,
     ):
       mock_verify.return_value = test_user.id
@@ -77,7 +80,10 @@ class TestGraphAccessControlDependency:
     mock_request.url.path = f"/v1/graphs/{sample_graph.graph_id}/info"
 
     with (
-      patch("robosystems.middleware.auth.dependencies.verify_jwt_token") as mock_verify,
+      patch(
+        "robosystems.middleware.auth.dependencies.verify_jwt_token_async",
+        new_callable=AsyncMock,
+      ) as mock_verify,
       patch("robosystems.middleware.auth.dependencies.User.get_by_id") as mock_get_user,
     ):
       mock_verify.return_value = test_user.id
@@ -105,7 +111,8 @@ class TestGraphAccessControlDependency:
     mock_request.url.path = f"/v1/graphs/{sample_graph.graph_id}/info"
 
     with patch(
-      "robosystems.middleware.auth.dependencies.validate_api_key_with_graph"
+      "robosystems.middleware.auth.dependencies.validate_api_key_with_graph_async",
+      new_callable=AsyncMock,
     ) as mock_validate:
       mock_validate.return_value = test_user
 
@@ -125,7 +132,8 @@ class TestGraphAccessControlDependency:
     mock_request.url.path = f"/v1/graphs/{sample_graph.graph_id}/info"
 
     with patch(
-      "robosystems.middleware.auth.dependencies.validate_api_key_with_graph"
+      "robosystems.middleware.auth.dependencies.validate_api_key_with_graph_async",
+      new_callable=AsyncMock,
     ) as mock_validate:
       mock_validate.return_value = None  # No access
 